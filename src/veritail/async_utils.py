@@ -0,0 +1,77 @@
+"""Background event loop for driving async LLM calls from synchronous code."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class EventLoopThread:
+    """Run coroutines on a dedicated asyncio event loop thread.
+
+    The synchronous pipeline submits coroutines and gets back
+    :class:`concurrent.futures.Future` objects, so it can use the same
+    in-order draining logic as its thread-pool path while thousands of
+    requests stay in flight on a single loop.  At most *limit* coroutines
+    run at once; the rest wait on a semaphore inside the loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="veritail-asyncio", daemon=True
+        )
+        self._thread.start()
+        # Create the semaphore on the loop thread so it binds to that loop
+        # (Python 3.9 binds asyncio primitives at construction time).
+        self._semaphore: asyncio.Semaphore = self._call(self._make_semaphore(limit))
+        logger.debug("event loop thread started: limit=%d", limit)
+
+    @staticmethod
+    async def _make_semaphore(limit: int) -> asyncio.Semaphore:
+        return asyncio.Semaphore(limit)
+
+    def _call(self, coro: Coroutine[Any, Any, T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _guarded(self, coro: Coroutine[Any, Any, T]) -> T:
+        async with self._semaphore:
+            return await coro
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule *coro* on the loop and return a thread-safe future."""
+        return asyncio.run_coroutine_threadsafe(self._guarded(coro), self._loop)
+
+    def close(self) -> None:
+        """Cancel outstanding work, stop the loop and join its thread."""
+        if self._loop.is_closed():
+            return
+
+        async def _cancel_pending() -> None:
+            current = asyncio.current_task()
+            tasks = [t for t in asyncio.all_tasks() if t is not current]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._call(_cancel_pending())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        logger.debug("event loop thread stopped")
+
+    def __enter__(self) -> EventLoopThread:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
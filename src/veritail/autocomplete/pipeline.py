@@ -17,7 +17,11 @@ from veritail.autocomplete.comparison import (
     check_suggestion_overlap,
 )
 from veritail.autocomplete.judge import SuggestionJudge
-from veritail.batch_utils import poll_until_done
+from veritail.batch_utils import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    poll_until_done,
+)
 from veritail.checkpoint import (
     BatchCheckpoint,
     clear_checkpoint,
@@ -206,6 +210,8 @@ def run_autocomplete_batch_llm_evaluation(
     llm_client: LLMClient,
     *,
     poll_interval: int = 60,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     resume: bool = False,
     output_dir: str = "./eval-results",
     cancel_event: threading.Event | None = None,
@@ -224,7 +230,9 @@ def run_autocomplete_batch_llm_evaluation(
 
     if saved_checkpoint is not None:
         batch_id = saved_checkpoint.batch_id
-        request_context: dict[str, dict[str, Any]] = saved_checkpoint.request_context
+        request_context: dict[str, dict[str, Any]] = dict(
+            saved_checkpoint.request_context
+        )
         # Restore Gemini custom_id ordering if needed
         if saved_checkpoint.gemini_custom_id_order:
             llm_client.restore_batch_custom_ids(
@@ -268,7 +276,7 @@ def run_autocomplete_batch_llm_evaluation(
             len(batch_requests),
         )
 
-        gemini_order = getattr(llm_client, "_batch_custom_ids", {}).get(batch_id, [])
+        gemini_order = llm_client.batch_custom_id_order(batch_id)
         save_checkpoint(
             output_dir,
             config.name,
@@ -291,6 +299,8 @@ def run_autocomplete_batch_llm_evaluation(
             batch_id,
             expected_total=len(request_context),
             poll_interval=poll_interval,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
             label="Waiting for autocomplete batch...",
             cancel_event=cancel_event,
         )
@@ -305,8 +315,7 @@ def run_autocomplete_batch_llm_evaluation(
 
     # Step 4: Retrieve & parse
     console.print("[cyan]Retrieving autocomplete batch results...[/cyan]")
-    batch_results = llm_client.retrieve_batch_results(batch_id)
-    results_by_id = {r.custom_id: r for r in batch_results}
+    results_by_id = {r.custom_id: r for r in llm_client.iter_batch_results(batch_id)}
 
     judgments: list[SuggestionJudgment] = []
 
@@ -353,4 +362,5 @@ def run_autocomplete_batch_llm_evaluation(
             )
 
     clear_checkpoint(output_dir, config.name, filename=AC_CHECKPOINT_FILENAME)
+    llm_client.release_batch(batch_id)
     return judgments
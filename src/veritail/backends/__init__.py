@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, TypeVar
 
-from veritail.types import CorrectionJudgment, JudgmentRecord, SuggestionJudgment
+from veritail.types import (
+    CheckResult,
+    CorrectionJudgment,
+    JudgmentRecord,
+    SuggestionJudgment,
+)
 
 logger = logging.getLogger(__name__)
 
+_BackendT = TypeVar("_BackendT", bound="EvalBackend")
+
 
 class EvalBackend(ABC):
     """Abstract base class for evaluation storage backends."""
@@ -19,6 +27,15 @@ class EvalBackend(ABC):
         """Store an LLM judgment (trace + score + reasoning)."""
         ...
 
+    def log_judgments(self, judgments: Sequence[JudgmentRecord]) -> None:
+        """Store several judgments at once, in order.
+
+        The default logs them one by one; backends override it to write a
+        whole batch in one operation.
+        """
+        for judgment in judgments:
+            self.log_judgment(judgment)
+
     @abstractmethod
     def log_experiment(
         self, name: str, config: dict[str, Any], *, resume: bool = False
@@ -39,16 +56,40 @@ class EvalBackend(ABC):
         """Optionally store a suggestion judgment. Default no-op."""
         pass
 
+    def log_checks(self, experiment: str, checks: list[CheckResult]) -> None:
+        """Optionally store the check results of a finished run. Default no-op."""
+        pass
+
+    def log_query_complete(
+        self, experiment: str, query_index: int, judgment_count: int
+    ) -> None:
+        """Optionally record that a query's judgments are all logged. Default no-op.
+
+        Backends that record it report only such queries as completed, so a
+        query interrupted halfway is judged again on resume.
+        """
+        pass
+
     def get_completed_query_indices(self, experiment: str) -> set[int]:
         """Return the set of query indices already judged for *experiment*."""
         return set()
 
+    def close(self) -> None:
+        """Flush pending writes and release resources. Default no-op."""
+        pass
+
+    def __enter__(self: _BackendT) -> _BackendT:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
 
 def create_backend(backend_type: str, **kwargs: Any) -> EvalBackend:
     """Create an evaluation backend by type name.
 
     Args:
-        backend_type: "file" or "langfuse"
+        backend_type: "file", "sqlite" or "langfuse"
         **kwargs: Backend-specific configuration
 
     Returns:
@@ -59,6 +100,11 @@ def create_backend(backend_type: str, **kwargs: Any) -> EvalBackend:
 
         logger.debug("created backend: file")
         return FileBackend(**kwargs)
+    elif backend_type == "sqlite":
+        from veritail.backends.sqlite import SqliteBackend
+
+        logger.debug("created backend: sqlite")
+        return SqliteBackend(**kwargs)
     elif backend_type == "langfuse":
         try:
             from veritail.backends.langfuse import LangfuseBackend
@@ -78,7 +124,7 @@ def create_backend(backend_type: str, **kwargs: Any) -> EvalBackend:
         return LangfuseBackend(**kwargs)
     else:
         raise ValueError(
-            f"Unknown backend type: {backend_type}. Use 'file' or 'langfuse'."
+            f"Unknown backend type: {backend_type}. Use 'file', 'sqlite' or 'langfuse'."
         )
 
 
@@ -2,32 +2,392 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import threading
 import warnings
-from dataclasses import asdict
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
 from veritail.backends import EvalBackend
+from veritail.compression import (
+    check_compression,
+    codec,
+    compressed_path,
+    find_existing,
+    iter_lines,
+    open_binary,
+    repair,
+    scan,
+    truncate,
+    write_bytes,
+)
 from veritail.types import JudgmentRecord, SearchResult
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+JUDGMENTS_FILENAME = "judgments.jsonl"
+INDEX_FILENAME = "judgments.index.jsonl"
+PRODUCTS_FILENAME = "products.jsonl"
+
+
+@dataclass
+class _Span:
+    """Consecutive judgment lines of one query in ``judgments.jsonl``."""
+
+    query_index: int | None
+    offset: int
+    length: int = 0
+    count: int = 0
+
+    def entry(self) -> dict[str, Any]:
+        return {
+            "query_index": self.query_index,
+            "offset": self.offset,
+            "bytes": self.length,
+            "count": self.count,
+        }
+
+
+@dataclass
+class _Index:
+    """Replayed contents of a judgments index file."""
+
+    spans: list[_Span] = field(default_factory=list)
+    # query_index -> judgment count recorded when the query finished
+    complete: dict[int, int] = field(default_factory=dict)
+    # Decompressed end, size and mtime of a compressed file when last closed
+    seal: tuple[int, int, int] | None = None
+
+    @classmethod
+    def find(cls, judgments_file: Path) -> _Index | None:
+        index_file = judgments_file.parent / INDEX_FILENAME
+        return cls.load(index_file) if index_file.exists() else None
+
+    @classmethod
+    def load(cls, path: Path) -> _Index:
+        index = cls()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    if "end" in entry:
+                        index.seal = (
+                            int(entry["end"]),
+                            int(entry["file_bytes"]),
+                            int(entry["mtime_ns"]),
+                        )
+                    elif "complete" in entry:
+                        index.complete[int(entry["query_index"])] = int(
+                            entry["complete"]
+                        )
+                    else:
+                        index.spans.append(
+                            _Span(
+                                query_index=entry["query_index"],
+                                offset=int(entry["offset"]),
+                                length=int(entry["bytes"]),
+                                count=int(entry["count"]),
+                            )
+                        )
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    # Only the line being written when the process died can
+                    # be incomplete; the judgments it covers are dropped.
+                    continue
+        return index
+
+    @property
+    def end(self) -> int:
+        return self.spans[-1].offset + self.spans[-1].length if self.spans else 0
+
+    def covers(self, size: int) -> bool:
+        """Whether the spans tile ``judgments.jsonl`` from the start."""
+        position = 0
+        for span in self.spans:
+            if span.offset != position:
+                return False
+            position += span.length
+        return position <= size
+
+    def sealed_size(self, path: Path) -> int | None:
+        """Decompressed size of *path* if unchanged since it was sealed."""
+        if self.seal is None:
+            return None
+        end, file_bytes, mtime_ns = self.seal
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (file_bytes, mtime_ns):
+            return None
+        return end
+
+    def counts(self) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for span in self.spans:
+            if span.query_index is not None:
+                counts[span.query_index] = counts.get(span.query_index, 0) + span.count
+        return counts
+
+    def completed(self) -> set[int]:
+        """Queries whose logged judgments match their completion record."""
+        counts = self.counts()
+        return {qi for qi, n in self.complete.items() if counts.get(qi) == n}
+
+
+def _seal_entry(path: Path, end: int) -> dict[str, Any]:
+    """Index entry recording a closed compressed file's decompressed *end*."""
+    stat = path.stat()
+    return {"end": end, "file_bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _stored_size(path: Path, index: _Index | None) -> int:
+    """Decompressed size of *path*, from the index seal when still current."""
+    if codec(path) is None:
+        return path.stat().st_size
+    sealed = index.sealed_size(path) if index is not None else None
+    return sealed if sealed is not None else scan(path)[0]
+
+
+def _scan_spans(path: Path) -> Iterator[_Span]:
+    """Index an existing judgments file, one span per line."""
+    offset = 0
+    for line in iter_lines(path):
+        query_index: int | None = None
+        try:
+            qi = json.loads(line).get("metadata", {}).get("query_index")
+            query_index = None if qi is None else int(qi)
+        except (json.JSONDecodeError, AttributeError, ValueError, TypeError):
+            pass
+        yield _Span(query_index, offset, len(line), 1)
+        offset += len(line)
+
+
+class _JudgmentLog:
+    """Open judgments file of one experiment and its pending index entries."""
+
+    def __init__(self, path: Path, buffer_size: int, fsync: bool) -> None:
+        self._fsync = fsync
+        self.path = path
+        self.compressed = codec(path) is not None
+        # Offsets count decompressed bytes of a compressed file.  A torn
+        # end left by a writer that died is cut before appending after it.
+        size = None
+        if self.compressed and path.exists():
+            index = _Index.find(path)
+            size = index.sealed_size(path) if index is not None else None
+        if size is None:
+            size = repair(path) if path.exists() else 0
+        self.size = size
+        self.data: BinaryIO = open_binary(path, "ab", buffer_size)
+        self.index: TextIO = open(path.parent / INDEX_FILENAME, "a", encoding="utf-8")
+        self.span: _Span | None = None
+        self.entries: list[dict[str, Any]] = []
+        self.pending = 0
+
+    def append(self, query_index: int | None, line: bytes) -> None:
+        span = self.span
+        if span is None or span.query_index != query_index:
+            self._close_span()
+            span = self.span = _Span(query_index, self.size)
+        self.data.write(line)
+        span.length += len(line)
+        span.count += 1
+        self.size += len(line)
+        self.pending += 1
+
+    def complete(self, query_index: int, count: int) -> None:
+        self._close_span()
+        self.entries.append({"query_index": query_index, "complete": count})
+        self.pending += 1
+
+    def _close_span(self) -> None:
+        if self.span is not None:
+            self.entries.append(self.span.entry())
+            self.span = None
+
+    def flush(self) -> None:
+        """Write buffered judgments, then the index entries describing them."""
+        self._close_span()
+        self.data.flush()
+        if self._fsync:
+            os.fsync(self.data.fileno())
+        if self.entries:
+            self.index.write("".join(json.dumps(e) + "\n" for e in self.entries))
+            self.index.flush()
+            if self._fsync:
+                os.fsync(self.index.fileno())
+            self.entries.clear()
+        self.pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.data.close()
+        if self.compressed:
+            # Lets the next reader trust self.size instead of decompressing
+            self.index.write(json.dumps(_seal_entry(self.path, self.size)) + "\n")
+            self.index.flush()
+            if self._fsync:
+                os.fsync(self.index.fileno())
+        self.index.close()
+
+
+def _encode_product(product: dict[str, Any]) -> tuple[str, str]:
+    """Return the canonical JSON of *product* and the hash addressing it."""
+    encoded = json.dumps(product, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32], encoded
+
+
+# Every products line starts with its hash: {"hash": "<32 hex digits>", ...
+_REF_PREFIX = b'{"hash": "'
+_REF_END = len(_REF_PREFIX) + 32
+
+
+class _ProductStore:
+    """Content-addressed ``products.jsonl`` of one experiment.
+
+    Each line holds one product, without its position, under the hash of
+    its canonical JSON.  The file lives in the experiment directory, so
+    like ``judgments.jsonl`` it has a single writer, and a torn end left
+    by a writer that died is cut before appending after it.
+    """
+
+    def __init__(self, path: Path, buffer_size: int, fsync: bool) -> None:
+        self._fsync = fsync
+        self.path = path
+        self.known: set[str] = set()
+        if path.exists():
+            repair(path)
+            self.known.update(self.refs(path))
+        self.data: BinaryIO = open_binary(path, "ab", buffer_size)
+
+    @staticmethod
+    def refs(path: Path) -> Iterator[str]:
+        """Yield the hash of each stored product without parsing the product."""
+        for line in iter_lines(path):
+            if line.startswith(_REF_PREFIX) and line.endswith(b"\n"):
+                yield line[len(_REF_PREFIX) : _REF_END].decode("ascii", "replace")
+
+    @staticmethod
+    def load(path: Path) -> dict[str, dict[str, Any]]:
+        """Map each stored product hash to its fields."""
+        products: dict[str, dict[str, Any]] = {}
+        for line in iter_lines(path):
+            try:
+                entry = json.loads(line)
+                products[entry["hash"]] = entry["product"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # A torn last line only loses a product that no flushed
+                # judgment references yet.
+                continue
+        return products
+
+    def add(self, ref: str, encoded: str) -> None:
+        """Append the product encoded as *encoded* unless already stored."""
+        if ref not in self.known:
+            line = '{"hash": "' + ref + '", "product": ' + encoded + "}\n"
+            self.data.write(line.encode("utf-8"))
+            self.known.add(ref)
+
+    def flush(self) -> None:
+        self.data.flush()
+        if self._fsync:
+            os.fsync(self.data.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        self.data.close()
+
+
+def _rehydrate(
+    data: dict[str, Any], products: dict[str, dict[str, Any]]
+) -> SearchResult:
+    """Return the product of a stored judgment, popping its product keys."""
+    if "product" in data:
+        # Written before products were interned
+        return SearchResult(**data.pop("product"))
+    fields = products[data.pop("product_ref")]
+    return SearchResult(
+        **{
+            **fields,
+            "attributes": dict(fields.get("attributes", {})),
+            "metadata": dict(fields.get("metadata", {})),
+        },
+        position=data.pop("position"),
+    )
+
 
 class FileBackend(EvalBackend):
     """Zero-infrastructure backend that stores everything in local files.
 
     Output structure:
         {output_dir}/{experiment}/
-            judgments.jsonl  - All LLM judgments
-            config.json      - Experiment configuration
-            metrics.json     - Computed IR metrics (written by CLI)
-            report.html      - HTML report (written by CLI)
+            judgments.jsonl        - All LLM judgments
+            products.jsonl         - Judged products, stored once by hash
+            judgments.index.jsonl  - Byte ranges and counts per query
+            config.json            - Experiment configuration
+            metrics.json           - Computed IR metrics (written by CLI)
+            report.html            - HTML report (written by CLI)
+
+    Each experiment's ``judgments.jsonl`` stays open for appending behind a
+    *buffer_size* byte buffer.  The buffer is flushed to the OS once
+    *flush_every* records are pending (the default of 1 flushes after every
+    ``log_judgment``/``log_judgments`` call), and with *fsync* each flush is
+    also synced to disk.  Reads flush first; :meth:`close` or leaving a
+    ``with`` block flushes and closes every handle.
+
+    The index is appended after the judgments it describes, so it only
+    covers complete lines.  It records the byte range and judgment count
+    of each run of same-query lines, plus the count of every query the
+    pipeline finished (:meth:`log_query_complete`).  Resuming reads the
+    index instead of the judgments, and cuts ``judgments.jsonl`` back to
+    before the first query that was still being judged.  Files written
+    before the index existed are indexed once, on resume.
+
+    Judgments reference their product by the hash of its content plus
+    its position in the results.  The products themselves are written
+    once to the experiment's ``products.jsonl``, so a product seen for
+    many queries is stored a single time.  It is flushed before the
+    judgments that reference it.  :meth:`get_judgments` rehydrates the
+    products, and still reads lines that embed the whole product.
+
+    With *compression* (``"gzip"``, or ``"zstd"`` when the ``zstandard``
+    package is installed) new judgments and products files are written
+    as ``judgments.jsonl.gz``/``.zst`` and streamed through the codec on
+    both write and read.  Existing files are found by extension and keep
+    the format they were created with, so resuming works whatever
+    *compression* is passed.  Index offsets count decompressed bytes.
+    Closing a compressed file seals it in the index with its decompressed
+    end and on-disk size and mtime, which later opens trust instead of
+    decompressing the file while both still match.
     """
 
-    def __init__(self, output_dir: str = "./eval-results") -> None:
+    def __init__(
+        self,
+        output_dir: str = "./eval-results",
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_every: int = 1,
+        fsync: bool = False,
+        compression: str | None = None,
+    ) -> None:
+        check_compression(compression)
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be >= 1, got {buffer_size}")
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
         self._output_dir = Path(output_dir)
+        self._buffer_size = buffer_size
+        self._flush_every = flush_every
+        self._fsync = fsync
+        self._compression = compression
+        self._logs: dict[str, _JudgmentLog] = {}
+        self._products: dict[str, _ProductStore] = {}
+        # Concurrent pipelines log from worker threads
+        self._lock = threading.Lock()
         logger.debug("file backend: output_dir=%s", output_dir)
 
     def _experiment_dir(self, experiment: str) -> Path:
@@ -39,14 +399,97 @@ class FileBackend(EvalBackend):
         """Return the experiment directory path without creating it."""
         return self._output_dir / experiment
 
+    def _data_path(self, path: Path) -> Path:
+        """Return the existing variant of *path*, or its name for new data."""
+        return find_existing(path) or compressed_path(path, self._compression)
+
+    def _log(self, experiment: str) -> _JudgmentLog:
+        """Return the open judgment log of *experiment*; caller holds the lock."""
+        log = self._logs.get(experiment)
+        if log is None:
+            path = self._data_path(
+                self._experiment_dir(experiment) / JUDGMENTS_FILENAME
+            )
+            log = _JudgmentLog(path, self._buffer_size, self._fsync)
+            self._logs[experiment] = log
+        return log
+
+    def _product_store(self, experiment: str) -> _ProductStore:
+        """Return *experiment*'s open products file; caller holds the lock."""
+        store = self._products.get(experiment)
+        if store is None:
+            path = self._data_path(self._experiment_dir(experiment) / PRODUCTS_FILENAME)
+            store = _ProductStore(path, self._buffer_size, self._fsync)
+            self._products[experiment] = store
+        return store
+
+    def _flush(self, experiment: str) -> None:
+        """Flush *experiment*'s products, then its judgments; caller holds the lock."""
+        store = self._products.get(experiment)
+        if store is not None:
+            store.flush()
+        log = self._logs.get(experiment)
+        if log is not None:
+            log.flush()
+
+    def _close_log(self, experiment: str) -> None:
+        """Flush and close *experiment*'s files; caller holds the lock."""
+        self._flush(experiment)
+        store = self._products.pop(experiment, None)
+        if store is not None:
+            store.close()
+        log = self._logs.pop(experiment, None)
+        if log is not None:
+            log.close()
+
+    def _written(self, experiment: str) -> None:
+        if self._logs[experiment].pending >= self._flush_every:
+            self._flush(experiment)
+
     def log_judgment(self, judgment: JudgmentRecord) -> None:
         """Append a judgment record as a JSON line."""
-        exp_dir = self._experiment_dir(judgment.experiment)
-        judgments_file = exp_dir / "judgments.jsonl"
+        self.log_judgments([judgment])
+
+    def log_judgments(self, judgments: Sequence[JudgmentRecord]) -> None:
+        """Append judgment records as JSON lines in one buffered write each."""
+        lines = []
+        for judgment in judgments:
+            record = asdict(judgment)
+            product = record.pop("product")
+            position = product.pop("position")
+            ref, encoded = _encode_product(product)
+            stored = {
+                "query": record.pop("query"),
+                "product_ref": ref,
+                "position": position,
+                **record,
+            }
+            lines.append(
+                (
+                    judgment.experiment,
+                    judgment.metadata.get("query_index"),
+                    ref,
+                    encoded,
+                    (json.dumps(stored, default=str) + "\n").encode("utf-8"),
+                )
+            )
+        with self._lock:
+            touched: set[str] = set()
+            for experiment, query_index, ref, encoded, line in lines:
+                self._product_store(experiment).add(ref, encoded)
+                log = self._log(experiment)
+                touched.add(experiment)
+                log.append(None if query_index is None else int(query_index), line)
+            for experiment in touched:
+                self._written(experiment)
 
-        record = asdict(judgment)
-        with open(judgments_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, default=str) + "\n")
+    def log_query_complete(
+        self, experiment: str, query_index: int, judgment_count: int
+    ) -> None:
+        """Record that *query_index* finished with *judgment_count* judgments."""
+        with self._lock:
+            self._log(experiment).complete(query_index, judgment_count)
+            self._written(experiment)
 
     def log_experiment(
         self, name: str, config: dict[str, Any], *, resume: bool = False
@@ -54,37 +497,148 @@ class FileBackend(EvalBackend):
         """Write experiment configuration to a JSON file."""
         exp_dir = self._experiment_dir(name)
         config_file = exp_dir / "config.json"
-        judgments_file = exp_dir / "judgments.jsonl"
 
         with open(config_file, "w", encoding="utf-8") as f:
             json.dump({"name": name, **config}, f, indent=2, default=str)
 
         logger.debug("experiment registered: %s, resume=%s", name, resume)
-        if not resume:
-            # One experiment run should produce one deterministic judgments file.
-            judgments_file.write_text("", encoding="utf-8")
+        with self._lock:
+            self._close_log(name)
+            if resume:
+                self._prepare_resume(exp_dir)
+            else:
+                # One experiment run should produce one deterministic judgments
+                # file.
+                for filename in (JUDGMENTS_FILENAME, PRODUCTS_FILENAME):
+                    write_bytes(
+                        compressed_path(exp_dir / filename, self._compression), b""
+                    )
+                (exp_dir / INDEX_FILENAME).write_text("", encoding="utf-8")
+
+    @staticmethod
+    def _current(index: _Index | None, size: int, path: Path) -> _Index | None:
+        """Return *index* if it describes *size* bytes of judgments *path*."""
+        if index is not None and not index.covers(size):
+            logger.debug("judgments index out of date for %s", path)
+            return None
+        return index
+
+    def _prepare_resume(self, exp_dir: Path) -> None:
+        """Cut judgments of unfinished queries and rewrite the index.
+
+        Caller holds the lock and has closed the experiment's log.
+        """
+        judgments_file = find_existing(exp_dir / JUDGMENTS_FILENAME)
+        if judgments_file is None:
+            return
+        index = _Index.find(judgments_file)
+        compressed = codec(judgments_file) is not None
+        size = (
+            index.sealed_size(judgments_file)
+            if compressed and index is not None
+            else None
+        )
+        if size is None:
+            size = repair(judgments_file)
+        index = self._current(index, size, judgments_file)
+        if index is None:
+            # Written before the index existed, or the index is damaged:
+            # index the file in one pass, treating every query as finished.
+            index = _Index(spans=list(_scan_spans(judgments_file)))
+            index.complete = index.counts()
+            logger.debug(
+                "indexed %d judgment line(s) in %s", len(index.spans), judgments_file
+            )
+
+        completed = index.completed()
+        cut = min(
+            (
+                span.offset
+                for span in index.spans
+                if span.query_index is not None and span.query_index not in completed
+            ),
+            default=index.end,
+        )
+        kept = [span for span in index.spans if span.offset < cut]
+        dropped = {span.query_index for span in index.spans if span.offset >= cut} - {
+            None
+        }
+        if cut < size:
+            logger.debug(
+                "resume: dropping %d byte(s) of judgments for %d unfinished "
+                "query(ies) in %s",
+                size - cut,
+                len(dropped),
+                judgments_file,
+            )
+            truncate(judgments_file, cut)
+
+        entries = [span.entry() for span in kept]
+        entries.extend(
+            {"query_index": qi, "complete": n}
+            for qi, n in index.complete.items()
+            if qi in completed and qi not in dropped
+        )
+        if compressed:
+            entries.append(_seal_entry(judgments_file, min(cut, size)))
+        tmp_file = exp_dir / f"{INDEX_FILENAME}.tmp"
+        tmp_file.write_text(
+            "".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8"
+        )
+        os.replace(tmp_file, exp_dir / INDEX_FILENAME)
+
+    def flush(self) -> None:
+        """Flush every open products and judgments file."""
+        with self._lock:
+            for experiment in list(self._logs):
+                self._flush(experiment)
+
+    def close(self) -> None:
+        """Flush and close every open products and judgments file."""
+        with self._lock:
+            for experiment in {*self._logs, *self._products}:
+                self._close_log(experiment)
 
     def get_completed_query_indices(self, experiment: str) -> set[int]:
-        """Return query indices that already have judgments on disk."""
-        exp_dir = self._experiment_path(experiment)
-        judgments_file = exp_dir / "judgments.jsonl"
+        """Return the queries whose judgments were all logged.
 
-        if not judgments_file.exists():
+        Read from the index when it is current.  Otherwise every query
+        with a judgment in ``judgments.jsonl`` counts as completed.
+        """
+        judgments_file = find_existing(
+            self._experiment_path(experiment) / JUDGMENTS_FILENAME
+        )
+        if judgments_file is None:
             return set()
+        with self._lock:
+            self._flush(experiment)
+            log = self._logs.get(experiment)
+            index = _Index.find(judgments_file)
+            size = log.size if log is not None else _stored_size(judgments_file, index)
+            index = self._current(index, size, judgments_file)
+        if index is not None:
+            indices = index.completed()
+            partial = set(index.counts()) - indices
+            logger.debug(
+                "resume: %d completed and %d partially judged queries for %s",
+                len(indices),
+                len(partial),
+                experiment,
+            )
+            return indices
 
-        indices: set[int] = set()
-        with open(judgments_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    qi = data.get("metadata", {}).get("query_index")
-                    if qi is not None:
-                        indices.add(int(qi))
-                except (json.JSONDecodeError, ValueError, TypeError):
-                    continue
+        indices = set()
+        for line in iter_lines(judgments_file):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                qi = data.get("metadata", {}).get("query_index")
+                if qi is not None:
+                    indices.add(int(qi))
+            except (json.JSONDecodeError, ValueError, TypeError):
+                continue
         logger.debug(
             "resume: %d completed query indices for %s",
             len(indices),
@@ -93,29 +647,33 @@ class FileBackend(EvalBackend):
         return indices
 
     def get_judgments(self, experiment: str) -> list[JudgmentRecord]:
-        """Read all judgments from JSONL file."""
-        exp_dir = self._experiment_path(experiment)
-        judgments_file = exp_dir / "judgments.jsonl"
-
-        if not judgments_file.exists():
+        """Read all judgments from JSONL file, rehydrating their products."""
+        with self._lock:
+            self._flush(experiment)
+        judgments_file = find_existing(
+            self._experiment_path(experiment) / JUDGMENTS_FILENAME
+        )
+        if judgments_file is None:
             return []
 
+        products_file = find_existing(
+            self._experiment_path(experiment) / PRODUCTS_FILENAME
+        )
+        products = _ProductStore.load(products_file) if products_file else {}
         judgments: list[JudgmentRecord] = []
-        with open(judgments_file, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    product_data = data.pop("product")
-                    data.setdefault("attribute_verdict", "n/a")
-                    product = SearchResult(**product_data)
-                    judgments.append(JudgmentRecord(product=product, **data))
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
-                    warnings.warn(
-                        f"Skipping corrupted line {line_num} in {judgments_file}: {e}",
-                        stacklevel=2,
-                    )
+        for line_num, line in enumerate(iter_lines(judgments_file), 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = json.loads(line)
+                product = _rehydrate(data, products)
+                data.setdefault("attribute_verdict", "n/a")
+                judgments.append(JudgmentRecord(product=product, **data))
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+                warnings.warn(
+                    f"Skipping corrupted line {line_num} in {judgments_file}: {e}",
+                    stacklevel=2,
+                )
 
         return judgments
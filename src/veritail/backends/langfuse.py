@@ -253,3 +253,7 @@ class LangfuseBackend(EvalBackend):
             value=float(judgment.diversity_score),
             comment=judgment.reasoning,
         )
+
+    def close(self) -> None:
+        """Send any queued events to Langfuse."""
+        self._client.flush()
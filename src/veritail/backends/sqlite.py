@@ -0,0 +1,510 @@
+"""SQLite evaluation backend with indexed judgments, checks and corrections."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from veritail.backends import EvalBackend
+from veritail.types import (
+    CheckResult,
+    CorrectionJudgment,
+    JudgmentRecord,
+    SearchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+DATABASE_FILENAME = "veritail.sqlite"
+
+DEFAULT_COMMIT_EVERY = 1000
+DEFAULT_COMMIT_INTERVAL = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS experiments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    product_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (product_id, content_hash)
+);
+CREATE TABLE IF NOT EXISTS judgments (
+    id INTEGER PRIMARY KEY,
+    experiment_id INTEGER NOT NULL REFERENCES experiments (id),
+    query_index INTEGER,
+    query TEXT NOT NULL,
+    product INTEGER NOT NULL REFERENCES products (id),
+    position INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    reasoning TEXT NOT NULL,
+    model TEXT NOT NULL,
+    attribute_verdict TEXT NOT NULL,
+    query_type TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS judgments_experiment_query
+    ON judgments (experiment_id, query_index);
+CREATE INDEX IF NOT EXISTS judgments_product ON judgments (product);
+CREATE TABLE IF NOT EXISTS completed_queries (
+    experiment_id INTEGER NOT NULL REFERENCES experiments (id),
+    query_index INTEGER NOT NULL,
+    judgment_count INTEGER NOT NULL,
+    PRIMARY KEY (experiment_id, query_index)
+);
+CREATE TABLE IF NOT EXISTS checks (
+    id INTEGER PRIMARY KEY,
+    experiment_id INTEGER NOT NULL REFERENCES experiments (id),
+    check_name TEXT NOT NULL,
+    query TEXT NOT NULL,
+    product_id TEXT,
+    passed INTEGER NOT NULL,
+    detail TEXT NOT NULL,
+    severity TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checks_experiment ON checks (experiment_id);
+CREATE INDEX IF NOT EXISTS checks_product_id ON checks (product_id);
+CREATE TABLE IF NOT EXISTS correction_judgments (
+    id INTEGER PRIMARY KEY,
+    experiment_id INTEGER NOT NULL REFERENCES experiments (id),
+    original_query TEXT NOT NULL,
+    corrected_query TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    reasoning TEXT NOT NULL,
+    model TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS correction_judgments_experiment
+    ON correction_judgments (experiment_id);
+"""
+
+# Tables holding one experiment's rows, cleared when a run starts over
+_EXPERIMENT_TABLES = (
+    "judgments",
+    "completed_queries",
+    "checks",
+    "correction_judgments",
+)
+
+# Finished queries whose judgment count still matches the completion record
+_COMPLETED_QUERIES = """
+SELECT c.query_index FROM completed_queries c
+WHERE c.experiment_id = :experiment AND c.judgment_count = (
+    SELECT COUNT(*) FROM judgments j
+    WHERE j.experiment_id = :experiment AND j.query_index = c.query_index
+)
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+class SqliteBackend(EvalBackend):
+    """Backend storing every experiment in one SQLite database.
+
+    Output structure:
+        {output_dir}/veritail.sqlite    - Judgments, checks and corrections
+        {output_dir}/{experiment}/
+            config.json                 - Experiment configuration
+            metrics.json                - Computed IR metrics (written by CLI)
+            report.html                 - HTML report (written by CLI)
+
+    Products are stored once per distinct content and referenced from each
+    judgment, so a product returned for many queries costs one row.  The
+    database runs in WAL mode and writes are grouped into transactions of
+    up to *commit_every* rows or *commit_interval* seconds, whichever comes
+    first; reads and :meth:`close` commit whatever is pending.  A crash
+    loses at most the uncommitted tail, which ``--resume`` judges again.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "./eval-results",
+        *,
+        commit_every: int = DEFAULT_COMMIT_EVERY,
+        commit_interval: float = DEFAULT_COMMIT_INTERVAL,
+    ) -> None:
+        if commit_every < 1:
+            raise ValueError(f"commit_every must be >= 1, got {commit_every}")
+        if commit_interval <= 0:
+            raise ValueError(f"commit_interval must be > 0, got {commit_interval}")
+        self._output_dir = Path(output_dir)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._path = self._output_dir / DATABASE_FILENAME
+        self._commit_every = commit_every
+        self._commit_interval = commit_interval
+        self._lock = threading.Lock()
+        # Pipelines may log from worker threads; the lock serializes access.
+        self._conn = sqlite3.connect(
+            str(self._path), timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._experiment_ids: dict[str, int] = {}
+        self._product_ids: dict[tuple[str, str], int] = {}
+        self._pending = 0
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        logger.debug("sqlite backend: path=%s", self._path)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _experiment_id(self, name: str) -> int:
+        cached = self._experiment_ids.get(name)
+        if cached is not None:
+            return cached
+        self._conn.execute(
+            "INSERT OR IGNORE INTO experiments (name, config) VALUES (?, '{}')",
+            (name,),
+        )
+        row = self._conn.execute(
+            "SELECT id FROM experiments WHERE name = ?", (name,)
+        ).fetchone()
+        self._experiment_ids[name] = int(row[0])
+        return int(row[0])
+
+    def _product_ref(self, product: SearchResult) -> int:
+        data = asdict(product)
+        # Position belongs to the judgment, so the same product returned at
+        # different ranks still shares one row.
+        del data["position"]
+        encoded = json.dumps(data, sort_keys=True, default=str)
+        key = (product.product_id, hashlib.sha256(encoded.encode()).hexdigest())
+        cached = self._product_ids.get(key)
+        if cached is not None:
+            return cached
+        self._conn.execute(
+            "INSERT OR IGNORE INTO products (product_id, content_hash, data) "
+            "VALUES (?, ?, ?)",
+            (*key, encoded),
+        )
+        row = self._conn.execute(
+            "SELECT id FROM products WHERE product_id = ? AND content_hash = ?", key
+        ).fetchone()
+        self._product_ids[key] = int(row[0])
+        return int(row[0])
+
+    def _wrote(self, rows: int = 1) -> None:
+        self._pending += rows
+        if self._pending >= self._commit_every:
+            self._commit()
+        elif self._timer is None:
+            # Commit a quiet tail too, so it neither waits for the next write
+            # nor holds the write lock other connections need.
+            self._timer = threading.Timer(self._commit_interval, self._commit_later)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _commit_later(self) -> None:
+        with self._lock:
+            if not self._closed:
+                self._commit()
+
+    def _commit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            logger.debug("sqlite backend: committing %d row(s)", self._pending)
+        self._conn.commit()
+        self._pending = 0
+
+    def log_judgment(self, judgment: JudgmentRecord) -> None:
+        """Insert a judgment, interning its product."""
+        self.log_judgments([judgment])
+
+    def log_judgments(self, judgments: Sequence[JudgmentRecord]) -> None:
+        """Insert judgments with one statement, interning their products."""
+        if not judgments:
+            return
+        with self._lock:
+            rows = []
+            for judgment in judgments:
+                query_index = judgment.metadata.get("query_index")
+                rows.append(
+                    (
+                        self._experiment_id(judgment.experiment),
+                        None if query_index is None else int(query_index),
+                        judgment.query,
+                        self._product_ref(judgment.product),
+                        judgment.product.position,
+                        judgment.score,
+                        judgment.reasoning,
+                        judgment.model,
+                        judgment.attribute_verdict,
+                        judgment.query_type,
+                        _dumps(judgment.metadata),
+                    )
+                )
+            self._conn.executemany(
+                "INSERT INTO judgments (experiment_id, query_index, query, "
+                "product, position, score, reasoning, model, attribute_verdict, "
+                "query_type, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._wrote(len(rows))
+
+    def log_query_complete(
+        self, experiment: str, query_index: int, judgment_count: int
+    ) -> None:
+        """Record that *query_index* finished with *judgment_count* judgments."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completed_queries VALUES (?, ?, ?)",
+                (self._experiment_id(experiment), query_index, judgment_count),
+            )
+            self._wrote()
+
+    def log_correction_judgment(self, judgment: CorrectionJudgment) -> None:
+        """Insert a correction judgment."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO correction_judgments (experiment_id, original_query, "
+                "corrected_query, verdict, reasoning, model, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._experiment_id(judgment.experiment),
+                    judgment.original_query,
+                    judgment.corrected_query,
+                    judgment.verdict,
+                    judgment.reasoning,
+                    judgment.model,
+                    _dumps(judgment.metadata),
+                ),
+            )
+            self._wrote()
+
+    def log_checks(self, experiment: str, checks: list[CheckResult]) -> None:
+        """Replace the stored check results of *experiment*."""
+        with self._lock:
+            experiment_id = self._experiment_id(experiment)
+            self._conn.execute(
+                "DELETE FROM checks WHERE experiment_id = ?", (experiment_id,)
+            )
+            self._conn.executemany(
+                "INSERT INTO checks (experiment_id, check_name, query, product_id, "
+                "passed, detail, severity) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        experiment_id,
+                        c.check_name,
+                        c.query,
+                        c.product_id,
+                        int(c.passed),
+                        c.detail,
+                        c.severity,
+                    )
+                    for c in checks
+                ],
+            )
+            self._commit()
+
+    def log_experiment(
+        self, name: str, config: dict[str, Any], *, resume: bool = False
+    ) -> None:
+        """Record the configuration and reset the experiment's rows.
+
+        A fresh run drops all of them; a resumed run drops the judgments of
+        queries that never finished.
+
+        ``config.json`` is also written to the experiment directory, which
+        the CLI reads to detect configuration changes on ``--resume``.
+        """
+        exp_dir = self._output_dir / name
+        exp_dir.mkdir(parents=True, exist_ok=True)
+        with open(exp_dir / "config.json", "w", encoding="utf-8") as f:
+            json.dump({"name": name, **config}, f, indent=2, default=str)
+
+        with self._lock:
+            experiment_id = self._experiment_id(name)
+            self._conn.execute(
+                "UPDATE experiments SET config = ? WHERE id = ?",
+                (_dumps(config), experiment_id),
+            )
+            if resume:
+                # Judgments of queries interrupted halfway are judged again
+                dropped = self._conn.execute(
+                    "DELETE FROM judgments WHERE experiment_id = :experiment "
+                    "AND query_index IS NOT NULL "
+                    f"AND query_index NOT IN ({_COMPLETED_QUERIES})",
+                    {"experiment": experiment_id},
+                ).rowcount
+                if dropped:
+                    logger.debug(
+                        "resume: dropped %d judgment(s) of unfinished queries",
+                        dropped,
+                    )
+            else:
+                for table in _EXPERIMENT_TABLES:
+                    self._conn.execute(
+                        f"DELETE FROM {table} WHERE experiment_id = ?",
+                        (experiment_id,),
+                    )
+            self._commit()
+        logger.debug("experiment registered: %s, resume=%s", name, resume)
+
+    def _lookup_experiment(self, name: str) -> int | None:
+        """Return the id of an existing experiment; caller holds the lock."""
+        if name in self._experiment_ids:
+            return self._experiment_ids[name]
+        row = self._conn.execute(
+            "SELECT id FROM experiments WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def get_completed_query_indices(self, experiment: str) -> set[int]:
+        """Return the queries whose judgments were all logged."""
+        with self._lock:
+            self._commit()
+            experiment_id = self._lookup_experiment(experiment)
+            if experiment_id is None:
+                return set()
+            rows = self._conn.execute(
+                _COMPLETED_QUERIES, {"experiment": experiment_id}
+            ).fetchall()
+        indices = {int(row[0]) for row in rows}
+        logger.debug(
+            "resume: %d completed query indices for %s", len(indices), experiment
+        )
+        return indices
+
+    def has_judgments(self, experiment: str) -> bool:
+        """Whether any judgment is stored for *experiment*."""
+        with self._lock:
+            self._commit()
+            experiment_id = self._lookup_experiment(experiment)
+            if experiment_id is None:
+                return False
+            row = self._conn.execute(
+                "SELECT 1 FROM judgments WHERE experiment_id = ? LIMIT 1",
+                (experiment_id,),
+            ).fetchone()
+        return row is not None
+
+    def get_judgments(self, experiment: str) -> list[JudgmentRecord]:
+        """Return the judgments of *experiment* in the order they were logged."""
+        with self._lock:
+            self._commit()
+            experiment_id = self._lookup_experiment(experiment)
+            if experiment_id is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT j.query, j.product, p.data, j.position, j.score, "
+                "j.reasoning, j.model, j.attribute_verdict, j.query_type, "
+                "j.metadata FROM judgments j JOIN products p ON p.id = j.product "
+                "WHERE j.experiment_id = ? ORDER BY j.id",
+                (experiment_id,),
+            ).fetchall()
+
+        products: dict[int, dict[str, Any]] = {}
+        judgments: list[JudgmentRecord] = []
+        for (
+            query,
+            product_ref,
+            product_data,
+            position,
+            score,
+            reasoning,
+            model,
+            attribute_verdict,
+            query_type,
+            metadata,
+        ) in rows:
+            fields = products.get(product_ref)
+            if fields is None:
+                fields = products[product_ref] = json.loads(product_data)
+            judgments.append(
+                JudgmentRecord(
+                    query=query,
+                    product=SearchResult(**fields, position=position),
+                    score=score,
+                    reasoning=reasoning,
+                    model=model,
+                    experiment=experiment,
+                    attribute_verdict=attribute_verdict,
+                    query_type=query_type,
+                    metadata=json.loads(metadata),
+                )
+            )
+        return judgments
+
+    def get_checks(self, experiment: str) -> list[CheckResult]:
+        """Return the check results stored for *experiment*."""
+        with self._lock:
+            self._commit()
+            experiment_id = self._lookup_experiment(experiment)
+            if experiment_id is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT check_name, query, product_id, passed, detail, severity "
+                "FROM checks WHERE experiment_id = ? ORDER BY id",
+                (experiment_id,),
+            ).fetchall()
+        return [
+            CheckResult(
+                check_name=check_name,
+                query=query,
+                product_id=product_id,
+                passed=bool(passed),
+                detail=detail,
+                severity=severity,
+            )
+            for check_name, query, product_id, passed, detail, severity in rows
+        ]
+
+    def get_correction_judgments(self, experiment: str) -> list[CorrectionJudgment]:
+        """Return the correction judgments stored for *experiment*."""
+        with self._lock:
+            self._commit()
+            experiment_id = self._lookup_experiment(experiment)
+            if experiment_id is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT original_query, corrected_query, verdict, reasoning, model, "
+                "metadata FROM correction_judgments WHERE experiment_id = ? "
+                "ORDER BY id",
+                (experiment_id,),
+            ).fetchall()
+        return [
+            CorrectionJudgment(
+                original_query=original_query,
+                corrected_query=corrected_query,
+                verdict=verdict,
+                reasoning=reasoning,
+                model=model,
+                experiment=experiment,
+                metadata=json.loads(metadata),
+            )
+            for (
+                original_query,
+                corrected_query,
+                verdict,
+                reasoning,
+                model,
+                metadata,
+            ) in rows
+        ]
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._conn.close()
+            self._closed = True
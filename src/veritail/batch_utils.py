@@ -1,16 +1,23 @@
-"""Shared polling helper for batch evaluation pipelines."""
+"""Shared sharding and polling helpers for batch evaluation pipelines."""
 
 from __future__ import annotations
 
 import logging
 import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
-from rich.progress import Progress, TaskID
+from rich.progress import (
+    BarColumn,
+    Progress,
+    TaskID,
+    TaskProgressColumn,
+    TextColumn,
+)
 
-from veritail.llm.client import LLMClient
+from veritail.llm.client import BatchRequest, LLMClient
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -36,107 +43,462 @@ class BatchCancelledError(Exception):
         super().__init__(message)
 
 
+# Per-request allowance for the provider's JSON envelope (ids, model name,
+# message roles, token limit) on top of the prompt text itself.
+_REQUEST_OVERHEAD_BYTES = 512
+
+# Fraction of the provider's byte limit a shard may fill, leaving headroom
+# for the estimate above.
+_BYTES_HEADROOM = 0.9
+
+DEFAULT_SUBMIT_WORKERS = 4
+
+
+def _request_bytes(request: BatchRequest) -> int:
+    return (
+        len(request.system_prompt.encode("utf-8"))
+        + len(request.user_prompt.encode("utf-8"))
+        + len(request.custom_id)
+        + _REQUEST_OVERHEAD_BYTES
+    )
+
+
+def shard_requests(
+    requests: Sequence[BatchRequest],
+    *,
+    max_requests: int | None = None,
+    max_bytes: int | None = None,
+) -> list[list[BatchRequest]]:
+    """Split *requests* into consecutive shards within a provider's limits.
+
+    A shard holds at most *max_requests* requests and an estimated payload of
+    at most 90% of *max_bytes*.  A single request larger than the byte limit
+    still gets a shard of its own, so the provider reports the error.
+    Returns an empty list for no requests and a single shard when no limit
+    is set.
+    """
+    if max_requests is not None and max_requests < 1:
+        raise ValueError(f"max_requests must be >= 1, got {max_requests}")
+    byte_budget = int(max_bytes * _BYTES_HEADROOM) if max_bytes is not None else None
+
+    shards: list[list[BatchRequest]] = []
+    current: list[BatchRequest] = []
+    current_bytes = 0
+    for request in requests:
+        size = _request_bytes(request) if byte_budget is not None else 0
+        full = (max_requests is not None and len(current) >= max_requests) or (
+            byte_budget is not None and current_bytes + size > byte_budget
+        )
+        if current and full:
+            shards.append(current)
+            current = []
+            current_bytes = 0
+        current.append(request)
+        current_bytes += size
+    if current:
+        shards.append(current)
+    return shards
+
+
+def shard_for_client(
+    llm_client: LLMClient, requests: Sequence[BatchRequest]
+) -> list[list[BatchRequest]]:
+    """Split *requests* using the limits advertised by *llm_client*."""
+
+    def _limit(value: object) -> int | None:
+        # Client wrappers and test doubles may not define real limits.
+        return value if isinstance(value, int) and value > 0 else None
+
+    return shard_requests(
+        requests,
+        max_requests=_limit(getattr(llm_client, "max_batch_requests", None)),
+        max_bytes=_limit(getattr(llm_client, "max_batch_bytes", None)),
+    )
+
+
+def group_by_system_prompt(requests: Iterable[BatchRequest]) -> list[BatchRequest]:
+    """Order *requests* so those sharing a system prompt are adjacent.
+
+    Providers with automatic prefix caching then cache each system prompt
+    once and hit it with the requests that follow.  The sort is stable.
+    """
+    return sorted(requests, key=lambda r: r.system_prompt)
+
+
+def submit_shards(
+    llm_client: LLMClient,
+    shards: Sequence[Sequence[BatchRequest]],
+    *,
+    max_workers: int = DEFAULT_SUBMIT_WORKERS,
+) -> list[str]:
+    """Submit every shard as its own batch and return the IDs in shard order.
+
+    Each shard is grouped by system prompt (:func:`group_by_system_prompt`)
+    and uploaded concurrently with the others.  If any submission raises,
+    the error propagates once the submissions already in flight have
+    finished, and the batches that were created are cancelled so none run
+    unrecorded.
+    """
+    if len(shards) <= 1:
+        return [llm_client.submit_batch(group_by_system_prompt(s)) for s in shards]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(shards))) as pool:
+        futures = [
+            pool.submit(llm_client.submit_batch, group_by_system_prompt(s))
+            for s in shards
+        ]
+    batch_ids: list[str] = []
+    error: BaseException | None = None
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            error = error or exc
+        else:
+            batch_ids.append(future.result())
+    if error is not None:
+        for batch_id in batch_ids:
+            try:
+                llm_client.cancel_batch(batch_id)
+            except Exception as e:
+                logger.warning(
+                    "batch shard submission failed; could not cancel shard %s: %s",
+                    batch_id,
+                    e,
+                )
+            else:
+                logger.debug("cancelled submitted shard %s", batch_id)
+        raise error
+    logger.debug("submitted %d batch shards: %s", len(batch_ids), batch_ids)
+    return batch_ids
+
+
+DEFAULT_MIN_POLL_INTERVAL = 5.0
+DEFAULT_MAX_POLL_INTERVAL = 600.0
+
+# How long a cancelled batch may take to stop before its partial results
+# are given up on
+DEFAULT_CANCEL_GRACE = 60.0
+_CANCEL_POLL_INTERVAL = 2.0
+# Rough duration of one synchronous judging call, used to stop polling
+# early enough before a deadline to judge the unfinished requests
+STRAGGLER_CALL_SECONDS = 10.0
+
+# Growth factor for the polling interval while a batch reports no progress
+_POLL_BACKOFF = 1.5
+
+
+class PollSchedule:
+    """Adaptive polling interval and completion estimate for one batch.
+
+    Polling starts every *initial* seconds.  Once two polls show progress,
+    the completion rate gives an ETA and the next poll is scheduled after
+    half of it, so checks get more frequent as the batch nears the end.
+    While progress is flat, the interval grows by half each poll.  The
+    interval stays within *min_interval* and *max_interval*, widened to
+    include *initial*.  :attr:`stalled_for` is the time since the
+    completed count last increased.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        *,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min = min(min_interval, initial)
+        self._max = max(max_interval, initial)
+        self._clock = clock
+        self._last: tuple[float, int] | None = None
+        self._rate: float | None = None  # requests per second, smoothed
+        self._progress_at = 0.0  # time the completed count last grew
+        self.interval = float(initial)
+        self.eta: float | None = None
+        self.stalled_for = 0.0
+
+    def update(self, completed: int, total: int) -> float:
+        """Record a poll result and return the seconds until the next poll."""
+        now = self._clock()
+        if self._last is None or completed > self._last[1]:
+            self._progress_at = now
+        self.stalled_for = now - self._progress_at
+        if self._last is not None:
+            last_time, last_completed = self._last
+            elapsed = now - last_time
+            if completed > last_completed and elapsed > 0:
+                rate = (completed - last_completed) / elapsed
+                self._rate = rate if self._rate is None else (rate + self._rate) / 2
+                remaining = max(total - completed, 0)
+                self.interval = remaining / self._rate / 2
+            else:
+                self.interval *= _POLL_BACKOFF
+            self.interval = min(max(self.interval, self._min), self._max)
+        self._last = (now, completed)
+        if self._rate and total:
+            self.eta = max(total - completed, 0) / self._rate
+        return self.interval
+
+
+def _format_eta(eta: float | None) -> str:
+    if eta is None:
+        return ""
+    minutes, seconds = divmod(int(eta), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"ETA {hours}h {minutes:02d}m"
+    if minutes:
+        return f"ETA {minutes}m {seconds:02d}s"
+    return f"ETA {seconds}s"
+
+
+def _progress() -> Progress:
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TextColumn("[dim]{task.fields[eta]}"),
+        console=console,
+    )
+
+
+def _failure_message(llm_client: LLMClient, batch_id: str, status: str) -> str:
+    detail = llm_client.batch_error_message(batch_id)
+    msg = f"Batch {batch_id} {status}."
+    if detail:
+        msg += f" Error: {detail}"
+    else:
+        msg += " Check your provider's dashboard for details."
+    return msg
+
+
+def _wait(delay: float, cancel_event: threading.Event | None) -> None:
+    if cancel_event is not None:
+        if cancel_event.wait(delay):
+            raise BatchCancelledError()
+    else:
+        time.sleep(delay)
+
+
+def deadline_headroom(unfinished: int, concurrency: int) -> float:
+    """Return how long before a deadline to stop polling.
+
+    Covers the wait for cancelled batches to stop and the synchronous
+    calls that judge *unfinished* requests, *concurrency* at a time.
+    """
+    waves = -(-unfinished // max(concurrency, 1))
+    return DEFAULT_CANCEL_GRACE + waves * STRAGGLER_CALL_SECONDS
+
+
+def wait_for_cancellation(
+    llm_client: LLMClient,
+    batch_ids: Sequence[str],
+    *,
+    grace: float | None = None,
+    cancel_event: threading.Event | None = None,
+) -> list[str]:
+    """Poll cancelled batches until they stop, for up to *grace* seconds.
+
+    Anthropic and OpenAI only expose the results of a cancelled batch once
+    the cancellation has finished.  *grace* defaults to
+    :data:`DEFAULT_CANCEL_GRACE`.  Returns the IDs of the batches still
+    stopping when *grace* runs out.
+    """
+    if grace is None:
+        grace = DEFAULT_CANCEL_GRACE
+    pending = list(batch_ids)
+    give_up_at = time.monotonic() + grace
+    while pending:
+        stopping: list[str] = []
+        for batch_id in pending:
+            try:
+                status, _, _ = llm_client.poll_batch(batch_id)
+            except Exception as e:
+                logger.debug("cancelled batch %s not polled: %s", batch_id, e)
+                continue
+            if status == "in_progress":
+                stopping.append(batch_id)
+        pending = stopping
+        remaining = give_up_at - time.monotonic()
+        if not pending or remaining <= 0:
+            break
+        _wait(min(_CANCEL_POLL_INTERVAL, remaining), cancel_event)
+    if pending:
+        logger.debug("batches still cancelling after %.0fs: %s", grace, pending)
+    return pending
+
+
 def poll_until_done(
     llm_client: LLMClient,
     batch_id: str,
     *,
     expected_total: int,
-    poll_interval: int = 60,
+    poll_interval: float = 60,
     label: str = "Waiting for batch completion...",
     cancel_event: threading.Event | None = None,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
 ) -> None:
     """Poll a batch until it reaches a terminal state.
 
+    The first wait is *poll_interval* seconds; later waits adapt to the
+    batch's progress (see :class:`PollSchedule`).
     Raises ``RuntimeError`` on ``"failed"`` or ``"expired"`` status.
     The caller is responsible for checkpoint cleanup.
     """
-    with Progress(console=console) as progress:
+    schedule = PollSchedule(
+        poll_interval, min_interval=min_poll_interval, max_interval=max_poll_interval
+    )
+    with _progress() as progress:
         poll_task = progress.add_task(
             f"[cyan]{label}",
             total=expected_total,
+            eta="",
         )
         while True:
             if cancel_event is not None and cancel_event.is_set():
                 raise BatchCancelledError()
 
             status, completed, total = llm_client.poll_batch(batch_id)
+            delay = schedule.update(completed, total or expected_total)
             logger.debug(
-                "poll: batch=%s, status=%s, %d/%d",
+                "poll: batch=%s, status=%s, %d/%d, next in %.0fs",
                 batch_id,
                 status,
                 completed,
                 total,
+                delay,
             )
             progress.update(
-                poll_task, completed=completed, total=total or expected_total
+                poll_task,
+                completed=completed,
+                total=total or expected_total,
+                eta=_format_eta(schedule.eta),
             )
 
             if status == "completed":
                 break
             if status in ("failed", "expired"):
-                detail = llm_client.batch_error_message(batch_id)
-                msg = f"Batch {batch_id} {status}."
-                if detail:
-                    msg += f" Error: {detail}"
-                else:
-                    msg += " Check your provider's dashboard for details."
                 logger.debug("batch terminal: id=%s, status=%s", batch_id, status)
-                raise BatchFailedError(msg, batch_id=batch_id, status=status)
+                raise BatchFailedError(
+                    _failure_message(llm_client, batch_id, status),
+                    batch_id=batch_id,
+                    status=status,
+                )
 
-            if cancel_event is not None:
-                if cancel_event.wait(poll_interval):
-                    raise BatchCancelledError()
-            else:
-                time.sleep(poll_interval)
+            _wait(delay, cancel_event)
 
 
 def poll_multiple_batches(
     llm_client: LLMClient,
     batches: Sequence[tuple[str, int, str]],
     *,
-    poll_interval: int = 60,
+    poll_interval: float = 60,
     cancel_event: threading.Event | None = None,
-) -> None:
+    on_complete: Callable[[str], None] | None = None,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    deadline: float | None = None,
+    stall_timeout: float | None = None,
+    straggler_concurrency: int | None = None,
+) -> list[str]:
     """Poll multiple batches concurrently in a single Rich progress context.
 
     *batches* is a sequence of ``(batch_id, expected_total, label)`` tuples.
-    Raises ``RuntimeError`` on the first failed/expired batch (matching the
-    behaviour of :func:`poll_until_done`).
+    Each batch gets its own :class:`PollSchedule`, and a round of polls
+    waits for the shortest interval among the batches still pending.
+    *on_complete* is called with each batch ID as soon as that batch
+    completes.  Raises ``RuntimeError`` on the first failed/expired batch
+    (matching the behaviour of :func:`poll_until_done`).
+
+    Polling gives up on batches still pending at *deadline* (a
+    ``time.time()`` timestamp) and on any batch whose completed count has
+    not moved for *stall_timeout* seconds.  With *straggler_concurrency*,
+    it gives up early enough to judge the unfinished requests with that
+    many parallel calls before the deadline (see :func:`deadline_headroom`),
+    but never sooner than halfway to it.  Returns the IDs of the batches
+    given up on, in input order; the caller decides whether to cancel them
+    and how to complete their requests.
     """
     if not batches:
-        return
+        return []
+    started = time.time()
 
-    with Progress(console=console) as progress:
-        tasks: list[tuple[str, int, TaskID]] = []
+    with _progress() as progress:
+        tasks: list[tuple[str, int, TaskID, PollSchedule]] = []
+        # Requests each batch has not finished, as of its last poll
+        unfinished: list[int] = [expected for _, expected, _ in batches]
         for batch_id, expected_total, label in batches:
-            tid = progress.add_task(f"[cyan]{label}", total=expected_total)
-            tasks.append((batch_id, expected_total, tid))
+            tid = progress.add_task(f"[cyan]{label}", total=expected_total, eta="")
+            schedule = PollSchedule(
+                poll_interval,
+                min_interval=min_poll_interval,
+                max_interval=max_poll_interval,
+            )
+            tasks.append((batch_id, expected_total, tid, schedule))
 
         pending = set(range(len(tasks)))
+        abandoned: set[int] = set()
+
+        def _cutoff() -> float | None:
+            """Return when to give up on the batches still pending."""
+            if deadline is None or straggler_concurrency is None:
+                return deadline
+            headroom = deadline_headroom(
+                sum(unfinished[idx] for idx in pending), straggler_concurrency
+            )
+            return deadline - max(min(headroom, (deadline - started) / 2), 0.0)
+
+        def _abandon(idx: int, reason: str) -> None:
+            batch_id, _, tid, _ = tasks[idx]
+            logger.debug("batch abandoned: id=%s, reason=%s", batch_id, reason)
+            pending.discard(idx)
+            abandoned.add(idx)
+            progress.update(tid, eta=reason)
 
         while pending:
             if cancel_event is not None and cancel_event.is_set():
                 raise BatchCancelledError()
 
             for idx in list(pending):
-                batch_id, expected_total, tid = tasks[idx]
+                batch_id, expected_total, tid, schedule = tasks[idx]
                 status, completed, total = llm_client.poll_batch(batch_id)
-                progress.update(tid, completed=completed, total=total or expected_total)
+                schedule.update(completed, total or expected_total)
+                unfinished[idx] = max((total or expected_total) - completed, 0)
+                progress.update(
+                    tid,
+                    completed=completed,
+                    total=total or expected_total,
+                    eta=_format_eta(schedule.eta),
+                )
 
                 if status == "completed":
                     pending.discard(idx)
+                    progress.update(tid, eta="")
+                    if on_complete is not None:
+                        on_complete(batch_id)
                 elif status in ("failed", "expired"):
-                    detail = llm_client.batch_error_message(batch_id)
-                    msg = f"Batch {batch_id} {status}."
-                    if detail:
-                        msg += f" Error: {detail}"
-                    else:
-                        msg += " Check your provider's dashboard for details."
-                    raise BatchFailedError(msg, batch_id=batch_id, status=status)
+                    raise BatchFailedError(
+                        _failure_message(llm_client, batch_id, status),
+                        batch_id=batch_id,
+                        status=status,
+                    )
+                elif stall_timeout and stall_timeout <= schedule.stalled_for:
+                    _abandon(idx, "stalled")
+
+            cutoff = _cutoff() if pending else None
+            if cutoff is not None and time.time() >= cutoff:
+                for idx in list(pending):
+                    _abandon(idx, "deadline reached")
 
             if pending:
-                if cancel_event is not None:
-                    if cancel_event.wait(poll_interval):
-                        raise BatchCancelledError()
-                else:
-                    time.sleep(poll_interval)
+                delay = min(tasks[idx][3].interval for idx in pending)
+                if cutoff is not None:
+                    # Poll once more right at the cutoff
+                    delay = min(delay, max(cutoff - time.time(), 0.0))
+                logger.debug(
+                    "poll: %d batch(es) pending, next in %.0fs", len(pending), delay
+                )
+                _wait(delay, cancel_event)
+
+    return [tasks[idx][0] for idx in sorted(abandoned)]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from dataclasses import asdict, dataclass, field
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field, fields
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
 from veritail.types import SearchResult
 
@@ -16,18 +20,75 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class BatchCheckpoint:
-    """State snapshot for a batch evaluation in progress."""
+    """State snapshot for a batch evaluation in progress.
+
+    Large relevance batches are split into shards, one provider batch each:
+    *batch_ids* lists every shard and *completed_batch_ids* the shards that
+    already finished, so a resumed run only polls the rest.
+    *retry_batch_ids* lists the follow-up batches for failed requests, one
+    per round.  *abandoned_batch_ids* lists batches given up on at the
+    deadline or after stalling; a resumed run does not poll them again and
+    judges their unfinished requests synchronously.  In dual mode both
+    configurations share merged batches: *merged_batch_ids* lists them,
+    *merged_prefix* marks this configuration's custom_ids in them and
+    *merged_aliases* maps requests answered by the other configuration's
+    identical request to that request's ID.  *pending_queries* lists the
+    queries whose requests were not collected yet because the run was
+    interrupted while classifying them; a resumed run collects and submits
+    them.  *batch_id* and *gemini_custom_id_order* describe the first
+    shard, as in checkpoints written before sharding.
+
+    A loaded checkpoint reads *request_context* and *checks* from disk on
+    first access.
+    """
 
     batch_id: str
     experiment_name: str
     phase: str  # "relevance" | "corrections"
-    request_context: dict[str, dict[str, Any]]
-    checks: list[dict[str, Any]]
+    request_context: Mapping[str, dict[str, Any]]
+    checks: Sequence[dict[str, Any]]
     correction_entries: list[list[Any]]
     gemini_custom_id_order: list[str] = field(default_factory=list)
     correction_batch_id: str | None = None
     correction_context: dict[str, dict[str, Any]] | None = None
     gemini_correction_custom_id_order: list[str] = field(default_factory=list)
+    batch_ids: list[str] = field(default_factory=list)
+    completed_batch_ids: list[str] = field(default_factory=list)
+    gemini_custom_id_orders: dict[str, list[str]] = field(default_factory=dict)
+    retry_batch_ids: list[str] = field(default_factory=list)
+    abandoned_batch_ids: list[str] = field(default_factory=list)
+    merged_prefix: str | None = None
+    merged_batch_ids: list[str] = field(default_factory=list)
+    merged_aliases: dict[str, str] = field(default_factory=dict)
+    pending_queries: list[int] = field(default_factory=list)
+
+    def shard_ids(self) -> list[str]:
+        """Return the relevance batch IDs, including pre-sharding checkpoints."""
+        if self.batch_ids:
+            return list(self.batch_ids)
+        return [self.batch_id] if self.batch_id else []
+
+    def shard_custom_id_order(self, batch_id: str) -> list[str]:
+        """Return the saved Gemini custom_id order for one shard."""
+        order = self.gemini_custom_id_orders.get(batch_id)
+        if order is not None:
+            return order
+        return self.gemini_custom_id_order if batch_id == self.batch_id else []
+
+
+# A checkpoint is two files.  The state file (*filename*) holds one JSON
+# line with the small batch bookkeeping fields, followed by one line per
+# update_checkpoint() call.  The context file next to it holds the request
+# contexts and checks, written once per run: one JSON array per line,
+# ["p", result] for each distinct product, ["c", custom_id, context,
+# product_ref] for each request and ["k", check] for each check.
+_FORMAT_VERSION = 2
+_PAYLOAD_FIELDS = ("request_context", "checks")
+_STATE_FIELDS = frozenset(
+    f.name for f in fields(BatchCheckpoint) if f.name not in _PAYLOAD_FIELDS
+)
+
+_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False, default=str)
 
 
 def _checkpoint_path(
@@ -36,6 +97,119 @@ def _checkpoint_path(
     return Path(output_dir) / experiment / filename
 
 
+def _context_path(state_path: Path) -> Path:
+    return state_path.with_name(f"{state_path.stem}.context.jsonl")
+
+
+def _write_payload(
+    path: Path,
+    request_context: Mapping[str, dict[str, Any]],
+    checks: Sequence[dict[str, Any]],
+) -> None:
+    # Products are interned by product_id and content hash: each distinct
+    # one is written once and referenced by index.
+    products: dict[tuple[str, str], int] = {}
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for custom_id, entry in request_context.items():
+            result = entry.get("result")
+            ref: int | None = None
+            if isinstance(result, dict):
+                encoded = _dumps(result, sort_keys=True)
+                key = (
+                    str(result.get("product_id")),
+                    hashlib.sha256(encoded.encode("utf-8")).hexdigest(),
+                )
+                ref = products.get(key)
+                if ref is None:
+                    ref = products[key] = len(products)
+                    f.write(f'["p",{encoded}]\n')
+                entry = {k: v for k, v in entry.items() if k != "result"}
+            f.write(_dumps(["c", custom_id, entry, ref]) + "\n")
+        for check in checks:
+            f.write(_dumps(["k", check]) + "\n")
+    os.replace(tmp_path, path)
+
+
+def _read_payload(
+    path: Path,
+) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+    products: list[dict[str, Any]] = []
+    request_context: dict[str, dict[str, Any]] = {}
+    checks: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            if row[0] == "p":
+                products.append(row[1])
+            elif row[0] == "c":
+                _, custom_id, entry, ref = row
+                if ref is not None:
+                    entry["result"] = products[ref]
+                request_context[custom_id] = entry
+            elif row[0] == "k":
+                checks.append(row[1])
+    logger.debug(
+        "checkpoint context loaded: %d requests, %d products",
+        len(request_context),
+        len(products),
+    )
+    return request_context, checks
+
+
+class _Payload:
+    """Request contexts and checks, read from the context file on first use."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._data: tuple[dict[str, dict[str, Any]], list[dict[str, Any]]] | None = None
+
+    def load(self) -> tuple[dict[str, dict[str, Any]], list[dict[str, Any]]]:
+        with self._lock:
+            if self._data is None:
+                self._data = _read_payload(self._path)
+            return self._data
+
+
+class _LazyRequestContext(Mapping[str, dict[str, Any]]):
+    def __init__(self, payload: _Payload) -> None:
+        self._payload = payload
+
+    def __getitem__(self, custom_id: str) -> dict[str, Any]:
+        return self._payload.load()[0][custom_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._payload.load()[0])
+
+    def __len__(self) -> int:
+        return len(self._payload.load()[0])
+
+
+class _LazyChecks(Sequence[dict[str, Any]]):
+    def __init__(self, payload: _Payload) -> None:
+        self._payload = payload
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        return self._payload.load()[1][index]
+
+    def __len__(self) -> int:
+        return len(self._payload.load()[1])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 def save_checkpoint(
     output_dir: str,
     experiment: str,
@@ -43,12 +217,20 @@ def save_checkpoint(
     *,
     filename: str = "checkpoint.json",
 ) -> None:
-    """Atomically write checkpoint to disk (write tmp, then rename)."""
+    """Atomically write a full checkpoint to disk (write tmp, then rename).
+
+    This rewrites the request contexts, so call it only when they change
+    and record other changes with :func:`update_checkpoint`.
+    """
     path = _checkpoint_path(output_dir, experiment, filename=filename)
     path.parent.mkdir(parents=True, exist_ok=True)
+    # Contexts first: a state file on disk always has its contexts
+    _write_payload(_context_path(path), checkpoint.request_context, checkpoint.checks)
+    state = {"format": _FORMAT_VERSION}
+    state.update((name, getattr(checkpoint, name)) for name in sorted(_STATE_FIELDS))
     tmp_path = path.with_suffix(".tmp")
     with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(asdict(checkpoint), f, indent=2, default=str)
+        f.write(_dumps(state) + "\n")
     # os.replace is atomic on the same filesystem
     os.replace(tmp_path, path)
     logger.debug(
@@ -58,27 +240,95 @@ def save_checkpoint(
     )
 
 
+def update_checkpoint(
+    output_dir: str,
+    experiment: str,
+    *,
+    filename: str = "checkpoint.json",
+    **changes: Any,
+) -> None:
+    """Append changed checkpoint fields without rewriting the checkpoint.
+
+    Fields are replaced on load, except that dict fields are merged key by
+    key.  Request contexts and checks cannot be updated.  Does nothing if
+    no checkpoint exists.
+    """
+    unknown = set(changes) - _STATE_FIELDS
+    if unknown:
+        raise ValueError(
+            f"Cannot update checkpoint field(s): {', '.join(sorted(unknown))}"
+        )
+    path = _checkpoint_path(output_dir, experiment, filename=filename)
+    if not path.exists():
+        return
+    line = _dumps(changes) + "\n"
+    with open(path, "r+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                # Keep a line torn by an interrupted update off this one
+                line = "\n" + line
+        f.write(line.encode("utf-8"))
+    logger.debug(
+        "checkpoint updated: experiment=%s, fields=%s", experiment, sorted(changes)
+    )
+
+
 def load_checkpoint(
     output_dir: str, experiment: str, *, filename: str = "checkpoint.json"
 ) -> BatchCheckpoint | None:
-    """Load a checkpoint from disk, or return None if absent."""
+    """Load a checkpoint from disk, or return None if absent.
+
+    Only the state file is read here; request contexts and checks are read
+    on first access.  Single-file checkpoints written by older versions are
+    loaded whole.
+    """
     path = _checkpoint_path(output_dir, experiment, filename=filename)
     if not path.exists():
         return None
     with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+        try:
+            state = json.loads(f.readline())
+        except json.JSONDecodeError:
+            state = None
+        if not isinstance(state, dict) or state.pop("format", None) is None:
+            f.seek(0)
+            logger.debug("checkpoint loaded (legacy): experiment=%s", experiment)
+            return BatchCheckpoint(**json.load(f))
+        for line in f:
+            try:
+                changes = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn line from an interrupted update
+                logger.debug("checkpoint: ignoring incomplete update line")
+                continue
+            for name, value in changes.items():
+                current = state.get(name)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    state[name] = {**current, **value}
+                else:
+                    state[name] = value
+    payload = _Payload(_context_path(path))
     logger.debug("checkpoint loaded: experiment=%s", experiment)
-    return BatchCheckpoint(**data)
+    return BatchCheckpoint(
+        request_context=_LazyRequestContext(payload),
+        checks=_LazyChecks(payload),
+        **state,
+    )
 
 
 def clear_checkpoint(
     output_dir: str, experiment: str, *, filename: str = "checkpoint.json"
 ) -> None:
-    """Remove the checkpoint file after a successful run."""
+    """Remove the checkpoint files after a successful run."""
     path = _checkpoint_path(output_dir, experiment, filename=filename)
     if path.exists():
         path.unlink()
         logger.debug("checkpoint cleared: experiment=%s", experiment)
+    context_path = _context_path(path)
+    if context_path.exists():
+        context_path.unlink()
 
 
 def serialize_request_context(
@@ -119,7 +369,7 @@ def serialize_request_context(
 
 
 def deserialize_request_context(
-    data: dict[str, dict[str, Any]],
+    data: Mapping[str, dict[str, Any]],
 ) -> dict[
     str,
     tuple[
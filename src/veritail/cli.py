@@ -6,6 +6,7 @@ import json
 import logging
 import re
 import threading
+import time
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,10 +18,33 @@ from rich.console import Console
 
 from veritail.adapter import load_adapter
 from veritail.backends import create_backend
+from veritail.batch_utils import DEFAULT_MAX_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
 from veritail.checks.custom import CustomCheckFn, load_checks
-from veritail.llm.client import create_llm_client
+from veritail.compression import (
+    check_compression,
+    compressed_path,
+    find_existing,
+    write_bytes,
+)
+from veritail.llm.cache import CACHE_FILENAME, DEFAULT_MAX_AGE_DAYS, JudgmentCache
+from veritail.llm.client import LLMClient, create_llm_client
+from veritail.llm.localbatch import (
+    DEFAULT_LOCAL_BATCH_CONCURRENCY,
+    SPOOL_DIRNAME,
+    LocalBatchClient,
+)
+from veritail.llm.ratelimit import (
+    RateLimitedClient,
+    RateLimiter,
+    parse_rate_limits,
+    resolve_rate_limit,
+)
 from veritail.logging import configure_logging
 from veritail.pipeline import (
+    DEFAULT_RETRY_ROUNDS,
+    count_deduplicated,
+    count_reused,
+    index_baseline,
     run_batch_evaluation,
     run_dual_batch_evaluation,
     run_dual_evaluation,
@@ -34,7 +58,7 @@ from veritail.scaffold import (
     DEFAULT_QUERIES_FILENAME,
     scaffold_project,
 )
-from veritail.types import ExperimentConfig, VerticalContext
+from veritail.types import ExperimentConfig, JudgmentRecord, VerticalContext
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +114,9 @@ def _build_run_metadata(
     adapter_path: str | None = None,
     adapter_path_a: str | None = None,
     adapter_path_b: str | None = None,
+    llm_calls_saved: int | None = None,
+    baseline_experiment: str | None = None,
+    judgments_reused: int | None = None,
 ) -> dict[str, object]:
     """Build provenance metadata for report rendering."""
     metadata: dict[str, object] = {
@@ -108,12 +135,39 @@ def _build_run_metadata(
         metadata["adapter_path_a"] = adapter_path_a
     if adapter_path_b is not None:
         metadata["adapter_path_b"] = adapter_path_b
+    if llm_calls_saved is not None:
+        metadata["llm_calls_saved"] = llm_calls_saved
+    if baseline_experiment is not None:
+        metadata["baseline_experiment"] = baseline_experiment
+    if judgments_reused is not None:
+        metadata["judgments_reused"] = judgments_reused
     return metadata
 
 
 _KNOWN_MODEL_PREFIXES = ("claude", "gemini", "gpt-", "o1", "o3", "o4")
 
 
+def _rate_limited(client: LLMClient, limiter: RateLimiter | None) -> LLMClient:
+    """Route *client*'s calls through *limiter* when one is configured."""
+    if limiter is None:
+        return client
+    return RateLimitedClient(client, limiter)
+
+
+def _local_batch_client(
+    client: LLMClient, base_url: str, output_dir: str, concurrency: int
+) -> LLMClient:
+    """Emulate the batch API for an OpenAI-compatible server at *base_url*."""
+    if concurrency <= 1:
+        concurrency = DEFAULT_LOCAL_BATCH_CONCURRENCY
+    spool_dir = Path(output_dir) / SPOOL_DIRNAME
+    console.print(
+        f"[dim]Emulating batch API against {base_url} with {concurrency} "
+        f"parallel requests (spooled in {spool_dir})[/dim]"
+    )
+    return LocalBatchClient(client, spool_dir, concurrency=concurrency)
+
+
 def _run_search_pipeline(  # noqa: PLR0913
     *,
     queries_path: str,
@@ -135,7 +189,24 @@ def _run_search_pipeline(  # noqa: PLR0913
     use_resume: bool,
     search_sibling: str | None,
     no_summary: bool = False,
+    concurrency: int = 1,
+    use_async: bool = False,
+    prefetch: int = 0,
+    classification_concurrency: int = 1,
+    listwise: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    use_cache: bool = False,
+    cache_max_age: float = DEFAULT_MAX_AGE_DAYS,
+    baseline_experiment: str | None = None,
+    batch_retry_rounds: int = DEFAULT_RETRY_ROUNDS,
+    poll_bounds: tuple[float, float] = (
+        DEFAULT_MIN_POLL_INTERVAL,
+        DEFAULT_MAX_POLL_INTERVAL,
+    ),
+    deadline: float | None = None,
+    stall_timeout: float | None = None,
     cancel_event: threading.Event | None = None,
+    compression: str | None = None,
 ) -> list[Path]:
     """Run the search evaluation pipeline. Returns list of HTML report paths."""
     logger.debug(
@@ -170,8 +241,9 @@ def _run_search_pipeline(  # noqa: PLR0913
             )
 
     _warn_custom_model(llm_model, llm_base_url)
-    llm_client = create_llm_client(
-        llm_model, base_url=llm_base_url, api_key=llm_api_key
+    llm_client = _rate_limited(
+        create_llm_client(llm_model, base_url=llm_base_url, api_key=llm_api_key),
+        rate_limiter,
     )
 
     try:
@@ -181,278 +253,396 @@ def _run_search_pipeline(  # noqa: PLR0913
 
     if use_batch:
         if llm_base_url is not None:
-            raise click.UsageError(
-                "--batch cannot be used with --llm-base-url. "
-                "Batch APIs are only available for cloud providers "
-                "(OpenAI, Anthropic, Gemini)."
+            llm_client = _local_batch_client(
+                llm_client, llm_base_url, output_dir, concurrency
             )
-        if not llm_client.supports_batch():
+        elif not llm_client.supports_batch():
             raise click.UsageError(
                 f"The model '{llm_model}' does not support batch operations."
             )
 
     backend_kwargs: dict[str, str] = {}
-    if backend_type == "file":
+    if backend_type in ("file", "sqlite"):
         backend_kwargs["output_dir"] = output_dir
     elif backend_type == "langfuse":
         if backend_url:
             backend_kwargs["url"] = backend_url
+    if backend_type == "file" and compression is not None:
+        backend_kwargs["compression"] = compression
 
     backend = create_backend(backend_type, **backend_kwargs)
 
-    html_paths: list[Path] = []
-
-    if len(adapters) == 1:
-        # Single configuration
-        config = ExperimentConfig(
-            name=config_names[0],
-            adapter_path=adapters[0],
-            llm_model=llm_model,
-            top_k=top_k,
-        )
-        adapter_fn = load_adapter(adapters[0])
-
-        pipeline_fn = run_batch_evaluation if use_batch else run_evaluation
-        batch_kwargs: dict[str, Any] = {}
-        if use_batch and cancel_event is not None:
-            batch_kwargs["cancel_event"] = cancel_event
-        judgments, checks, metrics, correction_judgments = pipeline_fn(
-            query_entries,
-            adapter_fn,
-            config,
-            llm_client,
-            backend,
-            instructions=instructions,
-            vertical=vertical_context,
-            custom_checks=custom_check_fns,
-            resume=use_resume,
-            output_dir=output_dir,
-            **batch_kwargs,
-        )
-        run_metadata = _build_run_metadata(
-            llm_model=llm_model,
-            vertical=vertical_raw,
-            top_k=top_k,
-            sample=sample,
-            total_queries=total_queries,
-            adapter_path=adapters[0],
-        )
-
-        summary: str | None = None
-        if not no_summary:
-            with console.status("Generating AI summary…"):
-                try:
-                    from veritail.reporting.summary import generate_summary
-
-                    summary = generate_summary(
-                        llm_client,
-                        metrics,
-                        checks,
-                        judgments=judgments,
-                        correction_judgments=correction_judgments or None,
-                        run_metadata=run_metadata,
-                    )
-                except Exception:
-                    logger.warning("Failed to generate AI summary", exc_info=True)
-
-        report = generate_single_report(
-            metrics,
-            checks,
-            run_metadata=run_metadata,
-            correction_judgments=correction_judgments or None,
-            summary=summary,
-            queries=query_entries,
-        )
-        console.print(report)
-
-        exp_dir = Path(output_dir) / config_names[0]
-        exp_dir.mkdir(parents=True, exist_ok=True)
-
-        metrics_path = exp_dir / "metrics.json"
-        metrics_path.write_text(
-            json.dumps(
-                [asdict(m) for m in metrics],
-                indent=2,
-                default=str,
-            ),
-            encoding="utf-8",
-        )
-
-        if correction_judgments:
-            corrections_path = exp_dir / "corrections.jsonl"
-            corrections_path.write_text(
-                "\n".join(
-                    json.dumps(asdict(cj), default=str) for cj in correction_judgments
-                )
-                + "\n",
-                encoding="utf-8",
+    try:
+        judgment_cache: JudgmentCache | None = None
+        if use_cache:
+            judgment_cache = JudgmentCache(
+                Path(output_dir) / CACHE_FILENAME, max_age_days=cache_max_age
             )
 
-        html = generate_single_report(
-            metrics,
-            checks,
-            judgments=judgments,
-            format="html",
-            run_metadata=run_metadata,
-            correction_judgments=correction_judgments or None,
-            sibling_report=search_sibling,
-            summary=summary,
-            queries=query_entries,
-        )
-        html_path = exp_dir / "report.html"
-        html_path.write_text(html, encoding="utf-8")
-        console.print(f"[dim]HTML report -> {html_path}[/dim]")
-        html_paths.append(html_path)
+        baseline: dict[str, JudgmentRecord] | None = None
+        if baseline_experiment is not None:
+            # The baseline lives next to this run: in the SQLite database, or
+            # as a judgments file for the other backends.
+            baseline_backend = (
+                backend
+                if backend_type == "sqlite"
+                else create_backend("file", output_dir=output_dir)
+            )
+            baseline = index_baseline(
+                baseline_backend.get_judgments(baseline_experiment)
+            )
+            if baseline:
+                console.print(
+                    f"[dim]Baseline '{baseline_experiment}': {len(baseline)} "
+                    "reusable judgment(s)[/dim]"
+                )
+            else:
+                console.print(
+                    f"[yellow]Warning: baseline '{baseline_experiment}' has no "
+                    "reusable judgments (it may predate pair hashes); every pair "
+                    "will be judged."
+                )
 
-    else:
-        # Dual configuration
-        config_a = ExperimentConfig(
-            name=config_names[0],
-            adapter_path=adapters[0],
-            llm_model=llm_model,
-            top_k=top_k,
-        )
-        config_b = ExperimentConfig(
-            name=config_names[1],
-            adapter_path=adapters[1],
-            llm_model=llm_model,
-            top_k=top_k,
-        )
-        adapter_a = load_adapter(adapters[0])
-        adapter_b = load_adapter(adapters[1])
-
-        dual_fn = run_dual_batch_evaluation if use_batch else run_dual_evaluation
-        dual_batch_kwargs: dict[str, Any] = {}
-        if use_batch and cancel_event is not None:
-            dual_batch_kwargs["cancel_event"] = cancel_event
-        (
-            judgments_a,
-            judgments_b,
-            checks_a,
-            checks_b,
-            metrics_a,
-            metrics_b,
-            comparison_checks,
-            corrections_a,
-            corrections_b,
-        ) = dual_fn(
-            query_entries,
-            adapter_a,
-            config_a,
-            adapter_b,
-            config_b,
-            llm_client,
-            backend,
-            instructions=instructions,
-            vertical=vertical_context,
-            custom_checks=custom_check_fns,
-            resume=use_resume,
-            output_dir=output_dir,
-            **dual_batch_kwargs,
-        )
-        run_metadata = _build_run_metadata(
-            llm_model=llm_model,
-            vertical=vertical_raw,
-            top_k=top_k,
-            sample=sample,
-            total_queries=total_queries,
-            adapter_path_a=adapters[0],
-            adapter_path_b=adapters[1],
-        )
+        html_paths: list[Path] = []
 
-        cmp_summary: str | None = None
-        if not no_summary:
-            with console.status("Generating AI summary…"):
-                try:
-                    from veritail.reporting.summary import (
-                        generate_comparison_summary,
-                    )
+        if len(adapters) == 1:
+            # Single configuration
+            config = ExperimentConfig(
+                name=config_names[0],
+                adapter_path=adapters[0],
+                llm_model=llm_model,
+                top_k=top_k,
+            )
+            adapter_fn = load_adapter(adapters[0])
+
+            pipeline_fn = run_batch_evaluation if use_batch else run_evaluation
+            batch_kwargs: dict[str, Any] = {}
+            if use_batch and cancel_event is not None:
+                batch_kwargs["cancel_event"] = cancel_event
+            if use_batch and batch_retry_rounds != DEFAULT_RETRY_ROUNDS:
+                batch_kwargs["retry_rounds"] = batch_retry_rounds
+            if use_batch and poll_bounds != (
+                DEFAULT_MIN_POLL_INTERVAL,
+                DEFAULT_MAX_POLL_INTERVAL,
+            ):
+                batch_kwargs["min_poll_interval"] = poll_bounds[0]
+                batch_kwargs["max_poll_interval"] = poll_bounds[1]
+            if use_batch and deadline is not None:
+                batch_kwargs["deadline"] = deadline
+            if use_batch and stall_timeout is not None:
+                batch_kwargs["stall_timeout"] = stall_timeout
+            if not use_batch and concurrency > 1:
+                batch_kwargs["concurrency"] = concurrency
+            if not use_batch and use_async:
+                batch_kwargs["use_async"] = True
+            if not use_batch and prefetch > 0:
+                batch_kwargs["prefetch"] = prefetch
+            if not use_batch and classification_concurrency > 1:
+                batch_kwargs["classification_concurrency"] = classification_concurrency
+            if listwise:
+                batch_kwargs["listwise"] = True
+            if judgment_cache is not None:
+                batch_kwargs["judgment_cache"] = judgment_cache
+            if baseline is not None:
+                batch_kwargs["baseline"] = baseline
+            judgments, checks, metrics, correction_judgments = pipeline_fn(
+                query_entries,
+                adapter_fn,
+                config,
+                llm_client,
+                backend,
+                instructions=instructions,
+                vertical=vertical_context,
+                custom_checks=custom_check_fns,
+                resume=use_resume,
+                output_dir=output_dir,
+                **batch_kwargs,
+            )
+            backend.log_checks(config.name, checks)
+            run_metadata = _build_run_metadata(
+                llm_model=llm_model,
+                vertical=vertical_raw,
+                top_k=top_k,
+                sample=sample,
+                total_queries=total_queries,
+                adapter_path=adapters[0],
+                baseline_experiment=baseline_experiment,
+                judgments_reused=(
+                    count_reused(judgments) if baseline is not None else None
+                ),
+            )
 
-                    cmp_summary = generate_comparison_summary(
-                        llm_client,
-                        metrics_a,
-                        metrics_b,
-                        checks_a=checks_a,
-                        checks_b=checks_b,
-                        judgments_a=judgments_a,
-                        judgments_b=judgments_b,
-                        comparison_checks=comparison_checks,
-                        config_a=config_names[0],
-                        config_b=config_names[1],
-                        corrections_a=corrections_a or None,
-                        corrections_b=corrections_b or None,
-                    )
-                except Exception:
-                    logger.warning(
-                        "Failed to generate AI comparison summary", exc_info=True
-                    )
+            summary: str | None = None
+            if not no_summary:
+                with console.status("Generating AI summary…"):
+                    try:
+                        from veritail.reporting.summary import generate_summary
+
+                        summary = generate_summary(
+                            llm_client,
+                            metrics,
+                            checks,
+                            judgments=judgments,
+                            correction_judgments=correction_judgments or None,
+                            run_metadata=run_metadata,
+                        )
+                    except Exception:
+                        logger.warning("Failed to generate AI summary", exc_info=True)
+
+            report = generate_single_report(
+                metrics,
+                checks,
+                run_metadata=run_metadata,
+                correction_judgments=correction_judgments or None,
+                summary=summary,
+                queries=query_entries,
+            )
+            console.print(report)
 
-        report = generate_comparison_report(
-            metrics_a,
-            metrics_b,
-            comparison_checks,
-            config_names[0],
-            config_names[1],
-            run_metadata=run_metadata,
-            correction_judgments_a=corrections_a or None,
-            correction_judgments_b=corrections_b or None,
-            judgments_a=judgments_a,
-            judgments_b=judgments_b,
-            checks_a=checks_a,
-            checks_b=checks_b,
-            summary=cmp_summary,
-        )
-        console.print(report)
-
-        configs_and_data = [
-            (config_names[0], metrics_a, corrections_a),
-            (config_names[1], metrics_b, corrections_b),
-        ]
-        for cfg_name, cfg_metrics, cfg_corrections in configs_and_data:
-            exp_dir = Path(output_dir) / cfg_name
+            exp_dir = Path(output_dir) / config_names[0]
             exp_dir.mkdir(parents=True, exist_ok=True)
-            metrics_path = exp_dir / "metrics.json"
-            metrics_path.write_text(
+
+            metrics_path = compressed_path(exp_dir / "metrics.json", compression)
+            write_bytes(
+                metrics_path,
                 json.dumps(
-                    [asdict(m) for m in cfg_metrics],
+                    [asdict(m) for m in metrics],
                     indent=2,
                     default=str,
+                ).encode("utf-8"),
+            )
+
+            if correction_judgments:
+                corrections_path = compressed_path(
+                    exp_dir / "corrections.jsonl", compression
+                )
+                write_bytes(
+                    corrections_path,
+                    (
+                        "\n".join(
+                            json.dumps(asdict(cj), default=str)
+                            for cj in correction_judgments
+                        )
+                        + "\n"
+                    ).encode("utf-8"),
+                )
+
+            html = generate_single_report(
+                metrics,
+                checks,
+                judgments=judgments,
+                format="html",
+                run_metadata=run_metadata,
+                correction_judgments=correction_judgments or None,
+                sibling_report=search_sibling,
+                summary=summary,
+                queries=query_entries,
+            )
+            html_path = exp_dir / "report.html"
+            html_path.write_text(html, encoding="utf-8")
+            console.print(f"[dim]HTML report -> {html_path}[/dim]")
+            html_paths.append(html_path)
+
+        else:
+            # Dual configuration
+            config_a = ExperimentConfig(
+                name=config_names[0],
+                adapter_path=adapters[0],
+                llm_model=llm_model,
+                top_k=top_k,
+            )
+            config_b = ExperimentConfig(
+                name=config_names[1],
+                adapter_path=adapters[1],
+                llm_model=llm_model,
+                top_k=top_k,
+            )
+            adapter_a = load_adapter(adapters[0])
+            adapter_b = load_adapter(adapters[1])
+
+            dual_fn = run_dual_batch_evaluation if use_batch else run_dual_evaluation
+            dual_batch_kwargs: dict[str, Any] = {}
+            if use_batch and cancel_event is not None:
+                dual_batch_kwargs["cancel_event"] = cancel_event
+            if use_batch and batch_retry_rounds != DEFAULT_RETRY_ROUNDS:
+                dual_batch_kwargs["retry_rounds"] = batch_retry_rounds
+            if use_batch and poll_bounds != (
+                DEFAULT_MIN_POLL_INTERVAL,
+                DEFAULT_MAX_POLL_INTERVAL,
+            ):
+                dual_batch_kwargs["min_poll_interval"] = poll_bounds[0]
+                dual_batch_kwargs["max_poll_interval"] = poll_bounds[1]
+            if use_batch and deadline is not None:
+                dual_batch_kwargs["deadline"] = deadline
+            if use_batch and stall_timeout is not None:
+                dual_batch_kwargs["stall_timeout"] = stall_timeout
+            if not use_batch and concurrency > 1:
+                dual_batch_kwargs["concurrency"] = concurrency
+            if not use_batch and use_async:
+                dual_batch_kwargs["use_async"] = True
+            if not use_batch and prefetch > 0:
+                dual_batch_kwargs["prefetch"] = prefetch
+            if not use_batch and classification_concurrency > 1:
+                dual_batch_kwargs["classification_concurrency"] = (
+                    classification_concurrency
+                )
+            if listwise:
+                dual_batch_kwargs["listwise"] = True
+            if judgment_cache is not None:
+                dual_batch_kwargs["judgment_cache"] = judgment_cache
+            if baseline is not None:
+                dual_batch_kwargs["baseline"] = baseline
+            (
+                judgments_a,
+                judgments_b,
+                checks_a,
+                checks_b,
+                metrics_a,
+                metrics_b,
+                comparison_checks,
+                corrections_a,
+                corrections_b,
+            ) = dual_fn(
+                query_entries,
+                adapter_a,
+                config_a,
+                adapter_b,
+                config_b,
+                llm_client,
+                backend,
+                instructions=instructions,
+                vertical=vertical_context,
+                custom_checks=custom_check_fns,
+                resume=use_resume,
+                output_dir=output_dir,
+                **dual_batch_kwargs,
+            )
+            backend.log_checks(config_a.name, checks_a)
+            backend.log_checks(config_b.name, checks_b)
+            run_metadata = _build_run_metadata(
+                llm_model=llm_model,
+                vertical=vertical_raw,
+                top_k=top_k,
+                sample=sample,
+                total_queries=total_queries,
+                adapter_path_a=adapters[0],
+                adapter_path_b=adapters[1],
+                llm_calls_saved=(
+                    count_deduplicated(judgments_a) + count_deduplicated(judgments_b)
+                ),
+                baseline_experiment=baseline_experiment,
+                judgments_reused=(
+                    count_reused(judgments_a) + count_reused(judgments_b)
+                    if baseline is not None
+                    else None
                 ),
-                encoding="utf-8",
             )
-            if cfg_corrections:
-                corrections_path = exp_dir / "corrections.jsonl"
-                corrections_path.write_text(
-                    "\n".join(
-                        json.dumps(asdict(cj), default=str) for cj in cfg_corrections
-                    )
-                    + "\n",
-                    encoding="utf-8",
+
+            cmp_summary: str | None = None
+            if not no_summary:
+                with console.status("Generating AI summary…"):
+                    try:
+                        from veritail.reporting.summary import (
+                            generate_comparison_summary,
+                        )
+
+                        cmp_summary = generate_comparison_summary(
+                            llm_client,
+                            metrics_a,
+                            metrics_b,
+                            checks_a=checks_a,
+                            checks_b=checks_b,
+                            judgments_a=judgments_a,
+                            judgments_b=judgments_b,
+                            comparison_checks=comparison_checks,
+                            config_a=config_names[0],
+                            config_b=config_names[1],
+                            corrections_a=corrections_a or None,
+                            corrections_b=corrections_b or None,
+                        )
+                    except Exception:
+                        logger.warning(
+                            "Failed to generate AI comparison summary", exc_info=True
+                        )
+
+            report = generate_comparison_report(
+                metrics_a,
+                metrics_b,
+                comparison_checks,
+                config_names[0],
+                config_names[1],
+                run_metadata=run_metadata,
+                correction_judgments_a=corrections_a or None,
+                correction_judgments_b=corrections_b or None,
+                judgments_a=judgments_a,
+                judgments_b=judgments_b,
+                checks_a=checks_a,
+                checks_b=checks_b,
+                summary=cmp_summary,
+            )
+            console.print(report)
+
+            configs_and_data = [
+                (config_names[0], metrics_a, corrections_a),
+                (config_names[1], metrics_b, corrections_b),
+            ]
+            for cfg_name, cfg_metrics, cfg_corrections in configs_and_data:
+                exp_dir = Path(output_dir) / cfg_name
+                exp_dir.mkdir(parents=True, exist_ok=True)
+                metrics_path = compressed_path(exp_dir / "metrics.json", compression)
+                write_bytes(
+                    metrics_path,
+                    json.dumps(
+                        [asdict(m) for m in cfg_metrics],
+                        indent=2,
+                        default=str,
+                    ).encode("utf-8"),
                 )
+                if cfg_corrections:
+                    corrections_path = compressed_path(
+                        exp_dir / "corrections.jsonl", compression
+                    )
+                    write_bytes(
+                        corrections_path,
+                        (
+                            "\n".join(
+                                json.dumps(asdict(cj), default=str)
+                                for cj in cfg_corrections
+                            )
+                            + "\n"
+                        ).encode("utf-8"),
+                    )
 
-        html = generate_comparison_report(
-            metrics_a,
-            metrics_b,
-            comparison_checks,
-            config_names[0],
-            config_names[1],
-            format="html",
-            run_metadata=run_metadata,
-            correction_judgments_a=corrections_a or None,
-            correction_judgments_b=corrections_b or None,
-            sibling_report=search_sibling,
-            judgments_a=judgments_a,
-            judgments_b=judgments_b,
-            checks_a=checks_a,
-            checks_b=checks_b,
-            summary=cmp_summary,
-        )
-        cmp_dir = f"{config_names[0]}_vs_{config_names[1]}"
-        html_path = Path(output_dir) / cmp_dir / "report.html"
-        html_path.parent.mkdir(parents=True, exist_ok=True)
-        html_path.write_text(html, encoding="utf-8")
-        console.print(f"[dim]HTML report -> {html_path}[/dim]")
-        html_paths.append(html_path)
+            html = generate_comparison_report(
+                metrics_a,
+                metrics_b,
+                comparison_checks,
+                config_names[0],
+                config_names[1],
+                format="html",
+                run_metadata=run_metadata,
+                correction_judgments_a=corrections_a or None,
+                correction_judgments_b=corrections_b or None,
+                sibling_report=search_sibling,
+                judgments_a=judgments_a,
+                judgments_b=judgments_b,
+                checks_a=checks_a,
+                checks_b=checks_b,
+                summary=cmp_summary,
+            )
+            cmp_dir = f"{config_names[0]}_vs_{config_names[1]}"
+            html_path = Path(output_dir) / cmp_dir / "report.html"
+            html_path.parent.mkdir(parents=True, exist_ok=True)
+            html_path.write_text(html, encoding="utf-8")
+            console.print(f"[dim]HTML report -> {html_path}[/dim]")
+            html_paths.append(html_path)
+
+        if judgment_cache is not None:
+            console.print(f"[dim]Judgment cache: {judgment_cache.summary()}[/dim]")
+            judgment_cache.close()
+    finally:
+        llm_client.close()
+        backend.close()
 
     return html_paths
 
@@ -476,6 +666,12 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
     use_batch: bool,
     use_resume: bool,
     ac_sibling: str | None,
+    concurrency: int = 1,
+    rate_limiter: RateLimiter | None = None,
+    poll_bounds: tuple[float, float] = (
+        DEFAULT_MIN_POLL_INTERVAL,
+        DEFAULT_MAX_POLL_INTERVAL,
+    ),
     cancel_event: threading.Event | None = None,
 ) -> list[Path]:
     """Run the autocomplete evaluation pipeline. Returns list of HTML report paths."""
@@ -556,7 +752,7 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
     html_paths: list[Path] = []
 
     backend_kwargs: dict[str, str] = {}
-    if backend_type == "file":
+    if backend_type in ("file", "sqlite"):
         backend_kwargs["output_dir"] = output_dir
     elif backend_type == "langfuse":
         if backend_url:
@@ -601,8 +797,9 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
 
         # Create own LLM client
         _warn_custom_model(llm_model, llm_base_url)
-        llm_client = create_llm_client(
-            llm_model, base_url=llm_base_url, api_key=llm_api_key
+        llm_client = _rate_limited(
+            create_llm_client(llm_model, base_url=llm_base_url, api_key=llm_api_key),
+            rate_limiter,
         )
         try:
             llm_client.preflight_check()
@@ -611,12 +808,10 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
 
         if use_batch:
             if llm_base_url is not None:
-                raise click.UsageError(
-                    "--batch cannot be used with --llm-base-url. "
-                    "Batch APIs are only available for cloud providers "
-                    "(OpenAI, Anthropic, Gemini)."
+                llm_client = _local_batch_client(
+                    llm_client, llm_base_url, output_dir, concurrency
                 )
-            if not llm_client.supports_batch():
+            elif not llm_client.supports_batch():
                 raise click.UsageError(
                     f"The model '{llm_model}' does not support batch operations."
                 )
@@ -632,26 +827,31 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
             ac_system_prompt = "\n\n".join(prefix_parts) + "\n\n" + ac_system_prompt
 
         ac_judge = SuggestionJudge(llm_client, ac_system_prompt, config_names[0])
-        if use_batch:
-            from veritail.autocomplete.pipeline import (
-                run_autocomplete_batch_llm_evaluation,
-            )
+        try:
+            if use_batch:
+                from veritail.autocomplete.pipeline import (
+                    run_autocomplete_batch_llm_evaluation,
+                )
 
-            ac_suggestion_judgments = run_autocomplete_batch_llm_evaluation(
-                prefix_entries,
-                ac_responses,
-                ac_judge,
-                ac_config,
-                llm_client,
-                poll_interval=60,
-                resume=use_resume,
-                output_dir=output_dir,
-                cancel_event=cancel_event,
-            )
-        else:
-            ac_suggestion_judgments = run_autocomplete_llm_evaluation(
-                prefix_entries, ac_responses, ac_judge, ac_config
-            )
+                ac_suggestion_judgments = run_autocomplete_batch_llm_evaluation(
+                    prefix_entries,
+                    ac_responses,
+                    ac_judge,
+                    ac_config,
+                    llm_client,
+                    poll_interval=60,
+                    min_poll_interval=poll_bounds[0],
+                    max_poll_interval=poll_bounds[1],
+                    resume=use_resume,
+                    output_dir=output_dir,
+                    cancel_event=cancel_event,
+                )
+            else:
+                ac_suggestion_judgments = run_autocomplete_llm_evaluation(
+                    prefix_entries, ac_responses, ac_judge, ac_config
+                )
+        finally:
+            llm_client.close()
 
         # Write suggestion-judgments.jsonl
         exp_dir = Path(output_dir) / config_names[0]
@@ -752,6 +952,7 @@ def _run_autocomplete_pipeline(  # noqa: PLR0913
         console.print(f"[dim]Autocomplete HTML report -> {ac_html_path}[/dim]")
         html_paths.append(ac_html_path)
 
+    backend.close()
     return html_paths
 
 
@@ -1027,6 +1228,8 @@ def generate_queries_cmd(
         raise click.ClickException(str(exc)) from exc
     except FileExistsError as exc:
         raise click.ClickException(str(exc)) from exc
+    finally:
+        llm_client.close()
 
     if append and existing_count:
         new_added = len(queries) - existing_count
@@ -1111,13 +1314,23 @@ def generate_queries_cmd(
     "--backend",
     "backend_type",
     default="file",
-    type=click.Choice(["file", "langfuse"]),
+    type=click.Choice(["file", "sqlite", "langfuse"]),
     help="Evaluation backend",
 )
 @click.option(
     "--output-dir",
     default="./eval-results",
-    help="Output directory (file backend)",
+    help="Output directory (file and sqlite backends)",
+)
+@click.option(
+    "--compression",
+    default="none",
+    type=click.Choice(["none", "gzip", "zstd"]),
+    show_default=True,
+    help=(
+        "Compress judgments.jsonl, products.jsonl, corrections.jsonl and "
+        "metrics.json. zstd requires the zstandard package."
+    ),
 )
 @click.option(
     "--backend-url",
@@ -1187,7 +1400,148 @@ def generate_queries_cmd(
     "use_batch",
     is_flag=True,
     default=False,
-    help="Use provider batch API for LLM calls (50%% cheaper, slower).",
+    help=(
+        "Use provider batch API for LLM calls (50%% cheaper, slower). "
+        "Emulated locally with --llm-base-url."
+    ),
+)
+@click.option(
+    "--batch-retry-rounds",
+    default=DEFAULT_RETRY_ROUNDS,
+    type=int,
+    show_default=True,
+    help=(
+        "Resubmit failed or unparseable batch requests in up to this many "
+        "follow-up batches; the last few are judged with direct calls "
+        "(--batch only)."
+    ),
+)
+@click.option(
+    "--poll-min-interval",
+    default=DEFAULT_MIN_POLL_INTERVAL,
+    type=float,
+    show_default=True,
+    help=(
+        "Shortest wait in seconds between batch status checks. Checks get "
+        "more frequent as a batch nears completion (--batch only)."
+    ),
+)
+@click.option(
+    "--poll-max-interval",
+    default=DEFAULT_MAX_POLL_INTERVAL,
+    type=float,
+    show_default=True,
+    help=(
+        "Longest wait in seconds between batch status checks. Waits grow "
+        "while a batch makes no progress (--batch only)."
+    ),
+)
+@click.option(
+    "--deadline",
+    default=None,
+    type=float,
+    help=(
+        "Wall-clock budget in seconds for batch search evaluation, counted "
+        "from the start of the run. Batches still running at the deadline "
+        "are cancelled, and their unfinished requests are judged with "
+        "parallel synchronous calls (--batch only)."
+    ),
+)
+@click.option(
+    "--stall-timeout",
+    default=None,
+    type=float,
+    help=(
+        "Give up on a batch whose progress has not moved for this many "
+        "seconds and judge its unfinished requests synchronously "
+        "(--batch only)."
+    ),
+)
+@click.option(
+    "--concurrency",
+    default=1,
+    type=int,
+    help=(
+        "Number of LLM judgment calls to run in parallel (non-batch search "
+        "evaluation, and batches emulated for --llm-base-url)."
+    ),
+)
+@click.option(
+    "--async",
+    "use_async",
+    is_flag=True,
+    default=False,
+    help=(
+        "Run LLM judgment calls on a single asyncio event loop instead of "
+        "threads. --concurrency sets the number of requests in flight."
+    ),
+)
+@click.option(
+    "--listwise",
+    is_flag=True,
+    default=False,
+    help=(
+        "Score all top-k results for a query in one LLM call instead of one "
+        "call per result. Missing positions fall back to per-result calls."
+    ),
+)
+@click.option(
+    "--classification-concurrency",
+    default=None,
+    type=int,
+    help=(
+        "Number of query-type classification calls to run in parallel. "
+        "Queries are judged as soon as their own classification returns "
+        "(non-batch search evaluation only). Defaults to --concurrency."
+    ),
+)
+@click.option(
+    "--prefetch",
+    default=0,
+    type=int,
+    help=(
+        "Number of worker threads calling the search adapter ahead of LLM "
+        "judging, so search and LLM latency overlap (non-batch search "
+        "evaluation only; the adapter must be thread-safe when > 1)."
+    ),
+)
+@click.option(
+    "--rate-limit",
+    "rate_limits",
+    multiple=True,
+    metavar="MODEL=RPM[:TPM]",
+    help=(
+        "Requests- and tokens-per-minute budget for a model, e.g. "
+        "gpt-4o=500:200000. Use * as MODEL to match any model. Repeatable."
+    ),
+)
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help=(
+        "Do not read or write the judgment cache. By default, relevance "
+        "judgments are cached in <output-dir>/judgment-cache.sqlite and reused "
+        "when the model and prompts are unchanged."
+    ),
+)
+@click.option(
+    "--cache-max-age",
+    type=float,
+    default=DEFAULT_MAX_AGE_DAYS,
+    show_default=True,
+    help="Evict judgment cache entries older than this many days.",
+)
+@click.option(
+    "--baseline-experiment",
+    default=None,
+    metavar="NAME",
+    help=(
+        "Reuse relevance judgments from a prior experiment in --output-dir "
+        "for pairs whose product content, query, model and prompts are "
+        "unchanged; only new or changed pairs are sent to the LLM."
+    ),
 )
 @click.option(
     "--resume",
@@ -1223,6 +1577,7 @@ def run(
     llm_api_key: str | None,
     backend_type: str,
     output_dir: str,
+    compression: str,
     backend_url: str | None,
     top_k: int,
     open_browser: bool,
@@ -1232,6 +1587,20 @@ def run(
     autocomplete_check_modules: tuple[str, ...],
     sample: int | None,
     use_batch: bool,
+    batch_retry_rounds: int,
+    poll_min_interval: float,
+    poll_max_interval: float,
+    deadline: float | None,
+    stall_timeout: float | None,
+    concurrency: int,
+    use_async: bool,
+    listwise: bool,
+    classification_concurrency: int | None,
+    prefetch: int,
+    rate_limits: tuple[str, ...],
+    no_cache: bool,
+    cache_max_age: float,
+    baseline_experiment: str | None,
     use_resume: bool,
     no_summary: bool,
     verbose: bool,
@@ -1293,7 +1662,7 @@ def run(
         raise click.UsageError(
             "--resume is not supported with --backend langfuse. "
             "The Langfuse backend is write-only and cannot retrieve "
-            "previous judgments. Use --backend file for resumable runs."
+            "previous judgments. Use --backend file or sqlite for resumable runs."
         )
 
     if use_resume and not config_names:
@@ -1322,6 +1691,81 @@ def run(
     if sample is not None and sample < 1:
         raise click.UsageError("--sample must be >= 1.")
 
+    if batch_retry_rounds < 0:
+        raise click.UsageError("--batch-retry-rounds must be >= 0.")
+
+    if poll_min_interval <= 0:
+        raise click.UsageError("--poll-min-interval must be > 0.")
+    if poll_max_interval < poll_min_interval:
+        raise click.UsageError("--poll-max-interval must be >= --poll-min-interval.")
+
+    if deadline is not None and deadline <= 0:
+        raise click.UsageError("--deadline must be > 0.")
+    if stall_timeout is not None and stall_timeout <= 0:
+        raise click.UsageError("--stall-timeout must be > 0.")
+    # Counted from here so adapter calls and submission share the budget
+    deadline_at = time.time() + deadline if deadline is not None else None
+
+    if concurrency < 1:
+        raise click.UsageError("--concurrency must be >= 1.")
+
+    if prefetch < 0:
+        raise click.UsageError("--prefetch must be >= 0.")
+
+    if classification_concurrency is None:
+        classification_concurrency = concurrency
+    elif classification_concurrency < 1:
+        raise click.UsageError("--classification-concurrency must be >= 1.")
+
+    if use_async and use_batch:
+        raise click.UsageError(
+            "--async cannot be used with --batch. "
+            "Batch mode submits requests through the provider's batch API."
+        )
+
+    try:
+        model_budgets = parse_rate_limits(rate_limits)
+    except ValueError as exc:
+        raise click.UsageError(f"--rate-limit: {exc}") from exc
+
+    # Concurrent runs always get a limiter so 429s are paced and retried
+    # even without an explicit budget.
+    rate_limiter: RateLimiter | None = None
+    budget = resolve_rate_limit(model_budgets, llm_model) if llm_model else None
+    if budget is not None:
+        rate_limiter = RateLimiter(rpm=budget.rpm, tpm=budget.tpm)
+    elif concurrency > 1:
+        rate_limiter = RateLimiter()
+
+    if cache_max_age <= 0:
+        raise click.UsageError("--cache-max-age must be > 0.")
+
+    storage_compression = None if compression == "none" else compression
+    try:
+        check_compression(storage_compression)
+    except ImportError as exc:
+        raise click.UsageError(f"--compression {compression}: {exc}") from exc
+
+    if baseline_experiment is not None and backend_type == "sqlite":
+        from veritail.backends.sqlite import DATABASE_FILENAME, SqliteBackend
+
+        database = Path(output_dir) / DATABASE_FILENAME
+        found = False
+        if database.exists():
+            with SqliteBackend(output_dir) as sqlite_backend:
+                found = sqlite_backend.has_judgments(baseline_experiment)
+        if not found:
+            raise click.UsageError(
+                f"--baseline-experiment: no judgments for '{baseline_experiment}' "
+                f"in '{database}'."
+            )
+    elif baseline_experiment is not None:
+        baseline_file = Path(output_dir) / baseline_experiment / "judgments.jsonl"
+        if find_existing(baseline_file) is None:
+            raise click.UsageError(
+                f"--baseline-experiment: no judgments found at '{baseline_file}'."
+            )
+
     if use_resume:
         # Verify experiment directory exists for each config
         for cn in config_names:
@@ -1404,7 +1848,9 @@ def run(
         "batch" if use_batch else "sync",
         "dual" if dual else "single",
     )
-    output_dir_is_new = backend_type == "file" and not Path(output_dir).exists()
+    output_dir_is_new = (
+        backend_type in ("file", "sqlite") and not Path(output_dir).exists()
+    )
     html_paths: list[Path] = []
     cancel_event: threading.Event | None = None
 
@@ -1431,7 +1877,21 @@ def run(
             use_resume=use_resume,
             search_sibling=search_sibling,
             no_summary=no_summary,
+            concurrency=concurrency,
+            use_async=use_async,
+            prefetch=prefetch,
+            classification_concurrency=classification_concurrency,
+            listwise=listwise,
+            rate_limiter=rate_limiter,
+            use_cache=not no_cache,
+            cache_max_age=cache_max_age,
+            baseline_experiment=baseline_experiment,
+            batch_retry_rounds=batch_retry_rounds,
+            poll_bounds=(poll_min_interval, poll_max_interval),
+            deadline=deadline_at,
+            stall_timeout=stall_timeout,
             cancel_event=cancel_event,
+            compression=storage_compression,
         )
 
     def _do_autocomplete() -> list[Path]:
@@ -1455,6 +1915,9 @@ def run(
             use_batch=use_batch,
             use_resume=use_resume,
             ac_sibling=ac_sibling,
+            concurrency=concurrency,
+            rate_limiter=rate_limiter,
+            poll_bounds=(poll_min_interval, poll_max_interval),
             cancel_event=cancel_event,
         )
 
@@ -1494,6 +1957,12 @@ def run(
         if autocomplete_prefixes:
             html_paths.extend(_do_autocomplete())
 
+    if rate_limiter is not None and rate_limiter.rate_limited_count:
+        console.print(
+            f"[dim]Rate limited {rate_limiter.rate_limited_count} time(s); "
+            f"request rate settled at {rate_limiter.factor:.0%} of the budget.[/dim]"
+        )
+
     # ---- Open report in browser ----
     if open_browser and html_paths:
         import webbrowser
@@ -0,0 +1,243 @@
+"""Streaming compression for stored evaluation artifacts.
+
+A file's codec is chosen by its extension: ``.gz`` is gzip from the
+standard library and ``.zst`` is zstd from the optional ``zstandard``
+package.  Any other name is read and written uncompressed.  Readers look
+for the uncompressed name first, then each compressed variant, so an
+output directory may mix experiments written with different settings.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+import os
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, cast
+
+logger = logging.getLogger(__name__)
+
+# Compression name -> file extension
+COMPRESSIONS: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+
+# zlib's default level; gzip.open's 9 costs far more CPU for little gain
+_GZIP_LEVEL = 6
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "The zstandard package is required for zstd compression. "
+            "Install it with: pip install veritail[zstd]"
+        ) from None
+    return zstandard
+
+
+def check_compression(compression: str | None) -> None:
+    """Raise if *compression* is unknown or its codec is not installed."""
+    if compression is None:
+        return
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression: {compression!r}. "
+            f"Use {', '.join(repr(c) for c in COMPRESSIONS)} or None."
+        )
+    if compression == "zstd":
+        _zstandard()
+
+
+def codec(path: Path) -> str | None:
+    """Return the compression implied by *path*'s extension, if any."""
+    for compression, suffix in COMPRESSIONS.items():
+        if path.name.endswith(suffix):
+            return compression
+    return None
+
+
+def base_path(path: Path) -> Path:
+    """Return *path* without its compression extension."""
+    compression = codec(path)
+    if compression is None:
+        return path
+    return path.with_name(path.name[: -len(COMPRESSIONS[compression])])
+
+
+def compressed_path(path: Path, compression: str | None) -> Path:
+    """Return the name *path* is stored under with *compression*."""
+    if compression is None:
+        return path
+    return path.with_name(path.name + COMPRESSIONS[compression])
+
+
+def variants(path: Path) -> list[Path]:
+    """Return *path* followed by each of its compressed names."""
+    return [path] + [compressed_path(path, c) for c in COMPRESSIONS]
+
+
+def find_existing(path: Path) -> Path | None:
+    """Return the first existing variant of *path*, or None."""
+    for candidate in variants(path):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def open_binary(
+    path: Path, mode: str, buffer_size: int = io.DEFAULT_BUFFER_SIZE
+) -> BinaryIO:
+    """Open *path* in binary *mode* (``rb``, ``wb`` or ``ab``) by extension.
+
+    Compressed writers emit a flush point on ``flush()``, so everything
+    written so far can be read back while the file is still open.
+    Appending to a compressed file starts a new gzip member or zstd
+    frame, which readers decode as one stream.
+    """
+    compression = codec(path)
+    if compression is None:
+        return cast(BinaryIO, open(path, mode, buffering=buffer_size))
+    if compression == "gzip":
+        return cast(BinaryIO, gzip.open(path, mode, compresslevel=_GZIP_LEVEL))
+    zstandard = _zstandard()
+    fh = open(path, mode, buffering=buffer_size)
+    if mode == "rb":
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            fh, read_across_frames=True, closefd=True
+        )
+        return cast(BinaryIO, io.BufferedReader(reader, buffer_size))
+    return cast(BinaryIO, zstandard.ZstdCompressor().stream_writer(fh, closefd=True))
+
+
+def _truncation_errors() -> tuple[type[Exception], ...]:
+    errors: tuple[type[Exception], ...] = (EOFError, gzip.BadGzipFile)
+    try:
+        import zstandard
+    except ImportError:
+        return errors
+    return (*errors, zstandard.ZstdError)
+
+
+def iter_lines(path: Path) -> Iterator[bytes]:
+    """Stream the lines of *path*, decompressing by extension.
+
+    A compressed file whose writer died before closing it ends without
+    its trailer.  Reading stops quietly at that point, after the last
+    line that was flushed.
+    """
+    with open_binary(path, "rb") as f:
+        try:
+            yield from f
+        except _truncation_errors() as e:
+            logger.debug("stopped at truncated end of %s: %s", path, e)
+
+
+def _decompressor(compression: str) -> Any:
+    """Return a decompressor object for one gzip member or zstd frame."""
+    if compression == "gzip":
+        return zlib.decompressobj(zlib.MAX_WBITS | 16)
+    return _zstandard().ZstdDecompressor().decompressobj()
+
+
+def _plain_lines_end(path: Path) -> int:
+    """Return the offset just past the last newline of an uncompressed file."""
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - io.DEFAULT_BUFFER_SIZE)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def scan(path: Path) -> tuple[int, bool]:
+    """Measure the complete lines of *path* and check that it ends cleanly.
+
+    Returns the decompressed size of the lines that end in a newline,
+    and whether nothing follows them: no partial line and, for a
+    compressed file, no gzip member or zstd frame left unfinished by a
+    writer that died.  Appending after an unfinished member or frame
+    would make the rest of the file unreadable.
+    """
+    compression = codec(path)
+    if compression is None:
+        end = _plain_lines_end(path)
+        return end, end == path.stat().st_size
+    errors: tuple[type[Exception], ...] = (zlib.error, *_truncation_errors())
+    size = 0
+    lines_end = 0
+    decompressor = None
+    with open(path, "rb") as f:
+        try:
+            while chunk := f.read(1 << 20):
+                while chunk:
+                    if decompressor is None:
+                        decompressor = _decompressor(compression)
+                    data = decompressor.decompress(chunk)
+                    newline = data.rfind(b"\n")
+                    if newline >= 0:
+                        lines_end = size + newline + 1
+                    size += len(data)
+                    chunk = b""
+                    if decompressor.eof:
+                        chunk = decompressor.unused_data
+                        decompressor = None
+        except errors as e:
+            logger.debug("stopped at corrupt data in %s: %s", path, e)
+            return lines_end, False
+    return lines_end, decompressor is None and lines_end == size
+
+
+def repair(path: Path) -> int:
+    """Cut a torn end off *path* so it is safe to append to.
+
+    Returns the decompressed size kept.  A compressed file is only
+    rewritten when its last member or frame was left unfinished.
+    """
+    size, clean = scan(path)
+    if not clean:
+        logger.debug("cutting torn end of %s at %d byte(s)", path, size)
+        truncate(path, size)
+    return size
+
+
+def truncate(path: Path, size: int) -> None:
+    """Cut *path* to its first *size* decompressed bytes.
+
+    *size* must fall on a line boundary.  Compressed files are rewritten
+    through a temporary file.
+    """
+    compression = codec(path)
+    if compression is None:
+        with open(path, "r+b") as f:
+            f.truncate(size)
+        return
+    base = base_path(path)
+    tmp_path = compressed_path(base.with_name(base.name + ".tmp"), compression)
+    written = 0
+    with open_binary(tmp_path, "wb") as out:
+        for line in iter_lines(path):
+            if written + len(line) > size:
+                break
+            out.write(line)
+            written += len(line)
+    os.replace(tmp_path, path)
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path*, compressing by extension.
+
+    Other variants of the same file are removed, so readers never find
+    a stale copy written with different settings.
+    """
+    for other in variants(base_path(path)):
+        if other != path:
+            other.unlink(missing_ok=True)
+    with open_binary(path, "wb") as f:
+        f.write(data)
@@ -1,5 +1,6 @@
 """LLM client and relevance judgment."""
 
+from veritail.llm.cache import JudgmentCache
 from veritail.llm.classifier import classify_query_type
 from veritail.llm.client import (
     AnthropicClient,
@@ -11,7 +12,9 @@ from veritail.llm.client import (
     OpenAIClient,
     create_llm_client,
 )
-from veritail.llm.judge import RelevanceJudge
+from veritail.llm.judge import ListwiseRelevanceJudge, RelevanceJudge
+from veritail.llm.localbatch import LocalBatchClient
+from veritail.llm.ratelimit import RateLimitedClient, RateLimiter
 
 __all__ = [
     "LLMClient",
@@ -21,7 +24,12 @@ __all__ = [
     "AnthropicClient",
     "GeminiClient",
     "OpenAIClient",
+    "JudgmentCache",
+    "LocalBatchClient",
+    "RateLimitedClient",
+    "RateLimiter",
     "classify_query_type",
     "create_llm_client",
+    "ListwiseRelevanceJudge",
     "RelevanceJudge",
 ]
@@ -0,0 +1,185 @@
+"""Persistent, content-addressed cache of LLM judgment responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from veritail.llm.client import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "judgment-cache.sqlite"
+
+DEFAULT_MAX_AGE_DAYS = 30.0
+DEFAULT_MAX_ENTRIES = 500_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used_at);
+"""
+
+
+def cache_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    """Return the SHA-256 content hash identifying one LLM request."""
+    h = hashlib.sha256()
+    for part in (model, system_prompt, user_prompt):
+        encoded = part.encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ.
+        h.update(len(encoded).to_bytes(8, "big"))
+        h.update(encoded)
+    return h.hexdigest()
+
+
+class JudgmentCache:
+    """SQLite-backed cache of judgment responses, shared across runs.
+
+    Entries are keyed by :func:`cache_key` over the model, the full system
+    prompt (vertical, instructions and rubric) and the exact user prompt, so
+    any change to the rubric, the product data or the model is a miss.
+    Only responses that parsed into a valid judgment are stored.
+
+    Eviction runs when the cache is opened: entries older than
+    *max_age_days* are dropped, then the least recently used entries beyond
+    *max_entries*.  Hit and miss counts cover the lifetime of the instance.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_age_days <= 0:
+            raise ValueError(f"max_age_days must be > 0, got {max_age_days}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_age = max_age_days * 86400.0
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Judges call the cache from worker threads; the lock serializes access.
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evicted = self.evict()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def get(
+        self, model: str, system_prompt: str, user_prompt: str
+    ) -> LLMResponse | None:
+        """Return the cached response for a request, or ``None`` on a miss.
+
+        Hits report zero token usage, since no tokens were spent this run.
+        """
+        key = cache_key(model, system_prompt, user_prompt)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT model, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used_at = ? WHERE key = ?",
+                (self._clock(), key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return LLMResponse(
+            content=row[1], model=row[0], input_tokens=0, output_tokens=0
+        )
+
+    def put(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        response: LLMResponse,
+    ) -> None:
+        """Store *response* for a request, replacing any previous entry."""
+        key = cache_key(model, system_prompt, user_prompt)
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.model,
+                    response.content,
+                    response.input_tokens,
+                    response.output_tokens,
+                    now,
+                    now,
+                ),
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def evict(self) -> int:
+        """Drop expired and least recently used entries; return how many."""
+        cutoff = self._clock() - self._max_age
+        with self._lock:
+            expired = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (cutoff,)
+            ).rowcount
+            overflow = self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY last_used_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            ).rowcount
+            self._conn.commit()
+        if expired or overflow:
+            logger.debug(
+                "judgment cache evicted %d expired and %d overflow entries",
+                expired,
+                overflow,
+            )
+        return expired + overflow
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(row[0])
+
+    def summary(self) -> str:
+        """One-line hit/miss summary for the run output."""
+        lookups = self.hits + self.misses
+        rate = f" ({self.hits / lookups:.0%} hit rate)" if lookups else ""
+        return (
+            f"{self.hits} hits, {self.misses} misses{rate}, "
+            f"{self.stores} stored, {self.evicted} evicted"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> JudgmentCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any
+from typing import IO, Any
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class LLMResponse:
-    """Raw response from an LLM provider."""
+    """Raw response from an LLM provider.
+
+    *cached_input_tokens* is the part of the prompt the provider served from
+    its prompt cache.  Anthropic reports it separately from *input_tokens*;
+    OpenAI and Gemini count it within *input_tokens*.
+    """
 
     content: str
     model: str
     input_tokens: int
     output_tokens: int
+    cached_input_tokens: int = 0
+
+
+def _token_count(value: Any) -> int:
+    """Coerce an optional SDK usage field to an int (``None`` -> 0)."""
+    return value if isinstance(value, int) else 0
+
+
+def _prompt_digest(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
 
 
 @dataclass
@@ -39,9 +61,41 @@ class BatchResult:
     error: str | None = None
 
 
+# Batch input files stay in memory up to this size, then spill to disk
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _spool_jsonl(entries: Iterable[dict[str, Any]]) -> tuple[IO[bytes], int]:
+    """Write *entries* as JSONL to a spooled temporary file, one at a time.
+
+    Returns the file, rewound for upload, and the number of lines written.
+    The caller closes the file, which deletes it.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    count = 0
+    try:
+        for entry in entries:
+            spool.write(json.dumps(entry).encode("utf-8"))
+            spool.write(b"\n")
+            count += 1
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return spool, count
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM providers."""
 
+    # (event loop, SDK async client) — see _async_sdk_client()
+    _async_sdk: tuple[asyncio.AbstractEventLoop, Any] | None = None
+
+    # Provider limits for a single batch job; larger submissions are split
+    # into shards.  ``None`` means no limit.
+    max_batch_requests: int | None = None
+    max_batch_bytes: int | None = None
+
     @abstractmethod
     def complete(
         self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
@@ -49,6 +103,30 @@ class LLMClient(ABC):
         """Send a prompt to the LLM and get a response."""
         ...
 
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        """Async variant of :meth:`complete`.
+
+        The built-in providers override this with their SDK's native async
+        client.  The default runs :meth:`complete` in a worker thread so
+        custom clients keep working under the async pipeline.
+        """
+        return await asyncio.to_thread(
+            self.complete, system_prompt, user_prompt, max_tokens=max_tokens
+        )
+
+    def _async_sdk_client(self, factory: Callable[[], Any]) -> Any:
+        """Return an SDK async client bound to the running event loop.
+
+        SDK async clients hold connection pools tied to the loop they were
+        first used on, so a new one is created whenever the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_sdk is None or self._async_sdk[0] is not loop:
+            self._async_sdk = (loop, factory())
+        return self._async_sdk[1]
+
     @abstractmethod
     def preflight_check(self) -> None:
         """Validate API key and model availability.
@@ -61,8 +139,12 @@ class LLMClient(ABC):
         """Return True if this provider supports batch operations."""
         return False
 
-    def submit_batch(self, requests: list[BatchRequest]) -> str:
-        """Submit a batch of requests. Returns a batch ID."""
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
+        """Submit a batch of requests. Returns a batch ID.
+
+        *requests* may be any iterable, including a generator; the built-in
+        providers serialize requests one at a time as they are consumed.
+        """
         raise NotImplementedError("This provider does not support batch operations.")
 
     def poll_batch(self, batch_id: str) -> tuple[str, int, int]:
@@ -76,6 +158,25 @@ class LLMClient(ABC):
         """Retrieve results from a completed batch."""
         raise NotImplementedError("This provider does not support batch operations.")
 
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
+        """Yield the results of a completed batch one at a time.
+
+        The built-in providers stream results from the provider instead of
+        loading the whole output first.  The default wraps
+        :meth:`retrieve_batch_results` so custom clients keep working.
+        """
+        yield from self.retrieve_batch_results(batch_id)
+
+    def cancel_batch(self, batch_id: str) -> bool:
+        """Ask the provider to stop processing a batch.
+
+        Returns ``True`` if cancellation was requested.  Results that were
+        already produced stay retrievable where the provider allows it.  The
+        default does nothing and returns ``False``, leaving the batch to run
+        out on its own.
+        """
+        return False
+
     def batch_error_message(self, batch_id: str) -> str | None:
         """Return a human-readable error message for a failed batch.
 
@@ -83,10 +184,34 @@ class LLMClient(ABC):
         """
         return None
 
+    def batch_custom_id_order(self, batch_id: str) -> list[str]:
+        """Return the custom_ids of a submitted batch in request order.
+
+        Providers that return results by position (Gemini) need this order
+        saved in checkpoints to map results after a resume.  The default
+        returns ``[]`` because results carry their own custom_id.
+        """
+        return []
+
     def restore_batch_custom_ids(self, batch_id: str, custom_ids: list[str]) -> None:
         """Restore custom_id ordering for a batch (needed by Gemini on resume)."""
         pass
 
+    def release_batch(self, batch_id: str) -> None:
+        """Free what the provider still keeps for a finished batch.
+
+        Called once the batch's results are saved and no checkpoint refers
+        to it any more.  The default does nothing.
+        """
+        pass
+
+    def close(self) -> None:
+        """Release resources the client created with the provider.
+
+        Call it once the run is over.  The default does nothing.
+        """
+        pass
+
 
 class AnthropicClient(LLMClient):
     """LLM client using the Anthropic API (Claude models).
@@ -96,6 +221,10 @@ class AnthropicClient(LLMClient):
         pip install veritail[anthropic]
     """
 
+    # Message Batches API: 100,000 requests or 256 MB per batch
+    max_batch_requests = 100_000
+    max_batch_bytes = 256 * 1024 * 1024
+
     def __init__(self, model: str = "claude-sonnet-4-5") -> None:
         try:
             import anthropic
@@ -108,27 +237,40 @@ class AnthropicClient(LLMClient):
         self._client = anthropic.Anthropic()
         self._model = model
 
-    def complete(
-        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
-    ) -> LLMResponse:
-        response = self._client.messages.create(
-            model=self._model,
-            max_tokens=max_tokens,
-            system=[
+    def _message_params(
+        self, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> dict[str, Any]:
+        return {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "system": [
                 {
                     "type": "text",
                     "text": system_prompt,
                     "cache_control": {"type": "ephemeral"},
                 }
             ],
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-        resp = LLMResponse(
-            content=response.content[0].text,  # type: ignore[union-attr]
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+
+    def _to_response(self, response: Any) -> LLMResponse:
+        return LLMResponse(
+            content=response.content[0].text,
             model=self._model,
             input_tokens=response.usage.input_tokens,
             output_tokens=response.usage.output_tokens,
+            cached_input_tokens=_token_count(
+                getattr(response.usage, "cache_read_input_tokens", 0)
+            ),
         )
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        response = self._client.messages.create(
+            **self._message_params(system_prompt, user_prompt, max_tokens)
+        )
+        resp = self._to_response(response)
         logger.debug(
             "anthropic complete: tokens=%d+%d",
             resp.input_tokens,
@@ -136,6 +278,23 @@ class AnthropicClient(LLMClient):
         )
         return resp
 
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        import anthropic
+
+        client = self._async_sdk_client(anthropic.AsyncAnthropic)
+        response = await client.messages.create(
+            **self._message_params(system_prompt, user_prompt, max_tokens)
+        )
+        resp = self._to_response(response)
+        logger.debug(
+            "anthropic acomplete: tokens=%d+%d",
+            resp.input_tokens,
+            resp.output_tokens,
+        )
+        return resp
+
     def preflight_check(self) -> None:
         import anthropic
 
@@ -156,30 +315,36 @@ class AnthropicClient(LLMClient):
     def supports_batch(self) -> bool:
         return True
 
-    def submit_batch(self, requests: list[BatchRequest]) -> str:
-        request_dicts = [
-            {
-                "custom_id": req.custom_id,
-                "params": {
-                    "model": self._model,
-                    "max_tokens": req.max_tokens,
-                    "system": [
-                        {
-                            "type": "text",
-                            "text": req.system_prompt,
-                            "cache_control": {"type": "ephemeral"},
-                        }
-                    ],
-                    "messages": [{"role": "user", "content": req.user_prompt}],
-                },
-            }
-            for req in requests
-        ]
-        batch = self._client.messages.batches.create(requests=request_dicts)  # type: ignore[arg-type]
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
+        submitted = 0
+
+        def request_dicts() -> Iterator[dict[str, Any]]:
+            nonlocal submitted
+            for req in requests:
+                submitted += 1
+                yield {
+                    "custom_id": req.custom_id,
+                    "params": {
+                        "model": self._model,
+                        "max_tokens": req.max_tokens,
+                        "system": [
+                            {
+                                "type": "text",
+                                "text": req.system_prompt,
+                                "cache_control": {"type": "ephemeral"},
+                            }
+                        ],
+                        "messages": [{"role": "user", "content": req.user_prompt}],
+                    },
+                }
+
+        # The SDK still encodes the whole request body in memory; batch
+        # sharding keeps it under the provider's size limit.
+        batch = self._client.messages.batches.create(requests=request_dicts())  # type: ignore[arg-type]
         logger.debug(
             "anthropic batch submitted: id=%s, requests=%d",
             batch.id,
-            len(requests),
+            submitted,
         )
         return batch.id
 
@@ -196,8 +361,16 @@ class AnthropicClient(LLMClient):
         logger.debug("anthropic poll: status=%s, %d/%d", status, completed, total)
         return status, completed, total
 
+    def cancel_batch(self, batch_id: str) -> bool:
+        self._client.messages.batches.cancel(batch_id)
+        logger.debug("anthropic batch cancel requested: id=%s", batch_id)
+        return True
+
     def retrieve_batch_results(self, batch_id: str) -> list[BatchResult]:
-        results: list[BatchResult] = []
+        return list(self.iter_batch_results(batch_id))
+
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
+        # The SDK decodes the results JSONL as it downloads
         for entry in self._client.messages.batches.results(batch_id):
             custom_id = entry.custom_id
             result = entry.result
@@ -205,26 +378,24 @@ class AnthropicClient(LLMClient):
                 message = result.message
                 text = message.content[0].text if message.content else ""  # type: ignore[union-attr]
                 usage = message.usage
-                results.append(
-                    BatchResult(
-                        custom_id=custom_id,
-                        response=LLMResponse(
-                            content=text,
-                            model=self._model,
-                            input_tokens=usage.input_tokens if usage else 0,
-                            output_tokens=usage.output_tokens if usage else 0,
+                yield BatchResult(
+                    custom_id=custom_id,
+                    response=LLMResponse(
+                        content=text,
+                        model=self._model,
+                        input_tokens=usage.input_tokens if usage else 0,
+                        output_tokens=usage.output_tokens if usage else 0,
+                        cached_input_tokens=_token_count(
+                            getattr(usage, "cache_read_input_tokens", 0)
                         ),
-                    )
+                    ),
                 )
             else:
-                results.append(
-                    BatchResult(
-                        custom_id=custom_id,
-                        response=None,
-                        error=f"Request {result.type}",
-                    )
+                yield BatchResult(
+                    custom_id=custom_id,
+                    response=None,
+                    error=f"Request {result.type}",
                 )
-        return results
 
 
 class OpenAIClient(LLMClient):
@@ -232,8 +403,17 @@ class OpenAIClient(LLMClient):
 
     Works with any OpenAI-compatible endpoint by setting ``base_url``.
     This includes local model servers such as Ollama, vLLM, and LM Studio.
+
+    OpenAI caches prompt prefixes automatically.  Requests put the shared
+    system prompt first and the per-pair user prompt last, and on the
+    OpenAI API itself carry a ``prompt_cache_key`` derived from the system
+    prompt so that requests sharing it are routed to the same cache.
     """
 
+    # Batch API: 50,000 requests and a 200 MB input file per batch
+    max_batch_requests = 50_000
+    max_batch_bytes = 200 * 1024 * 1024
+
     def __init__(
         self,
         model: str = "gpt-4o",
@@ -245,6 +425,7 @@ class OpenAIClient(LLMClient):
         self._client = openai.OpenAI(base_url=base_url, api_key=api_key)
         self._model = model
         self._base_url = base_url
+        self._api_key = api_key
         # Auto-detect whether the model requires max_completion_tokens
         # (e.g. o1, o3, gpt-5) vs the older max_tokens parameter.
         # None = not yet determined; set on first API call.
@@ -256,11 +437,15 @@ class OpenAIClient(LLMClient):
             return "max_completion_tokens"
         return "max_tokens"
 
-    def complete(
-        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
-    ) -> LLMResponse:
-        import openai
+    def _prompt_cache_key(self, system_prompt: str) -> str | None:
+        # OpenAI-compatible servers may reject unknown request fields.
+        if self._base_url is not None:
+            return None
+        return f"veritail-{_prompt_digest(system_prompt)}"
 
+    def _chat_kwargs(
+        self, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> dict[str, Any]:
         kwargs: dict[str, Any] = {
             "model": self._model,
             "messages": [
@@ -269,40 +454,64 @@ class OpenAIClient(LLMClient):
             ],
             self._token_limit_key(): max_tokens,
         }
+        cache_key = self._prompt_cache_key(system_prompt)
+        if cache_key is not None:
+            # Sent as an extra body field so older SDK versions accept it.
+            kwargs["extra_body"] = {"prompt_cache_key": cache_key}
+        return kwargs
+
+    def _switch_to_max_completion_tokens(
+        self, exc: Exception, kwargs: dict[str, Any], max_tokens: int
+    ) -> bool:
+        """Flip to ``max_completion_tokens`` if *exc* asks for it.
+
+        Newer models (o1, o3, gpt-5, …) reject max_tokens and require
+        max_completion_tokens.  Detect this on the first call, flip the
+        flag, and rewrite *kwargs* in place so the caller can retry.
+        """
+        if self._use_max_completion_tokens is not None or (
+            "max_completion_tokens" not in str(exc)
+        ):
+            return False
+        self._use_max_completion_tokens = True
+        logger.debug(
+            "model %s requires max_completion_tokens; retrying",
+            self._model,
+        )
+        kwargs.pop("max_tokens", None)
+        kwargs["max_completion_tokens"] = max_tokens
+        return True
 
-        try:
-            response = self._client.chat.completions.create(**kwargs)
-        except openai.BadRequestError as exc:
-            # Newer models (o1, o3, gpt-5, …) reject max_tokens and require
-            # max_completion_tokens.  Detect this on the first call, flip the
-            # flag, and transparently retry.
-            if (
-                self._use_max_completion_tokens is None
-                and "max_completion_tokens" in str(exc)
-            ):
-                self._use_max_completion_tokens = True
-                logger.debug(
-                    "model %s requires max_completion_tokens; retrying",
-                    self._model,
-                )
-                kwargs.pop("max_tokens", None)
-                kwargs["max_completion_tokens"] = max_tokens
-                response = self._client.chat.completions.create(**kwargs)
-            else:
-                raise
-
+    def _to_response(self, response: Any) -> LLMResponse:
         # First successful call — lock in whichever parameter worked.
         if self._use_max_completion_tokens is None:
             self._use_max_completion_tokens = False
 
         choice = response.choices[0]
         usage = response.usage
-        resp = LLMResponse(
+        details = getattr(usage, "prompt_tokens_details", None) if usage else None
+        return LLMResponse(
             content=choice.message.content or "",
             model=self._model,
             input_tokens=usage.prompt_tokens if usage else 0,
             output_tokens=usage.completion_tokens if usage else 0,
+            cached_input_tokens=_token_count(getattr(details, "cached_tokens", 0)),
         )
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        import openai
+
+        kwargs = self._chat_kwargs(system_prompt, user_prompt, max_tokens)
+        try:
+            response = self._client.chat.completions.create(**kwargs)
+        except openai.BadRequestError as exc:
+            if not self._switch_to_max_completion_tokens(exc, kwargs, max_tokens):
+                raise
+            response = self._client.chat.completions.create(**kwargs)
+
+        resp = self._to_response(response)
         logger.debug(
             "openai complete: tokens=%d+%d",
             resp.input_tokens,
@@ -310,6 +519,30 @@ class OpenAIClient(LLMClient):
         )
         return resp
 
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        import openai
+
+        client = self._async_sdk_client(
+            lambda: openai.AsyncOpenAI(base_url=self._base_url, api_key=self._api_key)
+        )
+        kwargs = self._chat_kwargs(system_prompt, user_prompt, max_tokens)
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except openai.BadRequestError as exc:
+            if not self._switch_to_max_completion_tokens(exc, kwargs, max_tokens):
+                raise
+            response = await client.chat.completions.create(**kwargs)
+
+        resp = self._to_response(response)
+        logger.debug(
+            "openai acomplete: tokens=%d+%d",
+            resp.input_tokens,
+            resp.output_tokens,
+        )
+        return resp
+
     def preflight_check(self) -> None:
         import openai
 
@@ -338,35 +571,36 @@ class OpenAIClient(LLMClient):
     def supports_batch(self) -> bool:
         return self._base_url is None
 
-    def submit_batch(self, requests: list[BatchRequest]) -> str:
-        import io
-        import json
-
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
         token_key = self._token_limit_key()
-        lines = []
-        for req in requests:
-            line = json.dumps(
-                {
+
+        def lines() -> Iterator[dict[str, Any]]:
+            # Requests stay in the caller's order; the pipeline groups them
+            # by system prompt so each prefix is cached once.
+            for req in requests:
+                body: dict[str, Any] = {
+                    "model": self._model,
+                    "messages": [
+                        {"role": "system", "content": req.system_prompt},
+                        {"role": "user", "content": req.user_prompt},
+                    ],
+                    token_key: req.max_tokens,
+                }
+                cache_key = self._prompt_cache_key(req.system_prompt)
+                if cache_key is not None:
+                    body["prompt_cache_key"] = cache_key
+                yield {
                     "custom_id": req.custom_id,
                     "method": "POST",
                     "url": "/v1/chat/completions",
-                    "body": {
-                        "model": self._model,
-                        "messages": [
-                            {"role": "system", "content": req.system_prompt},
-                            {"role": "user", "content": req.user_prompt},
-                        ],
-                        token_key: req.max_tokens,
-                    },
+                    "body": body,
                 }
-            )
-            lines.append(line)
 
-        jsonl_bytes = ("\n".join(lines) + "\n").encode("utf-8")
-        file_obj = io.BytesIO(jsonl_bytes)
-        file_obj.name = "batch_input.jsonl"
-
-        uploaded = self._client.files.create(file=file_obj, purpose="batch")
+        spool, count = _spool_jsonl(lines())
+        with spool:
+            uploaded = self._client.files.create(
+                file=("batch_input.jsonl", spool), purpose="batch"
+            )
         batch = self._client.batches.create(
             input_file_id=uploaded.id,
             endpoint="/v1/chat/completions",
@@ -375,18 +609,19 @@ class OpenAIClient(LLMClient):
         logger.debug(
             "openai batch submitted: id=%s, requests=%d",
             batch.id,
-            len(requests),
+            count,
         )
         return batch.id
 
     def poll_batch(self, batch_id: str) -> tuple[str, int, int]:
         batch = self._client.batches.retrieve(batch_id)
         raw_status = batch.status
-        if raw_status in ("validating", "in_progress", "finalizing"):
+        if raw_status in ("validating", "in_progress", "finalizing", "cancelling"):
             status = "in_progress"
-        elif raw_status == "completed":
+        elif raw_status in ("completed", "cancelled"):
+            # A cancelled batch keeps the output of the requests it finished
             status = "completed"
-        elif raw_status in ("failed", "cancelled", "cancelling"):
+        elif raw_status == "failed":
             status = "failed"
         elif raw_status == "expired":
             status = "expired"
@@ -403,61 +638,65 @@ class OpenAIClient(LLMClient):
         logger.debug("openai poll: status=%s, %d/%d", status, completed, total)
         return status, completed, total
 
+    def cancel_batch(self, batch_id: str) -> bool:
+        # Completed requests are written to a partial output file once the
+        # cancellation finishes
+        self._client.batches.cancel(batch_id)
+        logger.debug("openai batch cancel requested: id=%s", batch_id)
+        return True
+
     def retrieve_batch_results(self, batch_id: str) -> list[BatchResult]:
-        import json
+        return list(self.iter_batch_results(batch_id))
 
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
         batch = self._client.batches.retrieve(batch_id)
         if not batch.output_file_id:
-            return []
-
-        content = self._client.files.content(batch.output_file_id)
-        results: list[BatchResult] = []
-        for line in content.text.strip().split("\n"):
-            if not line.strip():
-                continue
-            entry = json.loads(line)
-            custom_id = entry["custom_id"]
-            error_body = entry.get("error")
-            response_body = entry.get("response")
-
-            if error_body:
-                results.append(
-                    BatchResult(
-                        custom_id=custom_id,
-                        response=None,
-                        error=str(error_body),
-                    )
-                )
-                continue
-
-            if response_body and response_body.get("status_code") == 200:
-                body = response_body["body"]
-                choice = body["choices"][0]
-                usage = body.get("usage", {})
-                results.append(
-                    BatchResult(
-                        custom_id=custom_id,
-                        response=LLMResponse(
-                            content=choice["message"]["content"] or "",
-                            model=self._model,
-                            input_tokens=usage.get("prompt_tokens", 0),
-                            output_tokens=usage.get("completion_tokens", 0),
-                        ),
-                    )
-                )
-            else:
-                status_code = (
-                    response_body.get("status_code") if response_body else None
-                )
-                results.append(
-                    BatchResult(
-                        custom_id=custom_id,
-                        response=None,
-                        error=f"Request failed with status {status_code}",
-                    )
-                )
+            return
+
+        # Stream the output file and parse it line by line instead of
+        # downloading it whole.
+        with self._client.files.with_streaming_response.content(
+            batch.output_file_id
+        ) as content:
+            for line in content.iter_lines():
+                if not line.strip():
+                    continue
+                yield self._parse_batch_line(json.loads(line))
+
+    def _parse_batch_line(self, entry: dict[str, Any]) -> BatchResult:
+        custom_id = entry["custom_id"]
+        error_body = entry.get("error")
+        response_body = entry.get("response")
+
+        if error_body:
+            return BatchResult(
+                custom_id=custom_id,
+                response=None,
+                error=str(error_body),
+            )
+
+        if response_body and response_body.get("status_code") == 200:
+            body = response_body["body"]
+            choice = body["choices"][0]
+            usage = body.get("usage", {})
+            details = usage.get("prompt_tokens_details") or {}
+            return BatchResult(
+                custom_id=custom_id,
+                response=LLMResponse(
+                    content=choice["message"]["content"] or "",
+                    model=self._model,
+                    input_tokens=usage.get("prompt_tokens", 0),
+                    output_tokens=usage.get("completion_tokens", 0),
+                    cached_input_tokens=_token_count(details.get("cached_tokens", 0)),
+                ),
+            )
 
-        return results
+        status_code = response_body.get("status_code") if response_body else None
+        return BatchResult(
+            custom_id=custom_id,
+            response=None,
+            error=f"Request failed with status {status_code}",
+        )
 
     def batch_error_message(self, batch_id: str) -> str | None:
         batch = self._client.batches.retrieve(batch_id)
@@ -468,6 +707,15 @@ class OpenAIClient(LLMClient):
         return None
 
 
+# Gemini only caches contexts above a minimum size (1,024 tokens on Flash
+# models, more on Pro); shorter system prompts are sent inline.  About four
+# characters per token.
+_GEMINI_CACHE_MIN_CHARS = 4096
+_GEMINI_CACHE_TTL_SECONDS = 3600
+# Batch jobs may take up to 48 hours, so their cache must outlive them.
+_GEMINI_BATCH_CACHE_TTL_SECONDS = 48 * 3600
+
+
 class GeminiClient(LLMClient):
     """LLM client using the Google Gemini API.
 
@@ -477,8 +725,19 @@ class GeminiClient(LLMClient):
 
     The API key is read from the ``GEMINI_API_KEY`` or ``GOOGLE_API_KEY``
     environment variable, or can be passed explicitly.
+
+    System prompts large enough for Gemini's explicit context caching are
+    uploaded once as a cached content and referenced by every request that
+    shares them, in both sync and batch mode.  A cache is recreated once
+    less than half of its TTL remains, and requests fall back to an inline
+    system instruction if cache creation fails.  Caches used by a batch are
+    deleted once its results have been read, and :meth:`close` deletes the
+    rest.
     """
 
+    # Inline batch requests are limited to 20 MB in total
+    max_batch_bytes = 20 * 1024 * 1024
+
     def __init__(self, model: str = "gemini-2.5-flash") -> None:
         try:
             from google import genai
@@ -492,28 +751,162 @@ class GeminiClient(LLMClient):
         self._client: Any = genai.Client()
         self._model = model
         self._batch_custom_ids: dict[str, list[str]] = {}
+        # (prompt digest, TTL) -> (cached content name or None, expiry time)
+        self._context_caches: dict[tuple[str, int], tuple[str | None, float]] = {}
+        # Batch ID -> names of the context caches its requests reference
+        self._batch_caches: dict[str, set[str]] = {}
+        self._context_cache_lock = threading.Lock()
+
+    def _fresh_cache_entry(
+        self, key: tuple[str, int]
+    ) -> tuple[str | None, float] | None:
+        """Return the cache entry for *key* unless it must be recreated."""
+        entry = self._context_caches.get(key)
+        if entry is not None and entry[1] - time.time() > key[1] / 2:
+            return entry
+        return None
 
-    def complete(
-        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
-    ) -> LLMResponse:
+    def _creates_cache(self, system_prompt: str, ttl_seconds: int) -> bool:
+        """Return True if using *system_prompt* would create a context cache."""
+        if len(system_prompt) < _GEMINI_CACHE_MIN_CHARS:
+            return False
+        key = (_prompt_digest(system_prompt), ttl_seconds)
+        return self._fresh_cache_entry(key) is None
+
+    def _cached_content(self, system_prompt: str, ttl_seconds: int) -> str | None:
+        """Return the name of a context cache holding *system_prompt*.
+
+        Returns ``None`` when the prompt is too short to cache or the cache
+        could not be created; failures are remembered for one TTL.
+        """
+        if len(system_prompt) < _GEMINI_CACHE_MIN_CHARS:
+            return None
+        key = (_prompt_digest(system_prompt), ttl_seconds)
+        # Fresh entries are read without the lock, which is only held
+        # while a cache is created
+        entry = self._fresh_cache_entry(key)
+        if entry is not None:
+            return entry[0]
+        with self._context_cache_lock:
+            now = time.time()
+            entry = self._fresh_cache_entry(key)
+            if entry is not None:
+                return entry[0]
+
+            from google.genai import types
+
+            name: str | None
+            try:
+                cache = self._client.caches.create(
+                    model=self._model,
+                    config=types.CreateCachedContentConfig(
+                        system_instruction=system_prompt,
+                        ttl=f"{ttl_seconds}s",
+                        display_name="veritail-system-prompt",
+                    ),
+                )
+                name = cache.name
+                logger.debug("gemini context cache created: %s", name)
+            except Exception as exc:
+                logger.debug("gemini context cache unavailable: %s", exc)
+                name = None
+            self._context_caches[key] = (name, now + ttl_seconds)
+            return name
+
+    def _drop_cached_content(self, name: str) -> None:
+        """Forget a context cache the API no longer accepts."""
+        with self._context_cache_lock:
+            for key, (cached, _expires) in list(self._context_caches.items()):
+                if cached == name:
+                    del self._context_caches[key]
+
+    def _delete_cached_content(self, names: Iterable[str]) -> None:
+        """Delete context caches; they would otherwise be billed until expiry."""
+        for name in sorted(names):
+            try:
+                self._client.caches.delete(name=name)
+                logger.debug("gemini context cache deleted: %s", name)
+            except Exception as exc:
+                logger.debug("gemini context cache %s not deleted: %s", name, exc)
+
+    def _release_batch_caches(self, batch_id: str) -> None:
+        """Delete the context caches no batch other than *batch_id* uses."""
+        with self._context_cache_lock:
+            names = self._batch_caches.pop(batch_id, set())
+            names -= set().union(*self._batch_caches.values())
+            for key, (cached, _expires) in list(self._context_caches.items()):
+                if cached in names:
+                    del self._context_caches[key]
+        self._delete_cached_content(names)
+
+    def close(self) -> None:
+        """Delete every context cache this client created."""
+        with self._context_cache_lock:
+            names = {name for name, _ in self._context_caches.values() if name}
+            self._context_caches.clear()
+            self._batch_caches.clear()
+        self._delete_cached_content(names)
+
+    def _content_config(
+        self, system_prompt: str, max_tokens: int, ttl_seconds: int
+    ) -> Any:
         from google.genai import types
 
-        response = self._client.models.generate_content(
-            model=self._model,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                max_output_tokens=max_tokens,
-            ),
-            contents=user_prompt,
+        cached = self._cached_content(system_prompt, ttl_seconds)
+        if cached is not None:
+            return types.GenerateContentConfig(
+                cached_content=cached, max_output_tokens=max_tokens
+            )
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt, max_output_tokens=max_tokens
         )
+
+    def _generate_kwargs(
+        self, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> dict[str, Any]:
+        return {
+            "model": self._model,
+            "config": self._content_config(
+                system_prompt, max_tokens, _GEMINI_CACHE_TTL_SECONDS
+            ),
+            "contents": user_prompt,
+        }
+
+    def _retry_inline(self, kwargs: dict[str, Any], exc: Exception) -> bool:
+        """Drop a rejected context cache from *kwargs*; True if it was one."""
+        cached = getattr(kwargs["config"], "cached_content", None)
+        if not isinstance(cached, str) or "cache" not in str(exc).lower():
+            return False
+        logger.debug("gemini context cache %s rejected: %s", cached, exc)
+        self._drop_cached_content(cached)
+        return True
+
+    def _to_response(self, response: Any) -> LLMResponse:
         text: str = response.text or ""
         usage = response.usage_metadata
-        resp = LLMResponse(
+        return LLMResponse(
             content=text,
             model=self._model,
             input_tokens=usage.prompt_token_count if usage else 0,
             output_tokens=usage.candidates_token_count if usage else 0,
+            cached_input_tokens=_token_count(
+                getattr(usage, "cached_content_token_count", 0)
+            ),
         )
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        kwargs = self._generate_kwargs(system_prompt, user_prompt, max_tokens)
+        try:
+            response = self._client.models.generate_content(**kwargs)
+        except Exception as exc:
+            if not self._retry_inline(kwargs, exc):
+                raise
+            response = self._client.models.generate_content(
+                **self._generate_kwargs(system_prompt, user_prompt, max_tokens)
+            )
+        resp = self._to_response(response)
         logger.debug(
             "gemini complete: tokens=%d+%d",
             resp.input_tokens,
@@ -521,6 +914,37 @@ class GeminiClient(LLMClient):
         )
         return resp
 
+    async def _agenerate_kwargs(
+        self, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> dict[str, Any]:
+        # Cache creation is a blocking call, so it runs off the event loop
+        if self._creates_cache(system_prompt, _GEMINI_CACHE_TTL_SECONDS):
+            return await asyncio.to_thread(
+                self._generate_kwargs, system_prompt, user_prompt, max_tokens
+            )
+        return self._generate_kwargs(system_prompt, user_prompt, max_tokens)
+
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        aio = self._async_sdk_client(lambda: self._genai.Client().aio)
+        kwargs = await self._agenerate_kwargs(system_prompt, user_prompt, max_tokens)
+        try:
+            response = await aio.models.generate_content(**kwargs)
+        except Exception as exc:
+            if not self._retry_inline(kwargs, exc):
+                raise
+            response = await aio.models.generate_content(
+                **await self._agenerate_kwargs(system_prompt, user_prompt, max_tokens)
+            )
+        resp = self._to_response(response)
+        logger.debug(
+            "gemini acomplete: tokens=%d+%d",
+            resp.input_tokens,
+            resp.output_tokens,
+        )
+        return resp
+
     def preflight_check(self) -> None:
         try:
             self._client.models.get(
@@ -545,20 +969,27 @@ class GeminiClient(LLMClient):
     def supports_batch(self) -> bool:
         return True
 
-    def submit_batch(self, requests: list[BatchRequest]) -> str:
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
         from google.genai import types
 
-        custom_ids = [req.custom_id for req in requests]
-        inlined_requests = [
-            types.InlinedRequest(
-                contents=req.user_prompt,
-                config=types.GenerateContentConfig(
-                    system_instruction=req.system_prompt,
-                    max_output_tokens=req.max_tokens,
-                ),
+        # Inline requests are sent as one message body built in memory,
+        # capped at 20 MB by the batch sharding.
+        custom_ids: list[str] = []
+        inlined_requests = []
+        caches: set[str] = set()
+        for req in requests:
+            custom_ids.append(req.custom_id)
+            config = self._content_config(
+                req.system_prompt,
+                req.max_tokens,
+                _GEMINI_BATCH_CACHE_TTL_SECONDS,
+            )
+            cached = getattr(config, "cached_content", None)
+            if isinstance(cached, str):
+                caches.add(cached)
+            inlined_requests.append(
+                types.InlinedRequest(contents=req.user_prompt, config=config)
             )
-            for req in requests
-        ]
         job = self._client.batches.create(
             model=self._model,
             src=inlined_requests,
@@ -566,10 +997,13 @@ class GeminiClient(LLMClient):
         )
         batch_id: str = job.name
         self._batch_custom_ids[batch_id] = custom_ids
+        if caches:
+            with self._context_cache_lock:
+                self._batch_caches[batch_id] = caches
         logger.debug(
             "gemini batch submitted: id=%s, requests=%d",
             batch_id,
-            len(requests),
+            len(custom_ids),
         )
         return batch_id
 
@@ -599,13 +1033,23 @@ class GeminiClient(LLMClient):
         logger.debug("gemini poll: status=%s, %d/%d", status, completed, total)
         return status, completed, total
 
+    def cancel_batch(self, batch_id: str) -> bool:
+        self._client.batches.cancel(name=batch_id)
+        logger.debug("gemini batch cancel requested: id=%s", batch_id)
+        return True
+
     def retrieve_batch_results(self, batch_id: str) -> list[BatchResult]:
+        return list(self.iter_batch_results(batch_id))
+
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
+        # Inline batch responses arrive with the job itself; converting them
+        # one at a time avoids a second full copy.
         job = self._client.batches.get(name=batch_id)
         custom_ids = self._batch_custom_ids.get(batch_id, [])
-        results: list[BatchResult] = []
 
         if not job.dest or not job.dest.inlined_responses:
-            return results
+            self._release_batch_caches(batch_id)
+            return
 
         for i, inline_response in enumerate(job.dest.inlined_responses):
             cid = custom_ids[i] if i < len(custom_ids) else f"unknown-{i}"
@@ -613,34 +1057,31 @@ class GeminiClient(LLMClient):
                 response = inline_response.response
                 text: str = response.text or ""
                 usage = response.usage_metadata
-                results.append(
-                    BatchResult(
-                        custom_id=cid,
-                        response=LLMResponse(
-                            content=text,
-                            model=self._model,
-                            input_tokens=(usage.prompt_token_count or 0)
-                            if usage
-                            else 0,
-                            output_tokens=(usage.candidates_token_count or 0)
-                            if usage
-                            else 0,
+                yield BatchResult(
+                    custom_id=cid,
+                    response=LLMResponse(
+                        content=text,
+                        model=self._model,
+                        input_tokens=(usage.prompt_token_count or 0) if usage else 0,
+                        output_tokens=(usage.candidates_token_count or 0)
+                        if usage
+                        else 0,
+                        cached_input_tokens=_token_count(
+                            getattr(usage, "cached_content_token_count", 0)
                         ),
-                    )
+                    ),
                 )
             else:
                 error_msg = "Request failed"
                 if inline_response.error and inline_response.error.message:
                     error_msg = inline_response.error.message
-                results.append(
-                    BatchResult(
-                        custom_id=cid,
-                        response=None,
-                        error=error_msg,
-                    )
+                yield BatchResult(
+                    custom_id=cid,
+                    response=None,
+                    error=error_msg,
                 )
         self._batch_custom_ids.pop(batch_id, None)
-        return results
+        self._release_batch_caches(batch_id)
 
     def batch_error_message(self, batch_id: str) -> str | None:
         job = self._client.batches.get(name=batch_id)
@@ -653,6 +1094,9 @@ class GeminiClient(LLMClient):
             return "; ".join(parts) if parts else None
         return None
 
+    def batch_custom_id_order(self, batch_id: str) -> list[str]:
+        return list(self._batch_custom_ids.get(batch_id, []))
+
     def restore_batch_custom_ids(self, batch_id: str, custom_ids: list[str]) -> None:
         """Restore custom_id ordering so results can be mapped after resume."""
         self._batch_custom_ids[batch_id] = custom_ids
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
+from veritail.llm.cache import JudgmentCache, cache_key
 from veritail.llm.client import BatchRequest, LLMClient, LLMResponse
 from veritail.prompts import load_prompt
 from veritail.types import CorrectionJudgment, JudgmentRecord, SearchResult
@@ -16,7 +17,21 @@ CORRECTION_SYSTEM_PROMPT = load_prompt("llm/correction.md")
 
 
 class RelevanceJudge:
-    """Judges the relevance of search results to queries using an LLM."""
+    """Judges the relevance of search results to queries using an LLM.
+
+    When a :class:`JudgmentCache` is given, a stored response for the same
+    *model*, system prompt and user prompt is reused instead of calling the
+    LLM, and every freshly parsed response is stored.
+
+    *shared* is an in-memory map of responses by :func:`cache_key`, passed
+    to the judges of several experiments so that identical prompts are only
+    judged once per run.  Reused judgments are marked ``deduplicated``.
+
+    Every judgment carries a ``pair_hash`` in its metadata (see
+    :meth:`pair_hash`).  *baseline* maps those hashes to the judgments of an
+    earlier experiment; a pair whose hash is found there is copied from the
+    baseline without calling the LLM and marked with ``reused_from``.
+    """
 
     def __init__(
         self,
@@ -24,13 +39,63 @@ class RelevanceJudge:
         system_prompt: str,
         format_user_prompt: Callable[..., str],
         experiment: str,
+        *,
+        cache: JudgmentCache | None = None,
+        model: str = "",
+        shared: dict[str, LLMResponse] | None = None,
+        baseline: Mapping[str, JudgmentRecord] | None = None,
     ) -> None:
         self._client = client
         self._system_prompt = system_prompt
         self._format_user_prompt = format_user_prompt
         self._experiment = experiment
+        self._cache = cache
+        self._model = model
+        self._shared = shared
+        self._baseline = baseline
 
-    def judge(
+    def pair_hash(
+        self,
+        query: str,
+        result: SearchResult,
+        *,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> str:
+        """Identify the judgment of a pair independently of its position.
+
+        Hashes the model, the system prompt and the user prompt rendered
+        without the result position, so the same product content judged for
+        the same query under the same configuration hashes identically in
+        any experiment.
+        """
+        return self._pair_hash(query, result, corrected_query, overlay, None)
+
+    def _pair_hash(
+        self,
+        query: str,
+        result: SearchResult,
+        corrected_query: str | None,
+        overlay: str | None,
+        user_prompt: str | None,
+    ) -> str:
+        kwargs: dict[str, object] = {"include_position": False}
+        if corrected_query is not None:
+            kwargs["corrected_query"] = corrected_query
+        if overlay is not None:
+            kwargs["overlay"] = overlay
+        try:
+            position_free = self._format_user_prompt(query, result, **kwargs)
+        except TypeError:
+            # Prompt formats without a position switch hash the full prompt.
+            position_free = (
+                user_prompt
+                if user_prompt is not None
+                else self._build_user_prompt(query, result, corrected_query, overlay)
+            )
+        return cache_key(self._model, self._system_prompt, position_free)
+
+    def baseline_judgment(
         self,
         query: str,
         result: SearchResult,
@@ -38,8 +103,120 @@ class RelevanceJudge:
         query_type: str | None = None,
         corrected_query: str | None = None,
         overlay: str | None = None,
-    ) -> JudgmentRecord:
-        """Judge the relevance of a single search result to a query."""
+    ) -> JudgmentRecord | None:
+        """Return the baseline's judgment of this pair, or ``None``."""
+        if not self._baseline:
+            return None
+        pair_hash = self.pair_hash(
+            query, result, corrected_query=corrected_query, overlay=overlay
+        )
+        return self._from_baseline(pair_hash, query, result, query_type)
+
+    def _from_baseline(
+        self,
+        pair_hash: str,
+        query: str,
+        result: SearchResult,
+        query_type: str | None,
+    ) -> JudgmentRecord | None:
+        prior = self._baseline.get(pair_hash) if self._baseline else None
+        if prior is None:
+            return None
+        return JudgmentRecord(
+            query=query,
+            product=result,
+            score=prior.score,
+            reasoning=prior.reasoning,
+            attribute_verdict=prior.attribute_verdict,
+            model=prior.model,
+            experiment=self._experiment,
+            query_type=query_type,
+            metadata={
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "pair_hash": pair_hash,
+                "reused_from": prior.experiment,
+            },
+        )
+
+    def reuse(self, request: BatchRequest) -> tuple[LLMResponse, str] | None:
+        """Find an earlier response to *request* without calling the LLM.
+
+        Returns the response together with the metadata marker to set on the
+        resulting judgment: ``"deduplicated"`` when another experiment in this
+        run judged the same prompt, ``"cached"`` when it came from the cache.
+        """
+        key = cache_key(self._model, request.system_prompt, request.user_prompt)
+        if self._shared is not None and key in self._shared:
+            return self._shared[key], "deduplicated"
+        if self._cache is not None:
+            response = self._cache.get(
+                self._model, request.system_prompt, request.user_prompt
+            )
+            if response is not None:
+                return response, "cached"
+        return None
+
+    def remember(
+        self, request: BatchRequest, response: LLMResponse, *, cached: bool = False
+    ) -> None:
+        """Record a successfully parsed response to *request*.
+
+        Fresh responses go to the cache; all of them are shared with the other
+        experiments of the run, with token usage zeroed since reusing them
+        costs nothing.
+        """
+        if self._cache is not None and not cached:
+            self._cache.put(
+                self._model, request.system_prompt, request.user_prompt, response
+            )
+        if self._shared is not None:
+            key = cache_key(self._model, request.system_prompt, request.user_prompt)
+            self._shared[key] = LLMResponse(
+                content=response.content,
+                model=response.model,
+                input_tokens=0,
+                output_tokens=0,
+            )
+
+    def _request(self, user_prompt: str) -> BatchRequest:
+        return BatchRequest(
+            custom_id="", system_prompt=self._system_prompt, user_prompt=user_prompt
+        )
+
+    def _cached_judgment(
+        self,
+        user_prompt: str,
+        query: str,
+        result: SearchResult,
+        query_type: str | None,
+    ) -> JudgmentRecord | None:
+        request = self._request(user_prompt)
+        reused = self.reuse(request)
+        if reused is None:
+            return None
+        response, marker = reused
+        try:
+            judgment = self.parse_batch_result(
+                response, query, result, query_type=query_type
+            )
+        except ValueError:
+            return None
+        judgment.metadata[marker] = True
+        if marker == "cached":
+            self.remember(request, response, cached=True)
+        return judgment
+
+    def _store(self, user_prompt: str, response: LLMResponse) -> None:
+        self.remember(self._request(user_prompt), response)
+
+    def _build_user_prompt(
+        self,
+        query: str,
+        result: SearchResult,
+        corrected_query: str | None,
+        overlay: str | None,
+    ) -> str:
         kwargs: dict[str, str] = {}
         if corrected_query is not None:
             kwargs["corrected_query"] = corrected_query
@@ -47,18 +224,39 @@ class RelevanceJudge:
             kwargs["overlay"] = overlay
         if kwargs:
             try:
-                user_prompt = self._format_user_prompt(query, result, **kwargs)
+                return self._format_user_prompt(query, result, **kwargs)
             except TypeError:
-                user_prompt = self._format_user_prompt(query, result)
-        else:
-            user_prompt = self._format_user_prompt(query, result)
+                return self._format_user_prompt(query, result)
+        return self._format_user_prompt(query, result)
+
+    def judge(
+        self,
+        query: str,
+        result: SearchResult,
+        *,
+        query_type: str | None = None,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> JudgmentRecord:
+        """Judge the relevance of a single search result to a query."""
+        user_prompt = self._build_user_prompt(query, result, corrected_query, overlay)
+        pair_hash = self._pair_hash(
+            query, result, corrected_query, overlay, user_prompt
+        )
+        prior = self._from_baseline(pair_hash, query, result, query_type)
+        if prior is not None:
+            return prior
+        cached = self._cached_judgment(user_prompt, query, result, query_type)
+        if cached is not None:
+            cached.metadata["pair_hash"] = pair_hash
+            return cached
 
         last_exc: Exception | None = None
         for _attempt in range(2):
             try:
                 response = self._client.complete(self._system_prompt, user_prompt)
-                score, attribute_verdict, reasoning = self._parse_response(
-                    response.content
+                judgment = self.parse_batch_result(
+                    response, query, result, query_type=query_type
                 )
             except Exception as exc:
                 last_exc = exc
@@ -66,27 +264,65 @@ class RelevanceJudge:
                     logger.debug("judge failed for %r, retrying: %s", query, exc)
                     continue
                 raise
+            self._store(user_prompt, response)
+            judgment.metadata["pair_hash"] = pair_hash
             logger.debug(
                 "relevance judge: query=%r, product=%s, score=%d, attrs=%s",
                 query,
                 result.product_id,
-                score,
-                attribute_verdict,
+                judgment.score,
+                judgment.attribute_verdict,
             )
-            return JudgmentRecord(
-                query=query,
-                product=result,
-                score=score,
-                reasoning=reasoning,
-                attribute_verdict=attribute_verdict,
-                model=response.model,
-                experiment=self._experiment,
-                query_type=query_type,
-                metadata={
-                    "input_tokens": response.input_tokens,
-                    "output_tokens": response.output_tokens,
-                },
+            return judgment
+        raise last_exc  # type: ignore[misc]  # unreachable, satisfies mypy
+
+    async def ajudge(
+        self,
+        query: str,
+        result: SearchResult,
+        *,
+        query_type: str | None = None,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> JudgmentRecord:
+        """Async variant of :meth:`judge` using :meth:`LLMClient.acomplete`."""
+        user_prompt = self._build_user_prompt(query, result, corrected_query, overlay)
+        pair_hash = self._pair_hash(
+            query, result, corrected_query, overlay, user_prompt
+        )
+        prior = self._from_baseline(pair_hash, query, result, query_type)
+        if prior is not None:
+            return prior
+        cached = self._cached_judgment(user_prompt, query, result, query_type)
+        if cached is not None:
+            cached.metadata["pair_hash"] = pair_hash
+            return cached
+
+        last_exc: Exception | None = None
+        for _attempt in range(2):
+            try:
+                response = await self._client.acomplete(
+                    self._system_prompt, user_prompt
+                )
+                judgment = self.parse_batch_result(
+                    response, query, result, query_type=query_type
+                )
+            except Exception as exc:
+                last_exc = exc
+                if _attempt == 0:
+                    logger.debug("judge failed for %r, retrying: %s", query, exc)
+                    continue
+                raise
+            self._store(user_prompt, response)
+            judgment.metadata["pair_hash"] = pair_hash
+            logger.debug(
+                "relevance judge: query=%r, product=%s, score=%d, attrs=%s",
+                query,
+                result.product_id,
+                judgment.score,
+                judgment.attribute_verdict,
             )
+            return judgment
         raise last_exc  # type: ignore[misc]  # unreachable, satisfies mypy
 
     def prepare_request(
@@ -99,22 +335,12 @@ class RelevanceJudge:
         overlay: str | None = None,
     ) -> BatchRequest:
         """Build a BatchRequest for a single query-result pair."""
-        kwargs: dict[str, str] = {}
-        if corrected_query is not None:
-            kwargs["corrected_query"] = corrected_query
-        if overlay is not None:
-            kwargs["overlay"] = overlay
-        if kwargs:
-            try:
-                user_prompt = self._format_user_prompt(query, result, **kwargs)
-            except TypeError:
-                user_prompt = self._format_user_prompt(query, result)
-        else:
-            user_prompt = self._format_user_prompt(query, result)
         return BatchRequest(
             custom_id=custom_id,
             system_prompt=self._system_prompt,
-            user_prompt=user_prompt,
+            user_prompt=self._build_user_prompt(
+                query, result, corrected_query, overlay
+            ),
         )
 
     def parse_batch_result(
@@ -127,7 +353,7 @@ class RelevanceJudge:
     ) -> JudgmentRecord:
         """Parse a batch response into a JudgmentRecord."""
         score, attribute_verdict, reasoning = self._parse_response(response.content)
-        return JudgmentRecord(
+        judgment = JudgmentRecord(
             query=query,
             product=result,
             score=score,
@@ -141,6 +367,9 @@ class RelevanceJudge:
                 "output_tokens": response.output_tokens,
             },
         )
+        if response.cached_input_tokens:
+            judgment.metadata["cached_input_tokens"] = response.cached_input_tokens
+        return judgment
 
     @staticmethod
     def _parse_response(response_text: str) -> tuple[int, str, str]:
@@ -183,6 +412,261 @@ class RelevanceJudge:
         return score, attribute_verdict, reasoning
 
 
+# Output budget for a listwise call: a fixed overhead plus room for one
+# SCORE/ATTRIBUTES/REASONING block per product.
+_LISTWISE_BASE_TOKENS = 256
+_LISTWISE_TOKENS_PER_RESULT = 192
+
+_RESULT_HEADER_RE = re.compile(r"(?im)^[\s#*]*RESULT\s*#?\s*(\d+)\b[^\n]*$")
+
+
+class ListwiseRelevanceJudge:
+    """Judges all results for a query in a single LLM call.
+
+    The response holds one ``RESULT <n>`` block per product.  Positions the
+    model skipped or garbled come back as ``None`` so the caller can fall back
+    to per-pair judging for just those products.  With a *cache*, only
+    responses that covered every position are stored.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        system_prompt: str,
+        format_user_prompt: Callable[..., str],
+        experiment: str,
+        *,
+        cache: JudgmentCache | None = None,
+        model: str = "",
+    ) -> None:
+        self._client = client
+        self._system_prompt = system_prompt
+        self._format_user_prompt = format_user_prompt
+        self._experiment = experiment
+        self._cache = cache
+        self._model = model
+
+    def _cached_judgments(
+        self,
+        user_prompt: str,
+        query: str,
+        results: list[SearchResult],
+        query_type: str | None,
+    ) -> list[JudgmentRecord | None] | None:
+        if self._cache is None:
+            return None
+        response = self._cache.get(self._model, self._system_prompt, user_prompt)
+        if response is None:
+            return None
+        judgments = self.parse_batch_result(
+            response, query, results, query_type=query_type
+        )
+        if any(j is None for j in judgments):
+            return None
+        for j in judgments:
+            if j is not None:
+                j.metadata["cached"] = True
+        return judgments
+
+    def _store(
+        self,
+        user_prompt: str,
+        response: LLMResponse,
+        judgments: list[JudgmentRecord | None],
+    ) -> None:
+        if self._cache is not None and all(j is not None for j in judgments):
+            self._cache.put(self._model, self._system_prompt, user_prompt, response)
+
+    @staticmethod
+    def max_tokens_for(num_results: int) -> int:
+        return _LISTWISE_BASE_TOKENS + _LISTWISE_TOKENS_PER_RESULT * num_results
+
+    def _build_user_prompt(
+        self,
+        query: str,
+        results: list[SearchResult],
+        corrected_query: str | None,
+        overlay: str | None,
+    ) -> str:
+        kwargs: dict[str, str] = {}
+        if corrected_query is not None:
+            kwargs["corrected_query"] = corrected_query
+        if overlay is not None:
+            kwargs["overlay"] = overlay
+        return self._format_user_prompt(query, results, **kwargs)
+
+    def judge(
+        self,
+        query: str,
+        results: list[SearchResult],
+        *,
+        query_type: str | None = None,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> list[JudgmentRecord | None]:
+        """Judge every result for *query* in one call (``None`` = missing)."""
+        user_prompt = self._build_user_prompt(query, results, corrected_query, overlay)
+        max_tokens = self.max_tokens_for(len(results))
+        cached = self._cached_judgments(user_prompt, query, results, query_type)
+        if cached is not None:
+            self._log_parsed(query, cached)
+            return cached
+
+        judgments: list[JudgmentRecord | None] = [None] * len(results)
+        for _attempt in range(2):
+            try:
+                response = self._client.complete(
+                    self._system_prompt, user_prompt, max_tokens=max_tokens
+                )
+            except Exception:
+                if _attempt == 0:
+                    logger.debug("listwise judge failed for %r, retrying", query)
+                    continue
+                raise
+            judgments = self.parse_batch_result(
+                response, query, results, query_type=query_type
+            )
+            if any(j is not None for j in judgments):
+                self._store(user_prompt, response, judgments)
+                break
+            if _attempt == 0:
+                logger.debug("listwise judge parse failed for %r, retrying", query)
+        self._log_parsed(query, judgments)
+        return judgments
+
+    async def ajudge(
+        self,
+        query: str,
+        results: list[SearchResult],
+        *,
+        query_type: str | None = None,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> list[JudgmentRecord | None]:
+        """Async variant of :meth:`judge` using :meth:`LLMClient.acomplete`."""
+        user_prompt = self._build_user_prompt(query, results, corrected_query, overlay)
+        max_tokens = self.max_tokens_for(len(results))
+        cached = self._cached_judgments(user_prompt, query, results, query_type)
+        if cached is not None:
+            self._log_parsed(query, cached)
+            return cached
+
+        judgments: list[JudgmentRecord | None] = [None] * len(results)
+        for _attempt in range(2):
+            try:
+                response = await self._client.acomplete(
+                    self._system_prompt, user_prompt, max_tokens=max_tokens
+                )
+            except Exception:
+                if _attempt == 0:
+                    logger.debug("listwise judge failed for %r, retrying", query)
+                    continue
+                raise
+            judgments = self.parse_batch_result(
+                response, query, results, query_type=query_type
+            )
+            if any(j is not None for j in judgments):
+                self._store(user_prompt, response, judgments)
+                break
+            if _attempt == 0:
+                logger.debug("listwise judge parse failed for %r, retrying", query)
+        self._log_parsed(query, judgments)
+        return judgments
+
+    @staticmethod
+    def _log_parsed(query: str, judgments: list[JudgmentRecord | None]) -> None:
+        logger.debug(
+            "listwise judge: query=%r, parsed %d/%d positions",
+            query,
+            sum(1 for j in judgments if j is not None),
+            len(judgments),
+        )
+
+    def prepare_request(
+        self,
+        custom_id: str,
+        query: str,
+        results: list[SearchResult],
+        *,
+        corrected_query: str | None = None,
+        overlay: str | None = None,
+    ) -> BatchRequest:
+        """Build a BatchRequest covering all results for one query."""
+        return BatchRequest(
+            custom_id=custom_id,
+            system_prompt=self._system_prompt,
+            user_prompt=self._build_user_prompt(
+                query, results, corrected_query, overlay
+            ),
+            max_tokens=self.max_tokens_for(len(results)),
+        )
+
+    def parse_batch_result(
+        self,
+        response: LLMResponse,
+        query: str,
+        results: list[SearchResult],
+        *,
+        query_type: str | None = None,
+    ) -> list[JudgmentRecord | None]:
+        """Parse a listwise response into one record per result position.
+
+        Token usage is split evenly across the parsed positions so per-run
+        token totals stay exact.
+        """
+        parsed = self._parse_response(response.content)
+        found = [i for i in range(len(results)) if i + 1 in parsed]
+        judgments: list[JudgmentRecord | None] = [None] * len(results)
+        for rank, i in enumerate(found):
+            score, attribute_verdict, reasoning = parsed[i + 1]
+            share_in, extra_in = divmod(response.input_tokens, len(found))
+            share_out, extra_out = divmod(response.output_tokens, len(found))
+            share_cached, extra_cached = divmod(
+                response.cached_input_tokens, len(found)
+            )
+            judgment = JudgmentRecord(
+                query=query,
+                product=results[i],
+                score=score,
+                reasoning=reasoning,
+                attribute_verdict=attribute_verdict,
+                model=response.model,
+                experiment=self._experiment,
+                query_type=query_type,
+                metadata={
+                    "input_tokens": share_in + (extra_in if rank == 0 else 0),
+                    "output_tokens": share_out + (extra_out if rank == 0 else 0),
+                    "listwise": True,
+                },
+            )
+            if response.cached_input_tokens:
+                judgment.metadata["cached_input_tokens"] = share_cached + (
+                    extra_cached if rank == 0 else 0
+                )
+            judgments[i] = judgment
+        return judgments
+
+    @staticmethod
+    def _parse_response(response_text: str) -> dict[int, tuple[int, str, str]]:
+        """Split a listwise response into per-position (score, attrs, reasoning).
+
+        Keys are 1-based result numbers.  Blocks without a valid score are
+        left out rather than raising.
+        """
+        headers = list(_RESULT_HEADER_RE.finditer(response_text))
+        parsed: dict[int, tuple[int, str, str]] = {}
+        for n, header in enumerate(headers):
+            end = headers[n + 1].start() if n + 1 < len(headers) else None
+            block = response_text[header.end() : end]
+            try:
+                parsed.setdefault(
+                    int(header.group(1)), RelevanceJudge._parse_response(block)
+                )
+            except ValueError:
+                logger.debug("listwise parse failure for result %s", header.group(1))
+        return parsed
+
+
 class CorrectionJudge:
     """Judges whether a query correction was appropriate using an LLM."""
 
@@ -226,6 +710,54 @@ class CorrectionJudge:
                 )
                 continue
 
+        return self._to_judgment(
+            original_query, corrected_query, verdict, reasoning, response
+        )
+
+    async def ajudge(
+        self,
+        original_query: str,
+        corrected_query: str,
+    ) -> CorrectionJudgment:
+        """Async variant of :meth:`judge` using :meth:`LLMClient.acomplete`."""
+        user_prompt = self._format_user_prompt(original_query, corrected_query)
+
+        verdict = "error"
+        reasoning = ""
+        response = None
+        for _attempt in range(2):
+            try:
+                response = await self._client.acomplete(
+                    self._system_prompt, user_prompt
+                )
+            except Exception:
+                if _attempt == 0:
+                    logger.debug(
+                        "correction judge failed for %r, retrying", original_query
+                    )
+                    continue
+                raise
+            verdict, reasoning = self._parse_response(response.content)
+            if verdict != "error":
+                break
+            if _attempt == 0:
+                logger.debug(
+                    "correction judge parse failed for %r, retrying", original_query
+                )
+                continue
+
+        return self._to_judgment(
+            original_query, corrected_query, verdict, reasoning, response
+        )
+
+    def _to_judgment(
+        self,
+        original_query: str,
+        corrected_query: str,
+        verdict: str,
+        reasoning: str,
+        response: LLMResponse | None,
+    ) -> CorrectionJudgment:
         logger.debug(
             "correction judge: %r -> %r, verdict=%s",
             original_query,
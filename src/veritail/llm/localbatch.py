@@ -0,0 +1,343 @@
+"""Batch API emulation for servers without one.
+
+Local OpenAI-compatible servers (Ollama, vLLM, LM Studio) implement chat
+completions but not the Files and Batches APIs.  :class:`LocalBatchClient`
+wraps any :class:`~veritail.llm.client.LLMClient` and emulates the batch
+operations by running the requests through ``complete`` on a pool of worker
+threads, so ``--batch`` and its checkpoint/resume workflow work against them.
+
+Every batch lives in a spool directory::
+
+    <spool_dir>/<batch_id>/requests.jsonl   # written once on submit
+    <spool_dir>/<batch_id>/results.jsonl    # one line per finished request
+    <spool_dir>/<batch_id>/cancelled        # present once cancelled
+
+Workers are daemon threads, so an interrupted process stops at once.  The
+spool survives it: polling a batch this process is not running picks up the
+requests that have no result yet.  A batch's spool is deleted by
+:meth:`LocalBatchClient.release_batch` once its results are no longer
+needed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from veritail.llm.client import BatchRequest, BatchResult, LLMClient, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Spool location under the output directory, used by ``veritail run``
+SPOOL_DIRNAME = "local-batches"
+DEFAULT_LOCAL_BATCH_CONCURRENCY = 8
+
+_REQUESTS_FILE = "requests.jsonl"
+_RESULTS_FILE = "results.jsonl"
+_CANCELLED_FILE = "cancelled"
+
+
+def _read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the JSON objects in *path*, skipping a torn last line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Only the line being written when the process died can be
+                # incomplete; its request runs again.
+                logger.debug("local batch: skipping torn line in %s", path)
+
+
+def _ends_mid_line(path: Path) -> bool:
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _result_entry(
+    custom_id: str, response: LLMResponse | None, error: str | None
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {"custom_id": custom_id, "error": error}
+    entry["response"] = (
+        None
+        if response is None
+        else {
+            "content": response.content,
+            "model": response.model,
+            "input_tokens": response.input_tokens,
+            "output_tokens": response.output_tokens,
+            "cached_input_tokens": response.cached_input_tokens,
+        }
+    )
+    return entry
+
+
+class _Runner:
+    """Worker threads working through one batch's unfinished requests."""
+
+    def __init__(
+        self,
+        client: LLMClient,
+        batch_dir: Path,
+        pending: list[BatchRequest],
+        slots: threading.Semaphore,
+        concurrency: int,
+    ) -> None:
+        self.stop = threading.Event()
+        self._client = client
+        self._slots = slots
+        self._queue: queue.SimpleQueue[BatchRequest] = queue.SimpleQueue()
+        for request in pending:
+            self._queue.put(request)
+        self._lock = threading.Lock()
+        results_path = batch_dir / _RESULTS_FILE
+        torn = _ends_mid_line(results_path)
+        self._results = open(results_path, "a", encoding="utf-8")
+        if torn:
+            # Close off the line an earlier process died writing
+            self._results.write("\n")
+        self._active = min(concurrency, len(pending))
+        self._threads = [
+            threading.Thread(
+                target=self._work, name=f"local-batch-{batch_dir.name}", daemon=True
+            )
+            for _ in range(self._active)
+        ]
+        if not self._threads:
+            self._results.close()
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        try:
+            while not self.stop.is_set():
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+                with self._slots:
+                    try:
+                        response = self._client.complete(
+                            request.system_prompt,
+                            request.user_prompt,
+                            max_tokens=request.max_tokens,
+                        )
+                        entry = _result_entry(request.custom_id, response, None)
+                    except Exception as e:
+                        entry = _result_entry(request.custom_id, None, str(e))
+                with self._lock:
+                    if self.stop.is_set():
+                        return
+                    self._results.write(json.dumps(entry) + "\n")
+                    self._results.flush()
+        finally:
+            with self._lock:
+                self._active -= 1
+                if self._active == 0:
+                    self._results.close()
+
+
+class LocalBatchClient(LLMClient):
+    """Emulate batch operations on top of *client*'s synchronous calls.
+
+    Up to *concurrency* requests run at once across all batches of a
+    process.  Synchronous calls and preflight checks go straight to
+    *client*.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        spool_dir: str | Path,
+        *,
+        concurrency: int = DEFAULT_LOCAL_BATCH_CONCURRENCY,
+    ) -> None:
+        self._client = client
+        self._spool_dir = Path(spool_dir)
+        self._concurrency = concurrency
+        self._runners: dict[str, _Runner] = {}
+        self._totals: dict[str, int] = {}
+        self._slots = threading.Semaphore(concurrency)
+        self._lock = threading.Lock()
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        return self._client.complete(system_prompt, user_prompt, max_tokens=max_tokens)
+
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        return await self._client.acomplete(
+            system_prompt, user_prompt, max_tokens=max_tokens
+        )
+
+    def preflight_check(self) -> None:
+        self._client.preflight_check()
+
+    def supports_batch(self) -> bool:
+        return True
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        return self._spool_dir / batch_id
+
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex[:16]}"
+        batch_dir = self._batch_dir(batch_id)
+        batch_dir.mkdir(parents=True)
+        # Written under a temporary name so a spool never holds half a batch
+        tmp_path = batch_dir / f"{_REQUESTS_FILE}.tmp"
+        count = 0
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for request in requests:
+                entry = {
+                    "custom_id": request.custom_id,
+                    "system_prompt": request.system_prompt,
+                    "user_prompt": request.user_prompt,
+                    "max_tokens": request.max_tokens,
+                }
+                f.write(json.dumps(entry) + "\n")
+                count += 1
+        os.replace(tmp_path, batch_dir / _REQUESTS_FILE)
+        logger.debug("local batch submitted: id=%s, requests=%d", batch_id, count)
+        self._ensure_running(batch_id)
+        return batch_id
+
+    def _requests(self, batch_id: str) -> list[BatchRequest]:
+        return [
+            BatchRequest(**entry)
+            for entry in _read_jsonl(self._batch_dir(batch_id) / _REQUESTS_FILE)
+        ]
+
+    def _finished_ids(self, batch_id: str) -> set[str]:
+        results_path = self._batch_dir(batch_id) / _RESULTS_FILE
+        if not results_path.exists():
+            return set()
+        return {entry["custom_id"] for entry in _read_jsonl(results_path)}
+
+    def _ensure_running(self, batch_id: str) -> None:
+        """Start workers for the batch's unfinished requests if none run here."""
+        with self._lock:
+            if batch_id in self._runners:
+                return
+            if (self._batch_dir(batch_id) / _CANCELLED_FILE).exists():
+                return
+            finished = self._finished_ids(batch_id)
+            pending = [
+                r for r in self._requests(batch_id) if r.custom_id not in finished
+            ]
+            if finished and pending:
+                logger.debug(
+                    "local batch resumed: id=%s, %d finished, %d pending",
+                    batch_id,
+                    len(finished),
+                    len(pending),
+                )
+            self._runners[batch_id] = _Runner(
+                self._client,
+                self._batch_dir(batch_id),
+                pending,
+                self._slots,
+                self._concurrency,
+            )
+
+    def poll_batch(self, batch_id: str) -> tuple[str, int, int]:
+        batch_dir = self._batch_dir(batch_id)
+        if not (batch_dir / _REQUESTS_FILE).exists():
+            return ("failed", 0, 0)
+        if (batch_dir / _CANCELLED_FILE).exists():
+            status = "failed"
+        else:
+            self._ensure_running(batch_id)
+            status = "in_progress"
+        if batch_id not in self._totals:
+            self._totals[batch_id] = len(self._requests(batch_id))
+        total = self._totals[batch_id]
+        completed = len(self._finished_ids(batch_id))
+        if completed >= total:
+            status = "completed"
+        logger.debug(
+            "local batch poll: id=%s, status=%s, %d/%d",
+            batch_id,
+            status,
+            completed,
+            total,
+        )
+        return (status, completed, total)
+
+    def retrieve_batch_results(self, batch_id: str) -> list[BatchResult]:
+        return list(self.iter_batch_results(batch_id))
+
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
+        results_path = self._batch_dir(batch_id) / _RESULTS_FILE
+        if not results_path.exists():
+            return
+        seen: set[str] = set()
+        for entry in _read_jsonl(results_path):
+            custom_id = entry["custom_id"]
+            if custom_id in seen:
+                continue
+            seen.add(custom_id)
+            response = entry.get("response")
+            yield BatchResult(
+                custom_id=custom_id,
+                response=None if response is None else LLMResponse(**response),
+                error=entry.get("error"),
+            )
+
+    def cancel_batch(self, batch_id: str) -> bool:
+        batch_dir = self._batch_dir(batch_id)
+        if not batch_dir.exists():
+            return False
+        (batch_dir / _CANCELLED_FILE).touch()
+        with self._lock:
+            runner = self._runners.get(batch_id)
+        if runner is not None:
+            runner.stop.set()
+        logger.debug("local batch cancelled: id=%s", batch_id)
+        return True
+
+    def batch_error_message(self, batch_id: str) -> str | None:
+        batch_dir = self._batch_dir(batch_id)
+        if not (batch_dir / _REQUESTS_FILE).exists():
+            return f"No local batch spool at {batch_dir}."
+        if (batch_dir / _CANCELLED_FILE).exists():
+            return "The local batch was cancelled."
+        return None
+
+    def batch_custom_id_order(self, batch_id: str) -> list[str]:
+        return self._client.batch_custom_id_order(batch_id)
+
+    def release_batch(self, batch_id: str) -> None:
+        """Delete the batch's spool, and the spool directory once empty."""
+        with self._lock:
+            runner = self._runners.pop(batch_id, None)
+            self._totals.pop(batch_id, None)
+        if runner is not None:
+            runner.stop.set()
+        shutil.rmtree(self._batch_dir(batch_id), ignore_errors=True)
+        try:
+            self._spool_dir.rmdir()
+        except OSError:
+            pass
+        logger.debug("local batch released: id=%s", batch_id)
+
+    def close(self) -> None:
+        """Stop this process's workers; the spool keeps unfinished work."""
+        with self._lock:
+            runners = list(self._runners.values())
+            self._runners.clear()
+        for runner in runners:
+            runner.stop.set()
+        self._client.close()
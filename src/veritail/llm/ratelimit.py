@@ -0,0 +1,432 @@
+"""Client-side rate limiting for LLM providers.
+
+:class:`RateLimiter` enforces requests-per-minute (RPM) and tokens-per-minute
+(TPM) budgets with token buckets, and adapts to the provider's real limits
+with AIMD: every rate-limit error halves the allowed rate, and sustained
+success grows it back additively towards the budget.  Rate-limit errors
+pause *all* callers sharing the limiter until the provider's ``Retry-After``
+has elapsed.
+
+:class:`RateLimitedClient` wraps any :class:`~veritail.llm.client.LLMClient`
+so every ``complete``/``acomplete`` call goes through a limiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+from veritail.llm.client import BatchRequest, BatchResult, LLMClient, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# AIMD tuning: halve on every rate-limit error, regain 2% of the budget per
+# second of error-free traffic.  After an error the rate may only climb back
+# to 90% of where it failed; that ceiling itself creeps up slowly so a
+# transient 429 does not cap throughput for the rest of the run.
+_DECREASE_FACTOR = 0.5
+_CEILING_FACTOR = 0.9
+_INCREASE_PER_SECOND = 0.02
+_CEILING_INCREASE_PER_SECOND = 0.002
+_MIN_FACTOR = 0.05
+
+_MAX_BACKOFF_SECONDS = 60.0
+
+_REQUEST_LIMIT_HEADERS = (
+    "x-ratelimit-limit-requests",
+    "anthropic-ratelimit-requests-limit",
+)
+_TOKEN_LIMIT_HEADERS = (
+    "x-ratelimit-limit-tokens",
+    "anthropic-ratelimit-tokens-limit",
+    "anthropic-ratelimit-input-tokens-limit",
+)
+_RESET_HEADERS = ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+
+
+@dataclass
+class RateLimit:
+    """Per-minute request and token budgets for one model."""
+
+    rpm: int | None = None
+    tpm: int | None = None
+
+
+def parse_rate_limits(specs: tuple[str, ...] | list[str]) -> dict[str, RateLimit]:
+    """Parse ``MODEL=RPM[:TPM]`` specs into a model -> budget mapping.
+
+    Either budget may be left empty (``gpt-4o=:200000``).  ``*`` as the model
+    name applies to any model without its own entry.  Raises ``ValueError``
+    on malformed specs.
+    """
+    limits: dict[str, RateLimit] = {}
+    for spec in specs:
+        model, sep, budgets = spec.partition("=")
+        model = model.strip()
+        if not sep or not model:
+            raise ValueError(
+                f"Invalid rate limit {spec!r}. Expected MODEL=RPM[:TPM], "
+                "e.g. gpt-4o=500:200000."
+            )
+        rpm_text, _, tpm_text = budgets.partition(":")
+        try:
+            rpm = int(rpm_text) if rpm_text.strip() else None
+            tpm = int(tpm_text) if tpm_text.strip() else None
+        except ValueError:
+            raise ValueError(
+                f"Invalid rate limit {spec!r}. RPM and TPM must be integers."
+            ) from None
+        if rpm is None and tpm is None:
+            raise ValueError(f"Invalid rate limit {spec!r}. Give an RPM or a TPM.")
+        if (rpm is not None and rpm < 1) or (tpm is not None and tpm < 1):
+            raise ValueError(f"Invalid rate limit {spec!r}. Budgets must be >= 1.")
+        limits[model] = RateLimit(rpm=rpm, tpm=tpm)
+    return limits
+
+
+def resolve_rate_limit(limits: Mapping[str, RateLimit], model: str) -> RateLimit | None:
+    """Return the budget configured for *model*, falling back to ``*``."""
+    return limits.get(model) or limits.get("*")
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough token count for *texts* (about four characters per token)."""
+    return max(1, sum(len(t) for t in texts) // 4)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return True if *exc* is a provider rate-limit or overload error."""
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status in (429, 529):
+        return True
+    if type(exc).__name__ == "RateLimitError":
+        return True
+    return "RESOURCE_EXHAUSTED" in str(exc)
+
+
+def _headers(exc: BaseException) -> Mapping[str, str]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return {}
+    return {str(k).lower(): str(v) for k, v in headers.items()}
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse OpenAI-style reset durations such as ``1s``, ``6m0s``, ``20ms``."""
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not parts:
+        return None
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(n) * scale[unit] for n, unit in parts)
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """Extract how long the provider asked us to wait, if it said."""
+    headers = _headers(exc)
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if "retry-after" in headers:
+        value = headers["retry-after"]
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    resets = [
+        d
+        for d in (_parse_duration(headers[h]) for h in _RESET_HEADERS if h in headers)
+        if d is not None
+    ]
+    if resets:
+        return max(resets)
+    # Gemini reports the delay in the error body as RetryInfo.retryDelay.
+    match = re.search(r"retryDelay['\"]?\s*[:=]\s*['\"]?(\d+(?:\.\d+)?)s", str(exc))
+    if match:
+        return float(match.group(1))
+    return None
+
+
+def _header_int(headers: Mapping[str, str], names: tuple[str, ...]) -> int | None:
+    for name in names:
+        if name in headers:
+            try:
+                return int(float(headers[name]))
+            except ValueError:
+                continue
+    return None
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` per second.
+
+    :meth:`reserve` always succeeds and may drive the balance negative; the
+    returned delay is how long the caller must wait before the reservation
+    is covered.  This lets threads and coroutines share one bucket without
+    holding a lock while they sleep.
+    """
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.per_minute = per_minute
+        self._tokens = per_minute
+        self._updated = now
+
+    def _refill(self, now: float, factor: float) -> None:
+        capacity = self.per_minute * factor
+        rate = capacity / 60.0
+        self._tokens = min(capacity, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def reserve(self, amount: float, now: float, factor: float) -> float:
+        self._refill(now, factor)
+        # Never ask for more than the bucket can ever hold.
+        self._tokens -= min(amount, self.per_minute * factor)
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / (self.per_minute * factor / 60.0)
+
+    def adjust(self, delta: float) -> None:
+        self._tokens -= delta
+
+
+class RateLimiter:
+    """Shared RPM/TPM budget with AIMD adaptation to provider rate limits.
+
+    Budgets left as ``None`` are unlimited until the provider reports its
+    limit in rate-limit headers, or until the first rate-limit error (then
+    the request rate observed over the last minute becomes the budget).
+    Thread-safe; one instance may be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._requests = _TokenBucket(rpm, now) if rpm else None
+        self._tokens = _TokenBucket(tpm, now) if tpm else None
+        self._factor = 1.0
+        self._ceiling = 1.0
+        self._last_increase = now
+        self._blocked_until = 0.0
+        self._recent: deque[float] = deque()
+        self.rate_limited_count = 0
+
+    @property
+    def factor(self) -> float:
+        """Fraction of the budget currently allowed (1.0 = full budget)."""
+        return self._factor
+
+    @property
+    def rpm(self) -> float | None:
+        return self._requests.per_minute if self._requests else None
+
+    @property
+    def tpm(self) -> float | None:
+        return self._tokens.per_minute if self._tokens else None
+
+    def acquire(self, tokens: int) -> float:
+        """Reserve one request of *tokens* and return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            delay = max(0.0, self._blocked_until - now)
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1, now, self._factor))
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.reserve(tokens, now, self._factor))
+            self._recent.append(now + delay)
+            while self._recent and self._recent[0] < now - 60.0:
+                self._recent.popleft()
+            return delay
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once a response reports real usage."""
+        with self._lock:
+            if self._tokens is not None:
+                self._tokens.adjust(actual - estimated)
+
+    def record_success(self) -> None:
+        """Additive increase: grow the allowed rate back towards the budget."""
+        with self._lock:
+            now = self._clock()
+            elapsed = min(now - self._last_increase, 60.0)
+            if elapsed < 1.0:
+                return
+            self._ceiling = min(
+                1.0, self._ceiling + _CEILING_INCREASE_PER_SECOND * elapsed
+            )
+            self._factor = min(
+                self._ceiling, self._factor + _INCREASE_PER_SECOND * elapsed
+            )
+            self._last_increase = now
+
+    def record_rate_limited(self, exc: BaseException, attempt: int) -> float:
+        """Multiplicative decrease after a rate-limit error.
+
+        Learns missing budgets from the error's rate-limit headers, pauses
+        every caller until the provider's ``Retry-After`` (or an exponential
+        backoff) has elapsed, and returns that pause in seconds.
+        """
+        headers = _headers(exc)
+        wait = retry_after_seconds(exc)
+        if wait is None:
+            wait = min(_MAX_BACKOFF_SECONDS, 2.0**attempt)
+        with self._lock:
+            now = self._clock()
+            self.rate_limited_count += 1
+            if self._requests is None:
+                limit = _header_int(headers, _REQUEST_LIMIT_HEADERS)
+                if limit is None:
+                    window = max(1.0, now - self._recent[0]) if self._recent else 60.0
+                    limit = max(1, round(len(self._recent) * 60.0 / window))
+                self._requests = _TokenBucket(limit, now)
+                self._requests.reserve(limit, now, 1.0)
+                self._factor = self._ceiling = 1.0
+            if self._tokens is None:
+                token_limit = _header_int(headers, _TOKEN_LIMIT_HEADERS)
+                if token_limit is not None:
+                    self._tokens = _TokenBucket(token_limit, now)
+            self._ceiling = max(_MIN_FACTOR, self._factor * _CEILING_FACTOR)
+            self._factor = max(_MIN_FACTOR, self._factor * _DECREASE_FACTOR)
+            self._last_increase = now
+            self._blocked_until = max(self._blocked_until, now + wait)
+            logger.debug(
+                "rate limited: wait=%.1fs, factor=%.2f, rpm=%s, tpm=%s",
+                wait,
+                self._factor,
+                self.rpm,
+                self.tpm,
+            )
+        return wait
+
+
+class RateLimitedClient(LLMClient):
+    """Wrap an :class:`LLMClient` so its calls respect a :class:`RateLimiter`.
+
+    Rate-limit errors are retried (up to *max_retries* times) after the
+    limiter's pause; any other error propagates unchanged.  Batch
+    operations are passed straight through.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        limiter: RateLimiter,
+        *,
+        max_retries: int = 6,
+    ) -> None:
+        self._client = client
+        self._limiter = limiter
+        self._max_retries = max_retries
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter
+
+    def complete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        estimate = estimate_tokens(system_prompt, user_prompt)
+        for attempt in range(self._max_retries + 1):
+            delay = self._limiter.acquire(estimate)
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = self._client.complete(
+                    system_prompt, user_prompt, max_tokens=max_tokens
+                )
+            except Exception as exc:
+                if attempt == self._max_retries or not is_rate_limit_error(exc):
+                    raise
+                self._limiter.record_rate_limited(exc, attempt)
+                continue
+            return self._settle(estimate, response)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def acomplete(
+        self, system_prompt: str, user_prompt: str, *, max_tokens: int = 1024
+    ) -> LLMResponse:
+        estimate = estimate_tokens(system_prompt, user_prompt)
+        for attempt in range(self._max_retries + 1):
+            delay = self._limiter.acquire(estimate)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._client.acomplete(
+                    system_prompt, user_prompt, max_tokens=max_tokens
+                )
+            except Exception as exc:
+                if attempt == self._max_retries or not is_rate_limit_error(exc):
+                    raise
+                self._limiter.record_rate_limited(exc, attempt)
+                continue
+            return self._settle(estimate, response)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _settle(self, estimate: int, response: LLMResponse) -> LLMResponse:
+        actual = response.input_tokens + response.output_tokens
+        if actual:
+            self._limiter.record_usage(estimate, actual)
+        self._limiter.record_success()
+        return response
+
+    def preflight_check(self) -> None:
+        self._client.preflight_check()
+
+    def supports_batch(self) -> bool:
+        return self._client.supports_batch()
+
+    @property
+    def max_batch_requests(self) -> int | None:  # type: ignore[override]
+        return self._client.max_batch_requests
+
+    @property
+    def max_batch_bytes(self) -> int | None:  # type: ignore[override]
+        return self._client.max_batch_bytes
+
+    def submit_batch(self, requests: Iterable[BatchRequest]) -> str:
+        return self._client.submit_batch(requests)
+
+    def poll_batch(self, batch_id: str) -> tuple[str, int, int]:
+        return self._client.poll_batch(batch_id)
+
+    def retrieve_batch_results(self, batch_id: str) -> list[BatchResult]:
+        return self._client.retrieve_batch_results(batch_id)
+
+    def iter_batch_results(self, batch_id: str) -> Iterator[BatchResult]:
+        return self._client.iter_batch_results(batch_id)
+
+    def cancel_batch(self, batch_id: str) -> bool:
+        return self._client.cancel_batch(batch_id)
+
+    def batch_error_message(self, batch_id: str) -> str | None:
+        return self._client.batch_error_message(batch_id)
+
+    def batch_custom_id_order(self, batch_id: str) -> list[str]:
+        return self._client.batch_custom_id_order(batch_id)
+
+    def restore_batch_custom_ids(self, batch_id: str, custom_ids: list[str]) -> None:
+        self._client.restore_batch_custom_ids(batch_id, custom_ids)
+
+    def release_batch(self, batch_id: str) -> None:
+        self._client.release_batch(batch_id)
+
+    def close(self) -> None:
+        self._client.close()
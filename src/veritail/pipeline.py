@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
-from collections import defaultdict
-from collections.abc import Callable
-from dataclasses import asdict, replace
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Generator, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from functools import partial
+from typing import Any, Optional, Union
 
 from rich.console import Console
 from rich.progress import Progress
 
+from veritail.async_utils import EventLoopThread
 from veritail.backends import EvalBackend
 from veritail.batch_utils import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
     BatchFailedError,
+    group_by_system_prompt,
     poll_multiple_batches,
     poll_until_done,
+    shard_for_client,
+    submit_shards,
+    wait_for_cancellation,
 )
 from veritail.checkpoint import (
     BatchCheckpoint,
@@ -24,6 +36,7 @@ from veritail.checkpoint import (
     load_checkpoint,
     save_checkpoint,
     serialize_request_context,
+    update_checkpoint,
 )
 from veritail.checks import run_all_checks
 from veritail.checks.comparison import (
@@ -35,16 +48,27 @@ from veritail.checks.correction import (
     check_correction_vocabulary,
     check_unnecessary_correction,
 )
+from veritail.llm.cache import JudgmentCache
 from veritail.llm.classifier import (
     CLASSIFICATION_MAX_TOKENS,
     build_classification_system_prompt,
     classify_query,
     parse_classification_with_overlay,
 )
-from veritail.llm.client import BatchRequest, LLMClient
-from veritail.llm.judge import CORRECTION_SYSTEM_PROMPT, CorrectionJudge, RelevanceJudge
+from veritail.llm.client import BatchRequest, BatchResult, LLMClient, LLMResponse
+from veritail.llm.judge import (
+    CORRECTION_SYSTEM_PROMPT,
+    CorrectionJudge,
+    ListwiseRelevanceJudge,
+    RelevanceJudge,
+)
 from veritail.metrics.ir import compute_all_metrics
-from veritail.rubrics import SYSTEM_PROMPT, format_user_prompt
+from veritail.rubrics import (
+    LISTWISE_SYSTEM_PROMPT,
+    SYSTEM_PROMPT,
+    format_listwise_user_prompt,
+    format_user_prompt,
+)
 from veritail.types import (
     CheckResult,
     CorrectionJudgment,
@@ -60,6 +84,70 @@ from veritail.types import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Failed batch requests are resubmitted in up to this many follow-up
+# batches; once no more than DEFAULT_SYNC_RETRY_LIMIT remain, they are
+# judged with synchronous calls instead.
+DEFAULT_RETRY_ROUNDS = 2
+DEFAULT_SYNC_RETRY_LIMIT = 10
+# Parallel synchronous calls used to finish requests from a batch that was
+# given up on at the deadline or after stalling.
+DEFAULT_STRAGGLER_CONCURRENCY = 8
+# Batch results are handed to the backend in chunks of this many judgments
+_LOG_CHUNK_SIZE = 1000
+
+
+def _log_query_complete(
+    backend: EvalBackend, experiment: str, query_index: int, judgment_count: int
+) -> None:
+    try:
+        backend.log_query_complete(experiment, query_index, judgment_count)
+    except Exception as e:
+        console.print(f"[yellow]Warning: failed to log query to backend: {e}")
+
+
+def _classification_targets(
+    queries: list[QueryEntry], overlay_keys: dict[str, str] | None
+) -> list[tuple[int, QueryEntry]]:
+    if overlay_keys:
+        # Classify all queries when overlays are present, except those whose
+        # type and overlay are both given in the query file
+        return [
+            (i, q)
+            for i, q in enumerate(queries)
+            if q.type is None or q.overlay not in overlay_keys
+        ]
+    return [(i, q) for i, q in enumerate(queries) if q.type is None]
+
+
+def _classify_entry(
+    llm_client: LLMClient,
+    query_entry: QueryEntry,
+    instructions: str | None,
+    vertical_text: str | None,
+    overlay_keys: dict[str, str] | None,
+) -> bool:
+    """Classify one query in place. Returns True if its type was newly set."""
+    inferred_type, inferred_overlay = classify_query(
+        llm_client,
+        query_entry.query,
+        instructions=instructions,
+        vertical=vertical_text,
+        overlay_keys=overlay_keys,
+    )
+    classified = False
+    if inferred_type is not None and query_entry.type is None:
+        query_entry.type = inferred_type
+        classified = True
+    if inferred_overlay is not None:
+        query_entry.overlay = inferred_overlay
+    logger.debug(
+        "classified %r -> type=%s, overlay=%s",
+        query_entry.query,
+        inferred_type,
+        inferred_overlay,
+    )
+    return classified
+
 
 def _classify_missing_query_types(
     queries: list[QueryEntry],
@@ -74,11 +162,7 @@ def _classify_missing_query_types(
     When *overlay_keys* is provided, ALL queries are classified (not just
     untyped) so that overlay keys are assigned.
     """
-    if overlay_keys:
-        # Classify all queries when overlays are present
-        targets = list(enumerate(queries))
-    else:
-        targets = [(i, q) for i, q in enumerate(queries) if q.type is None]
+    targets = _classification_targets(queries, overlay_keys)
     if not targets:
         return
 
@@ -91,51 +175,75 @@ def _classify_missing_query_types(
             total=len(targets),
         )
         for _i, query_entry in targets:
-            inferred_type, inferred_overlay = classify_query(
-                llm_client,
-                query_entry.query,
-                instructions=instructions,
-                vertical=vertical_text,
-                overlay_keys=overlay_keys,
-            )
-            if inferred_type is not None and query_entry.type is None:
-                query_entry.type = inferred_type
+            if _classify_entry(
+                llm_client, query_entry, instructions, vertical_text, overlay_keys
+            ):
                 classified += 1
-            if inferred_overlay is not None:
-                query_entry.overlay = inferred_overlay
-            logger.debug(
-                "classified %r -> type=%s, overlay=%s",
-                query_entry.query,
-                inferred_type,
-                inferred_overlay,
-            )
             progress.advance(task)
 
     console.print(f"[dim]Classified {classified}/{len(targets)} queries[/dim]")
 
 
-def _classify_missing_query_types_batch(
+def _submit_classifications(
+    executor: ThreadPoolExecutor,
+    queries: list[QueryEntry],
+    llm_client: LLMClient,
+    instructions: str | None,
+    vertical: VerticalContext | None,
+    overlay_keys: dict[str, str] | None,
+    on_done: Callable[[], None],
+) -> dict[int, Future[bool]]:
+    """Streaming pre-pass: submit every classification to *executor*.
+
+    Returns futures keyed by query index, submitted in query order so the
+    first queries are classified first and judging can start on them while
+    the rest of the pre-pass is still running.
+    """
+    targets = _classification_targets(queries, overlay_keys)
+    if targets:
+        console.print(
+            f"[cyan]Classifying {len(targets)} query type(s) via LLM...[/cyan]"
+        )
+    vertical_text = vertical.core if vertical else None
+    futures: dict[int, Future[bool]] = {}
+    for query_index, query_entry in targets:
+        future = executor.submit(
+            _classify_entry,
+            llm_client,
+            query_entry,
+            instructions,
+            vertical_text,
+            overlay_keys,
+        )
+        future.add_done_callback(lambda _f: on_done())
+        futures[query_index] = future
+    return futures
+
+
+@dataclass
+class _ClassificationBatch:
+    """A submitted classification batch and the queries it covers."""
+
+    batch_id: str
+    targets: list[tuple[int, QueryEntry]]
+
+
+def _submit_classification_batch(
     queries: list[QueryEntry],
     llm_client: LLMClient,
     instructions: str | None,
     vertical: VerticalContext | None,
-    poll_interval: int,
-    cancel_event: threading.Event | None = None,
     overlay_keys: dict[str, str] | None = None,
-) -> None:
-    """Batch variant of query type classification.
+) -> _ClassificationBatch | None:
+    """Batch variant of query type classification, first half.
 
-    Submits all untyped queries as a single batch request, polls for
-    completion, then parses and assigns types.  When *overlay_keys* is
-    provided, ALL queries are classified so that overlay keys are assigned.
-    Falls back to the synchronous path when there are no targets.
+    Submits the queries that need classifying (see
+    :func:`_classification_targets`) as a single batch without waiting for
+    it.  Returns ``None`` when there are no targets.
     """
-    if overlay_keys:
-        targets = list(enumerate(queries))
-    else:
-        targets = [(i, q) for i, q in enumerate(queries) if q.type is None]
+    targets = _classification_targets(queries, overlay_keys)
     if not targets:
-        return
+        return None
 
     vertical_text = vertical.core if vertical else None
     system_prompt = build_classification_system_prompt(instructions, vertical_text)
@@ -165,35 +273,464 @@ def _classify_missing_query_types_batch(
         batch_id,
         len(batch_requests),
     )
+    return _ClassificationBatch(batch_id, targets)
+
+
+def _collect_classification_batch(
+    llm_client: LLMClient,
+    classification: _ClassificationBatch,
+    poll_interval: int,
+    cancel_event: threading.Event | None = None,
+    overlay_keys: dict[str, str] | None = None,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+) -> None:
+    """Batch variant of query type classification, second half.
 
+    Polls the classification batch for completion, then parses and assigns
+    types and overlays in place.
+    """
+    targets = classification.targets
     poll_until_done(
         llm_client,
-        batch_id,
-        expected_total=len(batch_requests),
+        classification.batch_id,
+        expected_total=len(targets),
         poll_interval=poll_interval,
+        min_poll_interval=min_poll_interval,
+        max_poll_interval=max_poll_interval,
         label="Waiting for classification batch...",
         cancel_event=cancel_event,
     )
 
-    batch_results = llm_client.retrieve_batch_results(batch_id)
-    results_by_id = {r.custom_id: r for r in batch_results}
-
+    entries_by_id = {f"cls-{idx}": query_entry for idx, query_entry in targets}
     classified = 0
-    for idx, query_entry in targets:
-        result = results_by_id.get(f"cls-{idx}")
-        if result and result.response:
+    for result in llm_client.iter_batch_results(classification.batch_id):
+        entry = entries_by_id.get(result.custom_id)
+        if entry is not None and result.response:
             inferred_type, inferred_overlay = parse_classification_with_overlay(
                 result.response.content, overlay_keys
             )
-            if inferred_type is not None and query_entry.type is None:
-                query_entry.type = inferred_type
+            if inferred_type is not None and entry.type is None:
+                entry.type = inferred_type
                 classified += 1
             if inferred_overlay is not None:
-                query_entry.overlay = inferred_overlay
+                entry.overlay = inferred_overlay
 
+    # Nothing refers to the classification batch once it is read
+    llm_client.release_batch(classification.batch_id)
     console.print(f"[dim]Classified {classified}/{len(targets)} queries[/dim]")
 
 
+def _judgment_error(
+    config: ExperimentConfig,
+    query_entry: QueryEntry,
+    result: SearchResult,
+    exc: Exception,
+) -> JudgmentRecord:
+    console.print(
+        f"[red]LLM error for '{query_entry.query}' / '{result.product_id}': {exc}"
+    )
+    return JudgmentRecord(
+        query=query_entry.query,
+        product=result,
+        score=0,
+        reasoning=f"Error: {exc}",
+        attribute_verdict="n/a",
+        model=config.llm_model,
+        experiment=config.name,
+        query_type=query_entry.type,
+        metadata={"error": str(exc)},
+    )
+
+
+def _judge_result(
+    judge: RelevanceJudge,
+    config: ExperimentConfig,
+    query_entry: QueryEntry,
+    result: SearchResult,
+    corrected_query: str | None,
+    overlay_text: str | None,
+) -> JudgmentRecord:
+    """Judge one query-result pair, turning LLM errors into a score-0 record.
+
+    Safe to call from worker threads: it never raises for provider or parse
+    errors, so a single bad pair cannot take down the worker pool.
+    """
+    try:
+        return judge.judge(
+            query_entry.query,
+            result,
+            query_type=query_entry.type,
+            corrected_query=corrected_query,
+            overlay=overlay_text,
+        )
+    except Exception as e:
+        return _judgment_error(config, query_entry, result, e)
+
+
+async def _ajudge_result(
+    judge: RelevanceJudge,
+    config: ExperimentConfig,
+    query_entry: QueryEntry,
+    result: SearchResult,
+    corrected_query: str | None,
+    overlay_text: str | None,
+) -> JudgmentRecord:
+    """Async variant of :func:`_judge_result`."""
+    try:
+        return await judge.ajudge(
+            query_entry.query,
+            result,
+            query_type=query_entry.type,
+            corrected_query=corrected_query,
+            overlay=overlay_text,
+        )
+    except Exception as e:
+        return _judgment_error(config, query_entry, result, e)
+
+
+def _fill_missing_positions(
+    judgments: list[JudgmentRecord | None], query_entry: QueryEntry
+) -> list[int]:
+    missing = [i for i, j in enumerate(judgments) if j is None]
+    if missing:
+        logger.debug(
+            "listwise response missing %d/%d positions for %r; judging per pair",
+            len(missing),
+            len(judgments),
+            query_entry.query,
+        )
+    return missing
+
+
+def _judge_listwise(
+    listwise_judge: ListwiseRelevanceJudge,
+    judge: RelevanceJudge,
+    config: ExperimentConfig,
+    query_entry: QueryEntry,
+    results: list[SearchResult],
+    corrected_query: str | None,
+    overlay_text: str | None,
+) -> list[JudgmentRecord]:
+    """Judge all results for a query in one call.
+
+    Positions missing from the listwise response (or all of them, if the call
+    fails) are judged per pair with :func:`_judge_result`.
+    """
+    judgments: list[JudgmentRecord | None]
+    try:
+        judgments = listwise_judge.judge(
+            query_entry.query,
+            results,
+            query_type=query_entry.type,
+            corrected_query=corrected_query,
+            overlay=overlay_text,
+        )
+    except Exception as e:
+        logger.debug("listwise judge error for %r: %s", query_entry.query, e)
+        judgments = [None] * len(results)
+    for i in _fill_missing_positions(judgments, query_entry):
+        judgments[i] = _judge_result(
+            judge, config, query_entry, results[i], corrected_query, overlay_text
+        )
+    return [j for j in judgments if j is not None]
+
+
+async def _ajudge_listwise(
+    listwise_judge: ListwiseRelevanceJudge,
+    judge: RelevanceJudge,
+    config: ExperimentConfig,
+    query_entry: QueryEntry,
+    results: list[SearchResult],
+    corrected_query: str | None,
+    overlay_text: str | None,
+) -> list[JudgmentRecord]:
+    """Async variant of :func:`_judge_listwise`."""
+    judgments: list[JudgmentRecord | None]
+    try:
+        judgments = await listwise_judge.ajudge(
+            query_entry.query,
+            results,
+            query_type=query_entry.type,
+            corrected_query=corrected_query,
+            overlay=overlay_text,
+        )
+    except Exception as e:
+        logger.debug("listwise judge error for %r: %s", query_entry.query, e)
+        judgments = [None] * len(results)
+    missing = _fill_missing_positions(judgments, query_entry)
+    fallbacks = await asyncio.gather(
+        *(
+            _ajudge_result(
+                judge, config, query_entry, results[i], corrected_query, overlay_text
+            )
+            for i in missing
+        )
+    )
+    for i, judgment in zip(missing, fallbacks):
+        judgments[i] = judgment
+    return [j for j in judgments if j is not None]
+
+
+def _correction_error(
+    config: ExperimentConfig, original: str, corrected: str, exc: Exception
+) -> CorrectionJudgment:
+    console.print(
+        f"[red]Correction judge error for '{original}' -> '{corrected}': {exc}"
+    )
+    return CorrectionJudgment(
+        original_query=original,
+        corrected_query=corrected,
+        verdict="error",
+        reasoning=f"Error: {exc}",
+        model=config.llm_model,
+        experiment=config.name,
+        metadata={"error": str(exc)},
+    )
+
+
+def _judge_correction(
+    correction_judge: CorrectionJudge,
+    config: ExperimentConfig,
+    original: str,
+    corrected: str,
+) -> CorrectionJudgment:
+    """Judge one query correction, turning LLM errors into an error verdict."""
+    try:
+        return correction_judge.judge(original, corrected)
+    except Exception as e:
+        return _correction_error(config, original, corrected, e)
+
+
+async def _ajudge_correction(
+    correction_judge: CorrectionJudge,
+    config: ExperimentConfig,
+    original: str,
+    corrected: str,
+) -> CorrectionJudgment:
+    """Async variant of :func:`_judge_correction`."""
+    try:
+        return await correction_judge.ajudge(original, corrected)
+    except Exception as e:
+        return _correction_error(config, original, corrected, e)
+
+
+def _overlay_content(vertical: VerticalContext | None, key: str | None) -> str | None:
+    """Return the overlay text for *key*, or ``None`` if it is not defined."""
+    if vertical and key and key in vertical.overlays:
+        return vertical.overlays[key].content
+    return None
+
+
+def _reused_batch_results(
+    judge: RelevanceJudge, requests: list[BatchRequest]
+) -> dict[str, tuple[LLMResponse, str]]:
+    """Answer the already-judged subset of *requests*, keyed by custom_id.
+
+    Values are the reused response and its marker (see
+    :meth:`RelevanceJudge.reuse`).
+    """
+    reused: dict[str, tuple[LLMResponse, str]] = {}
+    for req in requests:
+        hit = judge.reuse(req)
+        if hit is not None:
+            reused[req.custom_id] = hit
+    return reused
+
+
+def _print_reused(reused: dict[str, tuple[LLMResponse, str]]) -> None:
+    deduplicated = sum(1 for _, marker in reused.values() if marker == "deduplicated")
+    if deduplicated:
+        console.print(
+            f"[dim]Deduplicated {deduplicated} request(s) already judged for "
+            "the other configuration, skipped from the batch[/dim]"
+        )
+    if len(reused) > deduplicated:
+        console.print(
+            f"[dim]Judgment cache: {len(reused) - deduplicated} request(s) "
+            "already judged, skipped from the batch[/dim]"
+        )
+
+
+def _print_dedupe_savings(
+    judgments_a: list[JudgmentRecord], judgments_b: list[JudgmentRecord]
+) -> None:
+    saved = count_deduplicated(judgments_a) + count_deduplicated(judgments_b)
+    total = len(judgments_a) + len(judgments_b)
+    logger.debug("dual dedupe: %d of %d judgments reused", saved, total)
+    console.print(
+        f"[dim]Deduplicated {saved} of {total} judgments across both "
+        f"configurations ({saved} LLM calls saved)[/dim]"
+    )
+
+
+def count_deduplicated(judgments: list[JudgmentRecord]) -> int:
+    """Count judgments reused from the other configuration of a dual run."""
+    return sum(1 for j in judgments if j.metadata.get("deduplicated"))
+
+
+def index_baseline(judgments: list[JudgmentRecord]) -> dict[str, JudgmentRecord]:
+    """Index a prior experiment's judgments by their ``pair_hash``.
+
+    Failed judgments and judgments written before pair hashes were recorded
+    are left out, so those pairs are judged again.
+    """
+    return {
+        j.metadata["pair_hash"]: j
+        for j in judgments
+        if j.metadata.get("pair_hash") and "error" not in j.metadata
+    }
+
+
+def count_reused(judgments: list[JudgmentRecord]) -> int:
+    """Count judgments copied from a baseline experiment."""
+    return sum(1 for j in judgments if j.metadata.get("reused_from"))
+
+
+def _print_token_usage(judgments: list[JudgmentRecord]) -> None:
+    """Print the run's relevance token usage, including prompt-cache reads."""
+    input_tokens = sum(j.metadata.get("input_tokens", 0) for j in judgments)
+    output_tokens = sum(j.metadata.get("output_tokens", 0) for j in judgments)
+    cached = sum(j.metadata.get("cached_input_tokens", 0) for j in judgments)
+    if not (input_tokens or output_tokens or cached):
+        return
+    logger.debug(
+        "token usage: input=%d, cached=%d, output=%d",
+        input_tokens,
+        cached,
+        output_tokens,
+    )
+    console.print(
+        f"[dim]Tokens: {input_tokens:,} input, {cached:,} read from the "
+        f"provider prompt cache, {output_tokens:,} output[/dim]"
+    )
+
+
+def _print_baseline_reuse(judgments: list[JudgmentRecord]) -> None:
+    reused = count_reused(judgments)
+    logger.debug("baseline: %d of %d judgments reused", reused, len(judgments))
+    console.print(
+        f"[dim]Baseline: reused {reused} of {len(judgments)} judgments "
+        f"({len(judgments) - reused} judged by the LLM)[/dim]"
+    )
+
+
+def _fetch_results(
+    adapter: Callable[[str], SearchResponse | list[SearchResult]],
+    query: str,
+    top_k: int,
+) -> tuple[list[SearchResult], str | None]:
+    """Call the adapter and normalize its response to (results, corrected_query)."""
+    raw_response = adapter(query)
+    if isinstance(raw_response, SearchResponse):
+        response = raw_response
+    else:
+        response = SearchResponse(results=raw_response)
+    corrected_query = response.corrected_query
+    # Normalize empty strings to None
+    if corrected_query is not None and not corrected_query.strip():
+        corrected_query = None
+    return response.results[:top_k], corrected_query
+
+
+_FetchOutcome = Union[tuple[list[SearchResult], Optional[str]], Exception]
+
+
+@dataclass
+class _StageStats:
+    """Queue depths and wait times for the fetch -> check -> judge pipeline.
+
+    *fetch_wait* is time the main loop spent blocked on the adapter and
+    *judge_wait* time spent blocked on LLM judgments; whichever dominates is
+    the bottleneck.  Depths are sampled once per query.
+    """
+
+    fetch_wait: float = 0.0
+    judge_wait: float = 0.0
+    classify_wait: float = 0.0
+    samples: int = 0
+    fetch_depth_sum: int = 0
+    judge_depth_sum: int = 0
+    fetch_depth_max: int = 0
+    judge_depth_max: int = 0
+
+    def sample(self, fetch_depth: int, judge_depth: int) -> None:
+        self.samples += 1
+        self.fetch_depth_sum += fetch_depth
+        self.judge_depth_sum += judge_depth
+        self.fetch_depth_max = max(self.fetch_depth_max, fetch_depth)
+        self.judge_depth_max = max(self.judge_depth_max, judge_depth)
+
+    def summary(self) -> str:
+        n = max(self.samples, 1)
+        classify = (
+            f", {self.classify_wait:.1f}s on classification"
+            if self.classify_wait
+            else ""
+        )
+        return (
+            f"waited {self.fetch_wait:.1f}s on the adapter and "
+            f"{self.judge_wait:.1f}s on LLM judgments{classify}; "
+            f"queue depth fetch avg {self.fetch_depth_sum / n:.1f} "
+            f"(max {self.fetch_depth_max}), "
+            f"judge avg {self.judge_depth_sum / n:.1f} "
+            f"(max {self.judge_depth_max})"
+        )
+
+
+def _iter_fetched(
+    adapter: Callable[[str], SearchResponse | list[SearchResult]],
+    entries: list[QueryEntry],
+    top_k: int,
+    prefetch: int,
+    stats: _StageStats,
+    ready: list[int],
+) -> Generator[_FetchOutcome, None, None]:
+    """Yield adapter outcomes for *entries* in order.
+
+    With *prefetch* > 0, that many worker threads call the adapter ahead of
+    the consumer, keeping at most ``2 * prefetch`` responses queued.  Adapter
+    errors are yielded (not raised) so the caller can report and skip them.
+    ``ready[0]`` is kept up to date with the number of fetched responses
+    waiting to be consumed.
+    """
+
+    def _fetch(entry: QueryEntry) -> _FetchOutcome:
+        try:
+            return _fetch_results(adapter, entry.query, top_k)
+        except Exception as e:
+            return e
+
+    if prefetch < 1:
+        for entry in entries:
+            started = time.monotonic()
+            outcome = _fetch(entry)
+            stats.fetch_wait += time.monotonic() - started
+            yield outcome
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="veritail-fetch"
+    )
+    queued: deque[Future[_FetchOutcome]] = deque()
+    pending = iter(entries)
+    try:
+        while True:
+            for entry in pending:
+                queued.append(executor.submit(_fetch, entry))
+                if len(queued) >= 2 * prefetch:
+                    break
+            if not queued:
+                return
+            ready[0] = sum(1 for f in queued if f.done())
+            started = time.monotonic()
+            outcome = queued.popleft().result()
+            stats.fetch_wait += time.monotonic() - started
+            yield outcome
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def run_evaluation(
     queries: list[QueryEntry],
     adapter: Callable[[str], SearchResponse | list[SearchResult]],
@@ -207,6 +744,14 @@ def run_evaluation(
     ) = None,
     resume: bool = False,
     output_dir: str = "./eval-results",
+    concurrency: int = 1,
+    use_async: bool = False,
+    prefetch: int = 0,
+    classification_concurrency: int = 1,
+    listwise: bool = False,
+    judgment_cache: JudgmentCache | None = None,
+    shared_responses: dict[str, LLMResponse] | None = None,
+    baseline: Mapping[str, JudgmentRecord] | None = None,
 ) -> tuple[
     list[JudgmentRecord],
     list[CheckResult],
@@ -221,6 +766,43 @@ def run_evaluation(
         3. Run correction evaluations for corrected queries
         4. Compute IR metrics
 
+    When *concurrency* is greater than 1, LLM judgments are fanned out over a
+    bounded thread pool of that size.  Judgments are still logged to the
+    backend in query order, so resume and metrics behave exactly as in the
+    sequential path.  With *use_async*, judgments instead run as coroutines
+    on a single asyncio event loop via :meth:`LLMClient.acomplete`, with up
+    to *concurrency* requests in flight.
+
+    When *prefetch* is greater than 0, that many worker threads call the
+    adapter ahead of the judging loop, so search latency overlaps with LLM
+    latency.  Responses are still consumed (checked and judged) in query
+    order.  Queue depths for the fetch and judge stages are reported at the
+    end of the run.
+
+    When *classification_concurrency* is greater than 1, the query-type
+    pre-pass no longer blocks the run: classifications are submitted to a
+    pool of that width and each query is judged as soon as its own
+    classification returns.
+
+    With *listwise*, all results for a query are scored in a single LLM call
+    (see :class:`ListwiseRelevanceJudge`); positions missing from the
+    response fall back to per-pair judging.
+
+    With a *judgment_cache*, relevance judgments whose exact prompts were
+    judged by the same model in an earlier run are served from the cache
+    instead of the LLM.
+
+    *shared_responses* is shared between the experiments of a dual run (see
+    :func:`run_dual_evaluation`): prompts omit the result position, and a
+    pair already judged for the other experiment is reused rather than
+    judged again.
+
+    *baseline* holds a prior experiment's judgments indexed by
+    :func:`index_baseline`.  Pairs whose product content, query, model and
+    prompt configuration are unchanged are copied from it instead of being
+    judged, and marked with ``reused_from``.  Listwise calls do not consult
+    the baseline.
+
     Returns:
         Tuple of (judgments, check_results, metrics, correction_judgments)
     """
@@ -236,8 +818,32 @@ def run_evaluation(
     judge = RelevanceJudge(
         llm_client,
         system_prompt,
-        format_user_prompt,
+        (
+            format_user_prompt
+            if shared_responses is None
+            else partial(format_user_prompt, include_position=False)
+        ),
         config.name,
+        cache=judgment_cache,
+        model=config.llm_model,
+        shared=shared_responses,
+        baseline=baseline,
+    )
+    listwise_judge = (
+        ListwiseRelevanceJudge(
+            llm_client,
+            (
+                f"{prefix}\n\n{LISTWISE_SYSTEM_PROMPT}"
+                if prefix_parts
+                else LISTWISE_SYSTEM_PROMPT
+            ),
+            format_listwise_user_prompt,
+            config.name,
+            cache=judgment_cache,
+            model=config.llm_model,
+        )
+        if listwise
+        else None
     )
     logger.debug(
         "run_evaluation: experiment=%s, queries=%d, top_k=%d",
@@ -278,10 +884,21 @@ def run_evaluation(
         else None
     )
 
-    # Pre-pass: classify query types that are missing
-    _classify_missing_query_types(
-        queries, llm_client, instructions, vertical, overlay_keys=overlay_keys
+    # Pre-pass: classify query types that are missing.  With a width > 1 it
+    # is streamed instead (see _submit_classifications below).
+    classify_executor = (
+        ThreadPoolExecutor(
+            max_workers=classification_concurrency,
+            thread_name_prefix="veritail-classify",
+        )
+        if classification_concurrency > 1
+        else None
     )
+    if classify_executor is None:
+        _classify_missing_query_types(
+            queries, llm_client, instructions, vertical, overlay_keys=overlay_keys
+        )
+    classify_futures: dict[int, Future[bool]] = {}
 
     all_judgments: list[JudgmentRecord] = []
     all_checks: list[CheckResult] = []
@@ -314,197 +931,367 @@ def run_evaluation(
     # Track queries with corrections for later LLM evaluation
     correction_entries: list[tuple[int, str, str]] = []  # (index, original, corrected)
 
-    with Progress(console=console) as progress:
-        task = progress.add_task(
-            f"[cyan]Evaluating '{config.name}'...",
-            total=len(queries),
+    def _record_judgment(
+        query_index: int,
+        judgment: JudgmentRecord,
+        product_failed_checks: list[dict[str, str]],
+        corrected_query: str | None,
+    ) -> None:
+        logger.debug(
+            "judgment: query=%r, product=%s, score=%d, attrs=%s, tokens=%d+%d",
+            judgment.query,
+            judgment.product.product_id,
+            judgment.score,
+            judgment.attribute_verdict,
+            judgment.metadata.get("input_tokens", 0),
+            judgment.metadata.get("output_tokens", 0),
         )
+        # Annotate with check failures
+        if product_failed_checks:
+            judgment.metadata["failed_checks"] = product_failed_checks
+        # Annotate with corrected query
+        if corrected_query is not None:
+            judgment.metadata["corrected_query"] = corrected_query
+        # Always store query_index for resume support
+        judgment.metadata["query_index"] = query_index
 
-        for query_index, query_entry in enumerate(queries):
-            # Skip already-completed queries on resume
-            if query_index in completed_indices:
-                progress.advance(task)
-                continue
-
-            # Step 1: Call adapter
-            try:
-                raw_response = adapter(query_entry.query)
-                if isinstance(raw_response, SearchResponse):
-                    response = raw_response
-                else:
-                    response = SearchResponse(results=raw_response)
-                results = response.results[: config.top_k]
-                corrected_query = response.corrected_query
-                # Normalize empty strings to None
-                if corrected_query is not None and not corrected_query.strip():
-                    corrected_query = None
-            except Exception as e:
-                console.print(f"[red]Adapter error for '{query_entry.query}': {e}")
-                progress.advance(task)
-                continue
+        try:
+            backend.log_judgment(judgment)
+        except Exception as e:
+            console.print(f"[yellow]Warning: failed to log judgment to backend: {e}")
+        all_judgments.append(judgment)
+        judgments_by_query[query_index].append(judgment)
 
-            logger.debug(
-                "adapter returned %d results for %r%s",
-                len(results),
-                query_entry.query,
-                f" (corrected: {corrected_query!r})" if corrected_query else "",
+    def _complete_query(query_index: int, judgment_count: int) -> None:
+        # Queries without results are fetched again on resume
+        if judgment_count:
+            _log_query_complete(backend, config.name, query_index, judgment_count)
+
+    # Concurrent mode: LLM calls are fanned out over a thread pool or, with
+    # *use_async*, a single asyncio event loop.  Per-query futures are drained
+    # strictly in submission order so the backend sees the same sequence as
+    # the sequential path.
+    runner = EventLoopThread(concurrency) if use_async else None
+    executor = (
+        ThreadPoolExecutor(max_workers=concurrency)
+        if concurrency > 1 and runner is None
+        else None
+    )
+    concurrent_mode = runner is not None or executor is not None
+    # (query_index, corrected_query, failed checks per product,
+    #  collect() -> judgments in result order, number of LLM calls)
+    in_flight: deque[
+        tuple[
+            int,
+            str | None,
+            list[list[dict[str, str]]],
+            Callable[[], list[JudgmentRecord]],
+            int,
+        ]
+    ] = deque()
+    outstanding = 0
+
+    def _submit_judgment(
+        query_entry: QueryEntry,
+        result: SearchResult,
+        corrected_query: str | None,
+        overlay_text: str | None,
+    ) -> Future[JudgmentRecord]:
+        args = (judge, config, query_entry, result, corrected_query, overlay_text)
+        if runner is not None:
+            return runner.submit(_ajudge_result(*args))
+        assert executor is not None
+        return executor.submit(_judge_result, *args)
+
+    def _judge_query(
+        query_entry: QueryEntry,
+        results: list[SearchResult],
+        corrected_query: str | None,
+        overlay_text: str | None,
+    ) -> list[JudgmentRecord]:
+        if listwise_judge is not None and results:
+            return _judge_listwise(
+                listwise_judge,
+                judge,
+                config,
+                query_entry,
+                results,
+                corrected_query,
+                overlay_text,
+            )
+        return [
+            _judge_result(
+                judge, config, query_entry, result, corrected_query, overlay_text
             )
+            for result in results
+        ]
 
-            # Step 2: Run deterministic checks
-            checks = run_all_checks(query_entry, results, custom_checks=custom_checks)
-            all_checks.extend(checks)
+    def _submit_query(
+        query_entry: QueryEntry,
+        results: list[SearchResult],
+        corrected_query: str | None,
+        overlay_text: str | None,
+    ) -> tuple[Callable[[], list[JudgmentRecord]], int]:
+        if listwise_judge is not None and results:
+            args = (
+                listwise_judge,
+                judge,
+                config,
+                query_entry,
+                results,
+                corrected_query,
+                overlay_text,
+            )
+            future: Future[list[JudgmentRecord]]
+            if runner is not None:
+                future = runner.submit(_ajudge_listwise(*args))
+            else:
+                assert executor is not None
+                future = executor.submit(_judge_listwise, *args)
+            return future.result, 1
+        futures = [
+            _submit_judgment(query_entry, result, corrected_query, overlay_text)
+            for result in results
+        ]
+        return (lambda: [f.result() for f in futures]), len(futures)
+
+    def _submit_correction(original: str, corrected: str) -> Future[CorrectionJudgment]:
+        args = (correction_judge, config, original, corrected)
+        if runner is not None:
+            return runner.submit(_ajudge_correction(*args))
+        assert executor is not None
+        return executor.submit(_judge_correction, *args)
+
+    def _drain_oldest() -> int:
+        query_index, corrected_query, failed_checks, collect, calls = (
+            in_flight.popleft()
+        )
+        started = time.monotonic()
+        judgments = collect()
+        for failed, judgment in zip(failed_checks, judgments):
+            _record_judgment(query_index, judgment, failed, corrected_query)
+        _complete_query(query_index, len(judgments))
+        stats.judge_wait += time.monotonic() - started
+        progress.advance(task)
+        return calls
+
+    # Stage 1 (adapter fetch) runs ahead on its own workers when *prefetch*
+    # is set; stages 2-3 (checks, judging) consume its output in order.
+    stats = _StageStats()
+    fetch_ready = [0]
+    fetched = _iter_fetched(
+        adapter,
+        [q for i, q in enumerate(queries) if i not in completed_indices],
+        config.top_k,
+        prefetch,
+        stats,
+        fetch_ready,
+    )
 
-            # Step 2b: Run correction checks if corrected
-            if corrected_query is not None:
-                all_checks.append(
-                    check_correction_vocabulary(
-                        query_entry.query, corrected_query, results
-                    )
-                )
-                all_checks.append(
-                    check_unnecessary_correction(
-                        query_entry.query, corrected_query, results
-                    )
+    all_correction_judgments: list[CorrectionJudgment] = []
+    try:
+        with Progress(console=console) as progress:
+            task = progress.add_task(
+                f"[cyan]Evaluating '{config.name}'...",
+                total=len(queries),
+            )
+            if classify_executor is not None:
+                classify_task = progress.add_task(
+                    "[cyan]Classifying query types...",
+                    total=len(_classification_targets(queries, overlay_keys)),
                 )
-                correction_entries.append(
-                    (query_index, query_entry.query, corrected_query)
+                classify_futures = _submit_classifications(
+                    classify_executor,
+                    queries,
+                    llm_client,
+                    instructions,
+                    vertical,
+                    overlay_keys,
+                    on_done=lambda: progress.advance(classify_task),
                 )
 
-            failed_count = sum(1 for c in checks if not c.passed)
-            if failed_count:
-                logger.debug(
-                    "checks: %d failed out of %d for %r",
-                    failed_count,
-                    len(checks),
-                    query_entry.query,
-                )
+            for query_index, query_entry in enumerate(queries):
+                # Skip already-completed queries on resume
+                if query_index in completed_indices:
+                    progress.advance(task)
+                    continue
 
-            # Build failed-checks info per product.
-            # A "failed check" is any deterministic check with passed=False
-            # attached to a specific product row.
-            failed_checks_by_product: dict[str, list[dict[str, str]]] = {}
-            for check in checks:
-                if not check.passed and check.product_id:
-                    pid = check.product_id
-                    failed_checks_by_product.setdefault(
-                        pid,
-                        [],
-                    ).append(
-                        {
-                            "check_name": check.check_name,
-                            "detail": check.detail,
-                        }
+                # Step 1: Call adapter (or take the prefetched response)
+                outcome = next(fetched)
+                stats.sample(fetch_ready[0], outstanding)
+                if isinstance(outcome, Exception):
+                    console.print(
+                        f"[red]Adapter error for '{query_entry.query}': {outcome}"
                     )
+                    progress.advance(task)
+                    continue
+                results, corrected_query = outcome
 
-            # Look up overlay content for this query
-            overlay_text = (
-                vertical.overlays[query_entry.overlay].content
-                if vertical
-                and query_entry.overlay
-                and query_entry.overlay in vertical.overlays
-                else None
-            )
+                # Wait for this query's own classification (streaming pre-pass)
+                classification = classify_futures.get(query_index)
+                if classification is not None:
+                    started = time.monotonic()
+                    classification.result()
+                    stats.classify_wait += time.monotonic() - started
 
-            # Step 3: LLM judgment for each result
-            for result in results:
-                product_failed_checks = failed_checks_by_product.get(
-                    result.product_id,
-                    [],
+                logger.debug(
+                    "adapter returned %d results for %r%s",
+                    len(results),
+                    query_entry.query,
+                    f" (corrected: {corrected_query!r})" if corrected_query else "",
                 )
 
-                try:
-                    judgment = judge.judge(
-                        query_entry.query,
-                        result,
-                        query_type=query_entry.type,
-                        corrected_query=corrected_query,
-                        overlay=overlay_text,
-                    )
-                except Exception as e:
-                    console.print(
-                        f"[red]LLM error for '{query_entry.query}' / "
-                        f"'{result.product_id}': {e}"
-                    )
-                    judgment = JudgmentRecord(
-                        query=query_entry.query,
-                        product=result,
-                        score=0,
-                        reasoning=f"Error: {e}",
-                        attribute_verdict="n/a",
-                        model=config.llm_model,
-                        experiment=config.name,
-                        query_type=query_entry.type,
-                        metadata={"error": str(e)},
-                    )
-                logger.debug(
-                    "judgment: query=%r, product=%s, score=%d, attrs=%s, tokens=%d+%d",
-                    query_entry.query,
-                    result.product_id,
-                    judgment.score,
-                    judgment.attribute_verdict,
-                    judgment.metadata.get("input_tokens", 0),
-                    judgment.metadata.get("output_tokens", 0),
+                # Step 2: Run deterministic checks
+                checks = run_all_checks(
+                    query_entry, results, custom_checks=custom_checks
                 )
-                # Annotate with check failures
-                if product_failed_checks:
-                    judgment.metadata["failed_checks"] = product_failed_checks
-                # Annotate with corrected query
+                all_checks.extend(checks)
+
+                # Step 2b: Run correction checks if corrected
                 if corrected_query is not None:
-                    judgment.metadata["corrected_query"] = corrected_query
-                # Always store query_index for resume support
-                judgment.metadata["query_index"] = query_index
+                    all_checks.append(
+                        check_correction_vocabulary(
+                            query_entry.query, corrected_query, results
+                        )
+                    )
+                    all_checks.append(
+                        check_unnecessary_correction(
+                            query_entry.query, corrected_query, results
+                        )
+                    )
+                    correction_entries.append(
+                        (query_index, query_entry.query, corrected_query)
+                    )
 
-                try:
-                    backend.log_judgment(judgment)
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Warning: failed to log judgment to backend: {e}"
+                failed_count = sum(1 for c in checks if not c.passed)
+                if failed_count:
+                    logger.debug(
+                        "checks: %d failed out of %d for %r",
+                        failed_count,
+                        len(checks),
+                        query_entry.query,
                     )
-                all_judgments.append(judgment)
-                judgments_by_query[query_index].append(judgment)
 
-            progress.advance(task)
+                # Build failed-checks info per product.
+                # A "failed check" is any deterministic check with passed=False
+                # attached to a specific product row.
+                failed_checks_by_product: dict[str, list[dict[str, str]]] = {}
+                for check in checks:
+                    if not check.passed and check.product_id:
+                        pid = check.product_id
+                        failed_checks_by_product.setdefault(
+                            pid,
+                            [],
+                        ).append(
+                            {
+                                "check_name": check.check_name,
+                                "detail": check.detail,
+                            }
+                        )
 
-    # Step 3b: Correction LLM evaluations (always re-run from scratch)
-    all_correction_judgments: list[CorrectionJudgment] = []
-    if correction_entries:
-        with Progress(console=console) as progress:
-            corr_task = progress.add_task(
-                f"[cyan]Evaluating query corrections for '{config.name}'...",
-                total=len(correction_entries),
-            )
-            for _idx, original, corrected in correction_entries:
-                try:
-                    cj = correction_judge.judge(original, corrected)
-                except Exception as e:
-                    console.print(
-                        f"[red]Correction judge error for "
-                        f"'{original}' -> '{corrected}': {e}"
+                # Look up overlay content for this query
+                overlay_text = (
+                    vertical.overlays[query_entry.overlay].content
+                    if vertical
+                    and query_entry.overlay
+                    and query_entry.overlay in vertical.overlays
+                    else None
+                )
+
+                # Step 3: LLM judgment for each result
+                product_failed_checks = [
+                    failed_checks_by_product.get(result.product_id, [])
+                    for result in results
+                ]
+                if not concurrent_mode:
+                    started = time.monotonic()
+                    judgments = _judge_query(
+                        query_entry, results, corrected_query, overlay_text
                     )
-                    cj = CorrectionJudgment(
-                        original_query=original,
-                        corrected_query=corrected,
-                        verdict="error",
-                        reasoning=f"Error: {e}",
-                        model=config.llm_model,
-                        experiment=config.name,
-                        metadata={"error": str(e)},
+                    for judgment, failed in zip(judgments, product_failed_checks):
+                        _record_judgment(query_index, judgment, failed, corrected_query)
+                    _complete_query(query_index, len(judgments))
+                    stats.judge_wait += time.monotonic() - started
+                    progress.advance(task)
+                else:
+                    collect, calls = _submit_query(
+                        query_entry, results, corrected_query, overlay_text
                     )
-                logger.debug(
-                    "correction: %r -> %r, verdict=%s",
-                    original,
-                    corrected,
-                    cj.verdict,
-                )
-                all_correction_judgments.append(cj)
-                try:
-                    backend.log_correction_judgment(cj)
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Warning: failed to log correction to backend: {e}"
+                    in_flight.append(
+                        (
+                            query_index,
+                            corrected_query,
+                            product_failed_checks,
+                            collect,
+                            calls,
+                        )
                     )
-                progress.advance(corr_task)
+                    outstanding += calls
+                    # Keep at most ~2x the pool size queued so memory stays
+                    # bounded while workers always have the next query ready.
+                    while in_flight and outstanding > 2 * concurrency:
+                        outstanding -= _drain_oldest()
+
+            while in_flight:
+                _drain_oldest()
+
+            # Metrics break down by query type, so resumed (skipped) queries
+            # must be classified too before the run completes.
+            if classify_futures:
+                classified = sum(f.result() for f in classify_futures.values())
+                console.print(
+                    f"[dim]Classified {classified}/{len(classify_futures)} "
+                    "queries[/dim]"
+                )
+
+        if prefetch > 0 or concurrent_mode or classify_executor is not None:
+            logger.debug("pipeline stages for %s: %s", config.name, stats.summary())
+            console.print(f"[dim]Pipeline: {stats.summary()}[/dim]")
 
+        # Step 3b: Correction LLM evaluations (always re-run from scratch)
+        if correction_entries:
+            with Progress(console=console) as progress:
+                corr_task = progress.add_task(
+                    f"[cyan]Evaluating query corrections for '{config.name}'...",
+                    total=len(correction_entries),
+                )
+                correction_results: Iterator[CorrectionJudgment]
+                if concurrent_mode:
+                    corr_futures = [
+                        _submit_correction(original, corrected)
+                        for _idx, original, corrected in correction_entries
+                    ]
+                    correction_results = (f.result() for f in corr_futures)
+                else:
+                    correction_results = (
+                        _judge_correction(correction_judge, config, original, corrected)
+                        for _idx, original, corrected in correction_entries
+                    )
+                for cj in correction_results:
+                    logger.debug(
+                        "correction: %r -> %r, verdict=%s",
+                        cj.original_query,
+                        cj.corrected_query,
+                        cj.verdict,
+                    )
+                    all_correction_judgments.append(cj)
+                    try:
+                        backend.log_correction_judgment(cj)
+                    except Exception as e:
+                        console.print(
+                            f"[yellow]Warning: failed to log correction to backend: {e}"
+                        )
+                    progress.advance(corr_task)
+    finally:
+        fetched.close()
+        if classify_executor is not None:
+            classify_executor.shutdown(wait=False, cancel_futures=True)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if runner is not None:
+            runner.close()
+
+    if all_correction_judgments:
         # Console summary
         appropriate = sum(
             1 for cj in all_correction_judgments if cj.verdict == "appropriate"
@@ -527,6 +1314,10 @@ def run_evaluation(
         summary += f" ({n} extra LLM calls)"
         console.print(summary)
 
+    if baseline is not None:
+        _print_baseline_reuse(all_judgments)
+    _print_token_usage(all_judgments)
+
     # Step 4: Compute metrics
     metrics = compute_all_metrics(judgments_by_query, queries)
 
@@ -548,6 +1339,14 @@ def run_dual_evaluation(
     ) = None,
     resume: bool = False,
     output_dir: str = "./eval-results",
+    concurrency: int = 1,
+    use_async: bool = False,
+    prefetch: int = 0,
+    classification_concurrency: int = 1,
+    listwise: bool = False,
+    judgment_cache: JudgmentCache | None = None,
+    dedupe: bool = True,
+    baseline: Mapping[str, JudgmentRecord] | None = None,
 ) -> tuple[
     list[JudgmentRecord],
     list[JudgmentRecord],
@@ -561,6 +1360,14 @@ def run_dual_evaluation(
 ]:
     """Run evaluation for two configurations and generate comparison checks.
 
+    With *dedupe* (the default), a (query, product) pair returned by both
+    configurations is judged once and the judgment is reused for the second
+    configuration.  Prompts then omit the result position so that shared
+    pairs produce identical prompts.
+
+    Both configurations reuse judgments from *baseline* (see
+    :func:`run_evaluation`).
+
     Returns:
         Tuple of (judgments_a, judgments_b, checks_a, checks_b,
                   metrics_a, metrics_b, comparison_checks,
@@ -576,6 +1383,8 @@ def run_dual_evaluation(
         config_b.name,
     )
 
+    shared_responses: dict[str, LLMResponse] | None = {} if dedupe else None
+
     # Run evaluation for config A
     judgments_a, checks_a, metrics_a, corrections_a = run_evaluation(
         queries,
@@ -588,6 +1397,14 @@ def run_dual_evaluation(
         custom_checks=custom_checks,
         resume=resume,
         output_dir=output_dir,
+        concurrency=concurrency,
+        use_async=use_async,
+        prefetch=prefetch,
+        classification_concurrency=classification_concurrency,
+        listwise=listwise,
+        judgment_cache=judgment_cache,
+        shared_responses=shared_responses,
+        baseline=baseline,
     )
 
     # Run evaluation for config B
@@ -602,8 +1419,19 @@ def run_dual_evaluation(
         custom_checks=custom_checks,
         resume=resume,
         output_dir=output_dir,
+        concurrency=concurrency,
+        use_async=use_async,
+        prefetch=prefetch,
+        classification_concurrency=classification_concurrency,
+        listwise=listwise,
+        judgment_cache=judgment_cache,
+        shared_responses=shared_responses,
+        baseline=baseline,
     )
 
+    if dedupe:
+        _print_dedupe_savings(judgments_a, judgments_b)
+
     # Run comparison checks
     console.print("\n[cyan]Running comparison checks...[/cyan]")
     comparison_checks: list[CheckResult] = []
@@ -642,6 +1470,198 @@ def run_dual_evaluation(
     )
 
 
+_BatchOutcome = tuple[
+    list[JudgmentRecord],
+    list[CheckResult],
+    list[MetricResult],
+    list[CorrectionJudgment],
+]
+
+
+@dataclass
+class _SubmitStep:
+    """Batch requests a coordinated batch evaluation is ready to submit."""
+
+    relevance: list[BatchRequest]
+    corrections: list[BatchRequest]
+
+
+@dataclass
+class _PollStep:
+    """Batches a coordinated batch evaluation is waiting on."""
+
+    entries: list[tuple[str, int, str]]
+    on_complete: Callable[[str], None]
+
+
+_BatchStep = Union[_SubmitStep, _PollStep]
+
+
+@dataclass
+class _MergedIds:
+    """Where one configuration's requests live in merged dual-mode batches.
+
+    Requests are submitted as ``"{prefix}-{custom_id}"``.  *aliases* maps
+    custom_ids whose prompt duplicates an earlier request to that request's
+    merged ID.  *orders* holds Gemini custom_id orders, which the client
+    forgets once a batch has been read.
+    """
+
+    prefix: str
+    batch_ids: set[str]
+    aliases: dict[str, str] = field(default_factory=dict)
+    orders: dict[str, list[str]] = field(default_factory=dict)
+
+    def results(self, llm_client: LLMClient, batch_id: str) -> Iterator[BatchResult]:
+        """Yield this configuration's results from a merged batch."""
+        order = self.orders.get(batch_id)
+        if order:
+            llm_client.restore_batch_custom_ids(batch_id, order)
+        by_merged_id: dict[str, list[str]] = defaultdict(list)
+        for custom_id, merged_id in self.aliases.items():
+            by_merged_id[merged_id].append(custom_id)
+        own = f"{self.prefix}-"
+        for result in llm_client.iter_batch_results(batch_id):
+            if result.custom_id.startswith(own):
+                yield replace(result, custom_id=result.custom_id[len(own) :])
+            for custom_id in by_merged_id.get(result.custom_id, ()):
+                yield replace(result, custom_id=custom_id)
+
+
+@dataclass
+class _Submitted:
+    """IDs sent back to a coordinated batch evaluation after submission."""
+
+    batch_ids: list[str]
+    correction_batch_id: str | None
+    merged: _MergedIds
+
+
+def _finish_steps(steps: Generator[_BatchStep, Any, _BatchOutcome]) -> _BatchOutcome:
+    try:
+        step = next(steps)
+    except StopIteration as done:
+        result: _BatchOutcome = done.value
+        return result
+    steps.close()
+    raise RuntimeError(f"Unexpected batch step outside dual mode: {step!r}")
+
+
+def _merge_requests(
+    requests_by_prefix: dict[str, list[BatchRequest]], *, dedupe: bool
+) -> tuple[list[BatchRequest], dict[str, set[str]], dict[str, dict[str, str]]]:
+    """Combine requests from several configurations into one batch.
+
+    Returns the merged requests, the prefixes that need each merged
+    request, and each prefix's aliases (see :class:`_MergedIds`).  With
+    *dedupe*, a request with the same prompt as an earlier one is not
+    submitted again.
+    """
+    merged: list[BatchRequest] = []
+    owners: dict[str, set[str]] = {}
+    aliases: dict[str, dict[str, str]] = {prefix: {} for prefix in requests_by_prefix}
+    by_prompt: dict[tuple[str, str, int], str] = {}
+    for prefix, requests in requests_by_prefix.items():
+        for req in requests:
+            prompt = (req.system_prompt, req.user_prompt, req.max_tokens)
+            merged_id = by_prompt.get(prompt) if dedupe else None
+            if merged_id is not None:
+                aliases[prefix][req.custom_id] = merged_id
+                owners[merged_id].add(prefix)
+                continue
+            merged_id = f"{prefix}-{req.custom_id}"
+            if dedupe:
+                by_prompt[prompt] = merged_id
+            owners[merged_id] = {prefix}
+            merged.append(replace(req, custom_id=merged_id))
+    return merged, owners, aliases
+
+
+def _submit_merged(
+    llm_client: LLMClient, steps: dict[str, _SubmitStep], *, dedupe: bool
+) -> dict[str, _Submitted]:
+    """Submit one relevance and one correction batch for several configurations."""
+    relevance, rel_owners, rel_aliases = _merge_requests(
+        {prefix: step.relevance for prefix, step in steps.items()}, dedupe=dedupe
+    )
+    corrections, corr_owners, corr_aliases = _merge_requests(
+        {prefix: step.corrections for prefix, step in steps.items()}, dedupe=dedupe
+    )
+
+    batch_ids_by_prefix: dict[str, list[str]] = {prefix: [] for prefix in steps}
+    if relevance:
+        total = sum(len(step.relevance) for step in steps.values())
+        shards = shard_for_client(llm_client, relevance)
+        console.print(
+            f"[cyan]Submitting combined batch of {len(relevance)} requests for "
+            f"{len(steps)} configurations"
+            + (f" in {len(shards)} shards" if len(shards) > 1 else "")
+            + "...[/cyan]"
+        )
+        if total > len(relevance):
+            console.print(
+                f"[dim]Deduplicated {total - len(relevance)} request(s) shared "
+                "between configurations[/dim]"
+            )
+        shard_ids = submit_shards(llm_client, shards)
+        console.print(f"[dim]Batch ID: {', '.join(shard_ids)}[/dim]")
+        for shard_id, shard in zip(shard_ids, shards):
+            shard_owners = set().union(*(rel_owners[r.custom_id] for r in shard))
+            for prefix in steps:
+                if prefix in shard_owners:
+                    batch_ids_by_prefix[prefix].append(shard_id)
+
+    corr_batch_id: str | None = None
+    if corrections:
+        console.print(
+            f"[cyan]Submitting combined correction batch of "
+            f"{len(corrections)} requests...[/cyan]"
+        )
+        corr_batch_id = llm_client.submit_batch(corrections)
+    corr_prefixes = set().union(*corr_owners.values()) if corr_owners else set()
+
+    submitted: dict[str, _Submitted] = {}
+    for prefix in steps:
+        prefix_corr_id = corr_batch_id if prefix in corr_prefixes else None
+        merged_ids = set(batch_ids_by_prefix[prefix])
+        if prefix_corr_id:
+            merged_ids.add(prefix_corr_id)
+        submitted[prefix] = _Submitted(
+            batch_ids=batch_ids_by_prefix[prefix],
+            correction_batch_id=prefix_corr_id,
+            merged=_MergedIds(
+                prefix=prefix,
+                batch_ids=merged_ids,
+                aliases={**rel_aliases[prefix], **corr_aliases[prefix]},
+            ),
+        )
+    logger.debug(
+        "merged batches submitted: relevance=%d, corrections=%d",
+        len(relevance),
+        len(corrections),
+    )
+    return submitted
+
+
+def _cancel_batches(llm_client: LLMClient, batch_ids: list[str]) -> None:
+    """Cancel batches no longer waited for, warning on failure."""
+    for batch_id in batch_ids:
+        console.print(
+            f"[yellow]Stopped waiting for batch {batch_id}; its unfinished "
+            "requests will be judged synchronously[/yellow]"
+        )
+        try:
+            llm_client.cancel_batch(batch_id)
+        except Exception as e:
+            console.print(f"[yellow]Warning: failed to cancel batch {batch_id}: {e}")
+    # Partial results only become readable once a cancellation has finished
+    for batch_id in wait_for_cancellation(llm_client, batch_ids):
+        console.print(
+            f"[yellow]Warning: batch {batch_id} is still cancelling; "
+            "its partial results will not be read[/yellow]"
+        )
+
+
 def run_batch_evaluation(
     queries: list[QueryEntry],
     adapter: Callable[[str], SearchResponse | list[SearchResult]],
@@ -654,9 +1674,20 @@ def run_batch_evaluation(
         list[Callable[[QueryEntry, list[SearchResult]], list[CheckResult]]] | None
     ) = None,
     poll_interval: int = 60,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     resume: bool = False,
     output_dir: str = "./eval-results",
     cancel_event: threading.Event | None = None,
+    listwise: bool = False,
+    judgment_cache: JudgmentCache | None = None,
+    shared_responses: dict[str, LLMResponse] | None = None,
+    baseline: Mapping[str, JudgmentRecord] | None = None,
+    retry_rounds: int = DEFAULT_RETRY_ROUNDS,
+    sync_retry_limit: int = DEFAULT_SYNC_RETRY_LIMIT,
+    deadline: float | None = None,
+    stall_timeout: float | None = None,
+    straggler_concurrency: int = DEFAULT_STRAGGLER_CONCURRENCY,
 ) -> tuple[
     list[JudgmentRecord],
     list[CheckResult],
@@ -667,8 +1698,101 @@ def run_batch_evaluation(
 
     Same as run_evaluation() but collects all LLM requests, submits them as a
     single batch, polls for completion, then processes results.
+
+    With *listwise*, the batch holds one request per query instead of one per
+    query-result pair; positions missing from a listwise response are judged
+    per pair with synchronous calls once the batch completes.
+
+    With a *judgment_cache*, requests whose prompts are already cached are
+    left out of the batch and answered from the cache.  If every relevance
+    request is cached, no relevance batch is submitted at all.
+    *shared_responses* works the same way for pairs already judged by the
+    other experiment of a dual run, and *baseline* for pairs judged by a
+    prior experiment.
+
+    Relevance requests that fail or return an unparseable response are
+    resubmitted in up to *retry_rounds* smaller follow-up batches.  Once at
+    most *sync_retry_limit* remain, they are judged with synchronous calls.
+    Follow-up batch IDs are checkpointed, so ``--resume`` picks them up.
+
+    Batches are first polled after *poll_interval* seconds; later polls
+    adapt to each batch's progress within *min_poll_interval* and
+    *max_poll_interval* (see :class:`~veritail.batch_utils.PollSchedule`).
+
+    With a *deadline* (a ``time.time()`` timestamp), batches still running
+    at that time are cancelled, whatever they already finished is
+    retrieved where the provider allows it, and the missing requests are
+    judged with up to *straggler_concurrency* parallel synchronous calls.
+    A batch whose progress stays flat for *stall_timeout* seconds is given
+    up on the same way.  Follow-up batches are not submitted once the
+    deadline has passed.
+    """
+    return _finish_steps(
+        _batch_evaluation(
+            queries,
+            adapter,
+            config,
+            llm_client,
+            backend,
+            instructions=instructions,
+            vertical=vertical,
+            custom_checks=custom_checks,
+            poll_interval=poll_interval,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+            resume=resume,
+            output_dir=output_dir,
+            cancel_event=cancel_event,
+            listwise=listwise,
+            judgment_cache=judgment_cache,
+            shared_responses=shared_responses,
+            baseline=baseline,
+            retry_rounds=retry_rounds,
+            sync_retry_limit=sync_retry_limit,
+            deadline=deadline,
+            stall_timeout=stall_timeout,
+            straggler_concurrency=straggler_concurrency,
+        )
+    )
+
+
+def _batch_evaluation(
+    queries: list[QueryEntry],
+    adapter: Callable[[str], SearchResponse | list[SearchResult]],
+    config: ExperimentConfig,
+    llm_client: LLMClient,
+    backend: EvalBackend,
+    instructions: str | None = None,
+    vertical: VerticalContext | None = None,
+    custom_checks: (
+        list[Callable[[QueryEntry, list[SearchResult]], list[CheckResult]]] | None
+    ) = None,
+    poll_interval: int = 60,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    resume: bool = False,
+    output_dir: str = "./eval-results",
+    cancel_event: threading.Event | None = None,
+    listwise: bool = False,
+    judgment_cache: JudgmentCache | None = None,
+    shared_responses: dict[str, LLMResponse] | None = None,
+    baseline: Mapping[str, JudgmentRecord] | None = None,
+    retry_rounds: int = DEFAULT_RETRY_ROUNDS,
+    sync_retry_limit: int = DEFAULT_SYNC_RETRY_LIMIT,
+    deadline: float | None = None,
+    stall_timeout: float | None = None,
+    straggler_concurrency: int = DEFAULT_STRAGGLER_CONCURRENCY,
+    coordinated: bool = False,
+) -> Generator[_BatchStep, Any, _BatchOutcome]:
+    """Steps of :func:`run_batch_evaluation`.
+
+    With *coordinated*, the generator yields a :class:`_SubmitStep` instead
+    of submitting its batches and a :class:`_PollStep` instead of polling,
+    so :func:`run_dual_batch_evaluation` can submit and poll both
+    configurations together.  Otherwise it never yields.
     """
     # Phase 0: Build judges (identical to run_evaluation)
+    reuse_enabled = judgment_cache is not None or shared_responses is not None
     system_prompt = SYSTEM_PROMPT
     prefix_parts: list[str] = []
     if vertical:
@@ -681,8 +1805,32 @@ def run_batch_evaluation(
     judge = RelevanceJudge(
         llm_client,
         system_prompt,
-        format_user_prompt,
+        (
+            format_user_prompt
+            if shared_responses is None
+            else partial(format_user_prompt, include_position=False)
+        ),
         config.name,
+        cache=judgment_cache,
+        model=config.llm_model,
+        shared=shared_responses,
+        baseline=baseline,
+    )
+    listwise_judge = (
+        ListwiseRelevanceJudge(
+            llm_client,
+            (
+                f"{prefix}\n\n{LISTWISE_SYSTEM_PROMPT}"
+                if prefix_parts
+                else LISTWISE_SYSTEM_PROMPT
+            ),
+            format_listwise_user_prompt,
+            config.name,
+            cache=judgment_cache,
+            model=config.llm_model,
+        )
+        if listwise
+        else None
     )
 
     if prefix_parts:
@@ -717,28 +1865,61 @@ def run_batch_evaluation(
         else None
     )
 
-    # Pre-pass: classify query types that are missing (batched)
-    _classify_missing_query_types_batch(
-        queries,
+    # Pre-pass: classify query types that are missing (batched).  A fresh
+    # run collects and submits the queries whose type and overlay are
+    # already known while the classification batch runs (see Phase 1).
+    classification = _submit_classification_batch(
+        queries, llm_client, instructions, vertical, overlay_keys
+    )
+    finish_classification = partial(
+        _collect_classification_batch,
         llm_client,
-        instructions,
-        vertical,
-        poll_interval,
+        poll_interval=poll_interval,
         cancel_event=cancel_event,
         overlay_keys=overlay_keys,
+        min_poll_interval=min_poll_interval,
+        max_poll_interval=max_poll_interval,
     )
 
     # Check for existing checkpoint when resuming
     saved_checkpoint: BatchCheckpoint | None = None
     if resume:
         saved_checkpoint = load_checkpoint(output_dir, config.name)
+    # In dual mode both configurations' requests are submitted together
+    if classification is not None and (saved_checkpoint is not None or coordinated):
+        finish_classification(classification)
+        classification = None
 
     # ---- Resume path: skip Phase 1 & 2, jump to polling ----
     corr_batch_id: str | None = None
     corr_context: dict[str, tuple[str, str]] = {}
+    reused: dict[str, tuple[LLMResponse, str]] = {}
+    # Judgments copied from the baseline experiment, keyed by custom_id
+    carried: dict[str, JudgmentRecord] = {}
+
+    # Relevance batch shards, and the shards already known to be finished
+    batch_ids: list[str] = []
+    completed_shards: set[str] = set()
+    # Follow-up batches for failed relevance requests, one per round
+    retry_batch_ids: list[str] = []
+    # Batches given up on at the deadline or after stalling
+    abandoned: set[str] = set()
+    # Dual mode: where this configuration's requests live in merged batches
+    merged: _MergedIds | None = None
+    # Queries still to be collected when resuming
+    pending: list[int] = []
 
     if saved_checkpoint is not None:
-        batch_id = saved_checkpoint.batch_id
+        batch_ids = saved_checkpoint.shard_ids()
+        completed_shards = set(saved_checkpoint.completed_batch_ids)
+        retry_batch_ids = list(saved_checkpoint.retry_batch_ids)
+        abandoned = set(saved_checkpoint.abandoned_batch_ids)
+        if saved_checkpoint.merged_prefix is not None:
+            merged = _MergedIds(
+                prefix=saved_checkpoint.merged_prefix,
+                batch_ids=set(saved_checkpoint.merged_batch_ids),
+                aliases=dict(saved_checkpoint.merged_aliases),
+            )
         request_context = deserialize_request_context(saved_checkpoint.request_context)
         all_checks_data = saved_checkpoint.checks
         all_checks = [CheckResult(**c) for c in all_checks_data]
@@ -747,10 +1928,12 @@ def run_batch_evaluation(
             for e in saved_checkpoint.correction_entries
         ]
         # Restore Gemini custom_id ordering if needed
-        if saved_checkpoint.gemini_custom_id_order:
-            llm_client.restore_batch_custom_ids(
-                batch_id, saved_checkpoint.gemini_custom_id_order
-            )
+        for shard_id in batch_ids + retry_batch_ids:
+            shard_order = saved_checkpoint.shard_custom_id_order(shard_id)
+            if shard_order:
+                llm_client.restore_batch_custom_ids(shard_id, shard_order)
+                if merged is not None and shard_id in merged.batch_ids:
+                    merged.orders[shard_id] = shard_order
         # Restore correction batch info
         corr_batch_id = saved_checkpoint.correction_batch_id
         if saved_checkpoint.correction_context:
@@ -762,10 +1945,18 @@ def run_batch_evaluation(
             llm_client.restore_batch_custom_ids(
                 corr_batch_id, saved_checkpoint.gemini_correction_custom_id_order
             )
+            if merged is not None and corr_batch_id in merged.batch_ids:
+                merged.orders[corr_batch_id] = list(
+                    saved_checkpoint.gemini_correction_custom_id_order
+                )
+
+        # Queries whose requests were never collected: the run was
+        # interrupted while they were being classified
+        pending = list(saved_checkpoint.pending_queries)
 
         # Re-submit correction batch if partial checkpoint (relevance submitted,
         # correction never submitted).
-        if corr_batch_id is None and correction_entries:
+        if corr_batch_id is None and correction_entries and not pending:
             corr_requests: list[BatchRequest] = []
             for idx, (_, original, corrected) in enumerate(correction_entries):
                 custom_id = f"corr-{idx}"
@@ -782,137 +1973,297 @@ def run_batch_evaluation(
             corr_batch_id = llm_client.submit_batch(corr_requests)
 
             # Update checkpoint with correction info
-            gemini_corr_order = getattr(llm_client, "_batch_custom_ids", {}).get(
-                corr_batch_id, []
-            )
-            save_checkpoint(
+            gemini_corr_order = llm_client.batch_custom_id_order(corr_batch_id)
+            update_checkpoint(
                 output_dir,
                 config.name,
-                BatchCheckpoint(
-                    batch_id=batch_id,
-                    experiment_name=config.name,
-                    phase="relevance",
-                    request_context=saved_checkpoint.request_context,
-                    checks=saved_checkpoint.checks,
-                    correction_entries=saved_checkpoint.correction_entries,
-                    gemini_custom_id_order=saved_checkpoint.gemini_custom_id_order,
-                    correction_batch_id=corr_batch_id,
-                    correction_context={
-                        k: {"original": v[0], "corrected": v[1]}
-                        for k, v in corr_context.items()
-                    },
-                    gemini_correction_custom_id_order=gemini_corr_order,
-                ),
+                correction_batch_id=corr_batch_id,
+                correction_context={
+                    k: {"original": v[0], "corrected": v[1]}
+                    for k, v in corr_context.items()
+                },
+                gemini_correction_custom_id_order=gemini_corr_order,
             )
 
-        console.print(f"[bold]Resuming batch {batch_id} for '{config.name}'...[/bold]")
-    else:
+        console.print(
+            f"[bold]Resuming batch {', '.join(batch_ids)} for '{config.name}'...[/bold]"
+        )
+        if completed_shards:
+            console.print(
+                f"[dim]{len(completed_shards)} of {len(batch_ids)} batch shards "
+                "already completed[/dim]"
+            )
+    if saved_checkpoint is None or pending:
         # Phase 1: Collect — call adapters and build batch requests
-        all_checks = []
+        checks_by_query: dict[int, list[CheckResult]] = {}
         batch_requests: list[BatchRequest] = []
-        request_context = {}
-        correction_entries = []
-
-        with Progress(console=console) as progress:
-            task = progress.add_task(
-                f"[cyan]Collecting requests for '{config.name}'...",
-                total=len(queries),
-            )
-
-            for query_index, query_entry in enumerate(queries):
-                try:
-                    raw_response = adapter(query_entry.query)
-                    if isinstance(raw_response, SearchResponse):
-                        response = raw_response
-                    else:
-                        response = SearchResponse(results=raw_response)
-                    results = response.results[: config.top_k]
-                    corrected_query = response.corrected_query
-                    if corrected_query is not None and not corrected_query.strip():
-                        corrected_query = None
-                except Exception as e:
-                    console.print(f"[red]Adapter error for '{query_entry.query}': {e}")
-                    progress.advance(task)
-                    continue
+        if saved_checkpoint is None:
+            request_context = {}
+            correction_entries = []
+        else:
+            # Keep the restored checks in query order with the new ones
+            uncollected = set(pending)
+            positions = {
+                entry.query: i
+                for i, entry in enumerate(queries)
+                if i not in uncollected
+            }
+            for check in all_checks:
+                checks_by_query.setdefault(positions.get(check.query, -1), []).append(
+                    check
+                )
 
-                # Deterministic checks
-                checks = run_all_checks(
-                    query_entry, results, custom_checks=custom_checks
+        def _collect(query_indices: list[int]) -> list[BatchRequest]:
+            """Call the adapter for *query_indices*; return their batch requests."""
+            requests: list[BatchRequest] = []
+            with Progress(console=console) as progress:
+                task = progress.add_task(
+                    f"[cyan]Collecting requests for '{config.name}'...",
+                    total=len(query_indices),
                 )
-                all_checks.extend(checks)
 
-                # Correction checks
-                if corrected_query is not None:
-                    all_checks.append(
-                        check_correction_vocabulary(
-                            query_entry.query, corrected_query, results
+                for query_index in query_indices:
+                    query_entry = queries[query_index]
+                    try:
+                        raw_response = adapter(query_entry.query)
+                        if isinstance(raw_response, SearchResponse):
+                            response = raw_response
+                        else:
+                            response = SearchResponse(results=raw_response)
+                        results = response.results[: config.top_k]
+                        corrected_query = response.corrected_query
+                        if corrected_query is not None and not corrected_query.strip():
+                            corrected_query = None
+                    except Exception as e:
+                        console.print(
+                            f"[red]Adapter error for '{query_entry.query}': {e}"
                         )
+                        progress.advance(task)
+                        continue
+
+                    # Deterministic checks
+                    checks = run_all_checks(
+                        query_entry, results, custom_checks=custom_checks
                     )
-                    all_checks.append(
-                        check_unnecessary_correction(
-                            query_entry.query, corrected_query, results
+                    checks_by_query[query_index] = list(checks)
+
+                    # Correction checks
+                    if corrected_query is not None:
+                        checks_by_query[query_index].append(
+                            check_correction_vocabulary(
+                                query_entry.query, corrected_query, results
+                            )
                         )
-                    )
-                    correction_entries.append(
-                        (query_index, query_entry.query, corrected_query)
+                        checks_by_query[query_index].append(
+                            check_unnecessary_correction(
+                                query_entry.query, corrected_query, results
+                            )
+                        )
+                        correction_entries.append(
+                            (query_index, query_entry.query, corrected_query)
+                        )
+
+                    # Failed checks by product
+                    failed_checks_by_product: dict[str, list[dict[str, str]]] = {}
+                    for check in checks:
+                        if not check.passed and check.product_id:
+                            pid = check.product_id
+                            failed_checks_by_product.setdefault(pid, []).append(
+                                {
+                                    "check_name": check.check_name,
+                                    "detail": check.detail,
+                                }
+                            )
+
+                    # Look up overlay content for this query
+                    overlay_text = (
+                        vertical.overlays[query_entry.overlay].content
+                        if vertical
+                        and query_entry.overlay
+                        and query_entry.overlay in vertical.overlays
+                        else None
                     )
 
-                # Failed checks by product
-                failed_checks_by_product: dict[str, list[dict[str, str]]] = {}
-                for check in checks:
-                    if not check.passed and check.product_id:
-                        pid = check.product_id
-                        failed_checks_by_product.setdefault(pid, []).append(
-                            {
-                                "check_name": check.check_name,
-                                "detail": check.detail,
-                            }
+                    # Listwise: one request covers every result for the query;
+                    # per-pair contexts below still map the answers back.
+                    if listwise_judge is not None and results:
+                        try:
+                            requests.append(
+                                listwise_judge.prepare_request(
+                                    f"list-{query_index}",
+                                    query_entry.query,
+                                    results,
+                                    corrected_query=corrected_query,
+                                    overlay=overlay_text,
+                                )
+                            )
+                        except Exception as e:
+                            console.print(
+                                f"[red]Error preparing listwise request for "
+                                f"'{query_entry.query}': {e}"
+                            )
+                            progress.advance(task)
+                            continue
+
+                    # Build batch requests for each result
+                    for result_idx, result in enumerate(results):
+                        custom_id = f"rel-{query_index}-{result_idx}"
+                        product_failed_checks = failed_checks_by_product.get(
+                            result.product_id, []
                         )
 
-                # Look up overlay content for this query
-                overlay_text = (
-                    vertical.overlays[query_entry.overlay].content
-                    if vertical
-                    and query_entry.overlay
-                    and query_entry.overlay in vertical.overlays
-                    else None
-                )
+                        try:
+                            prior = (
+                                judge.baseline_judgment(
+                                    query_entry.query,
+                                    result,
+                                    query_type=query_entry.type,
+                                    corrected_query=corrected_query,
+                                    overlay=overlay_text,
+                                )
+                                if listwise_judge is None
+                                else None
+                            )
+                            if prior is not None:
+                                carried[custom_id] = prior
+                            elif listwise_judge is None:
+                                requests.append(
+                                    judge.prepare_request(
+                                        custom_id,
+                                        query_entry.query,
+                                        result,
+                                        corrected_query=corrected_query,
+                                        overlay=overlay_text,
+                                    )
+                                )
+                            request_context[custom_id] = (
+                                query_entry.query,
+                                result,
+                                query_entry.type,
+                                corrected_query,
+                                product_failed_checks,
+                                query_index,
+                                query_entry.overlay,
+                            )
+                        except Exception as e:
+                            console.print(
+                                f"[red]Error preparing request for "
+                                f"'{query_entry.query}' / '{result.product_id}': {e}"
+                            )
 
-                # Build batch requests for each result
-                for result_idx, result in enumerate(results):
-                    custom_id = f"rel-{query_index}-{result_idx}"
-                    product_failed_checks = failed_checks_by_product.get(
-                        result.product_id, []
-                    )
+                    progress.advance(task)
 
-                    try:
-                        batch_req = judge.prepare_request(
-                            custom_id,
-                            query_entry.query,
-                            result,
-                            corrected_query=corrected_query,
-                            overlay=overlay_text,
-                        )
-                        batch_requests.append(batch_req)
-                        request_context[custom_id] = (
-                            query_entry.query,
-                            result,
-                            query_entry.type,
-                            corrected_query,
-                            product_failed_checks,
-                            query_index,
-                            query_entry.overlay,
-                        )
-                    except Exception as e:
-                        console.print(
-                            f"[red]Error preparing request for "
-                            f"'{query_entry.query}' / '{result.product_id}': {e}"
+            # Serve already-judged prompts from the shared map or the cache
+            # and submit only the rest
+            if reuse_enabled and requests:
+                newly_reused = _reused_batch_results(judge, requests)
+                if newly_reused:
+                    requests = [r for r in requests if r.custom_id not in newly_reused]
+                    _print_reused(newly_reused)
+                    reused.update(newly_reused)
+            return requests
+
+        def _submit_relevance(requests: list[BatchRequest]) -> list[str]:
+            """Submit relevance requests, split into shards beyond provider limits."""
+            shards = shard_for_client(llm_client, requests)
+            if len(shards) > 1:
+                console.print(
+                    f"[cyan]Submitting batch of {len(requests)} requests "
+                    f"in {len(shards)} shards...[/cyan]"
+                )
+            else:
+                console.print(
+                    f"[cyan]Submitting batch of {len(requests)} requests...[/cyan]"
+                )
+            shard_ids = submit_shards(llm_client, shards)
+            console.print(f"[dim]Batch ID: {', '.join(shard_ids)}[/dim]")
+            logger.debug(
+                "relevance batch submitted: ids=%s, requests=%d",
+                shard_ids,
+                len(requests),
+            )
+            return shard_ids
+
+        def _checkpoint_relevance(pending_queries: list[int]) -> None:
+            """Save the relevance batches submitted so far with their contexts."""
+            gemini_orders = {
+                shard_id: (
+                    merged.orders.get(shard_id, [])
+                    if merged is not None
+                    else llm_client.batch_custom_id_order(shard_id)
+                )
+                for shard_id in batch_ids
+            }
+            batch_id = batch_ids[0] if batch_ids else ""
+            save_checkpoint(
+                output_dir,
+                config.name,
+                BatchCheckpoint(
+                    batch_id=batch_id,
+                    experiment_name=config.name,
+                    phase="relevance",
+                    request_context=serialize_request_context(
+                        dict(
+                            sorted(request_context.items(), key=lambda item: item[1][5])
                         )
+                    ),
+                    checks=[
+                        asdict(c)
+                        for i in sorted(checks_by_query)
+                        for c in checks_by_query[i]
+                    ],
+                    correction_entries=[
+                        [idx, orig, corr]
+                        for idx, orig, corr in sorted(correction_entries)
+                    ],
+                    gemini_custom_id_order=gemini_orders.get(batch_id, []),
+                    correction_batch_id=None,
+                    correction_context=None,
+                    gemini_correction_custom_id_order=[],
+                    batch_ids=batch_ids,
+                    gemini_custom_id_orders=gemini_orders,
+                    merged_prefix=merged.prefix if merged is not None else None,
+                    merged_batch_ids=sorted(merged.batch_ids) if merged else [],
+                    merged_aliases=dict(merged.aliases) if merged else {},
+                    pending_queries=pending_queries,
+                ),
+            )
 
-                progress.advance(task)
+        if classification is not None:
+            # Queries with a known type and overlay go into a first batch
+            # while the rest are classified, then into a second one
+            classifying = {idx for idx, _ in classification.targets}
+            known = [i for i in range(len(queries)) if i not in classifying]
+            if known:
+                console.print(
+                    f"[dim]{len(known)} of {len(queries)} queries already typed; "
+                    "submitting them while the rest are classified[/dim]"
+                )
+                known_requests = _collect(known)
+                if known_requests:
+                    batch_ids = _submit_relevance(known_requests)
+                    # The first batch survives a failed or interrupted
+                    # classification; a resumed run collects the rest
+                    _checkpoint_relevance(sorted(classifying))
+            finish_classification(classification)
+            batch_requests = _collect(sorted(classifying))
+        else:
+            batch_requests = _collect(pending or list(range(len(queries))))
+        # Restore query order after collecting in two passes
+        request_context = dict(
+            sorted(request_context.items(), key=lambda item: item[1][5])
+        )
+        correction_entries.sort(key=lambda entry: entry[0])
+        all_checks = [c for i in sorted(checks_by_query) for c in checks_by_query[i]]
+
+        if carried:
+            console.print(
+                f"[dim]Baseline: {len(carried)} request(s) already judged, "
+                "skipped from the batch[/dim]"
+            )
 
         # Edge case: no requests
-        if not batch_requests:
+        if not request_context:
             metrics = compute_all_metrics({}, queries)
             return [], all_checks, metrics, []
 
@@ -927,44 +2278,38 @@ def run_batch_evaluation(
                 corr_requests.append(corr_req)
                 corr_context[custom_id] = (original, corrected)
 
-        # Phase 2: Submit batches
-        console.print(
-            f"[cyan]Submitting batch of {len(batch_requests)} requests...[/cyan]"
-        )
-        batch_id = llm_client.submit_batch(batch_requests)
-        console.print(f"[dim]Batch ID: {batch_id}[/dim]")
-        logger.debug(
-            "relevance batch submitted: id=%s, requests=%d",
-            batch_id,
-            len(batch_requests),
-        )
-
-        # Save partial checkpoint immediately so the relevance batch ID
-        # survives even if the correction submit below raises.
-        gemini_order = getattr(llm_client, "_batch_custom_ids", {}).get(batch_id, [])
-        serialized_req_ctx = serialize_request_context(request_context)
-        serialized_checks = [asdict(c) for c in all_checks]
-        serialized_corr_entries = [
-            [idx, orig, corr] for idx, orig, corr in correction_entries
-        ]
-        save_checkpoint(
-            output_dir,
-            config.name,
-            BatchCheckpoint(
-                batch_id=batch_id,
-                experiment_name=config.name,
-                phase="relevance",
-                request_context=serialized_req_ctx,
-                checks=serialized_checks,
-                correction_entries=serialized_corr_entries,
-                gemini_custom_id_order=gemini_order,
-                correction_batch_id=None,
-                correction_context=None,
-                gemini_correction_custom_id_order=[],
-            ),
-        )
-
-        if corr_requests:
+        # Phase 2: Submit batches.  Requests beyond the provider's per-batch
+        # limits are split into shards, submitted concurrently.  No shards
+        # means every relevance request was answered without the LLM.
+        if coordinated and not pending:
+            # Dual mode: the coordinator submits both configurations'
+            # requests together
+            submitted: _Submitted = yield _SubmitStep(batch_requests, corr_requests)
+            batch_ids = submitted.batch_ids
+            corr_batch_id = submitted.correction_batch_id
+            merged = submitted.merged
+        elif batch_requests:
+            batch_ids = batch_ids + _submit_relevance(batch_requests)
+
+        # Save partial checkpoint immediately so the relevance batch IDs
+        # survive even if the correction submit below raises.
+        _checkpoint_relevance([])
+
+        if corr_batch_id is not None:
+            # Submitted together with the other configuration's corrections
+            update_checkpoint(
+                output_dir,
+                config.name,
+                correction_batch_id=corr_batch_id,
+                correction_context={
+                    k: {"original": v[0], "corrected": v[1]}
+                    for k, v in corr_context.items()
+                },
+                gemini_correction_custom_id_order=(
+                    merged.orders.get(corr_batch_id, []) if merged else []
+                ),
+            )
+        elif corr_requests:
             console.print(
                 f"[cyan]Submitting correction batch of "
                 f"{len(corr_requests)} requests...[/cyan]"
@@ -977,48 +2322,97 @@ def run_batch_evaluation(
             )
 
             # Update checkpoint with correction batch info
-            gemini_corr_order = getattr(llm_client, "_batch_custom_ids", {}).get(
-                corr_batch_id, []
-            )
-            save_checkpoint(
+            gemini_corr_order = llm_client.batch_custom_id_order(corr_batch_id)
+            update_checkpoint(
                 output_dir,
                 config.name,
-                BatchCheckpoint(
-                    batch_id=batch_id,
-                    experiment_name=config.name,
-                    phase="relevance",
-                    request_context=serialized_req_ctx,
-                    checks=serialized_checks,
-                    correction_entries=serialized_corr_entries,
-                    gemini_custom_id_order=gemini_order,
-                    correction_batch_id=corr_batch_id,
-                    correction_context={
-                        k: {"original": v[0], "corrected": v[1]}
-                        for k, v in corr_context.items()
-                    },
-                    gemini_correction_custom_id_order=gemini_corr_order,
-                ),
+                correction_batch_id=corr_batch_id,
+                correction_context={
+                    k: {"original": v[0], "corrected": v[1]}
+                    for k, v in corr_context.items()
+                },
+                gemini_correction_custom_id_order=gemini_corr_order,
             )
 
-    # Phase 3: Poll for completion (both batches together)
-    poll_entries: list[tuple[str, int, str]] = [
-        (batch_id, len(request_context), "Waiting for relevance batch..."),
-    ]
-    if corr_batch_id:
+    # Phase 3: Poll for completion (all shards and corrections together)
+    relevance_total = (
+        len({ctx[5] for ctx in request_context.values()})
+        if listwise_judge is not None
+        else len(request_context)
+    )
+    poll_entries: list[tuple[str, int, str]] = []
+    if len(batch_ids) == 1:
+        if batch_ids[0] not in completed_shards | abandoned:
+            poll_entries.append(
+                (batch_ids[0], relevance_total, "Waiting for relevance batch..."),
+            )
+    else:
+        # Providers report each shard's exact size once polled
+        shard_total = -(-relevance_total // max(len(batch_ids), 1))
+        for n, shard_id in enumerate(batch_ids, start=1):
+            if shard_id not in completed_shards | abandoned:
+                poll_entries.append(
+                    (
+                        shard_id,
+                        shard_total,
+                        f"Waiting for relevance batch {n}/{len(batch_ids)}...",
+                    )
+                )
+    if corr_batch_id and corr_batch_id not in abandoned:
         poll_entries.append(
             (corr_batch_id, len(corr_context), "Waiting for correction batch..."),
         )
 
-    try:
-        poll_multiple_batches(
-            llm_client,
-            poll_entries,
-            poll_interval=poll_interval,
-            cancel_event=cancel_event,
+    def _record_shard_done(done_id: str) -> None:
+        # Only sharded runs track completions: a lone batch is re-polled
+        # once on resume, which returns immediately.
+        if done_id not in batch_ids or len(batch_ids) < 2:
+            return
+        completed_shards.add(done_id)
+        update_checkpoint(
+            output_dir,
+            config.name,
+            completed_batch_ids=[b for b in batch_ids if b in completed_shards],
+        )
+
+    def _give_up(gave_up: list[str]) -> None:
+        """Cancel batches no longer waited for and checkpoint them."""
+        if not gave_up:
+            return
+        # In dual mode the coordinator cancels the shared batches once
+        if not coordinated:
+            _cancel_batches(llm_client, gave_up)
+        abandoned.update(gave_up)
+        update_checkpoint(
+            output_dir, config.name, abandoned_batch_ids=sorted(abandoned)
+        )
+
+    def _out_of_time() -> bool:
+        return any(b in abandoned for b in batch_ids) or (
+            deadline is not None and time.time() >= deadline
         )
+
+    try:
+        if coordinated:
+            _give_up((yield _PollStep(poll_entries, _record_shard_done)))
+        elif poll_entries:
+            _give_up(
+                poll_multiple_batches(
+                    llm_client,
+                    poll_entries,
+                    poll_interval=poll_interval,
+                    min_poll_interval=min_poll_interval,
+                    max_poll_interval=max_poll_interval,
+                    cancel_event=cancel_event,
+                    on_complete=_record_shard_done,
+                    deadline=deadline,
+                    stall_timeout=stall_timeout,
+                    straggler_concurrency=straggler_concurrency,
+                )
+            )
     except BatchFailedError as exc:
         msg = str(exc)
-        if exc.batch_id == batch_id:
+        if exc.batch_id in batch_ids:
             # Relevance batch failed — corrections are useless without relevance scores
             clear_checkpoint(output_dir, config.name)
             msg += (
@@ -1026,18 +2420,13 @@ def run_batch_evaluation(
             )
         else:
             # Correction batch failed — preserve relevance batch for recovery
-            current_cp = load_checkpoint(output_dir, config.name)
-            if current_cp is not None:
-                save_checkpoint(
-                    output_dir,
-                    config.name,
-                    replace(
-                        current_cp,
-                        correction_batch_id=None,
-                        correction_context=None,
-                        gemini_correction_custom_id_order=[],
-                    ),
-                )
+            update_checkpoint(
+                output_dir,
+                config.name,
+                correction_batch_id=None,
+                correction_context=None,
+                gemini_correction_custom_id_order=[],
+            )
             msg += (
                 " Re-run with --resume to retrieve relevance results"
                 " and re-submit corrections."
@@ -1053,33 +2442,84 @@ def run_batch_evaluation(
             )
         raise RuntimeError(msg) from exc
 
-    # Phase 4: Retrieve and map relevance results
-    console.print("[cyan]Retrieving batch results...[/cyan]")
-    batch_results = llm_client.retrieve_batch_results(batch_id)
-    results_by_id = {r.custom_id: r for r in batch_results}
-    logger.debug("batch results retrieved: %d", len(batch_results))
-
-    all_judgments: list[JudgmentRecord] = []
-    judgments_by_query: dict[int | str, list[JudgmentRecord]] = defaultdict(list)
-
-    for custom_id, ctx in request_context.items():
-        (
-            query,
-            result,
-            query_type,
-            corrected_query,
-            product_failed_checks,
-            query_index,
-            overlay_key,
-        ) = ctx
+    # Phase 4: Retrieve relevance results.  Pointwise results are parsed
+    # and logged as they stream in, so raw responses are never held in
+    # full; listwise responses are kept until they are split per pair.
+    judged: dict[str, JudgmentRecord] = {}
+    results_by_id: dict[str, BatchResult] = {}
+    # Error judgments held back until follow-up rounds have had a go
+    failed: dict[str, JudgmentRecord] = {}
+    # Requests left unfinished by a batch that was given up on
+    stragglers: set[str] = set()
+    # Recorded judgments not yet handed to the backend
+    unlogged: list[JudgmentRecord] = []
+    retry_enabled = retry_rounds > 0 or sync_retry_limit > 0 or _out_of_time()
+
+    def _record(custom_id: str, judgment: JudgmentRecord) -> None:
+        _, _, _, corrected_query, product_failed_checks, query_index, _ = (
+            request_context[custom_id]
+        )
+        # Annotate with check failures
+        if product_failed_checks:
+            judgment.metadata["failed_checks"] = product_failed_checks
+        # Annotate with corrected query
+        if corrected_query is not None:
+            judgment.metadata["corrected_query"] = corrected_query
+        # Store query_index for resume support
+        judgment.metadata["query_index"] = query_index
 
-        batch_result = results_by_id.get(custom_id)
+        unlogged.append(judgment)
+        if len(unlogged) >= _LOG_CHUNK_SIZE:
+            _log_pending()
+        judged[custom_id] = judgment
 
+    def _log_pending() -> None:
+        try:
+            backend.log_judgments(unlogged[:])
+        except Exception as e:
+            console.print(f"[yellow]Warning: failed to log judgments to backend: {e}")
+        unlogged.clear()
+
+    def _batch_results(batch_id: str) -> Iterator[BatchResult]:
+        if merged is not None and batch_id in merged.batch_ids:
+            return merged.results(llm_client, batch_id)
+        return llm_client.iter_batch_results(batch_id)
+
+    def _judge_batch_result(
+        custom_id: str, batch_result: BatchResult | None
+    ) -> JudgmentRecord:
+        query, result, query_type, corrected_query, _, _, overlay_key = request_context[
+            custom_id
+        ]
         if batch_result and batch_result.response:
             try:
                 judgment = judge.parse_batch_result(
                     batch_result.response, query, result, query_type=query_type
                 )
+                judgment.metadata["pair_hash"] = judge.pair_hash(
+                    query,
+                    result,
+                    corrected_query=corrected_query,
+                    overlay=_overlay_content(vertical, overlay_key),
+                )
+                marker = reused[custom_id][1] if custom_id in reused else None
+                if merged is not None and custom_id in merged.aliases:
+                    # Answered by the other configuration's identical request
+                    marker = "deduplicated"
+                if marker is not None:
+                    judgment.metadata[marker] = True
+                if reuse_enabled and marker != "deduplicated":
+                    judge.remember(
+                        judge.prepare_request(
+                            custom_id,
+                            query,
+                            result,
+                            corrected_query=corrected_query,
+                            overlay=_overlay_content(vertical, overlay_key),
+                        ),
+                        batch_result.response,
+                        cached=marker == "cached",
+                    )
             except Exception as e:
                 judgment = JudgmentRecord(
                     query=query,
@@ -1092,46 +2532,395 @@ def run_batch_evaluation(
                     query_type=query_type,
                     metadata={"error": str(e)},
                 )
-        else:
-            error_msg = batch_result.error if batch_result else "No result returned"
-            judgment = JudgmentRecord(
-                query=query,
-                product=result,
-                score=0,
-                reasoning=f"Batch error: {error_msg}",
-                attribute_verdict="n/a",
-                model=config.llm_model,
-                experiment=config.name,
-                query_type=query_type,
-                metadata={"error": error_msg},
+            return judgment
+        error_msg = batch_result.error if batch_result else "No result returned"
+        return JudgmentRecord(
+            query=query,
+            product=result,
+            score=0,
+            reasoning=f"Batch error: {error_msg}",
+            attribute_verdict="n/a",
+            model=config.llm_model,
+            experiment=config.name,
+            query_type=query_type,
+            metadata={"error": error_msg},
+        )
+
+    if batch_ids:
+        console.print("[cyan]Retrieving batch results...[/cyan]")
+        retrieved = 0
+        for shard_id in batch_ids:
+            try:
+                for shard_result in _batch_results(shard_id):
+                    retrieved += 1
+                    custom_id = shard_result.custom_id
+                    if listwise_judge is not None:
+                        results_by_id[custom_id] = shard_result
+                    elif custom_id in request_context and custom_id not in judged:
+                        judgment = _judge_batch_result(custom_id, shard_result)
+                        if retry_enabled and "error" in judgment.metadata:
+                            failed[custom_id] = judgment
+                        else:
+                            _record(custom_id, judgment)
+            except Exception as e:
+                # A cancelled batch may have no results to retrieve yet
+                if shard_id not in abandoned:
+                    raise
+                console.print(
+                    f"[yellow]Warning: no partial results for batch {shard_id}: {e}"
+                )
+        logger.debug("batch results retrieved: %d", retrieved)
+    if baseline is not None and listwise_judge is None:
+        # On resume the baseline matches are not in the checkpoint; match
+        # the unanswered pairs again.
+        for custom_id, ctx in request_context.items():
+            if custom_id in judged or custom_id in failed or custom_id in carried:
+                continue
+            prior = judge.baseline_judgment(
+                ctx[0],
+                ctx[1],
+                query_type=ctx[2],
+                corrected_query=ctx[3],
+                overlay=_overlay_content(vertical, ctx[6]),
             )
+            if prior is not None:
+                carried[custom_id] = prior
+    if reuse_enabled:
+        # On resume the reused requests were never part of the batch; look
+        # them up again from the stored request context.
+        if listwise_judge is None:
+            unanswered = [
+                judge.prepare_request(
+                    custom_id,
+                    ctx[0],
+                    ctx[1],
+                    corrected_query=ctx[3],
+                    overlay=_overlay_content(vertical, ctx[6]),
+                )
+                for custom_id, ctx in request_context.items()
+                if custom_id not in judged
+                and custom_id not in failed
+                and custom_id not in reused
+                and custom_id not in carried
+            ]
+        else:
+            ctxs_by_query = defaultdict(list)
+            for ctx in request_context.values():
+                ctxs_by_query[ctx[5]].append(ctx)
+            unanswered = [
+                listwise_judge.prepare_request(
+                    f"list-{query_index}",
+                    ctxs[0][0],
+                    [c[1] for c in ctxs],
+                    corrected_query=ctxs[0][3],
+                    overlay=_overlay_content(vertical, ctxs[0][6]),
+                )
+                for query_index, ctxs in ctxs_by_query.items()
+                if f"list-{query_index}" not in results_by_id
+                and f"list-{query_index}" not in reused
+            ]
+        if unanswered:
+            reused.update(_reused_batch_results(judge, unanswered))
+    for custom_id, (reused_response, _marker) in reused.items():
+        results_by_id[custom_id] = BatchResult(
+            custom_id=custom_id, response=reused_response
+        )
 
-        # Annotate with check failures
-        if product_failed_checks:
-            judgment.metadata["failed_checks"] = product_failed_checks
-        # Annotate with corrected query
-        if corrected_query is not None:
-            judgment.metadata["corrected_query"] = corrected_query
-        # Store query_index for resume support
-        judgment.metadata["query_index"] = query_index
+    # Listwise: split each per-query response back into per-pair judgments
+    listwise_judgments: dict[str, JudgmentRecord | None] = {}
+    if listwise_judge is not None:
+        ids_by_query: dict[int, list[str]] = defaultdict(list)
+        for custom_id, ctx in request_context.items():
+            ids_by_query[ctx[5]].append(custom_id)
+        for query_index, custom_ids in ids_by_query.items():
+            ctxs = [request_context[cid] for cid in custom_ids]
+            list_id = f"list-{query_index}"
+            list_result = results_by_id.get(list_id)
+            parsed: list[JudgmentRecord | None] = [None] * len(ctxs)
+            if list_result is not None and list_result.response is not None:
+                parsed = listwise_judge.parse_batch_result(
+                    list_result.response,
+                    ctxs[0][0],
+                    [c[1] for c in ctxs],
+                    query_type=ctxs[0][2],
+                )
+                if list_id in reused:
+                    for j in parsed:
+                        if j is not None:
+                            j.metadata[reused[list_id][1]] = True
+                elif judgment_cache is not None and all(j is not None for j in parsed):
+                    req = listwise_judge.prepare_request(
+                        list_id,
+                        ctxs[0][0],
+                        [c[1] for c in ctxs],
+                        corrected_query=ctxs[0][3],
+                        overlay=_overlay_content(vertical, ctxs[0][6]),
+                    )
+                    judgment_cache.put(
+                        config.llm_model,
+                        req.system_prompt,
+                        req.user_prompt,
+                        list_result.response,
+                    )
+            listwise_judgments.update(zip(custom_ids, parsed))
+        missing = sum(1 for j in listwise_judgments.values() if j is None)
+        if missing:
+            console.print(
+                f"[cyan]{missing} result(s) missing from listwise responses "
+                "will be judged per pair[/cyan]"
+            )
 
+    # Pairs with no streamed result: baseline copies, reused judgments,
+    # listwise splits and errors
+    for custom_id, ctx in request_context.items():
+        if custom_id in judged or custom_id in failed:
+            continue
+        listwise_judgment = listwise_judgments.get(custom_id)
+
+        if custom_id in carried:
+            judgment = carried[custom_id]
+        elif listwise_judgment is not None:
+            judgment = listwise_judgment
+        elif listwise_judge is not None and custom_id not in results_by_id:
+            # Judged per pair below, in follow-up batches or synchronously
+            if f"list-{ctx[5]}" not in results_by_id and _out_of_time():
+                stragglers.add(custom_id)
+            failed[custom_id] = _judge_batch_result(
+                custom_id,
+                BatchResult(
+                    custom_id=custom_id,
+                    response=None,
+                    error="Missing from the listwise response",
+                ),
+            )
+            continue
+        else:
+            judgment = _judge_batch_result(custom_id, results_by_id.get(custom_id))
+            if retry_enabled and "error" in judgment.metadata:
+                if custom_id not in results_by_id and _out_of_time():
+                    stragglers.add(custom_id)
+                failed[custom_id] = judgment
+                continue
+        _record(custom_id, judgment)
+
+    # Phase 4b: Resubmit failed and unparseable requests in follow-up
+    # batches, then finish the last few stragglers synchronously.
+    def _apply_retry(retry_id: str, round_number: int) -> None:
+        for retry_result in llm_client.iter_batch_results(retry_id):
+            custom_id = retry_result.custom_id
+            if custom_id not in failed:
+                continue
+            # The retried response is fresh, not a cached or shared one
+            reused.pop(custom_id, None)
+            judgment = _judge_batch_result(custom_id, retry_result)
+            if "error" in judgment.metadata:
+                failed[custom_id] = judgment
+            else:
+                judgment.metadata["retry_round"] = round_number
+                del failed[custom_id]
+                _record(custom_id, judgment)
+
+    def _collect_retry(retry_id: str, round_number: int) -> bool:
+        """Apply one follow-up batch; return False if it failed or was dropped."""
+        if retry_id in abandoned:
+            return False
         try:
-            backend.log_judgment(judgment)
-        except Exception as e:
-            console.print(f"[yellow]Warning: failed to log judgment to backend: {e}")
-        all_judgments.append(judgment)
-        judgments_by_query[query_index].append(judgment)
+            gave_up = poll_multiple_batches(
+                llm_client,
+                [
+                    (
+                        retry_id,
+                        len(failed),
+                        f"Waiting for follow-up batch {round_number}...",
+                    )
+                ],
+                poll_interval=poll_interval,
+                min_poll_interval=min_poll_interval,
+                max_poll_interval=max_poll_interval,
+                cancel_event=cancel_event,
+                deadline=deadline,
+                stall_timeout=stall_timeout,
+                straggler_concurrency=straggler_concurrency,
+            )
+        except BatchFailedError as exc:
+            console.print(f"[yellow]Warning: follow-up batch failed: {exc}")
+            return False
+        if gave_up:
+            _give_up(gave_up)
+            # Keep whatever the cancelled batch finished
+            try:
+                _apply_retry(retry_id, round_number)
+            except Exception as e:
+                logger.debug("no partial results for batch %s: %s", retry_id, e)
+            return False
+        _apply_retry(retry_id, round_number)
+        return True
+
+    if failed:
+        initially_failed = len(failed)
+        if stragglers:
+            console.print(
+                f"[yellow]{len(stragglers)} relevance request(s) unfinished "
+                "when batch polling stopped[/yellow]"
+            )
+        if initially_failed > len(stragglers):
+            console.print(
+                f"[yellow]{initially_failed - len(stragglers)} relevance "
+                "request(s) failed or could not be parsed[/yellow]"
+            )
+        batch_retries_ok = not _out_of_time()
+        # Follow-up batches submitted before an interruption
+        for round_number, retry_id in enumerate(retry_batch_ids, start=1):
+            if not failed or not batch_retries_ok:
+                break
+            batch_retries_ok = _collect_retry(retry_id, round_number)
+        while (
+            batch_retries_ok
+            and len(failed) > sync_retry_limit
+            and len(retry_batch_ids) < retry_rounds
+            and not _out_of_time()
+        ):
+            round_number = len(retry_batch_ids) + 1
+            retry_requests = []
+            for custom_id in failed:
+                query, result, _, corrected_query, _, _, overlay_key = request_context[
+                    custom_id
+                ]
+                retry_requests.append(
+                    judge.prepare_request(
+                        custom_id,
+                        query,
+                        result,
+                        corrected_query=corrected_query,
+                        overlay=_overlay_content(vertical, overlay_key),
+                    )
+                )
+            console.print(
+                f"[cyan]Submitting follow-up batch {round_number}/{retry_rounds} "
+                f"of {len(retry_requests)} requests...[/cyan]"
+            )
+            retry_id = llm_client.submit_batch(group_by_system_prompt(retry_requests))
+            retry_batch_ids.append(retry_id)
+            update_checkpoint(
+                output_dir,
+                config.name,
+                retry_batch_ids=list(retry_batch_ids),
+                # Merged into the saved orders
+                gemini_custom_id_orders={
+                    retry_id: llm_client.batch_custom_id_order(retry_id)
+                },
+            )
+            batch_retries_ok = _collect_retry(retry_id, round_number)
+        # Listwise positions are always judged, even without a retry budget
+        if failed and (
+            len(failed) <= sync_retry_limit
+            or _out_of_time()
+            or listwise_judge is not None
+        ):
+            console.print(
+                f"[cyan]Judging {len(failed)} remaining request(s) "
+                "synchronously...[/cyan]"
+            )
+
+            def _judge_sync(custom_id: str) -> JudgmentRecord:
+                query, result, query_type, corrected_query, _, _, overlay_key = (
+                    request_context[custom_id]
+                )
+                return _judge_result(
+                    judge,
+                    config,
+                    QueryEntry(query=query, type=query_type, overlay=overlay_key),
+                    result,
+                    corrected_query,
+                    _overlay_content(vertical, overlay_key),
+                )
+
+            pending_ids = list(failed)
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(straggler_concurrency, len(pending_ids)))
+            ) as sync_executor:
+                sync_judgments = list(sync_executor.map(_judge_sync, pending_ids))
+            for custom_id, judgment in zip(pending_ids, sync_judgments):
+                if "error" not in judgment.metadata:
+                    if custom_id in stragglers:
+                        judgment.metadata["straggler"] = True
+                    else:
+                        judgment.metadata["retry_round"] = "sync"
+                    del failed[custom_id]
+                    _record(custom_id, judgment)
+        kind = "failed or unfinished" if stragglers else "failed"
+        console.print(
+            f"[dim]Recovered {initially_failed - len(failed)} of "
+            f"{initially_failed} {kind} request(s)[/dim]"
+        )
+        for custom_id, judgment in failed.items():
+            _record(custom_id, judgment)
+    _log_pending()
+
+    all_judgments = [judged[custom_id] for custom_id in request_context]
+    judgments_by_query: dict[int | str, list[JudgmentRecord]] = defaultdict(list)
+    for custom_id, ctx in request_context.items():
+        judgments_by_query[ctx[5]].append(judged[custom_id])
+    for query_key, query_judgments in judgments_by_query.items():
+        _log_query_complete(backend, config.name, int(query_key), len(query_judgments))
 
     # Phase 5: Retrieve correction results (already submitted & polled above)
     all_correction_judgments: list[CorrectionJudgment] = []
     if corr_batch_id and corr_context:
-        corr_results = llm_client.retrieve_batch_results(corr_batch_id)
-        corr_results_by_id = {r.custom_id: r for r in corr_results}
+        corr_results_by_id: dict[str, BatchResult] = {}
+        try:
+            for entry in _batch_results(corr_batch_id):
+                corr_results_by_id[entry.custom_id] = entry
+        except Exception as e:
+            if corr_batch_id not in abandoned:
+                raise
+            console.print(
+                f"[yellow]Warning: no partial results for batch {corr_batch_id}: {e}"
+            )
+
+        # Corrections left unfinished by an abandoned batch
+        corr_sync: dict[str, CorrectionJudgment] = {}
+        if corr_batch_id in abandoned:
+            corr_missing = [
+                cid for cid in corr_context if cid not in corr_results_by_id
+            ]
+            if corr_missing:
+                console.print(
+                    f"[cyan]Judging {len(corr_missing)} unfinished correction(s) "
+                    "synchronously...[/cyan]"
+                )
+
+                def _judge_correction_sync(custom_id: str) -> CorrectionJudgment:
+                    original, corrected = corr_context[custom_id]
+                    try:
+                        return correction_judge.judge(original, corrected)
+                    except Exception as e:
+                        return CorrectionJudgment(
+                            original_query=original,
+                            corrected_query=corrected,
+                            verdict="error",
+                            reasoning=f"Error: {e}",
+                            model=config.llm_model,
+                            experiment=config.name,
+                            metadata={"error": str(e)},
+                        )
+
+                with ThreadPoolExecutor(
+                    max_workers=max(1, min(straggler_concurrency, len(corr_missing)))
+                ) as sync_executor:
+                    corr_sync = dict(
+                        zip(
+                            corr_missing,
+                            sync_executor.map(_judge_correction_sync, corr_missing),
+                        )
+                    )
 
         for custom_id, (original, corrected) in corr_context.items():
             batch_result = corr_results_by_id.get(custom_id)
 
-            if batch_result and batch_result.response:
+            if custom_id in corr_sync:
+                cj = corr_sync[custom_id]
+            elif batch_result and batch_result.response:
                 try:
                     cj = correction_judge.parse_batch_result(
                         batch_result.response, original, corrected
@@ -1187,15 +2976,126 @@ def run_batch_evaluation(
             summary += f", {errored} errored"
         console.print(summary)
 
+    if baseline is not None:
+        _print_baseline_reuse(all_judgments)
+    _print_token_usage(all_judgments)
+
     # Phase 6: Compute metrics
     metrics = compute_all_metrics(judgments_by_query, queries)
 
     # Clear checkpoint on success
     clear_checkpoint(output_dir, config.name)
+    # Merged batches are released by the dual run once both are done
+    for done_id in [*batch_ids, *retry_batch_ids, corr_batch_id]:
+        if done_id and (merged is None or done_id not in merged.batch_ids):
+            llm_client.release_batch(done_id)
 
     return all_judgments, all_checks, metrics, all_correction_judgments
 
 
+def _drive_batch_steps(
+    llm_client: LLMClient,
+    steps: dict[str, Generator[_BatchStep, Any, _BatchOutcome]],
+    *,
+    dedupe: bool,
+    poll_interval: int,
+    min_poll_interval: float,
+    max_poll_interval: float,
+    cancel_event: threading.Event | None,
+    deadline: float | None,
+    stall_timeout: float | None,
+    straggler_concurrency: int = DEFAULT_STRAGGLER_CONCURRENCY,
+) -> dict[str, _BatchOutcome]:
+    """Run coordinated batch evaluations, sharing their batches.
+
+    Each configuration collects its requests in turn; the requests are then
+    submitted as one merged relevance batch and one merged correction batch,
+    polled together, and each configuration finishes on its own.
+    """
+    outcomes: dict[str, _BatchOutcome] = {}
+    current: dict[str, _BatchStep] = {}
+
+    def _advance(key: str, sent: Any) -> None:
+        try:
+            current[key] = steps[key].send(sent)
+        except StopIteration as done:
+            current.pop(key, None)
+            outcomes[key] = done.value
+
+    for key in steps:
+        _advance(key, None)
+
+    # A resumed configuration goes straight to polling
+    submits = {k: s for k, s in current.items() if isinstance(s, _SubmitStep)}
+    if submits:
+        submitted = _submit_merged(llm_client, submits, dedupe=dedupe)
+        for key, ids in submitted.items():
+            # Gemini forgets a batch's order once it is read, so each
+            # configuration keeps its own copy
+            for merged_id in ids.merged.batch_ids:
+                order = llm_client.batch_custom_id_order(merged_id)
+                if order:
+                    ids.merged.orders[merged_id] = order
+            _advance(key, ids)
+
+    polls = {k: s for k, s in current.items() if isinstance(s, _PollStep)}
+    if len(polls) < len(current):
+        raise RuntimeError("Unexpected batch step in dual mode")
+    entries: dict[str, tuple[str, int, str]] = {}
+    owners: dict[str, list[str]] = defaultdict(list)
+    for key, poll in polls.items():
+        for batch_id, total, label in poll.entries:
+            if batch_id in entries:
+                entries[batch_id] = (batch_id, entries[batch_id][1] + total, label)
+            else:
+                entries[batch_id] = (batch_id, total, label)
+            owners[batch_id].append(key)
+
+    def _on_complete(done_id: str) -> None:
+        for key in owners.get(done_id, ()):
+            polls[key].on_complete(done_id)
+
+    gave_up: list[str] = []
+    try:
+        if entries:
+            gave_up = poll_multiple_batches(
+                llm_client,
+                list(entries.values()),
+                poll_interval=poll_interval,
+                min_poll_interval=min_poll_interval,
+                max_poll_interval=max_poll_interval,
+                cancel_event=cancel_event,
+                on_complete=_on_complete,
+                deadline=deadline,
+                stall_timeout=stall_timeout,
+                straggler_concurrency=straggler_concurrency,
+            )
+    except RuntimeError as exc:
+        # Let each affected configuration update its checkpoint
+        affected = (
+            owners.get(exc.batch_id, [])
+            if isinstance(exc, BatchFailedError)
+            else list(polls)
+        )
+        first: BaseException | None = None
+        for key in affected:
+            try:
+                steps[key].throw(exc)
+            except Exception as raised:
+                first = first or raised
+        raise (first or exc) from exc
+
+    _cancel_batches(llm_client, gave_up)
+    for key, poll in polls.items():
+        owned = {batch_id for batch_id, _, _ in poll.entries}
+        _advance(key, [batch_id for batch_id in gave_up if batch_id in owned])
+    if current:
+        raise RuntimeError("Unexpected batch step in dual mode")
+    for batch_id in entries:
+        llm_client.release_batch(batch_id)
+    return outcomes
+
+
 def run_dual_batch_evaluation(
     queries: list[QueryEntry],
     adapter_a: Callable[[str], SearchResponse | list[SearchResult]],
@@ -1210,9 +3110,20 @@ def run_dual_batch_evaluation(
         list[Callable[[QueryEntry, list[SearchResult]], list[CheckResult]]] | None
     ) = None,
     poll_interval: int = 60,
+    min_poll_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
     resume: bool = False,
     output_dir: str = "./eval-results",
     cancel_event: threading.Event | None = None,
+    listwise: bool = False,
+    judgment_cache: JudgmentCache | None = None,
+    dedupe: bool = True,
+    baseline: Mapping[str, JudgmentRecord] | None = None,
+    retry_rounds: int = DEFAULT_RETRY_ROUNDS,
+    sync_retry_limit: int = DEFAULT_SYNC_RETRY_LIMIT,
+    deadline: float | None = None,
+    stall_timeout: float | None = None,
+    straggler_concurrency: int = DEFAULT_STRAGGLER_CONCURRENCY,
 ) -> tuple[
     list[JudgmentRecord],
     list[JudgmentRecord],
@@ -1224,7 +3135,13 @@ def run_dual_batch_evaluation(
     list[CorrectionJudgment],
     list[CorrectionJudgment],
 ]:
-    """Run batch evaluation for two configurations and generate comparison checks."""
+    """Run batch evaluation for two configurations and generate comparison checks.
+
+    Both configurations' requests are submitted as one merged relevance
+    batch and one merged correction batch and polled together.  With
+    *dedupe*, a request identical to the other configuration's is submitted
+    only once (see :func:`run_dual_evaluation`).
+    """
     console.print(
         f"\n[bold]Running dual batch evaluation: "
         f"'{config_a.name}' vs '{config_b.name}'[/bold]\n"
@@ -1235,35 +3152,61 @@ def run_dual_batch_evaluation(
         config_b.name,
     )
 
-    judgments_a, checks_a, metrics_a, corrections_a = run_batch_evaluation(
-        queries,
-        adapter_a,
-        config_a,
-        llm_client,
-        backend,
-        instructions=instructions,
-        vertical=vertical,
-        custom_checks=custom_checks,
-        poll_interval=poll_interval,
-        resume=resume,
-        output_dir=output_dir,
-        cancel_event=cancel_event,
-    )
+    shared_responses: dict[str, LLMResponse] | None = {} if dedupe else None
 
-    judgments_b, checks_b, metrics_b, corrections_b = run_batch_evaluation(
-        queries,
-        adapter_b,
-        config_b,
-        llm_client,
-        backend,
-        instructions=instructions,
-        vertical=vertical,
-        custom_checks=custom_checks,
-        poll_interval=poll_interval,
-        resume=resume,
-        output_dir=output_dir,
-        cancel_event=cancel_event,
-    )
+    steps = {
+        key: _batch_evaluation(
+            queries,
+            adapter,
+            config,
+            llm_client,
+            backend,
+            instructions=instructions,
+            vertical=vertical,
+            custom_checks=custom_checks,
+            poll_interval=poll_interval,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+            resume=resume,
+            output_dir=output_dir,
+            cancel_event=cancel_event,
+            listwise=listwise,
+            judgment_cache=judgment_cache,
+            shared_responses=shared_responses,
+            baseline=baseline,
+            retry_rounds=retry_rounds,
+            sync_retry_limit=sync_retry_limit,
+            deadline=deadline,
+            stall_timeout=stall_timeout,
+            straggler_concurrency=straggler_concurrency,
+            coordinated=True,
+        )
+        for key, adapter, config in (
+            ("a", adapter_a, config_a),
+            ("b", adapter_b, config_b),
+        )
+    }
+    try:
+        outcomes = _drive_batch_steps(
+            llm_client,
+            steps,
+            dedupe=dedupe,
+            poll_interval=poll_interval,
+            min_poll_interval=min_poll_interval,
+            max_poll_interval=max_poll_interval,
+            cancel_event=cancel_event,
+            deadline=deadline,
+            stall_timeout=stall_timeout,
+            straggler_concurrency=straggler_concurrency,
+        )
+    finally:
+        for pending_steps in steps.values():
+            pending_steps.close()
+    judgments_a, checks_a, metrics_a, corrections_a = outcomes["a"]
+    judgments_b, checks_b, metrics_b, corrections_b = outcomes["b"]
+
+    if dedupe:
+        _print_dedupe_savings(judgments_a, judgments_b)
 
     # Run comparison checks
     console.print("\n[cyan]Running comparison checks...[/cyan]")
@@ -808,6 +808,9 @@ def _generate_html(
             ("adapter_path", "Adapter Path"),
             ("adapter_path_a", "Adapter Path (A)"),
             ("adapter_path_b", "Adapter Path (B)"),
+            ("llm_calls_saved", "LLM Calls Saved (Shared Pairs)"),
+            ("baseline_experiment", "Baseline Experiment"),
+            ("judgments_reused", "Judgments Reused from Baseline"),
         ]
         for key, label in key_to_label:
             if key in run_metadata:
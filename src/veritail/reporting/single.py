@@ -553,6 +553,8 @@ def _generate_html(
             ("adapter_path", "Adapter Path"),
             ("adapter_path_a", "Adapter Path (A)"),
             ("adapter_path_b", "Adapter Path (B)"),
+            ("baseline_experiment", "Baseline Experiment"),
+            ("judgments_reused", "Judgments Reused from Baseline"),
         ]
         for key, label in key_to_label:
             if key in run_metadata:
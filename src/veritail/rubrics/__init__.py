@@ -1,5 +1,15 @@
 """Ecommerce relevance rubric for LLM judgment."""
 
-from veritail.rubrics.ecommerce_default import SYSTEM_PROMPT, format_user_prompt
+from veritail.rubrics.ecommerce_default import (
+    LISTWISE_SYSTEM_PROMPT,
+    SYSTEM_PROMPT,
+    format_listwise_user_prompt,
+    format_user_prompt,
+)
 
-__all__ = ["SYSTEM_PROMPT", "format_user_prompt"]
+__all__ = [
+    "LISTWISE_SYSTEM_PROMPT",
+    "SYSTEM_PROMPT",
+    "format_listwise_user_prompt",
+    "format_user_prompt",
+]
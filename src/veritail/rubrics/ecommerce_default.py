@@ -7,25 +7,16 @@ from veritail.types import SearchResult
 
 SYSTEM_PROMPT = load_prompt("rubrics/ecommerce_default.md")
 
+# Listwise variant: same scale and criteria, but asks for one
+# SCORE/ATTRIBUTES/REASONING block per numbered product.
+LISTWISE_SYSTEM_PROMPT = SYSTEM_PROMPT.split("## Response Format")[0] + load_prompt(
+    "rubrics/ecommerce_listwise.md"
+)
 
-def format_user_prompt(
-    query: str,
-    result: SearchResult,
-    *,
-    corrected_query: str | None = None,
-    overlay: str | None = None,
-) -> str:
-    """Format a query-product pair into a user prompt for the LLM judge."""
-    attrs_str = ""
-    if result.attributes:
-        attrs_lines = [f"  - {k}: {v}" for k, v in result.attributes.items()]
-        attrs_str = "\n".join(attrs_lines)
-
-    metadata_str = ""
-    if result.metadata:
-        meta_lines = [f"  - {k}: {v}" for k, v in result.metadata.items()]
-        metadata_str = "\n".join(meta_lines)
 
+def _format_query_section(
+    query: str, corrected_query: str | None, overlay: str | None
+) -> str:
     if corrected_query is not None:
         query_section = (
             f"## Original Search Query\n{query}\n\n"
@@ -37,18 +28,81 @@ def format_user_prompt(
     overlay_section = ""
     if overlay:
         overlay_section = f"\n\n## Domain-Specific Scoring Guidance\n{overlay}"
+    return f"{query_section}{overlay_section}"
 
-    return f"""\
-{query_section}{overlay_section}
 
-## Product
+def _format_product_details(result: SearchResult, include_position: bool = True) -> str:
+    attrs_str = ""
+    if result.attributes:
+        attrs_lines = [f"  - {k}: {v}" for k, v in result.attributes.items()]
+        attrs_str = "\n".join(attrs_lines)
+
+    metadata_str = ""
+    if result.metadata:
+        meta_lines = [f"  - {k}: {v}" for k, v in result.metadata.items()]
+        metadata_str = "\n".join(meta_lines)
+
+    position_line = (
+        f"- **Position in Results**: {result.position + 1}\n"
+        if include_position
+        else ""
+    )
+
+    return f"""\
 - **Title**: {result.title}
 - **Description**: {result.description}
 - **Category**: {result.category}
 - **Price**: ${result.price:.2f}
 - **In Stock**: {"Yes" if result.in_stock else "No"}
-- **Position in Results**: {result.position + 1}
+{position_line}\
 {f"- **Attributes**:{chr(10)}{attrs_str}" if attrs_str else ""}\
-{f"{chr(10)}- **Metadata**:{chr(10)}{metadata_str}" if metadata_str else ""}
+{f"{chr(10)}- **Metadata**:{chr(10)}{metadata_str}" if metadata_str else ""}"""
+
+
+def format_user_prompt(
+    query: str,
+    result: SearchResult,
+    *,
+    corrected_query: str | None = None,
+    overlay: str | None = None,
+    include_position: bool = True,
+) -> str:
+    """Format a query-product pair into a user prompt for the LLM judge.
+
+    With ``include_position=False`` the prompt depends only on the query and
+    the product, so the same pair returned at different ranks (e.g. by the
+    two configurations of a dual run) yields an identical prompt.
+    """
+    return f"""\
+{_format_query_section(query, corrected_query, overlay)}
+
+## Product
+{_format_product_details(result, include_position)}
 
 Please evaluate the relevance of this product to the search query."""
+
+
+def format_listwise_user_prompt(
+    query: str,
+    results: list[SearchResult],
+    *,
+    corrected_query: str | None = None,
+    overlay: str | None = None,
+) -> str:
+    """Format a query and all of its results into one listwise user prompt.
+
+    Products are numbered ``Result 1..N`` in list order; the judge's
+    ``RESULT <n>`` blocks are mapped back by that number.
+    """
+    products = "\n\n".join(
+        f"### Result {i}\n{_format_product_details(result)}"
+        for i, result in enumerate(results, start=1)
+    )
+    return f"""\
+{_format_query_section(query, corrected_query, overlay)}
+
+## Products
+{products}
+
+Please evaluate the relevance of each of these {len(results)} products to the \
+search query."""
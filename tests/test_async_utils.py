@@ -0,0 +1,59 @@
+"""Tests for the background event loop helper."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from veritail.async_utils import EventLoopThread
+
+
+def test_submit_returns_result():
+    async def double(x: int) -> int:
+        await asyncio.sleep(0)
+        return x * 2
+
+    with EventLoopThread(4) as runner:
+        futures = [runner.submit(double(i)) for i in range(5)]
+        assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+
+
+def test_submit_propagates_exceptions():
+    async def boom() -> None:
+        raise RuntimeError("nope")
+
+    with EventLoopThread(1) as runner:
+        future = runner.submit(boom())
+        with pytest.raises(RuntimeError, match="nope"):
+            future.result(timeout=5)
+
+
+def test_limit_caps_concurrent_coroutines():
+    state = {"active": 0, "peak": 0}
+
+    async def work() -> None:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+
+    with EventLoopThread(3) as runner:
+        futures = [runner.submit(work()) for _ in range(10)]
+        for f in futures:
+            f.result(timeout=5)
+
+    assert state["peak"] == 3
+
+
+def test_close_cancels_pending_work():
+    runner = EventLoopThread(1)
+    future = runner.submit(asyncio.sleep(60))
+    runner.close()
+    assert future.cancelled()
+    runner.close()  # idempotent
+
+
+def test_rejects_non_positive_limit():
+    with pytest.raises(ValueError, match="limit must be >= 1"):
+        EventLoopThread(0)
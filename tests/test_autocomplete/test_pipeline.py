@@ -204,7 +204,7 @@ def _make_batch_client(
     client.poll_batch.return_value = (poll_status, 2, 2)
     client.batch_error_message.return_value = None
     if results is not None:
-        client.retrieve_batch_results.return_value = results
+        client.iter_batch_results.return_value = results
     return client
 
 
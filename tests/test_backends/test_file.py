@@ -230,3 +230,417 @@ class TestFileBackend:
         assert len(loaded) == 0
         assert len(w) == 1
         assert "Skipping corrupted line 1" in str(w[0].message)
+
+
+class TestFileBackendBuffering:
+    def test_log_judgments_appends_in_order(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments(
+                [
+                    _make_judgment(product_id="SKU-001"),
+                    _make_judgment(product_id="SKU-002", experiment="other"),
+                    _make_judgment(product_id="SKU-003"),
+                ]
+            )
+            backend.log_judgment(_make_judgment(product_id="SKU-004"))
+
+            ids = [j.product.product_id for j in backend.get_judgments("test-exp")]
+            assert ids == ["SKU-001", "SKU-003", "SKU-004"]
+            assert len(backend.get_judgments("other")) == 1
+
+    def test_flush_every_holds_records_until_threshold(self, tmp_path):
+        judgments_file = tmp_path / "test-exp" / "judgments.jsonl"
+        backend = FileBackend(output_dir=str(tmp_path), flush_every=3)
+
+        backend.log_judgments([_make_judgment(), _make_judgment()])
+        assert judgments_file.read_text() == ""
+
+        backend.log_judgment(_make_judgment())
+        assert len(judgments_file.read_text().splitlines()) == 3
+
+        backend.log_judgment(_make_judgment())
+        backend.close()
+        assert len(judgments_file.read_text().splitlines()) == 4
+
+    def test_reads_see_buffered_records(self, tmp_path):
+        backend = FileBackend(output_dir=str(tmp_path), flush_every=100)
+        judgment = _make_judgment()
+        judgment.metadata["query_index"] = 7
+        backend.log_judgment(judgment)
+        backend.log_query_complete("test-exp", 7, 1)
+
+        assert backend.get_completed_query_indices("test-exp") == {7}
+        assert len(backend.get_judgments("test-exp")) == 1
+        backend.close()
+
+    def test_handle_is_opened_once(self, tmp_path):
+        from unittest.mock import patch
+
+        backend = FileBackend(output_dir=str(tmp_path))
+        with patch("builtins.open", wraps=open) as mock_open:
+            for _ in range(5):
+                backend.log_judgment(_make_judgment())
+        backend.close()
+
+        # The products file, the judgments file and its index, each opened once
+        assert mock_open.call_count == 3
+
+    def test_fsync_policy(self, tmp_path):
+        from unittest.mock import patch
+
+        with patch("veritail.backends.file.os.fsync") as mock_fsync:
+            with FileBackend(output_dir=str(tmp_path)) as backend:
+                backend.log_judgment(_make_judgment())
+            mock_fsync.assert_not_called()
+
+            with FileBackend(output_dir=str(tmp_path), fsync=True) as backend:
+                backend.log_judgments([_make_judgment(), _make_judgment()])
+            mock_fsync.assert_called()
+
+    def test_log_experiment_resets_open_handle(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path), flush_every=100) as backend:
+            backend.log_judgment(_make_judgment(product_id="SKU-OLD"))
+            backend.log_experiment("test-exp", {"llm_model": "m"})
+            backend.log_judgment(_make_judgment(product_id="SKU-NEW"))
+
+        judgments = backend.get_judgments("test-exp")
+        assert [j.product.product_id for j in judgments] == ["SKU-NEW"]
+
+    def test_close_is_idempotent(self, tmp_path):
+        backend = FileBackend(output_dir=str(tmp_path))
+        backend.log_judgment(_make_judgment())
+        backend.close()
+        backend.close()
+        backend.log_judgment(_make_judgment())
+        backend.close()
+
+        assert len(backend.get_judgments("test-exp")) == 2
+
+    def test_rejects_invalid_policy(self, tmp_path):
+        import pytest
+
+        with pytest.raises(ValueError, match="flush_every"):
+            FileBackend(output_dir=str(tmp_path), flush_every=0)
+        with pytest.raises(ValueError, match="buffer_size"):
+            FileBackend(output_dir=str(tmp_path), buffer_size=0)
+
+
+def _indexed_judgment(query_index: int, product_id: str = "SKU-001") -> JudgmentRecord:
+    judgment = _make_judgment(product_id=product_id)
+    judgment.metadata["query_index"] = query_index
+    return judgment
+
+
+class TestFileBackendIndex:
+    def test_index_records_spans_and_completions(self, tmp_path):
+        import json
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments([_indexed_judgment(0), _indexed_judgment(0)])
+            backend.log_query_complete("test-exp", 0, 2)
+            backend.log_judgment(_indexed_judgment(1))
+
+        exp_dir = tmp_path / "test-exp"
+        lines = (exp_dir / "judgments.jsonl").read_bytes().splitlines(keepends=True)
+        entries = [
+            json.loads(line)
+            for line in (exp_dir / "judgments.index.jsonl").read_text().splitlines()
+        ]
+        first = len(lines[0]) + len(lines[1])
+        assert entries == [
+            {"query_index": 0, "offset": 0, "bytes": first, "count": 2},
+            {"query_index": 0, "complete": 2},
+            {"query_index": 1, "offset": first, "bytes": len(lines[2]), "count": 1},
+        ]
+
+    def test_partially_judged_query_is_not_completed(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments([_indexed_judgment(0), _indexed_judgment(0)])
+            backend.log_query_complete("test-exp", 0, 2)
+            backend.log_judgment(_indexed_judgment(1))
+            # Completion recorded for more judgments than were logged
+            backend.log_query_complete("test-exp", 2, 3)
+            backend.log_judgment(_indexed_judgment(2))
+
+            assert backend.get_completed_query_indices("test-exp") == {0}
+
+    def test_resume_cuts_unfinished_queries(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {})
+            backend.log_judgment(_indexed_judgment(0, "SKU-A"))
+            backend.log_query_complete("test-exp", 0, 1)
+            backend.log_judgment(_indexed_judgment(1, "SKU-B"))
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {}, resume=True)
+            assert backend.get_completed_query_indices("test-exp") == {0}
+            assert [
+                j.product.product_id for j in backend.get_judgments("test-exp")
+            ] == ["SKU-A"]
+
+            backend.log_judgment(_indexed_judgment(1, "SKU-C"))
+            backend.log_query_complete("test-exp", 1, 1)
+            assert backend.get_completed_query_indices("test-exp") == {0, 1}
+            assert [
+                j.product.product_id for j in backend.get_judgments("test-exp")
+            ] == [
+                "SKU-A",
+                "SKU-C",
+            ]
+
+    def test_resume_drops_unindexed_tail(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_indexed_judgment(0))
+            backend.log_query_complete("test-exp", 0, 1)
+        judgments_file = tmp_path / "test-exp" / "judgments.jsonl"
+        size = judgments_file.stat().st_size
+        # The process died after writing judgments but before indexing them
+        with open(judgments_file, "a", encoding="utf-8") as f:
+            f.write('{"query": "running shoes", "prod')
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {}, resume=True)
+
+            assert judgments_file.stat().st_size == size
+            assert len(backend.get_judgments("test-exp")) == 1
+
+    def test_resume_indexes_files_written_without_index(self, tmp_path):
+        import json
+        from dataclasses import asdict
+
+        exp_dir = tmp_path / "test-exp"
+        exp_dir.mkdir()
+        with open(exp_dir / "judgments.jsonl", "w", encoding="utf-8") as f:
+            for query_index in (0, 0, 1):
+                record = asdict(_indexed_judgment(query_index))
+                f.write(json.dumps(record) + "\n")
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            assert backend.get_completed_query_indices("test-exp") == {0, 1}
+            backend.log_experiment("test-exp", {}, resume=True)
+
+            assert (exp_dir / "judgments.index.jsonl").exists()
+            assert backend.get_completed_query_indices("test-exp") == {0, 1}
+            assert len(backend.get_judgments("test-exp")) == 3
+
+
+class TestFileBackendProductInterning:
+    def test_repeated_products_are_stored_once(self, tmp_path):
+        first = _make_judgment(query="a", experiment="baseline")
+        again = _make_judgment(query="b", experiment="baseline")
+        again.product.position = 4
+        other_config = _make_judgment(query="a", experiment="candidate")
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments([first, again, other_config])
+            backend.log_judgment(_make_judgment(product_id="SKU-002"))
+
+            assert backend.get_judgments("baseline") == [first, again]
+            assert backend.get_judgments("candidate") == [other_config]
+
+        baseline = tmp_path / "baseline" / "products.jsonl"
+        assert len(baseline.read_text().splitlines()) == 1
+        # Each experiment keeps its own products
+        candidate = tmp_path / "candidate" / "products.jsonl"
+        assert len(candidate.read_text().splitlines()) == 1
+        line = (tmp_path / "baseline" / "judgments.jsonl").read_text()
+        assert "Classic running shoes" not in line
+
+    def test_products_reset_with_experiment_and_kept_on_reopen(self, tmp_path):
+        products = tmp_path / "test-exp" / "products.jsonl"
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {})
+            backend.log_judgment(_make_judgment(product_id="SKU-OLD"))
+            backend.log_experiment("test-exp", {})
+            assert products.read_text() == ""
+            backend.log_judgment(_make_judgment())
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_make_judgment(score=1))
+            judgments = backend.get_judgments("test-exp")
+
+        assert [j.score for j in judgments] == [3, 1]
+        assert len(products.read_text().splitlines()) == 1
+
+    def test_torn_product_line_cut_on_reopen(self, tmp_path):
+        products = tmp_path / "test-exp" / "products.jsonl"
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_make_judgment())
+        with open(products, "a", encoding="utf-8") as f:
+            f.write('{"hash": "0123')
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_make_judgment(product_id="SKU-002"))
+            judgments = backend.get_judgments("test-exp")
+
+        assert [j.product.product_id for j in judgments] == ["SKU-001", "SKU-002"]
+        assert len(products.read_text().splitlines()) == 2
+
+    def test_rehydrated_products_do_not_share_dicts(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments([_make_judgment(), _make_judgment()])
+            first, second = backend.get_judgments("test-exp")
+
+        first.product.attributes["color"] = "red"
+        assert second.product.attributes == {"color": "black"}
+
+    def test_reads_judgments_with_embedded_products(self, tmp_path):
+        import json
+        from dataclasses import asdict
+
+        judgment = _make_judgment()
+        exp_dir = tmp_path / "test-exp"
+        exp_dir.mkdir()
+        (exp_dir / "judgments.jsonl").write_text(json.dumps(asdict(judgment)) + "\n")
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(judgment)
+
+            assert backend.get_judgments("test-exp") == [judgment, judgment]
+
+    def test_missing_product_skips_line(self, tmp_path):
+        import pytest
+
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_make_judgment())
+        (tmp_path / "test-exp" / "products.jsonl").write_text("")
+
+        with pytest.warns(UserWarning, match="corrupted line 1"):
+            assert FileBackend(output_dir=str(tmp_path)).get_judgments("test-exp") == []
+
+
+def _codecs() -> list[str]:
+    import importlib.util
+
+    codecs = ["gzip"]
+    if importlib.util.find_spec("zstandard") is not None:
+        codecs.append("zstd")
+    return codecs
+
+
+class TestFileBackendCompression:
+    def test_round_trip_writes_compressed_files(self, tmp_path):
+        import pytest
+
+        for compression in _codecs():
+            out = tmp_path / compression
+            judgments = [_indexed_judgment(0), _indexed_judgment(1, "SKU-002")]
+            with FileBackend(output_dir=str(out), compression=compression) as backend:
+                backend.log_experiment("test-exp", {})
+                backend.log_judgments(judgments)
+                # Flushed data is readable before the stream is closed
+                assert backend.get_judgments("test-exp") == judgments
+
+            suffix = {"gzip": ".gz", "zstd": ".zst"}[compression]
+            assert (out / "test-exp" / f"products.jsonl{suffix}").exists()
+            assert not (out / "test-exp" / "judgments.jsonl").exists()
+            with pytest.raises(UnicodeDecodeError):
+                (out / "test-exp" / f"judgments.jsonl{suffix}").read_text()
+            with FileBackend(output_dir=str(out)) as backend:
+                assert backend.get_judgments("test-exp") == judgments
+
+    def test_resume_cuts_unfinished_queries(self, tmp_path):
+        for compression in _codecs():
+            out = str(tmp_path / compression)
+            with FileBackend(output_dir=out, compression=compression) as backend:
+                backend.log_experiment("test-exp", {})
+                backend.log_judgment(_indexed_judgment(0, "SKU-A"))
+                backend.log_query_complete("test-exp", 0, 1)
+                backend.log_judgment(_indexed_judgment(1, "SKU-B"))
+
+            # Resuming keeps the experiment's format whatever is passed
+            with FileBackend(output_dir=out) as backend:
+                backend.log_experiment("test-exp", {}, resume=True)
+                assert backend.get_completed_query_indices("test-exp") == {0}
+
+                backend.log_judgment(_indexed_judgment(1, "SKU-C"))
+                backend.log_query_complete("test-exp", 1, 1)
+                assert backend.get_completed_query_indices("test-exp") == {0, 1}
+                assert [
+                    j.product.product_id for j in backend.get_judgments("test-exp")
+                ] == ["SKU-A", "SKU-C"]
+
+    def test_resume_after_writer_was_killed(self, tmp_path):
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        root = Path(__file__).resolve().parents[2]
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([str(root / "src"), str(root)]),
+        }
+        for compression in [None, *_codecs()]:
+            out = str(tmp_path / str(compression))
+            # The writer dies with its compressed streams left unfinished
+            script = (
+                "import os\n"
+                "from veritail.backends.file import FileBackend\n"
+                "from tests.test_backends.test_file import _indexed_judgment\n"
+                f"backend = FileBackend({out!r}, compression={compression!r})\n"
+                "backend.log_experiment('test-exp', {})\n"
+                "backend.log_judgment(_indexed_judgment(0, 'SKU-A'))\n"
+                "backend.log_query_complete('test-exp', 0, 1)\n"
+                "os._exit(1)\n"
+            )
+            subprocess.run([sys.executable, "-c", script], env=env, check=False)
+
+            with FileBackend(output_dir=out) as backend:
+                backend.log_experiment("test-exp", {}, resume=True)
+                assert backend.get_completed_query_indices("test-exp") == {0}
+                backend.log_judgment(_indexed_judgment(1, "SKU-B"))
+                backend.log_query_complete("test-exp", 1, 1)
+
+            with FileBackend(output_dir=out) as backend:
+                assert [
+                    j.product.product_id for j in backend.get_judgments("test-exp")
+                ] == ["SKU-A", "SKU-B"]
+
+    def test_resume_of_closed_file_skips_decompression(self, tmp_path):
+        from unittest.mock import patch
+
+        for compression in _codecs():
+            out = str(tmp_path / compression)
+            with FileBackend(output_dir=out, compression=compression) as backend:
+                backend.log_experiment("test-exp", {})
+                backend.log_judgment(_indexed_judgment(0))
+                backend.log_query_complete("test-exp", 0, 1)
+
+            with (
+                patch("veritail.backends.file.scan") as mock_scan,
+                patch("veritail.backends.file.repair") as mock_repair,
+                FileBackend(output_dir=out) as backend,
+            ):
+                backend.log_experiment("test-exp", {}, resume=True)
+                assert backend.get_completed_query_indices("test-exp") == {0}
+                backend.log_judgment(_indexed_judgment(1))
+                assert backend.get_completed_query_indices("test-exp") == {0}
+
+            # The decompressed size comes from the index seal
+            mock_scan.assert_not_called()
+            assert all(
+                "judgments" not in call.args[0].name
+                for call in mock_repair.call_args_list
+            )
+            with FileBackend(output_dir=out) as backend:
+                assert len(backend.get_judgments("test-exp")) == 2
+
+    def test_reset_replaces_plain_judgments(self, tmp_path):
+        with FileBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {})
+            backend.log_judgment(_make_judgment())
+
+        with FileBackend(output_dir=str(tmp_path), compression="gzip") as backend:
+            backend.log_experiment("test-exp", {})
+            backend.log_judgment(_make_judgment(score=1))
+            assert [j.score for j in backend.get_judgments("test-exp")] == [1]
+
+        exp_dir = tmp_path / "test-exp"
+        assert not (exp_dir / "judgments.jsonl").exists()
+        assert (exp_dir / "judgments.jsonl.gz").exists()
+
+    def test_rejects_unknown_compression(self, tmp_path):
+        import pytest
+
+        with pytest.raises(ValueError, match="Unknown compression"):
+            FileBackend(output_dir=str(tmp_path), compression="lz4")
@@ -322,3 +322,13 @@ def test_correction_judgment_with_session_id(mock_langfuse_cls: MagicMock) -> No
 
     mock_span.update_trace.assert_called_once()
     assert mock_span.update_trace.call_args.kwargs["session_id"] == "corr-session"
+
+
+@patch("veritail.backends.langfuse.Langfuse")
+def test_close_flushes_client(mock_langfuse_cls: MagicMock) -> None:
+    from veritail.backends.langfuse import LangfuseBackend
+
+    with LangfuseBackend():
+        pass
+
+    mock_langfuse_cls.return_value.flush.assert_called_once()
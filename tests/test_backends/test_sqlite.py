@@ -0,0 +1,205 @@
+"""Tests for SqliteBackend."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from veritail.backends import create_backend
+from veritail.backends.sqlite import DATABASE_FILENAME, SqliteBackend
+from veritail.types import (
+    CheckResult,
+    CorrectionJudgment,
+    JudgmentRecord,
+    SearchResult,
+)
+
+
+def _make_judgment(
+    query: str = "running shoes",
+    product_id: str = "SKU-001",
+    score: int = 3,
+    experiment: str = "test-exp",
+    position: int = 0,
+    query_index: int | None = 0,
+) -> JudgmentRecord:
+    metadata = {} if query_index is None else {"query_index": query_index}
+    return JudgmentRecord(
+        query=query,
+        product=SearchResult(
+            product_id=product_id,
+            title="Nike Running Shoes",
+            description="Classic running shoes",
+            category="Shoes > Running",
+            price=129.99,
+            position=position,
+            attributes={"color": "black"},
+            metadata={"brand": "Nike"},
+        ),
+        score=score,
+        reasoning="Good match",
+        attribute_verdict="match",
+        query_type="broad",
+        model="test-model",
+        experiment=experiment,
+        metadata=metadata,
+    )
+
+
+class TestSqliteBackend:
+    def test_log_and_get_judgments_round_trip(self, tmp_path):
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            j1 = _make_judgment(product_id="SKU-001", score=3)
+            j2 = _make_judgment(product_id="SKU-002", score=1, position=1)
+            backend.log_judgment(j1)
+            backend.log_judgment(j2)
+
+            assert backend.get_judgments("test-exp") == [j1, j2]
+            assert backend.get_judgments("missing") == []
+
+    def test_log_judgments_in_bulk(self, tmp_path):
+        judgments = [
+            _make_judgment(product_id="SKU-001", query_index=0),
+            _make_judgment(product_id="SKU-002", experiment="other"),
+            _make_judgment(product_id="SKU-003", query_index=1),
+        ]
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments(judgments)
+            backend.log_judgments([])
+
+            assert backend.get_judgments("test-exp") == [judgments[0], judgments[2]]
+            assert backend.get_judgments("other") == [judgments[1]]
+
+    def test_repeated_products_are_stored_once(self, tmp_path):
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgment(_make_judgment(query="a", position=0))
+            backend.log_judgment(_make_judgment(query="b", position=4, query_index=1))
+            judgments = backend.get_judgments("test-exp")
+
+        assert [j.product.position for j in judgments] == [0, 4]
+        conn = sqlite3.connect(tmp_path / DATABASE_FILENAME)
+        assert conn.execute("SELECT COUNT(*) FROM products").fetchone() == (1,)
+        conn.close()
+
+    def test_completed_query_indices(self, tmp_path):
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_judgments(
+                [_make_judgment(query_index=0), _make_judgment(query_index=0)]
+            )
+            backend.log_query_complete("test-exp", 0, 2)
+            backend.log_judgment(_make_judgment(query_index=2))
+            backend.log_query_complete("test-exp", 2, 1)
+            # Interrupted after one of its three judgments
+            backend.log_judgment(_make_judgment(query_index=3))
+            backend.log_judgment(_make_judgment(query_index=None))
+            backend.log_judgment(_make_judgment(experiment="other", query_index=5))
+            backend.log_query_complete("other", 5, 1)
+
+            assert backend.get_completed_query_indices("test-exp") == {0, 2}
+            assert backend.get_completed_query_indices("missing") == set()
+
+    def test_resume_drops_judgments_of_unfinished_queries(self, tmp_path):
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {})
+            backend.log_judgment(_make_judgment(query_index=0))
+            backend.log_query_complete("test-exp", 0, 1)
+            backend.log_judgment(_make_judgment(query_index=1))
+
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {}, resume=True)
+
+            assert backend.get_completed_query_indices("test-exp") == {0}
+            judgments = backend.get_judgments("test-exp")
+            assert [j.metadata["query_index"] for j in judgments] == [0]
+
+    def test_log_experiment_writes_config_and_resets_rows(self, tmp_path):
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_experiment("test-exp", {"llm_model": "m", "top_k": 10})
+            backend.log_judgment(_make_judgment())
+            backend.log_query_complete("test-exp", 0, 1)
+
+            backend.log_experiment("test-exp", {"llm_model": "m"}, resume=True)
+            assert len(backend.get_judgments("test-exp")) == 1
+
+            backend.log_experiment("test-exp", {"llm_model": "m"})
+            assert backend.get_judgments("test-exp") == []
+
+        config = json.loads((tmp_path / "test-exp" / "config.json").read_text())
+        assert config == {"name": "test-exp", "llm_model": "m"}
+
+    def test_checks_and_corrections(self, tmp_path):
+        checks = [
+            CheckResult(
+                check_name="zero_results",
+                query="shoes",
+                product_id=None,
+                passed=False,
+                detail="No results",
+                severity="fail",
+            ),
+            CheckResult(
+                check_name="price_outlier",
+                query="shoes",
+                product_id="SKU-001",
+                passed=True,
+                detail="ok",
+            ),
+        ]
+        correction = CorrectionJudgment(
+            original_query="runing shoes",
+            corrected_query="running shoes",
+            verdict="appropriate",
+            reasoning="Typo fix",
+            model="test-model",
+            experiment="test-exp",
+            metadata={"query_index": 0},
+        )
+        with SqliteBackend(output_dir=str(tmp_path)) as backend:
+            backend.log_checks("test-exp", checks)
+            backend.log_checks("test-exp", checks[:1])
+            backend.log_correction_judgment(correction)
+
+            assert backend.get_checks("test-exp") == checks[:1]
+            assert backend.get_correction_judgments("test-exp") == [correction]
+
+    def test_writes_survive_reopen_after_close(self, tmp_path):
+        backend = SqliteBackend(output_dir=str(tmp_path), commit_every=100)
+        for i in range(5):
+            backend.log_judgment(_make_judgment(query_index=i))
+        backend.close()
+        backend.close()
+
+        with SqliteBackend(output_dir=str(tmp_path)) as reopened:
+            assert len(reopened.get_judgments("test-exp")) == 5
+
+    def test_quiet_tail_is_committed_after_interval(self, tmp_path):
+        backend = SqliteBackend(
+            output_dir=str(tmp_path), commit_every=100, commit_interval=0.01
+        )
+        backend.log_judgment(_make_judgment())
+
+        # A second connection only sees committed rows
+        conn = sqlite3.connect(tmp_path / DATABASE_FILENAME)
+        deadline = time.monotonic() + 5
+        count = 0
+        while not count and time.monotonic() < deadline:
+            time.sleep(0.01)
+            count = conn.execute("SELECT COUNT(*) FROM judgments").fetchone()[0]
+        conn.close()
+        backend.close()
+        assert count == 1
+
+    def test_rejects_invalid_commit_settings(self, tmp_path):
+        with pytest.raises(ValueError, match="commit_every"):
+            SqliteBackend(output_dir=str(tmp_path), commit_every=0)
+        with pytest.raises(ValueError, match="commit_interval"):
+            SqliteBackend(output_dir=str(tmp_path), commit_interval=0)
+
+    def test_create_backend(self, tmp_path):
+        backend = create_backend("sqlite", output_dir=str(tmp_path))
+        assert isinstance(backend, SqliteBackend)
+        assert backend.path == tmp_path / DATABASE_FILENAME
+        backend.close()
@@ -8,12 +8,19 @@ from unittest.mock import Mock
 
 import pytest
 
+from veritail import batch_utils
 from veritail.batch_utils import (
     BatchCancelledError,
+    PollSchedule,
+    deadline_headroom,
     poll_multiple_batches,
     poll_until_done,
+    shard_for_client,
+    shard_requests,
+    submit_shards,
+    wait_for_cancellation,
 )
-from veritail.llm.client import LLMClient
+from veritail.llm.client import BatchRequest, LLMClient
 
 
 def _make_client(**overrides) -> Mock:
@@ -24,6 +31,13 @@ def _make_client(**overrides) -> Mock:
     return client
 
 
+def _requests(n: int, size: int = 10) -> list[BatchRequest]:
+    return [
+        BatchRequest(custom_id=f"r-{i}", system_prompt="", user_prompt="x" * size)
+        for i in range(n)
+    ]
+
+
 class TestPollUntilDone:
     def test_poll_completed_immediately(self) -> None:
         client = _make_client()
@@ -182,6 +196,94 @@ class TestPollMultipleBatches:
                 poll_interval=0,
             )
 
+    def test_on_complete_called_per_batch(self) -> None:
+        client = _make_client()
+        client.poll_batch.side_effect = [
+            ("in_progress", 0, 2),
+            ("completed", 2, 2),
+            ("completed", 2, 2),
+        ]
+        done: list[str] = []
+        poll_multiple_batches(
+            client,
+            [("batch-1", 2, "One"), ("batch-2", 2, "Two")],
+            poll_interval=0,
+            on_complete=done.append,
+        )
+        assert done == ["batch-2", "batch-1"]
+
+    def test_returns_no_ids_when_all_complete(self) -> None:
+        client = _make_client()
+        client.poll_batch.return_value = ("completed", 5, 5)
+        abandoned = poll_multiple_batches(
+            client, [("batch-1", 5, "My batch")], poll_interval=0, deadline=0
+        )
+        assert abandoned == []
+
+    def test_deadline_abandons_pending_batches(self) -> None:
+        client = _make_client()
+        client.poll_batch.side_effect = [
+            ("completed", 2, 2),
+            ("in_progress", 1, 3),
+        ]
+        abandoned = poll_multiple_batches(
+            client,
+            [("batch-1", 2, "One"), ("batch-2", 3, "Two")],
+            poll_interval=0,
+            deadline=time.time(),
+        )
+        assert abandoned == ["batch-2"]
+        assert client.poll_batch.call_count == 2
+
+    def test_wait_capped_at_deadline(self) -> None:
+        client = _make_client()
+        client.poll_batch.return_value = ("in_progress", 1, 3)
+        start = time.monotonic()
+        abandoned = poll_multiple_batches(
+            client,
+            [("batch-1", 3, "One")],
+            poll_interval=60,
+            deadline=time.time() + 0.05,
+        )
+        assert abandoned == ["batch-1"]
+        assert time.monotonic() - start < 5
+        # One poll at submission, one more right at the deadline
+        assert client.poll_batch.call_count == 2
+
+    def test_gives_up_early_enough_to_judge_stragglers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(batch_utils, "DEFAULT_CANCEL_GRACE", 0.0)
+        monkeypatch.setattr(batch_utils, "STRAGGLER_CALL_SECONDS", 0.1)
+        client = _make_client()
+        client.poll_batch.return_value = ("in_progress", 1, 3)
+        deadline = time.time() + 0.5
+        abandoned = poll_multiple_batches(
+            client,
+            [("batch-1", 3, "One")],
+            poll_interval=60,
+            deadline=deadline,
+            straggler_concurrency=1,
+        )
+        assert abandoned == ["batch-1"]
+        # Two unfinished requests, one call at a time
+        assert time.time() < deadline - 0.1
+        assert client.poll_batch.call_count == 2
+
+    def test_stalled_batch_abandoned(self) -> None:
+        client = _make_client()
+        client.poll_batch.side_effect = [
+            ("in_progress", 1, 3),
+            ("in_progress", 1, 3),
+        ]
+        abandoned = poll_multiple_batches(
+            client,
+            [("batch-1", 3, "One")],
+            poll_interval=0.02,
+            stall_timeout=0.01,
+        )
+        assert abandoned == ["batch-1"]
+
     def test_poll_multiple_cancel(self) -> None:
         """Pre-set cancel event raises BatchCancelledError."""
         client = _make_client()
@@ -195,3 +297,184 @@ class TestPollMultipleBatches:
                 poll_interval=0,
                 cancel_event=cancel,
             )
+
+
+class TestDeadlineHeadroom:
+    def test_grace_plus_straggler_waves(self) -> None:
+        assert deadline_headroom(0, 8) == batch_utils.DEFAULT_CANCEL_GRACE
+        assert deadline_headroom(20, 8) == (
+            batch_utils.DEFAULT_CANCEL_GRACE + 3 * batch_utils.STRAGGLER_CALL_SECONDS
+        )
+
+
+class TestWaitForCancellation:
+    def test_waits_until_stopped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(batch_utils, "_CANCEL_POLL_INTERVAL", 0)
+        client = _make_client()
+        client.poll_batch.side_effect = [
+            ("in_progress", 1, 3),
+            ("completed", 2, 2),
+            ("completed", 1, 3),
+        ]
+        assert wait_for_cancellation(client, ["batch-1", "batch-2"], grace=5) == []
+        assert client.poll_batch.call_count == 3
+
+    def test_returns_batches_still_cancelling(self) -> None:
+        client = _make_client()
+        client.poll_batch.return_value = ("in_progress", 1, 3)
+        assert wait_for_cancellation(client, ["batch-1"], grace=0) == ["batch-1"]
+
+    def test_poll_error_not_waited_on(self) -> None:
+        client = _make_client()
+        client.poll_batch.side_effect = RuntimeError("gone")
+        assert wait_for_cancellation(client, ["batch-1"], grace=5) == []
+
+
+class TestShardRequests:
+    def test_no_limits_single_shard(self) -> None:
+        shards = shard_requests(_requests(5))
+        assert [len(s) for s in shards] == [5]
+
+    def test_empty(self) -> None:
+        assert shard_requests([], max_requests=2) == []
+
+    def test_request_limit(self) -> None:
+        shards = shard_requests(_requests(5), max_requests=2)
+        assert [len(s) for s in shards] == [2, 2, 1]
+        assert [r.custom_id for s in shards for r in s] == [f"r-{i}" for i in range(5)]
+
+    def test_byte_limit(self) -> None:
+        # Each request is ~1,000 bytes of prompt plus envelope overhead
+        shards = shard_requests(_requests(6, size=1000), max_bytes=3500)
+        assert [len(s) for s in shards] == [2, 2, 2]
+
+    def test_oversized_request_gets_own_shard(self) -> None:
+        shards = shard_requests(_requests(2, size=10_000), max_bytes=1000)
+        assert [len(s) for s in shards] == [1, 1]
+
+    def test_invalid_request_limit(self) -> None:
+        with pytest.raises(ValueError, match="max_requests"):
+            shard_requests(_requests(1), max_requests=0)
+
+    def test_client_limits(self) -> None:
+        client = _make_client(max_batch_requests=3, max_batch_bytes=None)
+        assert [len(s) for s in shard_for_client(client, _requests(4))] == [3, 1]
+
+    def test_client_without_limits(self) -> None:
+        client = _make_client()
+        assert [len(s) for s in shard_for_client(client, _requests(4))] == [4]
+
+
+class TestSubmitShards:
+    def test_ids_in_shard_order(self) -> None:
+        client = _make_client()
+        client.submit_batch.side_effect = lambda reqs: f"batch-{reqs[0].custom_id}"
+        shards = shard_requests(_requests(5), max_requests=2)
+        assert submit_shards(client, shards) == ["batch-r-0", "batch-r-2", "batch-r-4"]
+
+    def test_shards_grouped_by_system_prompt(self) -> None:
+        client = _make_client()
+        client.submit_batch.return_value = "batch-1"
+        shard = [
+            BatchRequest(custom_id="rel-0", system_prompt="judge", user_prompt="a"),
+            BatchRequest(custom_id="corr-0", system_prompt="correct", user_prompt="b"),
+            BatchRequest(custom_id="rel-1", system_prompt="judge", user_prompt="c"),
+        ]
+        submit_shards(client, [shard])
+        submitted = client.submit_batch.call_args.args[0]
+        assert [r.custom_id for r in submitted] == ["corr-0", "rel-0", "rel-1"]
+
+    def test_failure_propagates(self) -> None:
+        client = _make_client()
+
+        def submit(reqs: list[BatchRequest]) -> str:
+            if reqs[0].custom_id == "r-2":
+                raise RuntimeError("upload failed")
+            return f"batch-{reqs[0].custom_id}"
+
+        client.submit_batch.side_effect = submit
+        shards = shard_requests(_requests(4), max_requests=2)
+        with pytest.raises(RuntimeError, match="upload failed"):
+            submit_shards(client, shards)
+        assert client.submit_batch.call_count == 2
+
+    def test_failure_cancels_submitted_shards(self) -> None:
+        client = _make_client()
+
+        def submit(reqs: list[BatchRequest]) -> str:
+            if reqs[0].custom_id == "r-2":
+                raise RuntimeError("upload failed")
+            return f"batch-{reqs[0].custom_id}"
+
+        client.submit_batch.side_effect = submit
+        client.cancel_batch.side_effect = [RuntimeError("gone"), None]
+        shards = shard_requests(_requests(6), max_requests=2)
+        with pytest.raises(RuntimeError, match="upload failed"):
+            submit_shards(client, shards)
+        cancelled = [c.args[0] for c in client.cancel_batch.call_args_list]
+        assert cancelled == ["batch-r-0", "batch-r-4"]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPollSchedule:
+    def _schedule(self, clock: _Clock, initial: float = 60) -> PollSchedule:
+        return PollSchedule(initial, min_interval=5, max_interval=600, clock=clock)
+
+    def test_first_poll_keeps_initial_interval(self) -> None:
+        schedule = self._schedule(_Clock())
+        assert schedule.update(10, 100) == 60
+        assert schedule.eta is None
+
+    def test_backs_off_while_progress_is_flat(self) -> None:
+        clock = _Clock()
+        schedule = self._schedule(clock)
+        intervals = []
+        for _ in range(12):
+            intervals.append(schedule.update(0, 100))
+            clock.now += intervals[-1]
+        assert intervals[:4] == [60, 90, 135, 202.5]
+        assert intervals[-1] == 600
+
+    def test_polls_sooner_near_completion(self) -> None:
+        clock = _Clock()
+        schedule = self._schedule(clock)
+        schedule.update(0, 100)
+        clock.now += 60
+        # 60 done in 60s: 40 remaining at 1/s, so poll again in 20s
+        assert schedule.update(60, 100) == 20
+        assert schedule.eta == 40
+        clock.now += 20
+        # Near the end the minimum interval applies
+        assert schedule.update(95, 100) == 5
+
+    def test_slow_batch_polls_at_most_every_max_interval(self) -> None:
+        clock = _Clock()
+        schedule = self._schedule(clock)
+        schedule.update(0, 100_000)
+        clock.now += 60
+        assert schedule.update(10, 100_000) == 600
+        assert schedule.eta is not None and schedule.eta > 3600
+
+    def test_stalled_for_resets_on_progress(self) -> None:
+        clock = _Clock()
+        schedule = self._schedule(clock)
+        schedule.update(5, 100)
+        clock.now += 60
+        schedule.update(5, 100)
+        assert schedule.stalled_for == 60
+        clock.now += 30
+        schedule.update(6, 100)
+        assert schedule.stalled_for == 0
+
+    def test_bounds_include_initial_interval(self) -> None:
+        clock = _Clock()
+        schedule = self._schedule(clock, initial=0)
+        for _ in range(3):
+            assert schedule.update(0, 10) == 0
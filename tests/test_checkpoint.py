@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+
 from veritail.checkpoint import (
     BatchCheckpoint,
     clear_checkpoint,
@@ -9,6 +15,7 @@ from veritail.checkpoint import (
     load_checkpoint,
     save_checkpoint,
     serialize_request_context,
+    update_checkpoint,
 )
 from veritail.types import SearchResult
 
@@ -183,3 +190,151 @@ class TestRequestContextOverlayKey:
         }
         restored = deserialize_request_context(data)
         assert restored["rel-0-0"][6] is None
+
+
+class TestCheckpointShards:
+    def test_legacy_checkpoint_has_single_shard(self) -> None:
+        cp = _make_checkpoint()
+        cp.gemini_custom_id_order = ["a", "b"]
+        assert cp.shard_ids() == ["batch-1"]
+        assert cp.shard_custom_id_order("batch-1") == ["a", "b"]
+        assert cp.shard_custom_id_order("batch-2") == []
+
+    def test_no_relevance_batch(self) -> None:
+        cp = _make_checkpoint()
+        cp.batch_id = ""
+        assert cp.shard_ids() == []
+
+    def test_shard_fields_round_trip(self, tmp_path) -> None:
+        cp = _make_checkpoint()
+        cp.batch_ids = ["batch-1", "batch-2"]
+        cp.completed_batch_ids = ["batch-2"]
+        cp.gemini_custom_id_orders = {"batch-2": ["c"]}
+        save_checkpoint(str(tmp_path), "exp", cp)
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.shard_ids() == ["batch-1", "batch-2"]
+        assert loaded.completed_batch_ids == ["batch-2"]
+        assert loaded.shard_custom_id_order("batch-2") == ["c"]
+
+
+def _context_checkpoint() -> BatchCheckpoint:
+    result = _make_result()
+    context = {
+        f"rel-{q}-0": (f"query {q}", result, None, None, [], q, None) for q in range(3)
+    }
+    cp = _make_checkpoint()
+    cp.request_context = serialize_request_context(context)
+    cp.checks = [{"check_name": "zero_results", "passed": True}]
+    return cp
+
+
+class TestCheckpointStore:
+    def test_products_interned(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _context_checkpoint())
+        lines = (tmp_path / "exp" / "checkpoint.context.jsonl").read_text()
+        rows = [json.loads(line) for line in lines.splitlines()]
+        assert [row[0] for row in rows] == ["p", "c", "c", "c", "k"]
+        assert [row[3] for row in rows if row[0] == "c"] == [0, 0, 0]
+
+    def test_round_trip(self, tmp_path) -> None:
+        cp = _context_checkpoint()
+        save_checkpoint(str(tmp_path), "exp", cp)
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.request_context == cp.request_context
+        assert loaded.checks == cp.checks
+        restored = deserialize_request_context(loaded.request_context)
+        assert restored["rel-2-0"][1] == _make_result()
+
+    def test_contexts_loaded_on_first_access(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _context_checkpoint())
+        with patch("veritail.checkpoint._read_payload") as read_payload:
+            loaded = load_checkpoint(str(tmp_path), "exp")
+            read_payload.assert_not_called()
+        assert loaded is not None
+        # The contexts are read only when accessed
+        (tmp_path / "exp" / "checkpoint.context.jsonl").unlink()
+        assert loaded.batch_id == "batch-1"
+        with pytest.raises(FileNotFoundError):
+            len(loaded.request_context)
+
+    def test_update_appends_without_rewriting_contexts(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _context_checkpoint())
+        context_file = tmp_path / "exp" / "checkpoint.context.jsonl"
+        before = context_file.stat().st_mtime_ns
+
+        update_checkpoint(str(tmp_path), "exp", completed_batch_ids=["batch-1"])
+        update_checkpoint(
+            str(tmp_path), "exp", gemini_custom_id_orders={"batch-2": ["a"]}
+        )
+        update_checkpoint(
+            str(tmp_path), "exp", gemini_custom_id_orders={"batch-3": ["b"]}
+        )
+
+        assert context_file.stat().st_mtime_ns == before
+        state_lines = (tmp_path / "exp" / "checkpoint.json").read_text().splitlines()
+        assert len(state_lines) == 4
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.completed_batch_ids == ["batch-1"]
+        # Dict fields are merged
+        assert loaded.gemini_custom_id_orders == {"batch-2": ["a"], "batch-3": ["b"]}
+
+    def test_update_replaces_with_none(self, tmp_path) -> None:
+        cp = _make_checkpoint()
+        cp.correction_batch_id = "batch-corr"
+        cp.correction_context = {"corr-0": {"original": "a", "corrected": "b"}}
+        save_checkpoint(str(tmp_path), "exp", cp)
+        update_checkpoint(
+            str(tmp_path), "exp", correction_batch_id=None, correction_context=None
+        )
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.correction_batch_id is None
+        assert loaded.correction_context is None
+
+    def test_update_rejects_payload_fields(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _make_checkpoint())
+        with pytest.raises(ValueError, match="request_context"):
+            update_checkpoint(str(tmp_path), "exp", request_context={})
+
+    def test_update_without_checkpoint_is_noop(self, tmp_path) -> None:
+        update_checkpoint(str(tmp_path), "exp", completed_batch_ids=["batch-1"])
+        assert load_checkpoint(str(tmp_path), "exp") is None
+
+    def test_torn_update_line_ignored(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _make_checkpoint())
+        update_checkpoint(str(tmp_path), "exp", retry_batch_ids=["batch-2"])
+        with open(tmp_path / "exp" / "checkpoint.json", "a") as f:
+            f.write('{"retry_batch_ids": ["bat')
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.retry_batch_ids == ["batch-2"]
+
+    def test_update_after_torn_line_is_kept(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _make_checkpoint())
+        with open(tmp_path / "exp" / "checkpoint.json", "a") as f:
+            f.write('{"retry_batch_ids": ["bat')
+        update_checkpoint(str(tmp_path), "exp", completed_batch_ids=["batch-1"])
+        update_checkpoint(str(tmp_path), "exp", abandoned_batch_ids=["batch-3"])
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.retry_batch_ids == []
+        assert loaded.completed_batch_ids == ["batch-1"]
+        assert loaded.abandoned_batch_ids == ["batch-3"]
+
+    def test_legacy_single_file_checkpoint(self, tmp_path) -> None:
+        cp = _context_checkpoint()
+        path = tmp_path / "exp" / "checkpoint.json"
+        path.parent.mkdir()
+        path.write_text(json.dumps(asdict(cp), indent=2))
+        loaded = load_checkpoint(str(tmp_path), "exp")
+        assert loaded is not None
+        assert loaded.request_context == cp.request_context
+        assert loaded.checks == cp.checks
+
+    def test_clear_removes_context_file(self, tmp_path) -> None:
+        save_checkpoint(str(tmp_path), "exp", _context_checkpoint())
+        clear_checkpoint(str(tmp_path), "exp")
+        assert list((tmp_path / "exp").iterdir()) == []
@@ -539,6 +539,78 @@ class TestCLI:
         assert (experiment_dirs[0] / "metrics.json").exists()
         assert (experiment_dirs[0] / "report.html").exists()
 
+    def test_run_gzip_compression_and_resume(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\nboots\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text(
+            "from veritail.types import SearchResult\n"
+            "def search(q):\n"
+            "    return [SearchResult(\n"
+            "        product_id='SKU-1', title='Shoe',\n"
+            "        description='A shoe',\n"
+            "        category='Shoes', price=50.0, position=0)]\n"
+        )
+
+        from unittest.mock import Mock, patch
+
+        from veritail.backends.file import FileBackend
+        from veritail.llm.client import LLMClient, LLMResponse
+
+        mock_client = Mock(spec=LLMClient)
+        mock_client.complete.return_value = LLMResponse(
+            content="SCORE: 2\nREASONING: Good match",
+            model="test-model",
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+        output_dir = tmp_path / "results"
+        args = [
+            "run",
+            "--queries",
+            str(queries_file),
+            "--adapter",
+            str(adapter_file),
+            "--config-name",
+            "nightly",
+            "--output-dir",
+            str(output_dir),
+            "--llm-model",
+            "test-model",
+            "--no-summary",
+            "--no-cache",
+            "--compression",
+            "gzip",
+        ]
+        with patch("veritail.cli.create_llm_client", return_value=mock_client):
+            result = CliRunner().invoke(main, args)
+            assert result.exit_code == 0, result.output
+
+            exp_dir = output_dir / "nightly"
+            assert sorted(p.name for p in exp_dir.iterdir()) == [
+                "config.json",
+                "judgments.index.jsonl",
+                "judgments.jsonl.gz",
+                "metrics.json.gz",
+                "products.jsonl.gz",
+                "report.html",
+            ]
+            (exp_dir / "report.html").unlink()
+            mock_client.complete.reset_mock()
+
+            result = CliRunner().invoke(main, [*args, "--resume"])
+
+        assert result.exit_code == 0, result.output
+        assert (exp_dir / "report.html").exists()
+        # Both queries were reloaded instead of judged again
+        assert all(
+            "classifier" in call.args[0] for call in mock_client.complete.call_args_list
+        )
+        with FileBackend(output_dir=str(output_dir)) as backend:
+            assert len(backend.get_judgments("nightly")) == 2
+
     def test_run_help_shows_llm_base_url_option(self):
         runner = CliRunner()
         result = runner.invoke(main, ["run", "--help"])
@@ -774,6 +846,495 @@ class TestCLI:
         assert result.exit_code != 0
         assert "--sample must be >= 1" in result.output
 
+    def test_run_rejects_concurrency_less_than_one(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--concurrency",
+                "0",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--concurrency must be >= 1" in result.output
+
+    def test_run_rejects_negative_batch_retry_rounds(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--batch",
+                "--batch-retry-rounds",
+                "-1",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--batch-retry-rounds must be >= 0" in result.output
+
+    def test_run_rejects_poll_max_below_min(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--batch",
+                "--poll-min-interval",
+                "30",
+                "--poll-max-interval",
+                "10",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--poll-max-interval must be >= --poll-min-interval" in result.output
+
+    def test_run_rejects_non_positive_deadline(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--batch",
+                "--deadline",
+                "0",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--deadline must be > 0" in result.output
+
+    def test_run_rejects_negative_prefetch(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--prefetch",
+                "-1",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--prefetch must be >= 0" in result.output
+
+    def test_run_rejects_classification_concurrency_less_than_one(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--classification-concurrency",
+                "0",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--classification-concurrency must be >= 1" in result.output
+
+    def test_run_rejects_async_with_batch(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--async",
+                "--batch",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--async" in result.output
+
+    def test_run_rejects_malformed_rate_limit(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--rate-limit",
+                "test-model=fast",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--rate-limit" in result.output
+
+    def test_run_rate_limit_wraps_client_for_model(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text(
+            "from veritail.types import SearchResult\n"
+            "def search(q):\n"
+            "    return [SearchResult(\n"
+            "        product_id='SKU-1', title='Shoe',\n"
+            "        description='A shoe',\n"
+            "        category='Shoes', price=50.0, position=0)]\n"
+        )
+
+        from unittest.mock import Mock, patch
+
+        from veritail.llm.client import LLMClient, LLMResponse
+        from veritail.llm.ratelimit import RateLimitedClient
+
+        mock_client = Mock(spec=LLMClient)
+        mock_client.complete.return_value = LLMResponse(
+            content="SCORE: 2\nREASONING: Good match",
+            model="test-model",
+            input_tokens=100,
+            output_tokens=50,
+        )
+
+        with (
+            patch("veritail.cli.create_llm_client", return_value=mock_client),
+            patch("veritail.cli.run_evaluation") as mock_run,
+        ):
+            mock_run.return_value = ([], [], [], [])
+            runner = CliRunner()
+            result = runner.invoke(
+                main,
+                [
+                    "run",
+                    "--queries",
+                    str(queries_file),
+                    "--adapter",
+                    str(adapter_file),
+                    "--config-name",
+                    "test",
+                    "--output-dir",
+                    str(tmp_path / "results"),
+                    "--llm-model",
+                    "test-model",
+                    "--rate-limit",
+                    "other-model=10",
+                    "--rate-limit",
+                    "test-model=500:200000",
+                    "--no-summary",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        llm_client = mock_run.call_args.args[3]
+        assert isinstance(llm_client, RateLimitedClient)
+        assert llm_client.limiter.rpm == 500
+        assert llm_client.limiter.tpm == 200000
+
+    def test_run_uses_judgment_cache_unless_disabled(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        from unittest.mock import Mock, patch
+
+        from veritail.llm.cache import JudgmentCache
+        from veritail.llm.client import LLMClient
+
+        def invoke(*extra: str) -> tuple[object, Mock]:
+            with (
+                patch(
+                    "veritail.cli.create_llm_client", return_value=Mock(spec=LLMClient)
+                ),
+                patch("veritail.cli.run_evaluation") as mock_run,
+            ):
+                mock_run.return_value = ([], [], [], [])
+                result = CliRunner().invoke(
+                    main,
+                    [
+                        "run",
+                        "--queries",
+                        str(queries_file),
+                        "--adapter",
+                        str(adapter_file),
+                        "--output-dir",
+                        str(tmp_path / "results"),
+                        "--llm-model",
+                        "test-model",
+                        "--no-summary",
+                        *extra,
+                    ],
+                )
+            return result, mock_run
+
+        result, mock_run = invoke()
+        assert result.exit_code == 0, result.output
+        cache = mock_run.call_args.kwargs["judgment_cache"]
+        assert isinstance(cache, JudgmentCache)
+        assert cache.path == tmp_path / "results" / "judgment-cache.sqlite"
+        assert "Judgment cache: 0 hits, 0 misses" in result.output
+
+        result, mock_run = invoke("--no-cache")
+        assert result.exit_code == 0, result.output
+        assert "judgment_cache" not in mock_run.call_args.kwargs
+        assert "Judgment cache" not in result.output
+
+    def test_run_passes_baseline_judgments(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        from unittest.mock import Mock, patch
+
+        from veritail.backends.file import FileBackend
+        from veritail.llm.client import LLMClient
+        from veritail.types import JudgmentRecord, SearchResult
+
+        output_dir = tmp_path / "results"
+        FileBackend(output_dir=str(output_dir)).log_judgment(
+            JudgmentRecord(
+                query="shoes",
+                product=SearchResult(
+                    product_id="SKU-1",
+                    title="Shoe",
+                    description="",
+                    category="Shoes",
+                    price=1.0,
+                    position=0,
+                ),
+                score=3,
+                reasoning="ok",
+                model="test-model",
+                experiment="nightly",
+                metadata={"pair_hash": "abc"},
+            )
+        )
+
+        def invoke(baseline: str) -> tuple[object, Mock]:
+            with (
+                patch(
+                    "veritail.cli.create_llm_client", return_value=Mock(spec=LLMClient)
+                ),
+                patch("veritail.cli.run_evaluation") as mock_run,
+            ):
+                mock_run.return_value = ([], [], [], [])
+                result = CliRunner().invoke(
+                    main,
+                    [
+                        "run",
+                        "--queries",
+                        str(queries_file),
+                        "--adapter",
+                        str(adapter_file),
+                        "--output-dir",
+                        str(output_dir),
+                        "--llm-model",
+                        "test-model",
+                        "--no-summary",
+                        "--no-cache",
+                        "--baseline-experiment",
+                        baseline,
+                    ],
+                )
+            return result, mock_run
+
+        result, mock_run = invoke("nightly")
+        assert result.exit_code == 0, result.output
+        baseline = mock_run.call_args.kwargs["baseline"]
+        assert list(baseline) == ["abc"]
+        assert "Baseline 'nightly': 1 reusable judgment(s)" in result.output
+
+        result, mock_run = invoke("missing")
+        assert result.exit_code != 0
+        assert "--baseline-experiment" in result.output
+        mock_run.assert_not_called()
+
+    def test_run_sqlite_backend_stores_checks_and_reads_baseline(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        from unittest.mock import Mock, patch
+
+        from veritail.backends.sqlite import SqliteBackend
+        from veritail.llm.client import LLMClient
+        from veritail.types import CheckResult, JudgmentRecord, SearchResult
+
+        output_dir = tmp_path / "results"
+        with SqliteBackend(output_dir=str(output_dir)) as seed:
+            seed.log_judgment(
+                JudgmentRecord(
+                    query="shoes",
+                    product=SearchResult(
+                        product_id="SKU-1",
+                        title="Shoe",
+                        description="",
+                        category="Shoes",
+                        price=1.0,
+                        position=0,
+                    ),
+                    score=3,
+                    reasoning="ok",
+                    model="test-model",
+                    experiment="nightly",
+                    metadata={"pair_hash": "abc", "query_index": 0},
+                )
+            )
+        check = CheckResult(
+            check_name="zero_results",
+            query="shoes",
+            product_id=None,
+            passed=False,
+            detail="No results",
+            severity="fail",
+        )
+
+        with (
+            patch("veritail.cli.create_llm_client", return_value=Mock(spec=LLMClient)),
+            patch("veritail.cli.run_evaluation") as mock_run,
+        ):
+            mock_run.return_value = ([], [check], [], [])
+            result = CliRunner().invoke(
+                main,
+                [
+                    "run",
+                    "--queries",
+                    str(queries_file),
+                    "--adapter",
+                    str(adapter_file),
+                    "--config-name",
+                    "tonight",
+                    "--backend",
+                    "sqlite",
+                    "--output-dir",
+                    str(output_dir),
+                    "--llm-model",
+                    "test-model",
+                    "--no-summary",
+                    "--no-cache",
+                    "--baseline-experiment",
+                    "nightly",
+                ],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert isinstance(mock_run.call_args.args[4], SqliteBackend)
+        assert list(mock_run.call_args.kwargs["baseline"]) == ["abc"]
+        with SqliteBackend(output_dir=str(output_dir)) as stored:
+            assert stored.get_checks("tonight") == [check]
+
+    def test_run_rejects_non_positive_cache_max_age(self, tmp_path):
+        queries_file = tmp_path / "queries.csv"
+        queries_file.write_text("query\nshoes\n")
+
+        adapter_file = tmp_path / "adapter.py"
+        adapter_file.write_text("def search(q): return []\n")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main,
+            [
+                "run",
+                "--queries",
+                str(queries_file),
+                "--adapter",
+                str(adapter_file),
+                "--llm-model",
+                "test-model",
+                "--cache-max-age",
+                "0",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "--cache-max-age must be > 0" in result.output
+
     def test_run_sample_selects_subset(self, tmp_path):
         queries_file = tmp_path / "queries.csv"
         queries_file.write_text("query\nshoes\nboots\nsandals\nsneakers\nloafers\n")
@@ -1025,7 +1586,7 @@ class TestCLI:
         assert result.exit_code == 0
         assert "--batch" in result.output
 
-    def test_run_batch_rejects_base_url(self, tmp_path):
+    def test_run_batch_with_base_url_emulates_batches(self, tmp_path):
         queries_file = tmp_path / "queries.csv"
         queries_file.write_text("query\nshoes\n")
 
@@ -1035,11 +1596,18 @@ class TestCLI:
         from unittest.mock import Mock, patch
 
         from veritail.llm.client import LLMClient
+        from veritail.llm.localbatch import LocalBatchClient
 
         mock_client = Mock(spec=LLMClient)
-        mock_client.supports_batch.return_value = True
+        mock_client.supports_batch.return_value = False
 
-        with patch("veritail.cli.create_llm_client", return_value=mock_client):
+        with (
+            patch("veritail.cli.create_llm_client", return_value=mock_client),
+            patch(
+                "veritail.cli.run_batch_evaluation",
+                return_value=([], [], [], []),
+            ) as mock_batch,
+        ):
             runner = CliRunner()
             result = runner.invoke(
                 main,
@@ -1049,16 +1617,31 @@ class TestCLI:
                     str(queries_file),
                     "--adapter",
                     str(adapter_file),
+                    "--config-name",
+                    "test",
+                    "--output-dir",
+                    str(tmp_path / "results"),
                     "--llm-model",
                     "gpt-4o",
                     "--llm-base-url",
                     "http://localhost:11434/v1",
+                    "--concurrency",
+                    "4",
                     "--batch",
+                    "--no-summary",
                 ],
             )
 
-        assert result.exit_code != 0
-        assert "--batch cannot be used with --llm-base-url" in result.output
+        assert result.exit_code == 0, result.output
+        client = mock_batch.call_args.args[3]
+        assert isinstance(client, LocalBatchClient)
+        assert client._spool_dir == tmp_path / "results" / "local-batches"
+        assert client._concurrency == 4
+        assert "Emulating batch API against http://localhost:11434/v1" in (
+            result.output
+        )
+        # Closed with the backend, which closes the wrapped client too
+        mock_client.close.assert_called_once()
 
     def test_run_batch_invokes_batch_pipeline(self, tmp_path):
         queries_file = tmp_path / "queries.csv"
@@ -1539,8 +2122,8 @@ class TestCLI:
         mock_client.complete.assert_called()
         mock_client.submit_batch.assert_not_called()
 
-    def test_batch_autocomplete_llm_rejects_base_url(self, tmp_path):
-        """--batch --llm-base-url → error for autocomplete."""
+    def test_batch_autocomplete_llm_emulates_batches_for_base_url(self, tmp_path):
+        """--batch --llm-base-url → local batch emulation for autocomplete."""
         prefixes_file = tmp_path / "prefixes.csv"
         prefixes_file.write_text("prefix,type\nrun,short_prefix\n")
 
@@ -1554,11 +2137,18 @@ class TestCLI:
         from unittest.mock import Mock, patch
 
         from veritail.llm.client import LLMClient
+        from veritail.llm.localbatch import LocalBatchClient
 
         mock_client = Mock(spec=LLMClient)
         mock_client.supports_batch.return_value = True
 
-        with patch("veritail.cli.create_llm_client", return_value=mock_client):
+        with (
+            patch("veritail.cli.create_llm_client", return_value=mock_client),
+            patch(
+                "veritail.autocomplete.pipeline.run_autocomplete_batch_llm_evaluation",
+                return_value=[],
+            ) as mock_batch,
+        ):
             runner = CliRunner()
             result = runner.invoke(
                 main,
@@ -1580,8 +2170,8 @@ class TestCLI:
                 ],
             )
 
-        assert result.exit_code != 0
-        assert "--batch cannot be used with --llm-base-url" in result.output
+        assert mock_batch.called, result.output
+        assert isinstance(mock_batch.call_args.args[4], LocalBatchClient)
 
     def test_batch_autocomplete_llm_validates_supports_batch(self, tmp_path):
         """Autocomplete --batch with unsupported model → error."""
@@ -0,0 +1,104 @@
+"""Tests for streaming compression helpers."""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from veritail.compression import (
+    check_compression,
+    compressed_path,
+    find_existing,
+    iter_lines,
+    open_binary,
+    repair,
+    scan,
+    truncate,
+    write_bytes,
+)
+
+CODECS = [None, "gzip"]
+if importlib.util.find_spec("zstandard") is not None:
+    CODECS.append("zstd")
+
+
+@pytest.mark.parametrize("compression", CODECS)
+def test_appends_are_read_as_one_stream(tmp_path, compression):
+    path = compressed_path(tmp_path / "data.jsonl", compression)
+    for lines in ([b"a\n", b"b\n"], [b"c\n"]):
+        with open_binary(path, "ab") as f:
+            for line in lines:
+                f.write(line)
+
+    assert list(iter_lines(path)) == [b"a\n", b"b\n", b"c\n"]
+    assert scan(path) == (6, True)
+
+    truncate(path, 4)
+    assert list(iter_lines(path)) == [b"a\n", b"b\n"]
+    assert not list(tmp_path.glob("*.tmp*"))
+
+
+@pytest.mark.parametrize("compression", CODECS[1:])
+def test_reads_flushed_lines_of_unclosed_stream(tmp_path, compression):
+    path = compressed_path(tmp_path / "data.jsonl", compression)
+    f = open_binary(path, "ab")
+    f.write(b"a\n")
+    f.flush()
+    try:
+        assert list(iter_lines(path)) == [b"a\n"]
+    finally:
+        f.close()
+
+
+def test_truncated_gzip_stops_at_last_complete_data(tmp_path):
+    path = tmp_path / "data.jsonl.gz"
+    path.write_bytes(gzip.compress(b"a\nb\n")[:-8])
+
+    assert list(iter_lines(path)) == [b"a\n", b"b\n"]
+
+
+@pytest.mark.parametrize("compression", CODECS)
+def test_repair_cuts_torn_end_before_appending(tmp_path, compression):
+    path = compressed_path(tmp_path / "data.jsonl", compression)
+    with open_binary(path, "ab") as f:
+        f.write(b"a\n")
+    # A writer died mid-line, leaving its member or frame unfinished
+    torn = open_binary(path, "ab")
+    torn.write(b"b\nc")
+    torn.flush()
+
+    assert scan(path) == (4, False)
+    assert repair(path) == 4
+    assert scan(path) == (4, True)
+    with open_binary(path, "ab") as f:
+        f.write(b"d\n")
+    # The dead writer's handle still points at the file before the cut
+    torn.close()
+
+    assert list(iter_lines(path)) == [b"a\n", b"b\n", b"d\n"]
+
+
+def test_write_bytes_replaces_other_variants(tmp_path):
+    plain = tmp_path / "metrics.json"
+    write_bytes(plain, b"[]")
+    assert find_existing(plain) == plain
+
+    write_bytes(compressed_path(plain, "gzip"), b"[1]")
+    assert find_existing(plain) == tmp_path / "metrics.json.gz"
+    assert not plain.exists()
+    assert gzip.decompress((tmp_path / "metrics.json.gz").read_bytes()) == b"[1]"
+    assert find_existing(tmp_path / "missing.json") is None
+
+
+def test_check_compression():
+    check_compression(None)
+    check_compression("gzip")
+    with pytest.raises(ValueError, match="Unknown compression"):
+        check_compression("brotli")
+    with patch.dict(sys.modules, {"zstandard": None}):
+        with pytest.raises(ImportError, match="veritail\\[zstd\\]"):
+            check_compression("zstd")
@@ -32,6 +32,28 @@ def _make_batch_requests() -> list[BatchRequest]:
     ]
 
 
+def _stream_output(client: OpenAIClient, lines: list[str]) -> MagicMock:
+    """Serve *lines* from the streamed batch output file."""
+    stream = client._client.files.with_streaming_response.content
+    response = stream.return_value.__enter__.return_value
+    response.iter_lines.return_value = iter(lines)
+    return stream
+
+
+def _capture_upload(client: OpenAIClient) -> list[bytes]:
+    """Record the batch input file contents as they are uploaded."""
+    uploads: list[bytes] = []
+
+    def create(*, file, purpose):
+        name, file_obj = file
+        assert name == "batch_input.jsonl"
+        uploads.append(file_obj.read())
+        return Mock(id="file-123")
+
+    client._client.files.create.side_effect = create
+    return uploads
+
+
 class TestOpenAIBatchClient:
     def _make_client(self, base_url: str | None = None) -> OpenAIClient:
         with patch("openai.OpenAI"):
@@ -39,6 +61,16 @@ class TestOpenAIBatchClient:
         client._client = MagicMock()
         return client
 
+    def test_submit_batch_accepts_generator(self):
+        client = self._make_client()
+        uploads = _capture_upload(client)
+        client._client.batches.create.return_value = Mock(id="batch-456")
+
+        client.submit_batch(req for req in _make_batch_requests())
+
+        lines = uploads[0].decode().splitlines()
+        assert [json.loads(line)["custom_id"] for line in lines] == ["req-0", "req-1"]
+
     def test_supports_batch_true_without_base_url(self):
         client = self._make_client(base_url=None)
         assert client.supports_batch() is True
@@ -49,7 +81,7 @@ class TestOpenAIBatchClient:
 
     def test_submit_batch_creates_file_and_batch(self):
         client = self._make_client()
-        client._client.files.create.return_value = Mock(id="file-123")
+        uploads = _capture_upload(client)
         client._client.batches.create.return_value = Mock(id="batch-456")
 
         batch_id = client.submit_batch(_make_batch_requests())
@@ -58,10 +90,11 @@ class TestOpenAIBatchClient:
         client._client.files.create.assert_called_once()
         call_kwargs = client._client.files.create.call_args[1]
         assert call_kwargs["purpose"] == "batch"
+        # The spooled input file is deleted once uploaded
+        assert call_kwargs["file"][1].closed
 
         # Verify JSONL content
-        file_obj = call_kwargs["file"]
-        content = file_obj.read().decode("utf-8")
+        content = uploads[0].decode("utf-8")
         lines = [json.loads(line) for line in content.strip().split("\n")]
         assert len(lines) == 2
         assert lines[0]["custom_id"] == "req-0"
@@ -76,6 +109,47 @@ class TestOpenAIBatchClient:
             completion_window="24h",
         )
 
+    def test_submit_batch_streams_requests_in_order(self):
+        client = self._make_client()
+        uploads = _capture_upload(client)
+        client._client.batches.create.return_value = Mock(id="batch-456")
+        requests = [
+            BatchRequest(custom_id="rel-0", system_prompt="judge", user_prompt="a"),
+            BatchRequest(custom_id="corr-0", system_prompt="correct", user_prompt="b"),
+            BatchRequest(custom_id="rel-1", system_prompt="judge", user_prompt="c"),
+        ]
+
+        client.submit_batch(iter(requests))
+
+        lines = [json.loads(line) for line in uploads[0].decode().splitlines()]
+        assert [line["custom_id"] for line in lines] == ["rel-0", "corr-0", "rel-1"]
+        keys = [line["body"]["prompt_cache_key"] for line in lines]
+        assert keys[0] == keys[2] != keys[1]
+
+    def test_retrieve_batch_results_reports_cached_tokens(self):
+        client = self._make_client()
+        client._client.batches.retrieve.return_value = Mock(output_file_id="file-out")
+        line = {
+            "custom_id": "req-0",
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "choices": [{"message": {"content": "SCORE: 3"}}],
+                    "usage": {
+                        "prompt_tokens": 2000,
+                        "completion_tokens": 10,
+                        "prompt_tokens_details": {"cached_tokens": 1920},
+                    },
+                },
+            },
+        }
+        _stream_output(client, [json.dumps(line)])
+
+        results = client.retrieve_batch_results("batch-456")
+
+        assert results[0].response is not None
+        assert results[0].response.cached_input_tokens == 1920
+
     def test_poll_batch_in_progress(self):
         client = self._make_client()
         client._client.batches.retrieve.return_value = Mock(
@@ -110,6 +184,27 @@ class TestOpenAIBatchClient:
         status, completed, total = client.poll_batch("batch-456")
         assert status == "failed"
 
+    def test_poll_batch_cancellation(self):
+        client = self._make_client()
+        client._client.batches.retrieve.return_value = Mock(
+            status="cancelling",
+            request_counts=Mock(total=10, completed=5, failed=0),
+        )
+        assert client.poll_batch("batch-456")[0] == "in_progress"
+
+        # The partial output of a cancelled batch is readable
+        client._client.batches.retrieve.return_value = Mock(
+            status="cancelled",
+            request_counts=Mock(total=10, completed=5, failed=0),
+        )
+        assert client.poll_batch("batch-456")[0] == "completed"
+
+    def test_cancel_batch(self):
+        client = self._make_client()
+
+        assert client.cancel_batch("batch-456") is True
+        client._client.batches.cancel.assert_called_once_with("batch-456")
+
     def test_retrieve_batch_results_success(self):
         client = self._make_client()
 
@@ -147,7 +242,7 @@ class TestOpenAIBatchClient:
                 }
             ),
         ]
-        client._client.files.content.return_value = Mock(text="\n".join(jsonl_lines))
+        _stream_output(client, jsonl_lines + [""])
 
         results = client.retrieve_batch_results("batch-456")
         assert len(results) == 2
@@ -187,7 +282,7 @@ class TestOpenAIBatchClient:
                 }
             ),
         ]
-        client._client.files.content.return_value = Mock(text="\n".join(jsonl_lines))
+        _stream_output(client, jsonl_lines + [""])
 
         results = client.retrieve_batch_results("batch-456")
         assert len(results) == 2
@@ -202,6 +297,24 @@ class TestOpenAIBatchClient:
         results = client.retrieve_batch_results("batch-456")
         assert results == []
 
+    def test_iter_batch_results_streams_lines(self):
+        client = self._make_client()
+        client._client.batches.retrieve.return_value = Mock(output_file_id="file-out")
+        lines = [
+            json.dumps({"custom_id": f"req-{i}", "error": {"message": "bad"}})
+            for i in range(3)
+        ]
+        stream = _stream_output(client, lines)
+
+        results = client.iter_batch_results("batch-456")
+        first = next(results)
+
+        assert first.custom_id == "req-0"
+        # The output file is read lazily, never downloaded whole
+        stream.assert_called_once_with("file-out")
+        client._client.files.content.assert_not_called()
+        assert [r.custom_id for r in results] == ["req-1", "req-2"]
+
 
 class TestAnthropicBatchClient:
     def _make_client(self) -> AnthropicClient:
@@ -222,7 +335,8 @@ class TestAnthropicBatchClient:
 
         assert batch_id == "msgbatch-123"
         call_kwargs = client._client.messages.batches.create.call_args[1]
-        requests = call_kwargs["requests"]
+        # Requests are passed as a generator for the SDK to consume
+        requests = list(call_kwargs["requests"])
         assert len(requests) == 2
         assert requests[0]["custom_id"] == "req-0"
         assert requests[0]["params"]["model"] == "claude-sonnet-4-5"
@@ -241,6 +355,12 @@ class TestAnthropicBatchClient:
         assert completed == 3
         assert total == 8
 
+    def test_cancel_batch(self):
+        client = self._make_client()
+
+        assert client.cancel_batch("msgbatch-123") is True
+        client._client.messages.batches.cancel.assert_called_once_with("msgbatch-123")
+
     def test_poll_batch_ended(self):
         client = self._make_client()
         client._client.messages.batches.retrieve.return_value = Mock(
@@ -318,6 +438,55 @@ class TestGeminiBatchClient:
         assert "batches/123" in client._batch_custom_ids
         assert client._batch_custom_ids["batches/123"] == ["req-0", "req-1"]
 
+    def test_submit_batch_references_context_cache(self):
+        client = self._make_client()
+        client._client.caches.create.return_value.name = "cachedContents/abc"
+        client._client.batches.create.return_value.name = "batches/123"
+        system_prompt = "Judge relevance carefully. " * 200
+        requests = [
+            BatchRequest(
+                custom_id=f"req-{i}", system_prompt=system_prompt, user_prompt=u
+            )
+            for i, u in enumerate(["a", "b"])
+        ]
+
+        client.submit_batch(requests)
+
+        client._client.caches.create.assert_called_once()
+        ttl = client._client.caches.create.call_args.kwargs["config"].ttl
+        assert ttl == f"{48 * 3600}s"
+        src = client._client.batches.create.call_args[1]["src"]
+        assert [r.config.cached_content for r in src] == ["cachedContents/abc"] * 2
+        assert all(r.config.system_instruction is None for r in src)
+
+    def test_context_cache_deleted_once_its_batches_are_read(self):
+        client = self._make_client()
+        client._client.caches.create.return_value.name = "cachedContents/abc"
+        jobs = [MagicMock(), MagicMock()]
+        jobs[0].name, jobs[1].name = "batches/1", "batches/2"
+        client._client.batches.create.side_effect = jobs
+        client._client.batches.get.return_value.dest = None
+        system_prompt = "Judge relevance carefully. " * 200
+        for shard in ("a", "b"):
+            client.submit_batch(
+                [
+                    BatchRequest(
+                        custom_id=f"req-{shard}",
+                        system_prompt=system_prompt,
+                        user_prompt=shard,
+                    )
+                ]
+            )
+        client._client.caches.create.assert_called_once()
+
+        list(client.iter_batch_results("batches/1"))
+        # Still referenced by the second batch
+        client._client.caches.delete.assert_not_called()
+        list(client.iter_batch_results("batches/2"))
+        client._client.caches.delete.assert_called_once_with(name="cachedContents/abc")
+        client.close()
+        client._client.caches.delete.assert_called_once()
+
     def test_poll_batch_running(self):
         client = self._make_client()
         job = MagicMock()
@@ -368,6 +537,12 @@ class TestGeminiBatchClient:
         status, completed, total = client.poll_batch("batches/123")
         assert status == "expired"
 
+    def test_cancel_batch(self):
+        client = self._make_client()
+
+        assert client.cancel_batch("batches/123") is True
+        client._client.batches.cancel.assert_called_once_with(name="batches/123")
+
     def test_retrieve_results_success(self):
         client = self._make_client()
         client._batch_custom_ids["batches/123"] = ["req-0", "req-1"]
@@ -402,6 +577,27 @@ class TestGeminiBatchClient:
         # Verify custom_ids were cleaned up
         assert "batches/123" not in client._batch_custom_ids
 
+    def test_custom_id_order_through_rate_limited_client(self):
+        from veritail.llm.ratelimit import RateLimitedClient, RateLimiter
+
+        inner = self._make_client()
+        inner._client.batches.create.return_value.name = "batches/123"
+        client = RateLimitedClient(inner, RateLimiter())
+
+        batch_id = client.submit_batch(_make_batch_requests())
+        order = client.batch_custom_id_order(batch_id)
+        assert order == ["req-0", "req-1"]
+
+        resp = MagicMock()
+        resp.response.text = "SCORE: 3"
+        resp.error = None
+        inner._client.batches.get.return_value.dest.inlined_responses = [resp, resp]
+        assert [r.custom_id for r in client.iter_batch_results(batch_id)] == order
+        # Reading forgets the order; a saved copy maps a later read
+        assert client.batch_custom_id_order(batch_id) == []
+        client.restore_batch_custom_ids(batch_id, order)
+        assert [r.custom_id for r in client.iter_batch_results(batch_id)] == order
+
     def test_retrieve_results_with_errors(self):
         client = self._make_client()
         client._batch_custom_ids["batches/123"] = ["req-0", "req-1"]
@@ -0,0 +1,111 @@
+"""Tests for the persistent judgment cache."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from veritail.llm.cache import JudgmentCache, cache_key
+from veritail.llm.client import LLMResponse
+
+
+def _response(content: str = "SCORE: 3\nREASONING: ok") -> LLMResponse:
+    return LLMResponse(content=content, model="m", input_tokens=100, output_tokens=20)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheKey:
+    def test_depends_on_every_part(self):
+        base = cache_key("m", "system", "user")
+        assert base == cache_key("m", "system", "user")
+        assert base != cache_key("m2", "system", "user")
+        assert base != cache_key("m", "system2", "user")
+        assert base != cache_key("m", "system", "user2")
+
+    def test_parts_are_not_concatenated(self):
+        assert cache_key("m", "ab", "c") != cache_key("m", "a", "bc")
+
+
+class TestJudgmentCache:
+    def test_miss_then_hit(self, tmp_path):
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+            assert cache.get("m", "sys", "user") is None
+            cache.put("m", "sys", "user", _response())
+            hit = cache.get("m", "sys", "user")
+
+            assert hit is not None
+            assert hit.content == "SCORE: 3\nREASONING: ok"
+            assert hit.model == "m"
+            # No tokens were spent on a hit
+            assert hit.input_tokens == 0
+            assert hit.output_tokens == 0
+            assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+            assert "1 hits, 1 misses (50% hit rate)" in cache.summary()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "cache.sqlite"
+        with JudgmentCache(path) as cache:
+            cache.put("m", "sys", "user", _response())
+        with JudgmentCache(path) as cache:
+            assert cache.get("m", "sys", "user") is not None
+            assert len(cache) == 1
+
+    def test_expired_entries_evicted_on_open(self, tmp_path):
+        clock = _Clock()
+        path = tmp_path / "cache.sqlite"
+        with JudgmentCache(path, max_age_days=1, clock=clock) as cache:
+            cache.put("m", "sys", "old", _response())
+            clock.now += 86400 / 2
+            cache.put("m", "sys", "new", _response())
+
+        clock.now += 86400 * 0.75
+        with JudgmentCache(path, max_age_days=1, clock=clock) as cache:
+            assert cache.evicted == 1
+            assert cache.get("m", "sys", "old") is None
+            assert cache.get("m", "sys", "new") is not None
+
+    def test_least_recently_used_entries_evicted_beyond_max(self, tmp_path):
+        clock = _Clock()
+        path = tmp_path / "cache.sqlite"
+        with JudgmentCache(path, clock=clock) as cache:
+            for name in ("a", "b", "c"):
+                clock.now += 1
+                cache.put("m", "sys", name, _response())
+            clock.now += 1
+            cache.get("m", "sys", "a")  # refresh "a"
+
+        with JudgmentCache(path, max_entries=2, clock=clock) as cache:
+            assert cache.evicted == 1
+            assert cache.get("m", "sys", "b") is None
+            assert cache.get("m", "sys", "a") is not None
+            assert cache.get("m", "sys", "c") is not None
+
+    def test_rejects_invalid_limits(self, tmp_path):
+        with pytest.raises(ValueError, match="max_age_days"):
+            JudgmentCache(tmp_path / "c.sqlite", max_age_days=0)
+        with pytest.raises(ValueError, match="max_entries"):
+            JudgmentCache(tmp_path / "c.sqlite", max_entries=0)
+
+    def test_usable_from_worker_threads(self, tmp_path):
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+
+            def work(i: int) -> None:
+                cache.put("m", "sys", f"user-{i}", _response())
+                assert cache.get("m", "sys", f"user-{i}") is not None
+
+            threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert len(cache) == 8
+            assert cache.hits == 8
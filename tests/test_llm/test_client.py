@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -21,6 +22,8 @@ except ImportError:
     HAS_GENAI = False
 
 from veritail.llm.client import (
+    LLMClient,
+    LLMResponse,
     OpenAIClient,
     create_llm_client,
 )
@@ -47,6 +50,29 @@ class TestAnthropicClient:
         assert result.input_tokens == 100
         assert result.output_tokens == 50
 
+    @patch("anthropic.AsyncAnthropic")
+    @patch("anthropic.Anthropic")
+    def test_acomplete(self, mock_anthropic_cls, mock_async_cls):
+        from veritail.llm.client import AnthropicClient
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="SCORE: 1\nREASONING: Weak")]
+        mock_response.usage.input_tokens = 90
+        mock_response.usage.output_tokens = 20
+        mock_async_cls.return_value.messages.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        client = AnthropicClient(model="claude-sonnet-4-5")
+        result = asyncio.run(client.acomplete("system prompt", "user prompt"))
+
+        assert result.content == "SCORE: 1\nREASONING: Weak"
+        assert result.input_tokens == 90
+        assert result.output_tokens == 20
+        call_kwargs = mock_async_cls.return_value.messages.create.call_args.kwargs
+        assert call_kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        mock_anthropic_cls.return_value.messages.create.assert_not_called()
+
     @patch("anthropic.Anthropic")
     def test_preflight_check_success(self, mock_anthropic_cls):
         from veritail.llm.client import AnthropicClient
@@ -115,6 +141,53 @@ class TestOpenAIClient:
         assert result.input_tokens == 200
         assert result.output_tokens == 80
 
+    @patch("openai.AsyncOpenAI")
+    @patch("openai.OpenAI")
+    def test_acomplete(self, mock_openai_cls, mock_async_cls):
+        mock_choice = MagicMock()
+        mock_choice.message.content = "SCORE: 2\nREASONING: Close"
+        mock_usage = MagicMock(prompt_tokens=40, completion_tokens=10)
+        mock_response = MagicMock(choices=[mock_choice], usage=mock_usage)
+        mock_async_cls.return_value.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        client = OpenAIClient(
+            model="gpt-4o", base_url="http://localhost:8000/v1", api_key="k"
+        )
+        result = asyncio.run(client.acomplete("sys", "usr", max_tokens=256))
+
+        assert result.content == "SCORE: 2\nREASONING: Close"
+        assert result.input_tokens == 40
+        assert result.output_tokens == 10
+        mock_async_cls.assert_called_once_with(
+            base_url="http://localhost:8000/v1", api_key="k"
+        )
+        call_kwargs = mock_async_cls.return_value.chat.completions.create.call_args
+        assert call_kwargs.kwargs["max_tokens"] == 256
+
+    @patch("openai.AsyncOpenAI")
+    @patch("openai.OpenAI")
+    def test_acomplete_reuses_client_within_loop(self, mock_openai_cls, mock_async_cls):
+        mock_choice = MagicMock()
+        mock_choice.message.content = "ok"
+        mock_response = MagicMock(choices=[mock_choice], usage=None)
+        mock_async_cls.return_value.chat.completions.create = AsyncMock(
+            return_value=mock_response
+        )
+        client = OpenAIClient(model="gpt-4o")
+
+        async def two_calls():
+            await client.acomplete("sys", "a")
+            await client.acomplete("sys", "b")
+
+        asyncio.run(two_calls())
+        assert mock_async_cls.call_count == 1
+
+        # A new event loop gets a fresh SDK client
+        asyncio.run(client.acomplete("sys", "c"))
+        assert mock_async_cls.call_count == 2
+
     @patch("openai.OpenAI")
     def test_preflight_check_success(self, mock_openai_cls):
         client = OpenAIClient(model="gpt-4o")
@@ -215,6 +288,36 @@ class TestOpenAIClientTokenParam:
         assert retry_kwargs["max_completion_tokens"] == 1024
         assert "max_tokens" not in retry_kwargs
 
+    @patch("openai.AsyncOpenAI")
+    @patch("openai.OpenAI")
+    def test_acomplete_retries_with_max_completion_tokens(
+        self, mock_openai_cls, mock_async_cls
+    ):
+        import openai
+
+        mock_choice = MagicMock()
+        mock_choice.message.content = "ok"
+        mock_response = MagicMock(choices=[mock_choice], usage=None)
+        create = AsyncMock(
+            side_effect=[
+                openai.BadRequestError(
+                    message="Use 'max_completion_tokens' instead.",
+                    response=MagicMock(status_code=400),
+                    body=None,
+                ),
+                mock_response,
+            ]
+        )
+        mock_async_cls.return_value.chat.completions.create = create
+
+        client = OpenAIClient(model="o3")
+        asyncio.run(client.acomplete("sys", "usr", max_tokens=64))
+
+        retry_kwargs = create.call_args_list[1].kwargs
+        assert retry_kwargs["max_completion_tokens"] == 64
+        assert "max_tokens" not in retry_kwargs
+        assert client._use_max_completion_tokens is True
+
     @patch("openai.OpenAI")
     def test_flag_cached_after_detection(self, mock_openai_cls):
         """After auto-detecting, subsequent calls use the right param directly."""
@@ -270,9 +373,13 @@ class TestOpenAIClientTokenParam:
         import json
 
         mock_client = mock_openai_cls.return_value
-        mock_uploaded = MagicMock()
-        mock_uploaded.id = "file-123"
-        mock_client.files.create.return_value = mock_uploaded
+        uploads: list[bytes] = []
+
+        def create(*, file, purpose):
+            uploads.append(file[1].read())
+            return MagicMock(id="file-123")
+
+        mock_client.files.create.side_effect = create
         mock_batch = MagicMock()
         mock_batch.id = "batch-123"
         mock_client.batches.create.return_value = mock_batch
@@ -288,8 +395,7 @@ class TestOpenAIClientTokenParam:
         )
 
         # Inspect the JSONL written to files.create
-        file_arg = mock_client.files.create.call_args.kwargs["file"]
-        line = json.loads(file_arg.read().decode())
+        line = json.loads(uploads[0].decode())
         assert "max_completion_tokens" in line["body"]
         assert "max_tokens" not in line["body"]
 
@@ -367,6 +473,28 @@ class TestGeminiClient:
         assert call_kwargs.kwargs["model"] == "gemini-2.5-flash"
         assert call_kwargs.kwargs["contents"] == "user prompt"
 
+    @patch("google.genai.Client")
+    def test_acomplete(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_response = MagicMock()
+        mock_response.text = "SCORE: 3\nREASONING: Exact"
+        mock_response.usage_metadata = MagicMock(
+            prompt_token_count=70, candidates_token_count=15
+        )
+        mock_aio = mock_genai_client_cls.return_value.aio
+        mock_aio.models.generate_content = AsyncMock(return_value=mock_response)
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        result = asyncio.run(client.acomplete("system prompt", "user prompt"))
+
+        assert result.content == "SCORE: 3\nREASONING: Exact"
+        assert result.input_tokens == 70
+        assert result.output_tokens == 15
+        call_kwargs = mock_aio.models.generate_content.call_args.kwargs
+        assert call_kwargs["contents"] == "user prompt"
+        assert call_kwargs["model"] == "gemini-2.5-flash"
+
     @patch("google.genai.Client")
     def test_complete_handles_none_text(self, mock_genai_client_cls):
         """response.text can be None when blocked by safety filters."""
@@ -430,6 +558,222 @@ class TestGeminiClient:
             client.preflight_check()
 
 
+def _openai_response(cached_tokens: int = 0) -> MagicMock:
+    mock_choice = MagicMock()
+    mock_choice.message.content = "SCORE: 2"
+    mock_usage = MagicMock(prompt_tokens=2000, completion_tokens=10)
+    mock_usage.prompt_tokens_details.cached_tokens = cached_tokens
+    return MagicMock(choices=[mock_choice], usage=mock_usage)
+
+
+def _gemini_response(cached_tokens: int | None = None) -> MagicMock:
+    mock_response = MagicMock()
+    mock_response.text = "SCORE: 2"
+    mock_response.usage_metadata = MagicMock(
+        prompt_token_count=1500,
+        candidates_token_count=10,
+        cached_content_token_count=cached_tokens,
+    )
+    return mock_response
+
+
+_LONG_SYSTEM_PROMPT = "Judge relevance carefully. " * 200
+
+
+class TestPromptCaching:
+    @pytest.mark.skipif(not HAS_ANTHROPIC, reason="anthropic not installed")
+    @patch("anthropic.Anthropic")
+    def test_anthropic_reports_cache_reads(self, mock_anthropic_cls):
+        from veritail.llm.client import AnthropicClient
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="SCORE: 2")]
+        mock_response.usage = MagicMock(
+            input_tokens=40, output_tokens=5, cache_read_input_tokens=3000
+        )
+        mock_anthropic_cls.return_value.messages.create.return_value = mock_response
+
+        result = AnthropicClient(model="claude-sonnet-4-5").complete("sys", "usr")
+
+        assert result.input_tokens == 40
+        assert result.cached_input_tokens == 3000
+
+    @patch("openai.OpenAI")
+    def test_openai_keys_requests_by_system_prompt(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.return_value = _openai_response(cached_tokens=1792)
+
+        client = OpenAIClient(model="gpt-4o")
+        result = client.complete("system A", "pair 1")
+        client.complete("system A", "pair 2")
+        client.complete("system B", "pair 3")
+
+        keys = [
+            c.kwargs["extra_body"]["prompt_cache_key"] for c in create.call_args_list
+        ]
+        assert keys[0] == keys[1] != keys[2]
+        assert result.input_tokens == 2000
+        assert result.cached_input_tokens == 1792
+        first = create.call_args_list[0].kwargs["messages"]
+        assert [m["role"] for m in first] == ["system", "user"]
+
+    @patch("openai.OpenAI")
+    def test_openai_compatible_servers_get_no_cache_key(self, mock_openai_cls):
+        create = mock_openai_cls.return_value.chat.completions.create
+        create.return_value = _openai_response()
+
+        client = OpenAIClient(model="llama3", base_url="http://localhost:11434/v1")
+        result = client.complete("sys", "usr")
+
+        assert "extra_body" not in create.call_args.kwargs
+        assert result.cached_input_tokens == 0
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_caches_long_system_prompt_once(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.caches.create.return_value.name = "cachedContents/abc"
+        mock_client.models.generate_content.return_value = _gemini_response(1400)
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        client.complete(_LONG_SYSTEM_PROMPT, "pair 1")
+        result = client.complete(_LONG_SYSTEM_PROMPT, "pair 2")
+
+        mock_client.caches.create.assert_called_once()
+        cache_config = mock_client.caches.create.call_args.kwargs["config"]
+        assert cache_config.system_instruction == _LONG_SYSTEM_PROMPT
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.cached_content == "cachedContents/abc"
+        assert config.system_instruction is None
+        assert result.cached_input_tokens == 1400
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_short_system_prompt_sent_inline(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.models.generate_content.return_value = _gemini_response()
+
+        result = GeminiClient(model="gemini-2.5-flash").complete("short", "usr")
+
+        mock_client.caches.create.assert_not_called()
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == "short"
+        assert result.cached_input_tokens == 0
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_cache_creation_failure_falls_back(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.caches.create.side_effect = RuntimeError("too few tokens")
+        mock_client.models.generate_content.return_value = _gemini_response()
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        client.complete(_LONG_SYSTEM_PROMPT, "pair 1")
+        client.complete(_LONG_SYSTEM_PROMPT, "pair 2")
+
+        # The failure is remembered instead of retried on every call
+        mock_client.caches.create.assert_called_once()
+        config = mock_client.models.generate_content.call_args.kwargs["config"]
+        assert config.system_instruction == _LONG_SYSTEM_PROMPT
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_recreates_rejected_cache(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.caches.create.return_value.name = "cachedContents/abc"
+        mock_client.aio.models.generate_content = AsyncMock(
+            side_effect=[
+                RuntimeError("404 CachedContent not found"),
+                _gemini_response(),
+            ]
+        )
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        result = asyncio.run(client.acomplete(_LONG_SYSTEM_PROMPT, "usr"))
+
+        assert result.content == "SCORE: 2"
+        assert mock_client.caches.create.call_count == 2
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_creates_cache_off_event_loop(self, mock_genai_client_cls):
+        import threading
+
+        from veritail.llm.client import GeminiClient
+
+        threads: list[str] = []
+
+        def create(**kwargs):
+            threads.append(threading.current_thread().name)
+            cache = MagicMock()
+            cache.name = "cachedContents/abc"
+            return cache
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.caches.create.side_effect = create
+        mock_client.aio.models.generate_content = AsyncMock(
+            return_value=_gemini_response()
+        )
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        asyncio.run(client.acomplete(_LONG_SYSTEM_PROMPT, "pair 1"))
+        asyncio.run(client.acomplete(_LONG_SYSTEM_PROMPT, "pair 2"))
+
+        assert len(threads) == 1
+        assert threads[0] != threading.main_thread().name
+
+    @pytest.mark.skipif(not HAS_GENAI, reason="google-genai not installed")
+    @patch("google.genai.Client")
+    def test_gemini_close_deletes_caches(self, mock_genai_client_cls):
+        from veritail.llm.client import GeminiClient
+
+        mock_client = mock_genai_client_cls.return_value
+        mock_client.caches.create.return_value.name = "cachedContents/abc"
+        mock_client.caches.delete.side_effect = RuntimeError("already gone")
+        mock_client.models.generate_content.return_value = _gemini_response()
+
+        client = GeminiClient(model="gemini-2.5-flash")
+        client.complete(_LONG_SYSTEM_PROMPT, "pair 1")
+        client.close()
+
+        mock_client.caches.delete.assert_called_once_with(name="cachedContents/abc")
+        # A later call creates a new cache
+        client.complete(_LONG_SYSTEM_PROMPT, "pair 2")
+        assert mock_client.caches.create.call_count == 2
+
+
+def test_default_acomplete_runs_complete_in_thread():
+    """Custom clients that only implement complete() still work async."""
+    import threading
+
+    seen: list[str] = []
+
+    class SyncOnlyClient(LLMClient):
+        def complete(self, system_prompt, user_prompt, *, max_tokens=1024):
+            seen.append(threading.current_thread().name)
+            return LLMResponse(
+                content=f"{user_prompt}:{max_tokens}",
+                model="m",
+                input_tokens=1,
+                output_tokens=1,
+            )
+
+        def preflight_check(self):
+            pass
+
+    result = asyncio.run(SyncOnlyClient().acomplete("sys", "usr", max_tokens=7))
+    assert result.content == "usr:7"
+    assert seen and seen[0] != threading.main_thread().name
+
+
 @pytest.mark.skipif(HAS_ANTHROPIC, reason="anthropic is installed")
 def test_anthropic_import_error_without_package():
     """AnthropicClient raises helpful ImportError when anthropic is missing."""
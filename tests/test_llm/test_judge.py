@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from veritail.llm.cache import JudgmentCache
 from veritail.llm.client import BatchRequest, LLMClient, LLMResponse
-from veritail.llm.judge import CORRECTION_SYSTEM_PROMPT, CorrectionJudge, RelevanceJudge
+from veritail.llm.judge import (
+    CORRECTION_SYSTEM_PROMPT,
+    CorrectionJudge,
+    ListwiseRelevanceJudge,
+    RelevanceJudge,
+)
 from veritail.types import SearchResult
 
 
@@ -144,6 +151,26 @@ class TestRelevanceJudge:
         assert judgment.metadata["input_tokens"] == 100
         assert judgment.metadata["output_tokens"] == 50
 
+    def test_judge_metadata_includes_prompt_cache_reads(self):
+        client = Mock(spec=LLMClient)
+        client.complete.return_value = LLMResponse(
+            content="SCORE: 3",
+            model="m",
+            input_tokens=2000,
+            output_tokens=10,
+            cached_input_tokens=1800,
+        )
+        judge = RelevanceJudge(client, "system", _format_user_prompt, "exp-1")
+
+        assert (
+            judge.judge("shoes", _make_result()).metadata["cached_input_tokens"] == 1800
+        )
+        # Responses without cache reads keep the metadata unchanged
+        client.complete.return_value.cached_input_tokens = 0
+        assert (
+            "cached_input_tokens" not in judge.judge("boots", _make_result()).metadata
+        )
+
     def test_judge_passes_query_type(self):
         client = _make_mock_client(
             "SCORE: 3\nATTRIBUTES: match\nREASONING: Perfect match."
@@ -337,3 +364,358 @@ class TestCorrectionJudgeBatch:
         assert cj.corrected_query == "running shoes"
         assert cj.model == "test-model"
         assert cj.metadata["input_tokens"] == 80
+
+
+class TestAsyncJudges:
+    def test_ajudge_uses_acomplete(self):
+        client = Mock(spec=LLMClient)
+        client.acomplete = AsyncMock(
+            return_value=LLMResponse(
+                content="SCORE: 2\nATTRIBUTES: partial\nREASONING: Close.",
+                model="test-model",
+                input_tokens=12,
+                output_tokens=3,
+            )
+        )
+        judge = RelevanceJudge(client, "system", _format_user_prompt, "exp-1")
+
+        judgment = asyncio.run(
+            judge.ajudge("running shoes", _make_result(), query_type="broad")
+        )
+
+        assert judgment.score == 2
+        assert judgment.attribute_verdict == "partial"
+        assert judgment.query_type == "broad"
+        assert judgment.metadata == {
+            "input_tokens": 12,
+            "output_tokens": 3,
+            "pair_hash": judge.pair_hash("running shoes", _make_result()),
+        }
+        client.complete.assert_not_called()
+        client.acomplete.assert_awaited_once_with(
+            "system", "Query: running shoes\nProduct: Nike Running Shoes"
+        )
+
+    def test_ajudge_retries_once_then_raises(self):
+        client = Mock(spec=LLMClient)
+        client.acomplete = AsyncMock(
+            side_effect=[
+                RuntimeError("timeout"),
+                LLMResponse(
+                    content="no score here",
+                    model="test-model",
+                    input_tokens=1,
+                    output_tokens=1,
+                ),
+            ]
+        )
+        judge = RelevanceJudge(client, "system", _format_user_prompt, "exp-1")
+
+        with pytest.raises(ValueError, match="Could not parse score"):
+            asyncio.run(judge.ajudge("shoes", _make_result()))
+        assert client.acomplete.await_count == 2
+
+    def test_correction_ajudge_retries_parse_failure(self):
+        client = Mock(spec=LLMClient)
+        client.acomplete = AsyncMock(
+            side_effect=[
+                LLMResponse(
+                    content="unclear", model="m", input_tokens=1, output_tokens=1
+                ),
+                LLMResponse(
+                    content="VERDICT: inappropriate\nREASONING: Changed intent.",
+                    model="m",
+                    input_tokens=5,
+                    output_tokens=2,
+                ),
+            ]
+        )
+        judge = CorrectionJudge(client, CORRECTION_SYSTEM_PROMPT, "exp-1")
+
+        cj = asyncio.run(judge.ajudge("nike air", "nike hair"))
+
+        assert cj.verdict == "inappropriate"
+        assert cj.reasoning == "Changed intent."
+        assert cj.metadata == {"input_tokens": 5, "output_tokens": 2}
+
+
+def _make_results(n: int) -> list[SearchResult]:
+    return [
+        SearchResult(
+            product_id=f"SKU-{i}",
+            title=f"Shoe {i}",
+            description="d",
+            category="Shoes",
+            price=10.0,
+            position=i,
+        )
+        for i in range(n)
+    ]
+
+
+def _format_listwise_prompt(query: str, results: list[SearchResult]) -> str:
+    return f"Query: {query}\n" + "\n".join(r.title for r in results)
+
+
+class TestListwiseRelevanceJudge:
+    def _judge(self, client) -> ListwiseRelevanceJudge:
+        return ListwiseRelevanceJudge(
+            client, "system", _format_listwise_prompt, "exp-1"
+        )
+
+    def test_judge_parses_every_position(self):
+        client = _make_mock_client(
+            "RESULT 1\nSCORE: 3\nATTRIBUTES: match\nREASONING: Exact.\n\n"
+            "RESULT 2\nSCORE: 1\nATTRIBUTES: mismatch\nREASONING: Wrong size.\n\n"
+            "RESULT 3\nSCORE: 0\nREASONING: Unrelated."
+        )
+        judgments = self._judge(client).judge(
+            "shoes", _make_results(3), query_type="broad"
+        )
+
+        assert [j.score for j in judgments] == [3, 1, 0]
+        assert [j.attribute_verdict for j in judgments] == ["match", "mismatch", "n/a"]
+        assert judgments[1].reasoning == "Wrong size."
+        assert [j.product.product_id for j in judgments] == ["SKU-0", "SKU-1", "SKU-2"]
+        assert all(
+            j.query_type == "broad" and j.metadata["listwise"] for j in judgments
+        )
+        # Usage is split across positions without losing tokens
+        assert sum(j.metadata["input_tokens"] for j in judgments) == 100
+        assert sum(j.metadata["output_tokens"] for j in judgments) == 50
+        client.complete.assert_called_once_with(
+            "system",
+            "Query: shoes\nShoe 0\nShoe 1\nShoe 2",
+            max_tokens=ListwiseRelevanceJudge.max_tokens_for(3),
+        )
+
+    def test_partial_response_leaves_missing_positions_none(self):
+        client = _make_mock_client(
+            "## Result 2\nSCORE: 2\nREASONING: Close.\n\n"
+            "**RESULT 3:**\nSCORE: 9\nREASONING: Bad score."
+        )
+        judgments = self._judge(client).judge("shoes", _make_results(3))
+
+        assert judgments[0] is None
+        assert judgments[1] is not None and judgments[1].score == 2
+        assert judgments[2] is None
+        assert judgments[1].metadata["input_tokens"] == 100
+        client.complete.assert_called_once()
+
+    def test_unparseable_response_is_retried_once(self):
+        client = Mock(spec=LLMClient)
+        client.complete.side_effect = [
+            LLMResponse(content="I cannot", model="m", input_tokens=1, output_tokens=1),
+            LLMResponse(
+                content="RESULT 1\nSCORE: 2\nREASONING: ok",
+                model="m",
+                input_tokens=1,
+                output_tokens=1,
+            ),
+        ]
+        judgments = self._judge(client).judge("shoes", _make_results(1))
+
+        assert judgments[0] is not None and judgments[0].score == 2
+        assert client.complete.call_count == 2
+
+    def test_ajudge_uses_acomplete(self):
+        client = Mock(spec=LLMClient)
+        client.acomplete = AsyncMock(
+            return_value=LLMResponse(
+                content="RESULT 1\nSCORE: 3\nREASONING: ok",
+                model="m",
+                input_tokens=4,
+                output_tokens=2,
+            )
+        )
+        judgments = asyncio.run(self._judge(client).ajudge("shoes", _make_results(2)))
+
+        assert judgments[0] is not None and judgments[0].score == 3
+        assert judgments[1] is None
+        client.complete.assert_not_called()
+
+    def test_prompt_cache_reads_split_across_positions(self):
+        response = LLMResponse(
+            content="RESULT 1\nSCORE: 3\n\nRESULT 2\nSCORE: 2\n\nRESULT 3\nSCORE: 1",
+            model="m",
+            input_tokens=3000,
+            output_tokens=30,
+            cached_input_tokens=2500,
+        )
+        judgments = self._judge(Mock(spec=LLMClient)).parse_batch_result(
+            response, "shoes", _make_results(3)
+        )
+
+        assert [
+            j.metadata["cached_input_tokens"] for j in judgments if j is not None
+        ] == [834, 833, 833]
+
+    def test_prepare_request_scales_max_tokens(self):
+        judge = self._judge(Mock(spec=LLMClient))
+        req = judge.prepare_request("list-0", "shoes", _make_results(10))
+
+        assert isinstance(req, BatchRequest)
+        assert req.custom_id == "list-0"
+        assert req.system_prompt == "system"
+        assert req.max_tokens == ListwiseRelevanceJudge.max_tokens_for(10)
+        assert req.max_tokens > 1024
+
+
+class TestJudgeCache:
+    def test_relevance_judge_reuses_cached_response(self, tmp_path):
+        client = _make_mock_client("SCORE: 2\nATTRIBUTES: partial\nREASONING: ok")
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+            judge = RelevanceJudge(
+                client,
+                "system",
+                lambda q, r: f"{q} / {r.title}",
+                "exp-1",
+                cache=cache,
+                model="test-model",
+            )
+            first = judge.judge("shoes", _make_result())
+            second = judge.judge("shoes", _make_result())
+
+            assert client.complete.call_count == 1
+            assert first.score == second.score == 2
+            assert "cached" not in first.metadata
+            assert second.metadata["cached"] is True
+            assert second.metadata["input_tokens"] == 0
+            assert (cache.hits, cache.misses, cache.stores) == (1, 1, 1)
+
+    def test_unparseable_response_is_not_cached(self, tmp_path):
+        client = _make_mock_client("no score here")
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+            judge = RelevanceJudge(
+                client, "system", lambda q, r: q, "exp-1", cache=cache, model="m"
+            )
+            with pytest.raises(ValueError):
+                judge.judge("shoes", _make_result())
+            assert len(cache) == 0
+
+    def test_listwise_caches_only_complete_responses(self, tmp_path):
+        partial = _make_mock_client("RESULT 1\nSCORE: 3\nREASONING: ok")
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+            judge = ListwiseRelevanceJudge(
+                partial,
+                "system",
+                _format_listwise_prompt,
+                "exp-1",
+                cache=cache,
+                model="m",
+            )
+            judge.judge("shoes", _make_results(2))
+            assert len(cache) == 0
+
+            complete = _make_mock_client(
+                "RESULT 1\nSCORE: 3\nREASONING: a\n\nRESULT 2\nSCORE: 1\nREASONING: b"
+            )
+            judge = ListwiseRelevanceJudge(
+                complete,
+                "system",
+                _format_listwise_prompt,
+                "exp-1",
+                cache=cache,
+                model="m",
+            )
+            judge.judge("shoes", _make_results(2))
+            again = judge.judge("shoes", _make_results(2))
+
+            assert complete.complete.call_count == 1
+            assert [j.score for j in again if j is not None] == [3, 1]
+            assert all(j is not None and j.metadata["cached"] for j in again)
+
+    def test_shared_responses_reused_across_judges(self):
+        shared: dict[str, LLMResponse] = {}
+        client = _make_mock_client("SCORE: 3\nATTRIBUTES: match\nREASONING: ok")
+
+        def fmt(q, r):
+            return f"{q} / {r.title}"
+
+        judge_a = RelevanceJudge(client, "system", fmt, "exp-a", shared=shared)
+        judge_b = RelevanceJudge(client, "system", fmt, "exp-b", shared=shared)
+        first = judge_a.judge("shoes", _make_result())
+        second = judge_b.judge("shoes", _make_result(), query_type="broad")
+
+        client.complete.assert_called_once()
+        assert first.metadata["input_tokens"] == 100
+        assert "deduplicated" not in first.metadata
+        assert second.experiment == "exp-b"
+        assert second.query_type == "broad"
+        assert second.score == 3
+        assert second.metadata["deduplicated"] is True
+        assert second.metadata["input_tokens"] == 0
+
+    def test_reuse_prefers_shared_over_cache(self, tmp_path):
+        shared: dict[str, LLMResponse] = {}
+        with JudgmentCache(tmp_path / "cache.sqlite") as cache:
+            judge = RelevanceJudge(
+                Mock(spec=LLMClient),
+                "system",
+                lambda q, r: q,
+                "exp-1",
+                cache=cache,
+                shared=shared,
+                model="m",
+            )
+            request = judge.prepare_request("rel-0-0", "shoes", _make_result())
+            assert judge.reuse(request) is None
+
+            judge.remember(
+                request,
+                LLMResponse(
+                    content="SCORE: 1", model="m", input_tokens=5, output_tokens=1
+                ),
+            )
+            hit = judge.reuse(request)
+
+            assert hit is not None
+            assert hit[1] == "deduplicated"
+            assert len(cache) == 1
+            shared.clear()
+            hit = judge.reuse(request)
+            assert hit is not None and hit[1] == "cached"
+
+
+class TestJudgeBaseline:
+    def test_pair_hash_ignores_position(self):
+        from veritail.rubrics import format_user_prompt
+
+        judge = RelevanceJudge(
+            Mock(spec=LLMClient), "system", format_user_prompt, "exp-1", model="m"
+        )
+        moved = _make_result()
+        moved.position = 4
+
+        assert judge.pair_hash("shoes", _make_result()) == judge.pair_hash(
+            "shoes", moved
+        )
+        assert judge.pair_hash("shoes", _make_result()) != judge.pair_hash(
+            "boots", _make_result()
+        )
+
+    def test_baseline_match_skips_llm(self):
+        client = _make_mock_client("SCORE: 2\nATTRIBUTES: partial\nREASONING: ok")
+        first = RelevanceJudge(client, "system", _format_user_prompt, "old", model="m")
+        prior = first.judge("shoes", _make_result())
+
+        judge = RelevanceJudge(
+            client,
+            "system",
+            _format_user_prompt,
+            "new",
+            model="m",
+            baseline={prior.metadata["pair_hash"]: prior},
+        )
+        judgment = judge.judge("shoes", _make_result(), query_type="broad")
+
+        assert client.complete.call_count == 1
+        assert judgment.score == 2
+        assert judgment.reasoning == "ok"
+        assert judgment.experiment == "new"
+        assert judgment.query_type == "broad"
+        assert judgment.metadata["reused_from"] == "old"
+        assert judgment.metadata["input_tokens"] == 0
+
+        judge.judge("boots", _make_result())
+        assert client.complete.call_count == 2
@@ -0,0 +1,153 @@
+"""Tests for batch emulation on top of synchronous calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import Mock
+
+from veritail.llm.client import BatchRequest, LLMClient, LLMResponse
+from veritail.llm.localbatch import LocalBatchClient
+
+
+def _requests(n: int) -> list[BatchRequest]:
+    return [
+        BatchRequest(custom_id=f"rel-{i}", system_prompt="sys", user_prompt=f"q{i}")
+        for i in range(n)
+    ]
+
+
+def _inner(block_on: str | None = None, release: threading.Event | None = None):
+    """Client answering with the user prompt; optionally blocks on one prompt."""
+    client = Mock(spec=LLMClient)
+
+    def complete(system_prompt, user_prompt, *, max_tokens=1024):
+        if user_prompt == block_on and release is not None:
+            release.wait(5)
+        if user_prompt == "boom":
+            raise RuntimeError("server error")
+        return LLMResponse(
+            content=f"answer {user_prompt}",
+            model="local",
+            input_tokens=3,
+            output_tokens=2,
+        )
+
+    client.complete.side_effect = complete
+    return client
+
+
+def _wait(client: LocalBatchClient, batch_id: str, done: int) -> tuple[str, int, int]:
+    deadline = time.monotonic() + 5
+    while True:
+        status = client.poll_batch(batch_id)
+        if status[1] >= done or time.monotonic() > deadline:
+            return status
+        time.sleep(0.01)
+
+
+class TestLocalBatchClient:
+    def test_runs_requests_and_returns_results(self, tmp_path):
+        client = LocalBatchClient(_inner(), tmp_path, concurrency=2)
+        requests = _requests(3)
+        requests.append(
+            BatchRequest(custom_id="bad", system_prompt="s", user_prompt="boom")
+        )
+
+        batch_id = client.submit_batch(iter(requests))
+
+        assert _wait(client, batch_id, 4) == ("completed", 4, 4)
+        results = {r.custom_id: r for r in client.iter_batch_results(batch_id)}
+        assert results["rel-1"].response == LLMResponse(
+            content="answer q1", model="local", input_tokens=3, output_tokens=2
+        )
+        assert results["bad"].response is None
+        assert results["bad"].error == "server error"
+        assert client.supports_batch()
+
+    def test_restart_resumes_unfinished_requests(self, tmp_path):
+        release = threading.Event()
+        first = LocalBatchClient(
+            _inner(block_on="q1", release=release), tmp_path, concurrency=1
+        )
+        batch_id = first.submit_batch(_requests(3))
+        assert _wait(first, batch_id, 1)[1] == 1
+        # The process goes away while q1 is in flight
+        first.close()
+
+        inner = _inner()
+        second = LocalBatchClient(inner, tmp_path, concurrency=2)
+        assert _wait(second, batch_id, 3) == ("completed", 3, 3)
+        release.set()
+
+        assert [c.args[1] for c in inner.complete.call_args_list] == ["q1", "q2"]
+        assert sorted(r.custom_id for r in second.iter_batch_results(batch_id)) == [
+            "rel-0",
+            "rel-1",
+            "rel-2",
+        ]
+
+    def test_torn_result_line_is_rerun(self, tmp_path):
+        client = LocalBatchClient(_inner(), tmp_path)
+        batch_id = client.submit_batch(_requests(2))
+        _wait(client, batch_id, 2)
+        client.close()
+        results_path = tmp_path / batch_id / "results.jsonl"
+        first_line = results_path.read_text().splitlines()[0]
+        results_path.write_text(first_line + "\n" + '{"custom_id": "rel-')
+
+        resumed = LocalBatchClient(_inner(), tmp_path)
+        assert _wait(resumed, batch_id, 2) == ("completed", 2, 2)
+        assert len(list(resumed.iter_batch_results(batch_id))) == 2
+
+    def test_cancel_stops_batch_and_keeps_partial_results(self, tmp_path):
+        release = threading.Event()
+        client = LocalBatchClient(
+            _inner(block_on="q1", release=release), tmp_path, concurrency=1
+        )
+        batch_id = client.submit_batch(_requests(3))
+        _wait(client, batch_id, 1)
+
+        assert client.cancel_batch(batch_id) is True
+        release.set()
+
+        assert client.poll_batch(batch_id) == ("failed", 1, 3)
+        assert client.batch_error_message(batch_id) == "The local batch was cancelled."
+        assert [r.custom_id for r in client.iter_batch_results(batch_id)] == ["rel-0"]
+        # A later process does not restart it
+        assert LocalBatchClient(_inner(), tmp_path).poll_batch(batch_id)[0] == "failed"
+
+    def test_release_deletes_spool(self, tmp_path):
+        inner = _inner()
+        spool_dir = tmp_path / "local-batches"
+        client = LocalBatchClient(inner, spool_dir)
+        first = client.submit_batch(_requests(1))
+        second = client.submit_batch(_requests(1))
+        _wait(client, first, 1)
+        _wait(client, second, 1)
+
+        client.release_batch(first)
+        assert [p.name for p in spool_dir.iterdir()] == [second]
+        client.release_batch(second)
+        assert not spool_dir.exists()
+
+        client.close()
+        inner.close.assert_called_once()
+
+    def test_unknown_batch_fails(self, tmp_path):
+        client = LocalBatchClient(_inner(), tmp_path)
+
+        assert client.poll_batch("local-missing") == ("failed", 0, 0)
+        assert "No local batch spool" in (
+            client.batch_error_message("local-missing") or ""
+        )
+        assert list(client.iter_batch_results("local-missing")) == []
+        assert client.cancel_batch("local-missing") is False
+
+    def test_sync_calls_pass_through(self, tmp_path):
+        inner = _inner()
+        client = LocalBatchClient(inner, tmp_path)
+
+        assert client.complete("sys", "hi").content == "answer hi"
+        client.preflight_check()
+        inner.preflight_check.assert_called_once()
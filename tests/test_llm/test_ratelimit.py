@@ -0,0 +1,241 @@
+"""Tests for client-side rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from veritail.llm.client import LLMClient, LLMResponse
+from veritail.llm.ratelimit import (
+    RateLimit,
+    RateLimitedClient,
+    RateLimiter,
+    estimate_tokens,
+    is_rate_limit_error,
+    parse_rate_limits,
+    resolve_rate_limit,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, headers: dict[str, str] | None = None, message: str = "429"):
+        super().__init__(message)
+        self.status_code = 429
+        self.response = Mock(headers=headers or {})
+
+
+def _response(tokens: int = 10) -> LLMResponse:
+    return LLMResponse(
+        content="SCORE: 2", model="m", input_tokens=tokens, output_tokens=0
+    )
+
+
+class TestParseRateLimits:
+    def test_parses_rpm_and_tpm(self):
+        limits = parse_rate_limits(["gpt-4o=500:200000", "claude-sonnet-4-5=50"])
+        assert limits["gpt-4o"] == RateLimit(rpm=500, tpm=200000)
+        assert limits["claude-sonnet-4-5"] == RateLimit(rpm=50, tpm=None)
+
+    def test_tpm_only(self):
+        assert parse_rate_limits(["*=:90000"])["*"] == RateLimit(tpm=90000)
+
+    @pytest.mark.parametrize(
+        "spec", ["gpt-4o", "=500", "gpt-4o=", "gpt-4o=abc", "gpt-4o=0:10"]
+    )
+    def test_rejects_malformed(self, spec):
+        with pytest.raises(ValueError, match="Invalid rate limit"):
+            parse_rate_limits([spec])
+
+    def test_resolve_falls_back_to_wildcard(self):
+        limits = parse_rate_limits(["gpt-4o=500", "*=60"])
+        assert resolve_rate_limit(limits, "gpt-4o") == RateLimit(rpm=500)
+        assert resolve_rate_limit(limits, "gemini-2.5-flash") == RateLimit(rpm=60)
+        assert resolve_rate_limit({}, "gpt-4o") is None
+
+
+class TestErrorInspection:
+    def test_detects_rate_limit_errors(self):
+        assert is_rate_limit_error(FakeRateLimitError())
+        gemini_exc = Exception("429 RESOURCE_EXHAUSTED")
+        assert is_rate_limit_error(gemini_exc)
+        assert not is_rate_limit_error(RuntimeError("bad request"))
+
+    def test_retry_after_headers(self):
+        assert retry_after_seconds(FakeRateLimitError({"Retry-After": "7"})) == 7.0
+        assert (
+            retry_after_seconds(FakeRateLimitError({"retry-after-ms": "250"})) == 0.25
+        )
+        exc = FakeRateLimitError(
+            {"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "6m0s"}
+        )
+        assert retry_after_seconds(exc) == 360.0
+
+    def test_retry_after_from_gemini_body(self):
+        exc = Exception("429 RESOURCE_EXHAUSTED {'retryDelay': '27s'}")
+        assert retry_after_seconds(exc) == 27.0
+
+    def test_retry_after_missing(self):
+        assert retry_after_seconds(RuntimeError("boom")) is None
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("a" * 400, "b" * 400) == 200
+        assert estimate_tokens("") == 1
+
+
+class TestRateLimiter:
+    def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+        assert all(limiter.acquire(10_000) == 0 for _ in range(100))
+
+    def test_rpm_bucket_paces_after_burst(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=60, clock=clock)
+        for _ in range(60):
+            assert limiter.acquire(1) == 0
+        # Bucket empty: one request per second at 60 RPM
+        assert limiter.acquire(1) == pytest.approx(1.0)
+        assert limiter.acquire(1) == pytest.approx(2.0)
+        clock.now += 2.0
+        assert limiter.acquire(1) == pytest.approx(1.0)
+
+    def test_tpm_bucket_uses_estimate_and_actual_usage(self):
+        clock = FakeClock()
+        limiter = RateLimiter(tpm=600, clock=clock)
+        assert limiter.acquire(300) == 0
+        limiter.record_usage(estimated=300, actual=600)
+        # 600 of 600 spent: the next 60 tokens need 6 s of refill
+        assert limiter.acquire(60) == pytest.approx(6.0)
+
+    def test_rate_limit_blocks_all_callers_for_retry_after(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=600, clock=clock)
+        wait = limiter.record_rate_limited(FakeRateLimitError({"retry-after": "5"}), 0)
+        assert wait == 5.0
+        assert limiter.acquire(1) == pytest.approx(5.0)
+        assert limiter.rate_limited_count == 1
+
+    def test_backoff_without_retry_after(self):
+        limiter = RateLimiter(rpm=600, clock=FakeClock())
+        assert limiter.record_rate_limited(FakeRateLimitError(), 3) == 8.0
+
+    def test_aimd_halves_then_recovers_to_ceiling(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rpm=600, clock=clock)
+        limiter.record_rate_limited(FakeRateLimitError({"retry-after": "0"}), 0)
+        assert limiter.factor == pytest.approx(0.5)
+
+        clock.now += 10.0
+        limiter.record_success()
+        assert limiter.factor == pytest.approx(0.7)
+
+        # Growth stops just under the rate that triggered the error
+        clock.now += 30.0
+        limiter.record_success()
+        assert 0.9 <= limiter.factor < 1.0
+
+    def test_learns_budget_from_headers(self):
+        limiter = RateLimiter(clock=FakeClock())
+        exc = FakeRateLimitError(
+            {
+                "retry-after": "1",
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-tokens-limit": "40000",
+            }
+        )
+        limiter.record_rate_limited(exc, 0)
+        assert limiter.rpm == 50
+        assert limiter.tpm == 40000
+
+    def test_learns_budget_from_observed_rate(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        for _ in range(30):
+            limiter.acquire(1)
+            clock.now += 1.0
+        limiter.record_rate_limited(FakeRateLimitError({"retry-after": "0"}), 0)
+        assert limiter.rpm == 60
+        assert limiter.factor == pytest.approx(0.5)
+
+
+class TestRateLimitedClient:
+    def _inner(self, *effects) -> Mock:
+        inner = Mock(spec=LLMClient)
+        inner.complete.side_effect = list(effects)
+        return inner
+
+    @patch("veritail.llm.ratelimit.time.sleep")
+    def test_retries_rate_limit_errors(self, mock_sleep):
+        inner = self._inner(FakeRateLimitError({"retry-after": "2"}), _response())
+        limiter = RateLimiter(rpm=600)
+        client = RateLimitedClient(inner, limiter)
+
+        result = client.complete("sys", "usr", max_tokens=64)
+
+        assert result.content == "SCORE: 2"
+        assert inner.complete.call_count == 2
+        inner.complete.assert_called_with("sys", "usr", max_tokens=64)
+        assert mock_sleep.call_args.args[0] == pytest.approx(2.0, abs=0.1)
+        assert limiter.rate_limited_count == 1
+
+    @patch("veritail.llm.ratelimit.time.sleep")
+    def test_other_errors_propagate_immediately(self, mock_sleep):
+        inner = self._inner(RuntimeError("bad request"))
+        client = RateLimitedClient(inner, RateLimiter())
+
+        with pytest.raises(RuntimeError, match="bad request"):
+            client.complete("sys", "usr")
+        assert inner.complete.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("veritail.llm.ratelimit.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        inner = self._inner(*[FakeRateLimitError({"retry-after": "0"})] * 3)
+        client = RateLimitedClient(inner, RateLimiter(), max_retries=2)
+
+        with pytest.raises(FakeRateLimitError):
+            client.complete("sys", "usr")
+        assert inner.complete.call_count == 3
+
+    def test_acomplete_retries_rate_limit_errors(self):
+        inner = Mock(spec=LLMClient)
+        inner.acomplete = AsyncMock(
+            side_effect=[FakeRateLimitError({"retry-after-ms": "1"}), _response()]
+        )
+        client = RateLimitedClient(inner, RateLimiter())
+
+        result = asyncio.run(client.acomplete("sys", "usr"))
+
+        assert result.content == "SCORE: 2"
+        assert inner.acomplete.await_count == 2
+        inner.complete.assert_not_called()
+
+    def test_delegates_batch_operations(self):
+        inner = Mock(spec=LLMClient)
+        inner.supports_batch.return_value = True
+        inner.submit_batch.return_value = "batch-1"
+        inner.max_batch_requests = 100
+        inner.max_batch_bytes = None
+        client = RateLimitedClient(inner, RateLimiter())
+
+        assert client.supports_batch() is True
+        assert client.submit_batch([]) == "batch-1"
+        assert client.max_batch_requests == 100
+        assert client.max_batch_bytes is None
+        inner.cancel_batch.return_value = True
+        assert client.cancel_batch("batch-1") is True
+        inner.iter_batch_results.return_value = iter([])
+        assert list(client.iter_batch_results("batch-1")) == []
+        inner.iter_batch_results.assert_called_once_with("batch-1")
+        client.preflight_check()
+        inner.preflight_check.assert_called_once()
@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
 from veritail.backends import EvalBackend
 from veritail.backends.file import FileBackend
+from veritail.batch_utils import BatchCancelledError
 from veritail.checkpoint import (
     BatchCheckpoint,
     load_checkpoint,
     save_checkpoint,
     serialize_request_context,
+    update_checkpoint,
 )
+from veritail.llm.cache import JudgmentCache
 from veritail.llm.client import BatchRequest, BatchResult, LLMClient, LLMResponse
-from veritail.pipeline import run_batch_evaluation, run_dual_evaluation, run_evaluation
+from veritail.pipeline import (
+    index_baseline,
+    run_batch_evaluation,
+    run_dual_batch_evaluation,
+    run_dual_evaluation,
+    run_evaluation,
+)
 from veritail.rubrics import format_user_prompt
 from veritail.types import (
     CheckResult,
     ExperimentConfig,
+    JudgmentRecord,
     QueryEntry,
     SearchResponse,
     SearchResult,
@@ -902,6 +914,260 @@ class TestRunEvaluation:
         for call in overlay_calls:
             assert call == "Ovens, fryers, griddles scoring guidance."
 
+    def test_prints_token_usage_with_prompt_cache_reads(self, tmp_path, capsys):
+        llm_client = Mock(spec=LLMClient)
+        llm_client.complete.return_value = LLMResponse(
+            content="SCORE: 2\nATTRIBUTES: match\nREASONING: ok",
+            model="test",
+            input_tokens=1200,
+            output_tokens=20,
+            cached_input_tokens=1024,
+        )
+        config = ExperimentConfig(
+            name="test-exp", adapter_path="test.py", llm_model="test-model", top_k=3
+        )
+
+        run_evaluation(
+            [QueryEntry(query="shoes", type="broad")],
+            _make_mock_adapter(),
+            config,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+        )
+
+        out = capsys.readouterr().out
+        assert (
+            "Tokens: 3,600 input, 3,072 read from the provider prompt cache, "
+            "60 output" in out
+        )
+
+
+def _make_keyed_llm_client(delay: float = 0.0) -> Mock:
+    """Mock client whose score depends on the product, not the call order.
+
+    Needed for the concurrent path, where the order of ``complete`` calls is
+    non-deterministic.  Also records the peak number of in-flight calls.
+    """
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def complete(system_prompt, user_prompt, **kwargs):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            time.sleep(delay)
+            if "## Original Query" in user_prompt:
+                content = "VERDICT: appropriate\nREASONING: Spelling fix."
+            else:
+                score = 3 - int(user_prompt.split("**Title**: Result ")[1][0])
+                content = f"SCORE: {score}\nATTRIBUTES: match\nREASONING: ok"
+            return LLMResponse(
+                content=content, model="test", input_tokens=10, output_tokens=5
+            )
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    async def acomplete(system_prompt, user_prompt, **kwargs):
+        import asyncio
+
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            with lock:
+                state["active"] -= 1
+        state["async_calls"] += 1
+        return complete(system_prompt, user_prompt, **kwargs)
+
+    state["async_calls"] = 0
+    client = Mock(spec=LLMClient)
+    client.complete.side_effect = complete
+    client.acomplete.side_effect = acomplete
+    client.state = state
+    return client
+
+
+class TestRunEvaluationConcurrency:
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="test-exp",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+
+    def test_concurrent_judgments_logged_in_query_order(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(6)]
+        llm_client = _make_keyed_llm_client(delay=0.01)
+        backend = FileBackend(output_dir=str(tmp_path))
+
+        judgments, _checks, metrics, _corr = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            backend,
+            concurrency=4,
+        )
+
+        expected = [(qi, f"SKU-{r}") for qi in range(6) for r in range(3)]
+        assert [
+            (j.metadata["query_index"], j.product.product_id) for j in judgments
+        ] == expected
+        stored = backend.get_judgments("test-exp")
+        assert [
+            (j.metadata["query_index"], j.product.product_id) for j in stored
+        ] == expected
+        assert [j.score for j in judgments[:3]] == [3, 2, 1]
+        assert llm_client.state["peak"] > 1
+        assert llm_client.state["peak"] <= 4
+        ndcg = next(m for m in metrics if m.metric_name == "ndcg@10")
+        assert len(ndcg.per_query) == 6
+
+    def test_concurrent_matches_sequential_metrics(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(4)]
+
+        _, _, seq_metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path / "seq")),
+        )
+        _, _, par_metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path / "par")),
+            concurrency=8,
+        )
+
+        assert [(m.metric_name, m.value) for m in seq_metrics] == [
+            (m.metric_name, m.value) for m in par_metrics
+        ]
+
+    def test_concurrent_llm_error_becomes_zero_score(self, tmp_path):
+        queries = [QueryEntry(query="shoes", type="broad")]
+        keyed = _make_keyed_llm_client()
+        inner = keyed.complete.side_effect
+
+        def complete(system_prompt, user_prompt, **kwargs):
+            if "**Title**: Result 1 " in user_prompt:
+                raise RuntimeError("boom")
+            return inner(system_prompt, user_prompt, **kwargs)
+
+        keyed.complete.side_effect = complete
+
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            keyed,
+            FileBackend(output_dir=str(tmp_path)),
+            concurrency=3,
+        )
+
+        assert [j.product.product_id for j in judgments] == ["SKU-0", "SKU-1", "SKU-2"]
+        assert judgments[1].score == 0
+        assert "boom" in judgments[1].metadata["error"]
+
+    def test_concurrent_corrections_preserve_order(self, tmp_path):
+        queries = [QueryEntry(query=f"qeury {i}", type="broad") for i in range(5)]
+
+        def adapter(query: str) -> SearchResponse:
+            return SearchResponse(
+                results=_make_mock_adapter()(query)[:1],
+                corrected_query=query.replace("qeury", "query"),
+            )
+
+        _, _, _, corrections = run_evaluation(
+            queries,
+            adapter,
+            self._config(),
+            _make_keyed_llm_client(delay=0.01),
+            FileBackend(output_dir=str(tmp_path)),
+            concurrency=3,
+        )
+
+        assert [c.original_query for c in corrections] == [q.query for q in queries]
+        assert all(c.verdict == "appropriate" for c in corrections)
+
+    def test_concurrent_resume_skips_completed(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(3)]
+        backend = FileBackend(output_dir=str(tmp_path))
+        run_evaluation(
+            queries[:2],
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            backend,
+        )
+
+        llm_client = _make_keyed_llm_client()
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            backend,
+            resume=True,
+            concurrency=4,
+        )
+
+        assert llm_client.complete.call_count == 3
+        assert len(judgments) == 9
+        assert [j.metadata["query_index"] for j in judgments[-3:]] == [2, 2, 2]
+
+    def test_resume_rejudges_partially_logged_query(self, tmp_path):
+        class _Killed(BaseException):
+            pass
+
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(2)]
+        backend = FileBackend(output_dir=str(tmp_path))
+        log_judgments = backend.log_judgments
+        logged: list[int] = []
+
+        def dies_mid_query(judgments):
+            for judgment in judgments:
+                if logged.count(1) == 1:
+                    raise _Killed
+                log_judgments([judgment])
+                logged.append(judgment.metadata["query_index"])
+
+        backend.log_judgments = dies_mid_query  # type: ignore[method-assign]
+        with pytest.raises(_Killed):
+            run_evaluation(
+                queries,
+                _make_mock_adapter(),
+                self._config(),
+                _make_keyed_llm_client(),
+                backend,
+            )
+        assert logged == [0, 0, 0, 1]
+
+        llm_client = _make_keyed_llm_client()
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            resume=True,
+        )
+
+        # Only the interrupted query is judged again, and its stray
+        # judgment is not kept alongside the new ones
+        assert llm_client.complete.call_count == 3
+        assert [j.metadata["query_index"] for j in judgments] == [0, 0, 0, 1, 1, 1]
+
 
 def _make_mock_batch_llm_client(responses: list[str]) -> LLMClient:
     """Create a mock LLM client with batch support.
@@ -922,9 +1188,13 @@ def _make_mock_batch_llm_client(responses: list[str]) -> LLMClient:
     client.poll_batch.return_value = ("completed", 0, 0)
 
     call_count = [0]
+    # Results are fixed once read, as a provider's would be
+    retrieved: dict[str, list[BatchResult]] = {}
 
-    def retrieve_batch_results(batch_id):
-        results = []
+    def iter_batch_results(batch_id):
+        if batch_id in retrieved:
+            return retrieved[batch_id]
+        results = retrieved[batch_id] = []
         batch_idx = int(batch_id.split("-")[1]) - 1
         reqs = submitted[batch_idx]
         for req in reqs:
@@ -944,167 +1214,1938 @@ def _make_mock_batch_llm_client(responses: list[str]) -> LLMClient:
             )
         return results
 
-    client.retrieve_batch_results.side_effect = retrieve_batch_results
+    client.iter_batch_results.side_effect = iter_batch_results
     return client
 
 
-class TestRunBatchEvaluation:
-    def test_batch_basic_pipeline(self, tmp_path):
-        queries = [QueryEntry(query="running shoes", type="broad")]
-        adapter = _make_mock_adapter()
-        config = ExperimentConfig(
-            name="test-batch",
+class TestRunEvaluationAsync:
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="test-exp",
             adapter_path="test.py",
             llm_model="test-model",
             top_k=3,
         )
-        responses = [
-            "SCORE: 3\nATTRIBUTES: match\nREASONING: Excellent match",
-            "SCORE: 2\nATTRIBUTES: partial\nREASONING: Good match",
-            "SCORE: 1\nATTRIBUTES: mismatch\nREASONING: Marginal match",
-        ]
-        llm_client = _make_mock_batch_llm_client(responses)
+
+    def test_async_judgments_logged_in_query_order(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(5)]
+        llm_client = _make_keyed_llm_client(delay=0.01)
         backend = FileBackend(output_dir=str(tmp_path))
 
-        judgments, checks, metrics, corrections = run_batch_evaluation(
+        judgments, _checks, metrics, _corr = run_evaluation(
             queries,
-            adapter,
-            config,
+            _make_mock_adapter(),
+            self._config(),
             llm_client,
             backend,
-            poll_interval=0,
+            concurrency=6,
+            use_async=True,
         )
 
-        assert len(judgments) == 3
-        assert judgments[0].score == 3
-        assert judgments[1].score == 2
-        assert judgments[2].score == 1
+        expected = [(qi, f"SKU-{r}") for qi in range(5) for r in range(3)]
+        assert [
+            (j.metadata["query_index"], j.product.product_id) for j in judgments
+        ] == expected
+        assert [j.score for j in judgments[:3]] == [3, 2, 1]
+        assert llm_client.state["async_calls"] == 15
+        assert 1 < llm_client.state["peak"] <= 6
+        ndcg = next(m for m in metrics if m.metric_name == "ndcg@10")
+        assert len(ndcg.per_query) == 5
 
-        assert len(checks) > 0
+    def test_async_llm_error_yields_score_zero(self, tmp_path):
+        queries = [QueryEntry(query="shoes", type="broad")]
+        llm_client = Mock(spec=LLMClient)
+        llm_client.acomplete.side_effect = RuntimeError("API down")
+        backend = FileBackend(output_dir=str(tmp_path))
 
-        metric_names = [m.metric_name for m in metrics]
-        assert "ndcg@10" in metric_names
-        assert "mrr" in metric_names
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            backend,
+            use_async=True,
+        )
 
-        assert len(corrections) == 0
-        llm_client.submit_batch.assert_called_once()
+        assert len(judgments) == 3
+        assert all(j.score == 0 for j in judgments)
+        assert all("API down" in j.reasoning for j in judgments)
+        llm_client.complete.assert_not_called()
 
-    def test_batch_zero_requests(self, tmp_path):
-        """All adapters fail → empty judgments, zero-filled metrics."""
-        queries = [QueryEntry(query="error query", type="broad")]
+    def test_async_corrections_judged(self, tmp_path):
+        queries = [QueryEntry(query=f"qeury {i}", type="broad") for i in range(3)]
 
-        def failing_adapter(query: str):
-            raise RuntimeError("API down")
+        def adapter(query: str) -> SearchResponse:
+            return SearchResponse(
+                results=[
+                    SearchResult(
+                        product_id=f"SKU-{i}",
+                        title=f"Result {i} for {query}",
+                        description="d",
+                        category="c",
+                        price=1.0,
+                        position=i,
+                    )
+                    for i in range(2)
+                ],
+                corrected_query=query.replace("qeury", "query"),
+            )
 
-        config = ExperimentConfig(
-            name="test-batch",
-            adapter_path="test.py",
-            llm_model="test",
-        )
-        llm_client = _make_mock_batch_llm_client([])
+        llm_client = _make_keyed_llm_client(delay=0.005)
         backend = FileBackend(output_dir=str(tmp_path))
 
-        judgments, checks, metrics, corrections = run_batch_evaluation(
+        _, _, _, corrections = run_evaluation(
             queries,
-            failing_adapter,
-            config,
+            adapter,
+            self._config(),
             llm_client,
             backend,
-            poll_interval=0,
+            concurrency=3,
+            use_async=True,
         )
 
-        assert len(judgments) == 0
-        llm_client.submit_batch.assert_not_called()
+        assert [c.original_query for c in corrections] == [
+            "qeury 0",
+            "qeury 1",
+            "qeury 2",
+        ]
+        assert all(c.verdict == "appropriate" for c in corrections)
 
-    def test_batch_partial_failures(self, tmp_path):
-        """Some results error → score=0 judgments."""
-        queries = [QueryEntry(query="running shoes", type="broad")]
-        adapter = _make_mock_adapter()
-        config = ExperimentConfig(
-            name="test-batch",
+
+class TestRunEvaluationPrefetch:
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="test-exp",
             adapter_path="test.py",
             llm_model="test-model",
             top_k=3,
         )
 
-        client = Mock(spec=LLMClient)
-        client.supports_batch.return_value = True
-        client.submit_batch.return_value = "batch-1"
-        client.poll_batch.return_value = ("completed", 3, 3)
+    def test_adapter_runs_ahead_of_judging(self, tmp_path, capsys):
+        import threading
 
-        # First result succeeds, second/third fail
-        client.retrieve_batch_results.return_value = [
-            BatchResult(
-                custom_id="rel-0-0",
-                response=LLMResponse(
-                    content="SCORE: 3\nATTRIBUTES: match\nREASONING: Good",
-                    model="test",
-                    input_tokens=100,
-                    output_tokens=50,
-                ),
-            ),
-            BatchResult(
-                custom_id="rel-0-1",
-                response=None,
-                error="Rate limit exceeded",
-            ),
-            BatchResult(
-                custom_id="rel-0-2",
-                response=None,
-                error="Server error",
-            ),
-        ]
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(4)]
+        base_adapter = _make_mock_adapter()
+        fetched_q1 = threading.Event()
+        fetch_threads: set[str] = set()
 
+        def adapter(query: str) -> list[SearchResult]:
+            fetch_threads.add(threading.current_thread().name)
+            if query == "query 1":
+                fetched_q1.set()
+            return base_adapter(query)
+
+        llm_client = _make_keyed_llm_client()
+        keyed_complete = llm_client.complete.side_effect
+        overlapped: list[bool] = []
+
+        def complete(system_prompt, user_prompt, **kwargs):
+            if "for query 0" in user_prompt and not overlapped:
+                # Judging query 0 must not block the adapter for query 1
+                overlapped.append(fetched_q1.wait(timeout=5))
+            return keyed_complete(system_prompt, user_prompt, **kwargs)
+
+        llm_client.complete.side_effect = complete
         backend = FileBackend(output_dir=str(tmp_path))
 
-        judgments, checks, metrics, corrections = run_batch_evaluation(
+        judgments, _, metrics, _ = run_evaluation(
             queries,
             adapter,
-            config,
-            client,
+            self._config(),
+            llm_client,
             backend,
-            poll_interval=0,
+            prefetch=2,
         )
 
-        assert len(judgments) == 3
-        assert judgments[0].score == 3
-        assert judgments[1].score == 0
-        assert "Rate limit" in judgments[1].reasoning
-        assert judgments[2].score == 0
-
-    def test_batch_with_corrections(self, tmp_path):
-        """Verify two separate batches submitted when corrections exist."""
-        queries = [QueryEntry(query="runnign shoes", type="broad")]
+        assert overlapped == [True]
+        assert all(name.startswith("veritail-fetch") for name in fetch_threads)
+        expected = [(qi, f"SKU-{r}") for qi in range(4) for r in range(3)]
+        assert [
+            (j.metadata["query_index"], j.product.product_id) for j in judgments
+        ] == expected
+        ndcg = next(m for m in metrics if m.metric_name == "ndcg@10")
+        assert len(ndcg.per_query) == 4
+        out = capsys.readouterr().out
+        assert "Pipeline:" in out
+        assert "queue depth" in out
 
-        def adapter(query: str) -> SearchResponse:
-            return SearchResponse(
-                results=[
-                    SearchResult(
-                        product_id="SKU-1",
-                        title="Running Shoes",
-                        description="Great shoes",
-                        category="Shoes",
-                        price=100.0,
-                        position=0,
-                    )
-                ],
-                corrected_query="running shoes",
-            )
+    def test_prefetch_with_concurrent_judging_matches_sequential(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(6)]
 
-        config = ExperimentConfig(
-            name="test-batch",
-            adapter_path="test.py",
-            llm_model="test-model",
-            top_k=3,
+        seq, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path / "seq")),
         )
-        responses = [
-            # Relevance judgment
-            "SCORE: 3\nATTRIBUTES: match\nREASONING: Perfect",
-            # Correction judgment
-            "VERDICT: appropriate\nREASONING: Spelling fix.",
+        piped, _, _, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(delay=0.005),
+            FileBackend(output_dir=str(tmp_path / "piped")),
+            concurrency=4,
+            prefetch=3,
+        )
+
+        assert [(j.query, j.product.product_id, j.score) for j in piped] == [
+            (j.query, j.product.product_id, j.score) for j in seq
         ]
-        llm_client = _make_mock_batch_llm_client(responses)
-        backend = FileBackend(output_dir=str(tmp_path))
+
+    def test_prefetched_adapter_errors_are_skipped(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(3)]
+        base_adapter = _make_mock_adapter()
+
+        def adapter(query: str) -> list[SearchResult]:
+            if query == "query 1":
+                raise ConnectionError("search down")
+            return base_adapter(query)
+
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            adapter,
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path)),
+            prefetch=2,
+        )
+
+        assert sorted({j.metadata["query_index"] for j in judgments}) == [0, 2]
+
+    def test_prefetch_skips_completed_queries_on_resume(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(3)]
+        backend = FileBackend(output_dir=str(tmp_path))
+        run_evaluation(
+            queries[:1],
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            backend,
+        )
+
+        seen: list[str] = []
+        base_adapter = _make_mock_adapter()
+
+        def adapter(query: str) -> list[SearchResult]:
+            seen.append(query)
+            return base_adapter(query)
+
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            adapter,
+            self._config(),
+            _make_keyed_llm_client(),
+            backend,
+            resume=True,
+            prefetch=2,
+        )
+
+        assert sorted(seen) == ["query 1", "query 2"]
+        assert len(judgments) == 9
+
+
+class TestStreamingClassification:
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="test-exp",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+
+    def _client(self, classify_hook=None) -> Mock:
+        """Keyed judge client that also answers classification prompts."""
+        import threading
+
+        client = _make_keyed_llm_client()
+        keyed_complete = client.complete.side_effect
+        lock = threading.Lock()
+        client.state["classified"] = []
+
+        def complete(system_prompt, user_prompt, **kwargs):
+            if user_prompt.startswith("Query: "):
+                query = user_prompt[len("Query: ") :]
+                if classify_hook is not None:
+                    classify_hook(query)
+                with lock:
+                    client.state["classified"].append(query)
+                return LLMResponse(
+                    content="QUERY_TYPE: navigational",
+                    model="test",
+                    input_tokens=5,
+                    output_tokens=2,
+                )
+            return keyed_complete(system_prompt, user_prompt, **kwargs)
+
+        client.complete.side_effect = complete
+        return client
+
+    def test_judging_starts_before_prepass_finishes(self, tmp_path):
+        import threading
+
+        queries = [QueryEntry(query=f"query {i}") for i in range(4)]
+        judging_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def classify_hook(query: str) -> None:
+            if query == "query 3":
+                # The last classification waits for judging to begin
+                overlapped.append(judging_started.wait(timeout=5))
+
+        llm_client = self._client(classify_hook)
+        keyed = llm_client.complete.side_effect
+
+        def complete(system_prompt, user_prompt, **kwargs):
+            if "**Title**" in user_prompt:
+                judging_started.set()
+            return keyed(system_prompt, user_prompt, **kwargs)
+
+        llm_client.complete.side_effect = complete
+
+        judgments, _, metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            classification_concurrency=2,
+        )
+
+        assert overlapped == [True]
+        assert sorted(llm_client.state["classified"]) == [
+            f"query {i}" for i in range(4)
+        ]
+        assert all(q.type == "navigational" for q in queries)
+        assert all(j.query_type == "navigational" for j in judgments)
+        assert [j.metadata["query_index"] for j in judgments[::3]] == [0, 1, 2, 3]
+        ndcg = next(m for m in metrics if m.metric_name == "ndcg@10")
+        assert set(ndcg.by_query_type) == {"navigational"}
+
+    def test_resumed_queries_are_still_classified(self, tmp_path):
+        backend = FileBackend(output_dir=str(tmp_path))
+        first = [QueryEntry(query="query 0", type="broad")]
+        run_evaluation(
+            first,
+            _make_mock_adapter(),
+            self._config(),
+            self._client(),
+            backend,
+        )
+
+        queries = [QueryEntry(query=f"query {i}") for i in range(3)]
+        llm_client = self._client()
+        judgments, _, metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            backend,
+            resume=True,
+            classification_concurrency=3,
+        )
+
+        assert sorted(llm_client.state["classified"]) == [
+            "query 0",
+            "query 1",
+            "query 2",
+        ]
+        assert all(q.type == "navigational" for q in queries)
+        assert len(judgments) == 9
+
+
+def _make_listwise_llm_client(skip_last: bool = False) -> Mock:
+    """Mock client that answers listwise prompts with RESULT blocks.
+
+    With *skip_last* the final product is left out of every listwise answer,
+    so the pipeline has to fall back to a pointwise call for it.  Pointwise
+    prompts are scored like :func:`_make_keyed_llm_client`.
+    """
+    keyed = _make_keyed_llm_client()
+
+    def complete(system_prompt, user_prompt, **kwargs):
+        if "### Result 1" not in user_prompt:
+            return keyed.complete(system_prompt, user_prompt, **kwargs)
+        titles = user_prompt.split("**Title**: Result ")[1:]
+        if skip_last:
+            titles = titles[:-1]
+        blocks = [
+            f"RESULT {i}\nSCORE: {3 - int(t[0])}\nATTRIBUTES: match\nREASONING: ok"
+            for i, t in enumerate(titles, start=1)
+        ]
+        return LLMResponse(
+            content="\n\n".join(blocks),
+            model="test",
+            input_tokens=30,
+            output_tokens=15,
+        )
+
+    async def acomplete(system_prompt, user_prompt, **kwargs):
+        return complete(system_prompt, user_prompt, **kwargs)
+
+    client = Mock(spec=LLMClient)
+    client.complete.side_effect = complete
+    client.acomplete.side_effect = acomplete
+    return client
+
+
+class TestListwiseJudging:
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="test-exp",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+
+    def _listwise_calls(self, client: Mock, method: str = "complete") -> int:
+        return sum(
+            "### Result 1" in c.args[1] for c in getattr(client, method).call_args_list
+        )
+
+    def test_one_call_per_query(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(3)]
+        llm_client = _make_listwise_llm_client()
+
+        judgments, _checks, metrics, _corr = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            listwise=True,
+        )
+
+        assert llm_client.complete.call_count == 3
+        assert [j.score for j in judgments] == [3, 2, 1] * 3
+        assert all(j.metadata["listwise"] for j in judgments)
+        assert [j.metadata["query_index"] for j in judgments] == sorted([0, 1, 2] * 3)
+        _, _, pointwise_metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path / "pointwise")),
+        )
+        assert [m.value for m in metrics] == [m.value for m in pointwise_metrics]
+
+    def test_missing_positions_fall_back_to_pointwise(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        llm_client = _make_listwise_llm_client(skip_last=True)
+
+        judgments, _checks, _metrics, _corr = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            listwise=True,
+        )
+
+        assert [j.score for j in judgments] == [3, 2, 1]
+        assert [j.metadata.get("listwise", False) for j in judgments] == [
+            True,
+            True,
+            False,
+        ]
+        assert self._listwise_calls(llm_client) == 1
+        assert llm_client.complete.call_count == 2
+
+    def test_concurrent_and_async_listwise(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(4)]
+
+        for use_async in (False, True):
+            llm_client = _make_listwise_llm_client(skip_last=True)
+            judgments, _checks, _metrics, _corr = run_evaluation(
+                queries,
+                _make_mock_adapter(),
+                self._config(),
+                llm_client,
+                FileBackend(output_dir=str(tmp_path / str(use_async))),
+                concurrency=3,
+                use_async=use_async,
+                listwise=True,
+            )
+
+            assert [j.score for j in judgments] == [3, 2, 1] * 4
+            method = "acomplete" if use_async else "complete"
+            assert self._listwise_calls(llm_client, method) == 4
+
+    def test_batch_listwise_with_pointwise_fallback(self, tmp_path):
+        queries = [QueryEntry(query="running shoes", type="broad")]
+        llm_client = _make_mock_batch_llm_client(
+            ["RESULT 1\nSCORE: 3\nREASONING: a\n\nRESULT 2\nSCORE: 2\nREASONING: b"]
+        )
+        llm_client.complete.return_value = LLMResponse(
+            content="SCORE: 1\nATTRIBUTES: n/a\nREASONING: fallback",
+            model="test",
+            input_tokens=10,
+            output_tokens=5,
+        )
+
+        judgments, _checks, _metrics, _corr = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            listwise=True,
+        )
+
+        submitted = llm_client.submit_batch.call_args.args[0]
+        assert [r.custom_id for r in submitted] == ["list-0"]
+        assert [j.score for j in judgments] == [3, 2, 1]
+        assert judgments[2].reasoning == "fallback"
+        llm_client.complete.assert_called_once()
+
+    def test_batch_listwise_missing_positions_in_follow_up_batch(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(2)]
+        llm_client = _make_mock_batch_llm_client(
+            ["RESULT 1\nSCORE: 3\nREASONING: a"] * 2
+            + ["SCORE: 1\nATTRIBUTES: n/a\nREASONING: follow-up"] * 4
+        )
+
+        judgments, _checks, _metrics, _corr = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            listwise=True,
+            sync_retry_limit=1,
+        )
+
+        follow_up = llm_client.submit_batch.call_args_list[1].args[0]
+        assert [r.custom_id for r in follow_up] == [
+            "rel-0-1",
+            "rel-0-2",
+            "rel-1-1",
+            "rel-1-2",
+        ]
+        assert [j.score for j in judgments] == [3, 1, 1] * 2
+        assert [j.metadata.get("retry_round") for j in judgments] == [None, 1, 1] * 2
+        llm_client.complete.assert_not_called()
+
+    def test_batch_listwise_missing_positions_judged_without_retries(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        llm_client = _make_mock_batch_llm_client(["RESULT 1\nSCORE: 3\nREASONING: a"])
+        llm_client.complete.return_value = LLMResponse(
+            content="SCORE: 1\nATTRIBUTES: n/a\nREASONING: fallback",
+            model="test",
+            input_tokens=10,
+            output_tokens=5,
+        )
+
+        judgments, _checks, _metrics, _corr = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            listwise=True,
+            retry_rounds=0,
+            sync_retry_limit=0,
+        )
+
+        assert llm_client.submit_batch.call_count == 1
+        assert llm_client.complete.call_count == 2
+        assert [j.score for j in judgments] == [3, 1, 1]
+
+
+class TestJudgmentCache:
+    def _config(self, name: str = "test-exp") -> ExperimentConfig:
+        return ExperimentConfig(
+            name=name,
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+
+    def test_rerun_is_served_from_cache(self, tmp_path):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(2)]
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+
+        first_client = _make_keyed_llm_client()
+        first, _, first_metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-1"),
+            first_client,
+            FileBackend(output_dir=str(tmp_path)),
+            judgment_cache=cache,
+        )
+        second_client = _make_keyed_llm_client()
+        second, _, second_metrics, _ = run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-2"),
+            second_client,
+            FileBackend(output_dir=str(tmp_path)),
+            concurrency=3,
+            judgment_cache=cache,
+        )
+
+        assert first_client.complete.call_count == 6
+        second_client.complete.assert_not_called()
+        assert [j.score for j in second] == [j.score for j in first]
+        assert all(j.metadata["cached"] for j in second)
+        assert [m.value for m in second_metrics] == [m.value for m in first_metrics]
+        assert (cache.hits, cache.misses) == (6, 6)
+        cache.close()
+
+    def test_changed_model_misses(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config(),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path)),
+            judgment_cache=cache,
+        )
+        other = ExperimentConfig(
+            name="other", adapter_path="test.py", llm_model="other-model", top_k=3
+        )
+        client = _make_keyed_llm_client()
+        run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            other,
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            judgment_cache=cache,
+        )
+
+        assert client.complete.call_count == 3
+        cache.close()
+
+    def test_batch_submits_only_uncached_requests(self, tmp_path):
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        responses = [
+            "SCORE: 3\nATTRIBUTES: match\nREASONING: a",
+            "SCORE: 2\nATTRIBUTES: match\nREASONING: b",
+            "SCORE: 1\nATTRIBUTES: match\nREASONING: c",
+        ]
+        first_client = _make_mock_batch_llm_client(responses)
+        run_batch_evaluation(
+            [QueryEntry(query="query 0", type="broad")],
+            _make_mock_adapter(),
+            self._config("night-1"),
+            first_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+        assert len(cache) == 3
+
+        second_client = _make_mock_batch_llm_client(responses)
+        judgments, _, _, _ = run_batch_evaluation(
+            [
+                QueryEntry(query="query 0", type="broad"),
+                QueryEntry(query="query 1", type="broad"),
+            ],
+            _make_mock_adapter(),
+            self._config("night-2"),
+            second_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+
+        submitted = second_client.submit_batch.call_args.args[0]
+        assert [r.custom_id for r in submitted] == ["rel-1-0", "rel-1-1", "rel-1-2"]
+        assert [j.score for j in judgments] == [3, 2, 1, 3, 2, 1]
+        assert [j.metadata.get("cached", False) for j in judgments] == [
+            True,
+            True,
+            True,
+            False,
+            False,
+            False,
+        ]
+        cache.close()
+
+    def test_batch_fully_cached_skips_submission(self, tmp_path):
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        queries = [QueryEntry(query="query 0", type="broad")]
+        responses = ["SCORE: 2\nATTRIBUTES: match\nREASONING: ok"] * 3
+        run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-1"),
+            _make_mock_batch_llm_client(responses),
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+
+        client = _make_mock_batch_llm_client(responses)
+        judgments, _, metrics, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-2"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+
+        client.submit_batch.assert_not_called()
+        client.iter_batch_results.assert_not_called()
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert any(m.metric_name == "ndcg@10" for m in metrics)
+        assert load_checkpoint(str(tmp_path), "night-2") is None
+        cache.close()
+
+    def test_batch_resume_answers_cached_pairs_from_cache(self, tmp_path):
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+        responses = ["SCORE: 3\nATTRIBUTES: match\nREASONING: ok"] * 3
+        run_batch_evaluation(
+            [QueryEntry(query="query 0", type="broad")],
+            _make_mock_adapter(),
+            self._config("night-1"),
+            _make_mock_batch_llm_client(responses),
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+
+        queries = [
+            QueryEntry(query="query 0", type="broad"),
+            QueryEntry(query="query 1", type="broad"),
+        ]
+        interrupted = _make_mock_batch_llm_client(responses)
+        interrupted.poll_batch.side_effect = KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            run_batch_evaluation(
+                queries,
+                _make_mock_adapter(),
+                self._config("night-2"),
+                interrupted,
+                FileBackend(output_dir=str(tmp_path)),
+                poll_interval=0,
+                output_dir=str(tmp_path),
+                judgment_cache=cache,
+            )
+        checkpoint = load_checkpoint(str(tmp_path), "night-2")
+        assert checkpoint is not None
+        assert len(checkpoint.request_context) == 6
+
+        resumed = Mock(spec=LLMClient)
+        resumed.poll_batch.return_value = ("completed", 3, 3)
+        resumed.iter_batch_results.return_value = [
+            BatchResult(
+                custom_id=f"rel-1-{i}",
+                response=LLMResponse(
+                    content="SCORE: 1\nATTRIBUTES: match\nREASONING: new",
+                    model="test",
+                    input_tokens=10,
+                    output_tokens=5,
+                ),
+            )
+            for i in range(3)
+        ]
+        judgments, _, _, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-2"),
+            resumed,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            resume=True,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+        )
+
+        assert [j.score for j in judgments] == [3, 3, 3, 1, 1, 1]
+        assert all(j.metadata.get("cached") for j in judgments[:3])
+        cache.close()
+
+    def test_batch_listwise_resume_answers_cached_queries_from_cache(self, tmp_path):
+        cache = JudgmentCache(tmp_path / "cache.sqlite")
+
+        def answer(score: int) -> str:
+            return "\n\n".join(
+                f"RESULT {i}\nSCORE: {score}\nATTRIBUTES: match\nREASONING: ok"
+                for i in range(1, 4)
+            )
+
+        run_batch_evaluation(
+            [QueryEntry(query="query 0", type="broad")],
+            _make_mock_adapter(),
+            self._config("night-1"),
+            _make_mock_batch_llm_client([answer(3)]),
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+            listwise=True,
+        )
+        assert len(cache) == 1
+
+        queries = [
+            QueryEntry(query="query 0", type="broad"),
+            QueryEntry(query="query 1", type="broad"),
+        ]
+        interrupted = _make_mock_batch_llm_client([answer(1)])
+        interrupted.poll_batch.side_effect = KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            run_batch_evaluation(
+                queries,
+                _make_mock_adapter(),
+                self._config("night-2"),
+                interrupted,
+                FileBackend(output_dir=str(tmp_path)),
+                poll_interval=0,
+                output_dir=str(tmp_path),
+                judgment_cache=cache,
+                listwise=True,
+            )
+        submitted = interrupted.submit_batch.call_args.args[0]
+        assert [r.custom_id for r in submitted] == ["list-1"]
+
+        resumed = Mock(spec=LLMClient)
+        resumed.poll_batch.return_value = ("completed", 1, 1)
+        resumed.iter_batch_results.return_value = [
+            BatchResult(
+                custom_id="list-1",
+                response=LLMResponse(
+                    content=answer(1), model="test", input_tokens=10, output_tokens=5
+                ),
+            )
+        ]
+        judgments, _, _, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("night-2"),
+            resumed,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            resume=True,
+            output_dir=str(tmp_path),
+            judgment_cache=cache,
+            listwise=True,
+        )
+
+        # The cached query is not judged again pair by pair
+        resumed.complete.assert_not_called()
+        assert [j.score for j in judgments] == [3, 3, 3, 1, 1, 1]
+        assert all(j.metadata.get("cached") for j in judgments[:3])
+        cache.close()
+
+
+def _make_shifted_adapter(ids: list[int]):
+    """Adapter returning the products of :func:`_make_mock_adapter` in *ids* order."""
+
+    def adapter(query: str) -> list[SearchResult]:
+        return [
+            SearchResult(
+                product_id=f"SKU-{i}",
+                title=f"Result {i} for {query}",
+                description=f"Description for result {i}",
+                category="Shoes > Running",
+                price=100.0 + i * 10,
+                position=pos,
+                attributes={"color": "black"},
+            )
+            for pos, i in enumerate(ids)
+        ]
+
+    return adapter
+
+
+class TestDualDedupe:
+    def _configs(self) -> tuple[ExperimentConfig, ExperimentConfig]:
+        config_a = ExperimentConfig(
+            name="config-a", adapter_path="a.py", llm_model="test-model", top_k=3
+        )
+        config_b = ExperimentConfig(
+            name="config-b", adapter_path="b.py", llm_model="test-model", top_k=3
+        )
+        return config_a, config_b
+
+    def test_shared_pairs_judged_once(self, tmp_path, capsys):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(2)]
+        config_a, config_b = self._configs()
+        llm_client = _make_keyed_llm_client()
+
+        result = run_dual_evaluation(
+            queries,
+            _make_shifted_adapter([0, 1, 2]),
+            config_a,
+            _make_shifted_adapter([2, 3, 1]),
+            config_b,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+        )
+        judgments_a, judgments_b = result[0], result[1]
+
+        # 6 pairs for A, only SKU-3 is new for B
+        assert llm_client.complete.call_count == 8
+        for call in llm_client.complete.call_args_list:
+            assert "Position in Results" not in call.args[1]
+        assert [j.product.product_id for j in judgments_b[:3]] == [
+            "SKU-2",
+            "SKU-3",
+            "SKU-1",
+        ]
+        assert [j.product.position for j in judgments_b[:3]] == [0, 1, 2]
+        assert [j.score for j in judgments_b[:3]] == [1, 0, 2]
+        assert [j.metadata.get("deduplicated", False) for j in judgments_b[:3]] == [
+            True,
+            False,
+            True,
+        ]
+        assert all(j.experiment == "config-b" for j in judgments_b)
+        assert not any(j.metadata.get("deduplicated") for j in judgments_a)
+        assert "Deduplicated 4 of 12 judgments" in capsys.readouterr().out
+
+    def test_dedupe_can_be_disabled(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        config_a, config_b = self._configs()
+        llm_client = _make_keyed_llm_client()
+
+        run_dual_evaluation(
+            queries,
+            _make_shifted_adapter([0, 1, 2]),
+            config_a,
+            _make_shifted_adapter([0, 1, 2]),
+            config_b,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            dedupe=False,
+        )
+
+        assert llm_client.complete.call_count == 6
+        assert "Position in Results" in llm_client.complete.call_args.args[1]
+
+    def test_batch_submits_only_unshared_pairs_for_second_config(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        config_a, config_b = self._configs()
+        llm_client = _make_mock_batch_llm_client(
+            [
+                "SCORE: 3\nATTRIBUTES: match\nREASONING: a",
+                "SCORE: 2\nATTRIBUTES: match\nREASONING: b",
+                "SCORE: 1\nATTRIBUTES: match\nREASONING: c",
+                "SCORE: 0\nATTRIBUTES: mismatch\nREASONING: d",
+            ]
+        )
+
+        result = run_dual_batch_evaluation(
+            queries,
+            _make_shifted_adapter([0, 1, 2]),
+            config_a,
+            _make_shifted_adapter([2, 3, 1]),
+            config_b,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+        )
+        judgments_b = result[1]
+
+        # One merged batch; SKU-1 and SKU-2 are judged once for both
+        (merged_batch,) = [c.args[0] for c in llm_client.submit_batch.call_args_list]
+        assert [r.custom_id for r in merged_batch] == [
+            "a-rel-0-0",
+            "a-rel-0-1",
+            "a-rel-0-2",
+            "b-rel-0-1",
+        ]
+        assert [j.score for j in judgments_b] == [1, 0, 2]
+        assert [j.metadata.get("deduplicated", False) for j in judgments_b] == [
+            True,
+            False,
+            True,
+        ]
+
+
+class TestBaselineReuse:
+    def _config(self, name: str, model: str = "test-model") -> ExperimentConfig:
+        return ExperimentConfig(
+            name=name, adapter_path="test.py", llm_model=model, top_k=3
+        )
+
+    def _baseline(self, tmp_path, name: str = "baseline"):
+        return index_baseline(FileBackend(output_dir=str(tmp_path)).get_judgments(name))
+
+    def test_unchanged_pairs_reused_from_baseline(self, tmp_path, capsys):
+        queries = [QueryEntry(query=f"query {i}", type="broad") for i in range(2)]
+        run_evaluation(
+            queries,
+            _make_shifted_adapter([0, 1, 2]),
+            self._config("baseline"),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path)),
+        )
+        baseline = self._baseline(tmp_path)
+        assert len(baseline) == 6
+
+        client = _make_keyed_llm_client()
+        judgments, _, _, _ = run_evaluation(
+            queries,
+            _make_shifted_adapter([2, 3, 1]),
+            self._config("candidate"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            concurrency=2,
+            baseline=baseline,
+        )
+
+        # Only SKU-3 is new for each query
+        assert client.complete.call_count == 2
+        assert [j.score for j in judgments[:3]] == [1, 0, 2]
+        assert [j.product.position for j in judgments[:3]] == [0, 1, 2]
+        assert [j.metadata.get("reused_from") for j in judgments[:3]] == [
+            "baseline",
+            None,
+            "baseline",
+        ]
+        assert all(j.experiment == "candidate" for j in judgments)
+        assert judgments[0].metadata["input_tokens"] == 0
+        # Fresh and reused judgments can seed the next incremental run
+        assert len(self._baseline(tmp_path, "candidate")) == 6
+        assert "Baseline: reused 4 of 6 judgments" in capsys.readouterr().out
+
+    def test_changed_content_or_model_is_judged_again(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("baseline"),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path)),
+        )
+        baseline = self._baseline(tmp_path)
+
+        def repriced(query: str) -> list[SearchResult]:
+            results = _make_mock_adapter()(query)
+            results[0].price = 1.0
+            return results
+
+        client = _make_keyed_llm_client()
+        run_evaluation(
+            queries,
+            repriced,
+            self._config("repriced"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            baseline=baseline,
+        )
+        assert client.complete.call_count == 1
+
+        client = _make_keyed_llm_client()
+        run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("other-model", model="other-model"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            baseline=baseline,
+        )
+        assert client.complete.call_count == 3
+
+    def test_failed_and_unhashed_judgments_are_not_indexed(self):
+        def judgment(**metadata) -> JudgmentRecord:
+            return JudgmentRecord(
+                query="q",
+                product=SearchResult(
+                    product_id="SKU-0",
+                    title="t",
+                    description="d",
+                    category="c",
+                    price=1.0,
+                    position=0,
+                ),
+                score=0,
+                reasoning="",
+                model="test-model",
+                experiment="baseline",
+                metadata=metadata,
+            )
+
+        indexed = index_baseline(
+            [
+                judgment(pair_hash="ok"),
+                judgment(pair_hash="failed", error="timeout"),
+                judgment(),
+            ]
+        )
+        assert list(indexed) == ["ok"]
+
+    def test_batch_submits_only_pairs_missing_from_baseline(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        run_batch_evaluation(
+            queries,
+            _make_shifted_adapter([0, 1, 2]),
+            self._config("baseline"),
+            _make_mock_batch_llm_client(
+                [
+                    "SCORE: 3\nATTRIBUTES: match\nREASONING: a",
+                    "SCORE: 2\nATTRIBUTES: match\nREASONING: b",
+                    "SCORE: 1\nATTRIBUTES: match\nREASONING: c",
+                ]
+            ),
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+        )
+        baseline = self._baseline(tmp_path)
+
+        client = _make_mock_batch_llm_client(
+            ["SCORE: 0\nATTRIBUTES: mismatch\nREASONING: d"]
+        )
+        judgments, _, _, _ = run_batch_evaluation(
+            queries,
+            _make_shifted_adapter([2, 3, 1]),
+            self._config("candidate"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            baseline=baseline,
+        )
+
+        submitted = client.submit_batch.call_args.args[0]
+        assert [r.custom_id for r in submitted] == ["rel-0-1"]
+        assert [j.score for j in judgments] == [1, 0, 2]
+        assert [j.metadata.get("reused_from") for j in judgments] == [
+            "baseline",
+            None,
+            "baseline",
+        ]
+        assert "pair_hash" in judgments[1].metadata
+
+    def test_batch_fully_reused_skips_submission(self, tmp_path):
+        queries = [QueryEntry(query="query 0", type="broad")]
+        run_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("baseline"),
+            _make_keyed_llm_client(),
+            FileBackend(output_dir=str(tmp_path)),
+        )
+
+        client = _make_mock_batch_llm_client([])
+        judgments, _, metrics, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            self._config("candidate"),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            baseline=self._baseline(tmp_path),
+        )
+
+        client.submit_batch.assert_not_called()
+        assert [j.score for j in judgments] == [3, 2, 1]
+        assert any(m.metric_name == "ndcg@10" for m in metrics)
+
+
+_GOOD = "SCORE: 2\nATTRIBUTES: match\nREASONING: ok"
+
+
+class TestBatchFollowUp:
+    """Failed batch requests are retried in follow-up batches or synchronously."""
+
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="retried", adapter_path="test.py", llm_model="test-model"
+        )
+
+    def _client(self, rounds: list[dict[str, str | None]]) -> Mock:
+        """Batch N answers custom_id -> content from ``rounds[N]``; None fails."""
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.poll_batch.return_value = ("completed", 0, 0)
+        submitted: list[list[BatchRequest]] = []
+
+        def submit_batch(requests):
+            submitted.append(list(requests))
+            return f"batch-{len(submitted)}"
+
+        def iter_batch_results(batch_id):
+            answers = rounds[int(batch_id.split("-")[1]) - 1]
+            for custom_id, content in answers.items():
+                yield BatchResult(
+                    custom_id=custom_id,
+                    response=None
+                    if content is None
+                    else LLMResponse(
+                        content=content, model="test", input_tokens=1, output_tokens=1
+                    ),
+                    error="Request errored" if content is None else None,
+                )
+
+        client.submit_batch.side_effect = submit_batch
+        client.iter_batch_results.side_effect = iter_batch_results
+        client.complete.return_value = LLMResponse(
+            content=_GOOD, model="test", input_tokens=1, output_tokens=1
+        )
+        client.submitted = submitted
+        return client
+
+    def _run(self, client, tmp_path, **kwargs):
+        judgments, _, _, _ = run_batch_evaluation(
+            [QueryEntry(query="shoes", type="broad")],
+            _make_mock_adapter(),
+            self._config(),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            **kwargs,
+        )
+        return judgments
+
+    def test_failed_requests_resubmitted_in_follow_up_batch(self, tmp_path):
+        client = self._client(
+            [
+                {"rel-0-0": _GOOD, "rel-0-1": None, "rel-0-2": "garbage"},
+                {"rel-0-1": _GOOD, "rel-0-2": _GOOD},
+            ]
+        )
+
+        judgments = self._run(client, tmp_path, sync_retry_limit=0)
+
+        assert [len(reqs) for reqs in client.submitted] == [3, 2]
+        assert [r.custom_id for r in client.submitted[1]] == ["rel-0-1", "rel-0-2"]
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert [j.metadata.get("retry_round") for j in judgments] == [None, 1, 1]
+        client.complete.assert_not_called()
+
+    def test_stops_after_retry_rounds(self, tmp_path):
+        client = self._client(
+            [
+                {"rel-0-0": _GOOD, "rel-0-1": None, "rel-0-2": None},
+                {"rel-0-1": None, "rel-0-2": _GOOD},
+            ]
+        )
+
+        judgments = self._run(client, tmp_path, retry_rounds=1, sync_retry_limit=0)
+
+        assert client.submit_batch.call_count == 2
+        assert "error" in judgments[1].metadata
+        assert judgments[2].metadata["retry_round"] == 1
+
+    def test_few_stragglers_judged_synchronously(self, tmp_path):
+        client = self._client([{"rel-0-0": _GOOD, "rel-0-1": _GOOD}])
+
+        judgments = self._run(client, tmp_path)
+
+        # rel-0-2 never came back; one straggler is below the sync limit
+        assert client.submit_batch.call_count == 1
+        client.complete.assert_called_once()
+        assert judgments[2].score == 2
+        assert judgments[2].metadata["retry_round"] == "sync"
+
+    def test_disabled_records_errors(self, tmp_path):
+        client = self._client([{"rel-0-0": _GOOD, "rel-0-1": None}])
+
+        judgments = self._run(client, tmp_path, retry_rounds=0, sync_retry_limit=0)
+
+        assert client.submit_batch.call_count == 1
+        assert [("error" in j.metadata) for j in judgments] == [False, True, True]
+
+    def test_follow_up_batch_checkpointed_and_resumed(self, tmp_path):
+        client = self._client(
+            [{"rel-0-0": _GOOD, "rel-0-1": None, "rel-0-2": None}, {}]
+        )
+        client.poll_batch.side_effect = lambda batch_id: (
+            ("in_progress", 0, 2) if batch_id == "batch-2" else ("completed", 0, 0)
+        )
+        cancel = threading.Event()
+        submit_batch = client.submit_batch.side_effect
+
+        def submit_then_interrupt(requests):
+            batch_id = submit_batch(requests)
+            if batch_id == "batch-2":
+                cancel.set()  # Ctrl+C while the follow-up batch is running
+            return batch_id
+
+        client.submit_batch.side_effect = submit_then_interrupt
+
+        with pytest.raises(BatchCancelledError):
+            self._run(client, tmp_path, sync_retry_limit=0, cancel_event=cancel)
+
+        saved = load_checkpoint(str(tmp_path), "retried")
+        assert saved is not None
+        assert saved.retry_batch_ids == ["batch-2"]
+
+        resumed = self._client(
+            [
+                {"rel-0-0": _GOOD, "rel-0-1": None, "rel-0-2": None},
+                {"rel-0-1": _GOOD, "rel-0-2": _GOOD},
+            ]
+        )
+        judgments = self._run(resumed, tmp_path, sync_retry_limit=0, resume=True)
+
+        resumed.submit_batch.assert_not_called()
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert load_checkpoint(str(tmp_path), "retried") is None
+
+
+class TestBatchDeadline:
+    """Batches still running at the deadline are finished synchronously."""
+
+    def _client(self, answers: dict[str, str]) -> Mock:
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.submit_batch.return_value = "batch-1"
+        # The batch stops once it is cancelled
+        client.poll_batch.side_effect = lambda batch_id: (
+            "completed" if client.cancel_batch.called else "in_progress",
+            len(answers),
+            3,
+        )
+        client.cancel_batch.return_value = True
+
+        def iter_batch_results(batch_id):
+            for custom_id, content in answers.items():
+                yield BatchResult(
+                    custom_id=custom_id,
+                    response=LLMResponse(
+                        content=content, model="test", input_tokens=1, output_tokens=1
+                    ),
+                )
+
+        client.iter_batch_results.side_effect = iter_batch_results
+        client.complete.return_value = LLMResponse(
+            content=_GOOD, model="test", input_tokens=1, output_tokens=1
+        )
+        return client
+
+    def _run(self, client, tmp_path, **kwargs):
+        kwargs.setdefault("poll_interval", 0)
+        judgments, _, _, _ = run_batch_evaluation(
+            [QueryEntry(query="shoes", type="broad")],
+            _make_mock_adapter(),
+            ExperimentConfig(
+                name="deadline", adapter_path="test.py", llm_model="test-model"
+            ),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            output_dir=str(tmp_path),
+            **kwargs,
+        )
+        return judgments
+
+    def test_deadline_cancels_batch_and_judges_stragglers(self, tmp_path):
+        client = self._client({"rel-0-0": _GOOD})
+
+        judgments = self._run(client, tmp_path, deadline=time.time())
+
+        client.cancel_batch.assert_called_once_with("batch-1")
+        # No follow-up batch once the deadline has passed
+        assert client.submit_batch.call_count == 1
+        assert client.complete.call_count == 2
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert [j.metadata.get("straggler") for j in judgments] == [None, True, True]
+
+    def test_unavailable_partial_results_judged_synchronously(self, tmp_path):
+        client = self._client({})
+        client.iter_batch_results.side_effect = RuntimeError("results not ready")
+
+        judgments = self._run(client, tmp_path, deadline=time.time())
+
+        assert client.complete.call_count == 3
+        assert all(j.metadata.get("straggler") for j in judgments)
+
+    def test_partial_results_read_once_cancellation_finishes(
+        self, tmp_path, monkeypatch
+    ):
+        from veritail import batch_utils
+
+        monkeypatch.setattr(batch_utils, "_CANCEL_POLL_INTERVAL", 0)
+        client = self._client({"rel-0-0": _GOOD, "rel-0-1": _GOOD})
+        statuses = iter(["in_progress", "in_progress", "in_progress", "completed"])
+        client.poll_batch.side_effect = lambda batch_id: (next(statuses), 2, 3)
+        answers = client.iter_batch_results.side_effect
+
+        def iter_batch_results(batch_id):
+            # Results are only readable once the cancellation has finished
+            if client.poll_batch.call_count < 4:
+                raise RuntimeError("batch is still cancelling")
+            return answers(batch_id)
+
+        client.iter_batch_results.side_effect = iter_batch_results
+
+        judgments = self._run(client, tmp_path, deadline=time.time())
+
+        client.cancel_batch.assert_called_once_with("batch-1")
+        client.complete.assert_called_once()
+        assert [j.metadata.get("straggler") for j in judgments] == [None, None, True]
+
+    def test_still_cancelling_after_grace(self, tmp_path, monkeypatch):
+        from veritail import batch_utils
+
+        monkeypatch.setattr(batch_utils, "DEFAULT_CANCEL_GRACE", 0.0)
+        client = self._client({})
+        client.poll_batch.side_effect = None
+        client.poll_batch.return_value = ("in_progress", 1, 3)
+        client.iter_batch_results.side_effect = RuntimeError("results not ready")
+
+        judgments = self._run(client, tmp_path, deadline=time.time())
+
+        client.cancel_batch.assert_called_once_with("batch-1")
+        assert client.complete.call_count == 3
+        assert all(j.metadata.get("straggler") for j in judgments)
+
+    def test_stalled_batch_given_up(self, tmp_path):
+        client = self._client({"rel-0-0": _GOOD, "rel-0-1": _GOOD})
+
+        judgments = self._run(client, tmp_path, poll_interval=0.02, stall_timeout=0.01)
+
+        client.cancel_batch.assert_called_once_with("batch-1")
+        client.complete.assert_called_once()
+        assert judgments[2].metadata["straggler"] is True
+
+    def test_no_deadline_waits_for_completion(self, tmp_path):
+        client = self._client({"rel-0-0": _GOOD, "rel-0-1": _GOOD, "rel-0-2": _GOOD})
+        client.poll_batch.side_effect = [("in_progress", 1, 3), ("completed", 3, 3)]
+
+        self._run(client, tmp_path)
+
+        client.cancel_batch.assert_not_called()
+        client.complete.assert_not_called()
+
+    def test_abandoned_batch_not_polled_on_resume(self, tmp_path):
+        client = self._client({"rel-0-0": _GOOD})
+        client.complete.side_effect = KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            self._run(client, tmp_path, deadline=time.time())
+
+        saved = load_checkpoint(str(tmp_path), "deadline")
+        assert saved is not None
+        assert saved.abandoned_batch_ids == ["batch-1"]
+
+        resumed = self._client({"rel-0-0": _GOOD})
+        judgments = self._run(resumed, tmp_path, resume=True)
+
+        resumed.poll_batch.assert_not_called()
+        resumed.cancel_batch.assert_not_called()
+        assert resumed.complete.call_count == 2
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert load_checkpoint(str(tmp_path), "deadline") is None
+
+
+class TestBatchResultStreaming:
+    def test_judgments_logged_in_chunks_as_results_arrive(self, tmp_path):
+        config = ExperimentConfig(
+            name="streamed", adapter_path="test.py", llm_model="test-model"
+        )
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.submit_batch.return_value = "batch-1"
+        client.poll_batch.return_value = ("completed", 3, 3)
+        backend = Mock(spec=EvalBackend)
+        logged_before: list[int] = []
+
+        def iter_batch_results(batch_id):
+            # Results arrive out of order; full chunks are logged right away
+            for i in (2, 0, 1):
+                logged_before.append(backend.log_judgments.call_count)
+                yield BatchResult(
+                    custom_id=f"rel-0-{i}",
+                    response=LLMResponse(
+                        content=f"SCORE: {i}\nATTRIBUTES: n/a\nREASONING: ok",
+                        model="test",
+                        input_tokens=10,
+                        output_tokens=5,
+                    ),
+                )
+
+        client.iter_batch_results.side_effect = iter_batch_results
+        logged: list[list[str]] = []
+        backend.log_judgments.side_effect = lambda judgments: logged.append(
+            [j.product.product_id for j in judgments]
+        )
+
+        with patch("veritail.pipeline._LOG_CHUNK_SIZE", 2):
+            judgments, _, _, _ = run_batch_evaluation(
+                [QueryEntry(query="shoes", type="broad")],
+                _make_mock_adapter(),
+                config,
+                client,
+                backend,
+                poll_interval=0,
+                output_dir=str(tmp_path),
+            )
+
+        assert logged_before == [0, 0, 1]
+        assert logged == [["SKU-2", "SKU-0"], ["SKU-1"]]
+        backend.log_judgment.assert_not_called()
+        # The returned judgments keep the request order
+        assert [j.product.product_id for j in judgments] == ["SKU-0", "SKU-1", "SKU-2"]
+        assert [j.score for j in judgments] == [0, 1, 2]
+
+
+class TestBatchSharding:
+    """Batches beyond the provider's per-batch limits are split into shards."""
+
+    def _config(self) -> ExperimentConfig:
+        return ExperimentConfig(
+            name="sharded", adapter_path="test.py", llm_model="test-model"
+        )
+
+    def _client(self, statuses: dict[str, str] | None = None) -> Mock:
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.max_batch_requests = 2
+        client.max_batch_bytes = None
+        submitted: dict[str, list[BatchRequest]] = {}
+
+        def submit_batch(requests):
+            # Shard ids follow the first request, independent of thread order
+            batch_id = f"batch-{requests[0].custom_id}"
+            submitted[batch_id] = list(requests)
+            return batch_id
+
+        def poll_batch(batch_id):
+            return ((statuses or {}).get(batch_id, "completed"), 0, 0)
+
+        def iter_batch_results(batch_id):
+            return [
+                BatchResult(
+                    custom_id=req.custom_id,
+                    response=LLMResponse(
+                        content="SCORE: 2\nATTRIBUTES: match\nREASONING: ok",
+                        model="test",
+                        input_tokens=10,
+                        output_tokens=5,
+                    ),
+                )
+                for req in submitted[batch_id]
+            ]
+
+        client.submit_batch.side_effect = submit_batch
+        client.poll_batch.side_effect = poll_batch
+        client.iter_batch_results.side_effect = iter_batch_results
+        client.submitted = submitted
+        return client
+
+    def test_requests_split_and_results_merged(self, tmp_path):
+        client = self._client()
+        judgments, _, _, _ = run_batch_evaluation(
+            [QueryEntry(query="shoes", type="broad")],
+            _make_mock_adapter(),
+            self._config(),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+        )
+
+        assert client.submit_batch.call_count == 2
+        assert sorted(len(reqs) for reqs in client.submitted.values()) == [1, 2]
+        assert client.iter_batch_results.call_count == 2
+        assert [j.score for j in judgments] == [2, 2, 2]
+        assert load_checkpoint(str(tmp_path), "sharded") is None
+
+    def test_failed_shard_clears_checkpoint(self, tmp_path):
+        client = self._client(statuses={"batch-rel-0-2": "failed"})
+        client.batch_error_message.return_value = None
+        with pytest.raises(RuntimeError, match="batch-rel-0-2 failed"):
+            run_batch_evaluation(
+                [QueryEntry(query="shoes", type="broad")],
+                _make_mock_adapter(),
+                self._config(),
+                client,
+                FileBackend(output_dir=str(tmp_path)),
+                poll_interval=0,
+                output_dir=str(tmp_path),
+            )
+        assert load_checkpoint(str(tmp_path), "sharded") is None
+
+    def test_resume_polls_only_unfinished_shards(self, tmp_path):
+        from veritail.checkpoint import serialize_request_context
+
+        results = _make_mock_adapter()("shoes")
+        req_ctx = {
+            f"rel-0-{i}": ("shoes", r, "broad", None, [], 0, None)
+            for i, r in enumerate(results)
+        }
+        save_checkpoint(
+            str(tmp_path),
+            "sharded",
+            BatchCheckpoint(
+                batch_id="batch-rel-0-0",
+                experiment_name="sharded",
+                phase="relevance",
+                request_context=serialize_request_context(req_ctx),
+                checks=[],
+                correction_entries=[],
+                batch_ids=["batch-rel-0-0", "batch-rel-0-2"],
+                completed_batch_ids=["batch-rel-0-0"],
+                gemini_custom_id_orders={"batch-rel-0-2": ["rel-0-2"]},
+            ),
+        )
+        client = self._client()
+        client.submitted["batch-rel-0-0"] = [
+            BatchRequest(custom_id=f"rel-0-{i}", system_prompt="s", user_prompt="u")
+            for i in range(2)
+        ]
+        client.submitted["batch-rel-0-2"] = [
+            BatchRequest(custom_id="rel-0-2", system_prompt="s", user_prompt="u")
+        ]
+
+        judgments, _, _, _ = run_batch_evaluation(
+            [QueryEntry(query="shoes", type="broad")],
+            _make_mock_adapter(),
+            self._config(),
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            resume=True,
+            output_dir=str(tmp_path),
+        )
+
+        client.submit_batch.assert_not_called()
+        client.poll_batch.assert_called_once_with("batch-rel-0-2")
+        client.restore_batch_custom_ids.assert_called_once_with(
+            "batch-rel-0-2", ["rel-0-2"]
+        )
+        assert len(judgments) == 3
+
+
+class TestDualBatchMerging:
+    """Dual batch mode submits and polls one batch for both configurations."""
+
+    def _configs(self) -> tuple[ExperimentConfig, ExperimentConfig]:
+        return (
+            ExperimentConfig(
+                name="config-a", adapter_path="a.py", llm_model="test-model", top_k=3
+            ),
+            ExperimentConfig(
+                name="config-b", adapter_path="b.py", llm_model="test-model", top_k=3
+            ),
+        )
+
+    def _client(self, submitted: dict[str, list[BatchRequest]] | None = None) -> Mock:
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.max_batch_requests = None
+        client.max_batch_bytes = None
+        client.submitted = {} if submitted is None else submitted
+
+        def submit_batch(requests):
+            batch_id = f"batch-{len(client.submitted) + 1}"
+            client.submitted[batch_id] = list(requests)
+            return batch_id
+
+        def iter_batch_results(batch_id):
+            return [
+                BatchResult(
+                    custom_id=req.custom_id,
+                    response=LLMResponse(
+                        content=(
+                            "VERDICT: appropriate\nREASONING: ok"
+                            if "corr-" in req.custom_id
+                            else _GOOD
+                        ),
+                        model="test",
+                        input_tokens=10,
+                        output_tokens=5,
+                    ),
+                )
+                for req in client.submitted[batch_id]
+            ]
+
+        client.submit_batch.side_effect = submit_batch
+        client.poll_batch.return_value = ("completed", 0, 0)
+        client.iter_batch_results.side_effect = iter_batch_results
+        return client
+
+    def _corrected_adapter(self, positions: list[int]):
+        shifted = _make_shifted_adapter(positions)
+
+        def adapter(query: str) -> SearchResponse:
+            return SearchResponse(
+                results=shifted(query), corrected_query=f"{query} fixed"
+            )
+
+        return adapter
+
+    def _run(self, tmp_path, client, **kwargs):
+        config_a, config_b = self._configs()
+        return run_dual_batch_evaluation(
+            [QueryEntry(query="query 0", type="broad")],
+            self._corrected_adapter([0, 1, 2]),
+            config_a,
+            self._corrected_adapter([2, 3, 1]),
+            config_b,
+            client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+            **kwargs,
+        )
+
+    def test_one_relevance_and_one_correction_batch(self, tmp_path):
+        client = self._client()
+        result = self._run(tmp_path, client, dedupe=False)
+
+        assert client.submit_batch.call_count == 2
+        assert [r.custom_id for r in client.submitted["batch-1"]] == [
+            "a-rel-0-0",
+            "a-rel-0-1",
+            "a-rel-0-2",
+            "b-rel-0-0",
+            "b-rel-0-1",
+            "b-rel-0-2",
+        ]
+        assert [r.custom_id for r in client.submitted["batch-2"]] == [
+            "a-corr-0",
+            "b-corr-0",
+        ]
+        assert sorted(c.args[0] for c in client.poll_batch.call_args_list) == [
+            "batch-1",
+            "batch-2",
+        ]
+        judgments_a, judgments_b = result[0], result[1]
+        assert [j.score for j in judgments_a + judgments_b] == [2] * 6
+        assert [j.product.product_id for j in judgments_b] == [
+            "SKU-2",
+            "SKU-3",
+            "SKU-1",
+        ]
+        assert [c.verdict for c in result[7] + result[8]] == [
+            "appropriate",
+            "appropriate",
+        ]
+        assert load_checkpoint(str(tmp_path), "config-a") is None
+        assert load_checkpoint(str(tmp_path), "config-b") is None
+
+    def test_identical_requests_submitted_once(self, tmp_path, capsys):
+        client = self._client()
+        result = self._run(tmp_path, client)
+
+        assert [r.custom_id for r in client.submitted["batch-1"]] == [
+            "a-rel-0-0",
+            "a-rel-0-1",
+            "a-rel-0-2",
+            "b-rel-0-1",
+        ]
+        # Both configurations made the same correction
+        assert [r.custom_id for r in client.submitted["batch-2"]] == ["a-corr-0"]
+        assert [j.metadata.get("deduplicated", False) for j in result[1]] == [
+            True,
+            False,
+            True,
+        ]
+        assert [c.verdict for c in result[8]] == ["appropriate"]
+        assert "Deduplicated 2 request(s) shared" in capsys.readouterr().out
+
+    def test_failed_batch_fails_both_configurations(self, tmp_path):
+        client = self._client()
+        client.poll_batch.return_value = ("failed", 0, 0)
+        client.batch_error_message.return_value = None
+
+        with pytest.raises(RuntimeError, match="batch-1 failed"):
+            self._run(tmp_path, client)
+
+        assert load_checkpoint(str(tmp_path), "config-a") is None
+        assert load_checkpoint(str(tmp_path), "config-b") is None
+
+    def test_resume_reads_merged_batches(self, tmp_path):
+        client = self._client()
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with pytest.raises(BatchCancelledError):
+            self._run(tmp_path, client, cancel_event=cancel_event)
+
+        saved_b = load_checkpoint(str(tmp_path), "config-b")
+        assert saved_b is not None
+        assert saved_b.merged_prefix == "b"
+        assert saved_b.merged_batch_ids == ["batch-1", "batch-2"]
+        assert saved_b.merged_aliases == {
+            "rel-0-0": "a-rel-0-2",
+            "rel-0-2": "a-rel-0-1",
+            "corr-0": "a-corr-0",
+        }
+
+        resumed = self._client(client.submitted)
+        result = self._run(tmp_path, resumed, resume=True)
+
+        resumed.submit_batch.assert_not_called()
+        assert resumed.poll_batch.call_count == 2
+        assert [j.score for j in result[0] + result[1]] == [2] * 6
+        assert [j.metadata.get("deduplicated", False) for j in result[1]] == [
+            True,
+            False,
+            True,
+        ]
+        assert len(result[7]) == len(result[8]) == 1
+
+
+class TestRunBatchEvaluation:
+    def test_batch_basic_pipeline(self, tmp_path):
+        queries = [QueryEntry(query="running shoes", type="broad")]
+        adapter = _make_mock_adapter()
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+        responses = [
+            "SCORE: 3\nATTRIBUTES: match\nREASONING: Excellent match",
+            "SCORE: 2\nATTRIBUTES: partial\nREASONING: Good match",
+            "SCORE: 1\nATTRIBUTES: mismatch\nREASONING: Marginal match",
+        ]
+        llm_client = _make_mock_batch_llm_client(responses)
+        backend = FileBackend(output_dir=str(tmp_path))
+
+        judgments, checks, metrics, corrections = run_batch_evaluation(
+            queries,
+            adapter,
+            config,
+            llm_client,
+            backend,
+            poll_interval=0,
+        )
+
+        assert len(judgments) == 3
+        assert judgments[0].score == 3
+        assert judgments[1].score == 2
+        assert judgments[2].score == 1
+
+        assert len(checks) > 0
+
+        metric_names = [m.metric_name for m in metrics]
+        assert "ndcg@10" in metric_names
+        assert "mrr" in metric_names
+
+        assert len(corrections) == 0
+        llm_client.submit_batch.assert_called_once()
+
+    def test_batch_zero_requests(self, tmp_path):
+        """All adapters fail → empty judgments, zero-filled metrics."""
+        queries = [QueryEntry(query="error query", type="broad")]
+
+        def failing_adapter(query: str):
+            raise RuntimeError("API down")
+
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test",
+        )
+        llm_client = _make_mock_batch_llm_client([])
+        backend = FileBackend(output_dir=str(tmp_path))
+
+        judgments, checks, metrics, corrections = run_batch_evaluation(
+            queries,
+            failing_adapter,
+            config,
+            llm_client,
+            backend,
+            poll_interval=0,
+        )
+
+        assert len(judgments) == 0
+        llm_client.submit_batch.assert_not_called()
+
+    def test_batch_partial_failures(self, tmp_path):
+        """Some results error → score=0 judgments."""
+        queries = [QueryEntry(query="running shoes", type="broad")]
+        adapter = _make_mock_adapter()
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+
+        client = Mock(spec=LLMClient)
+        client.supports_batch.return_value = True
+        client.submit_batch.return_value = "batch-1"
+        client.poll_batch.return_value = ("completed", 3, 3)
+
+        # First result succeeds, second/third fail
+        client.iter_batch_results.return_value = [
+            BatchResult(
+                custom_id="rel-0-0",
+                response=LLMResponse(
+                    content="SCORE: 3\nATTRIBUTES: match\nREASONING: Good",
+                    model="test",
+                    input_tokens=100,
+                    output_tokens=50,
+                ),
+            ),
+            BatchResult(
+                custom_id="rel-0-1",
+                response=None,
+                error="Rate limit exceeded",
+            ),
+            BatchResult(
+                custom_id="rel-0-2",
+                response=None,
+                error="Server error",
+            ),
+        ]
+
+        backend = FileBackend(output_dir=str(tmp_path))
+
+        judgments, checks, metrics, corrections = run_batch_evaluation(
+            queries,
+            adapter,
+            config,
+            client,
+            backend,
+            poll_interval=0,
+        )
+
+        assert len(judgments) == 3
+        assert judgments[0].score == 3
+        assert judgments[1].score == 0
+        assert "Rate limit" in judgments[1].reasoning
+        assert judgments[2].score == 0
+
+    def test_batch_with_corrections(self, tmp_path):
+        """Verify two separate batches submitted when corrections exist."""
+        queries = [QueryEntry(query="runnign shoes", type="broad")]
+
+        def adapter(query: str) -> SearchResponse:
+            return SearchResponse(
+                results=[
+                    SearchResult(
+                        product_id="SKU-1",
+                        title="Running Shoes",
+                        description="Great shoes",
+                        category="Shoes",
+                        price=100.0,
+                        position=0,
+                    )
+                ],
+                corrected_query="running shoes",
+            )
+
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+        responses = [
+            # Relevance judgment
+            "SCORE: 3\nATTRIBUTES: match\nREASONING: Perfect",
+            # Correction judgment
+            "VERDICT: appropriate\nREASONING: Spelling fix.",
+        ]
+        llm_client = _make_mock_batch_llm_client(responses)
+        backend = FileBackend(output_dir=str(tmp_path))
 
         judgments, checks, metrics, corrections = run_batch_evaluation(
             queries,
@@ -1294,6 +3335,183 @@ class TestRunBatchEvaluation:
         ndcg = next(m for m in metrics if m.metric_name == "ndcg@10")
         assert "navigational" in ndcg.by_query_type
 
+    def test_batch_known_queries_submitted_during_classification(self, tmp_path):
+        """Typed queries go into a relevance batch before classification ends."""
+        queries = [
+            QueryEntry(query="nike air max"),
+            QueryEntry(query="running shoes", type="broad"),
+        ]
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+        responses = [
+            # Read in order: classification, then both relevance batches
+            "QUERY_TYPE: navigational",
+            *["SCORE: 2\nATTRIBUTES: match\nREASONING: Good"] * 6,
+        ]
+        llm_client = _make_mock_batch_llm_client(responses)
+        calls: list[str] = []
+        submit = llm_client.submit_batch.side_effect
+        read = llm_client.iter_batch_results.side_effect
+
+        def submit_batch(requests):
+            calls.append("submit")
+            return submit(requests)
+
+        def iter_batch_results(batch_id):
+            calls.append("read")
+            return read(batch_id)
+
+        llm_client.submit_batch.side_effect = submit_batch
+        llm_client.iter_batch_results.side_effect = iter_batch_results
+
+        judgments, _, _, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            config,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            output_dir=str(tmp_path),
+        )
+
+        submitted = [c.args[0] for c in llm_client.submit_batch.call_args_list]
+        assert [r.custom_id for r in submitted[0]] == ["cls-0"]
+        assert [r.custom_id for r in submitted[1]] == [
+            "rel-1-0",
+            "rel-1-1",
+            "rel-1-2",
+        ]
+        assert [r.custom_id for r in submitted[2]] == [
+            "rel-0-0",
+            "rel-0-1",
+            "rel-0-2",
+        ]
+        # The known queries were submitted before the classification was read
+        assert calls[:3] == ["submit", "submit", "read"]
+        # Each batch's spool is released once nothing refers to it
+        released = [c.args[0] for c in llm_client.release_batch.call_args_list]
+        assert released == ["batch-1", "batch-2", "batch-3"]
+        assert queries[0].type == "navigational"
+        assert [j.query for j in judgments] == ["nike air max"] * 3 + [
+            "running shoes"
+        ] * 3
+        assert all(j.score == 2 for j in judgments)
+
+    def test_first_batch_checkpointed_when_classification_fails(self, tmp_path):
+        """The known queries' batch is resumed, the rest collected on resume."""
+        from veritail.batch_utils import BatchFailedError
+        from veritail.checkpoint import load_checkpoint
+
+        queries = [
+            QueryEntry(query="nike air max"),
+            QueryEntry(query="running shoes", type="broad"),
+        ]
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+        llm_client = _make_mock_batch_llm_client(
+            [
+                "QUERY_TYPE: navigational",
+                *["SCORE: 2\nATTRIBUTES: match\nREASONING: Good"] * 6,
+            ]
+        )
+        llm_client.poll_batch.side_effect = [("failed", 0, 0)]
+
+        with pytest.raises(BatchFailedError):
+            run_batch_evaluation(
+                queries,
+                _make_mock_adapter(),
+                config,
+                llm_client,
+                FileBackend(output_dir=str(tmp_path)),
+                poll_interval=0,
+                output_dir=str(tmp_path),
+            )
+
+        checkpoint = load_checkpoint(str(tmp_path), "test-batch")
+        assert checkpoint is not None
+        assert checkpoint.batch_ids == ["batch-2"]
+        assert checkpoint.pending_queries == [0]
+        assert sorted(checkpoint.request_context) == [
+            "rel-1-0",
+            "rel-1-1",
+            "rel-1-2",
+        ]
+
+        llm_client.poll_batch.side_effect = None
+        judgments, _, _, _ = run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            config,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            poll_interval=0,
+            resume=True,
+            output_dir=str(tmp_path),
+        )
+
+        # Classification resubmitted, then only the pending query collected
+        submitted = [c.args[0] for c in llm_client.submit_batch.call_args_list]
+        assert len(submitted) == 4
+        assert [r.custom_id for r in submitted[2]] == ["cls-0"]
+        assert [r.custom_id for r in submitted[3]] == [
+            "rel-0-0",
+            "rel-0-1",
+            "rel-0-2",
+        ]
+        assert queries[0].type == "navigational"
+        assert [j.query for j in judgments] == ["nike air max"] * 3 + [
+            "running shoes"
+        ] * 3
+        assert all(j.score == 2 for j in judgments)
+        assert load_checkpoint(str(tmp_path), "test-batch") is None
+
+    def test_batch_typed_query_with_overlay_not_classified(self, tmp_path):
+        """Queries with a type and a known overlay skip classification."""
+        from veritail.types import VerticalOverlay
+
+        queries = [
+            QueryEntry(query="trail shoes", type="broad", overlay="footwear"),
+        ]
+        vertical = VerticalContext(
+            core="Sporting goods",
+            overlays={
+                "footwear": VerticalOverlay(description="Shoes", content="Shoes!")
+            },
+        )
+        config = ExperimentConfig(
+            name="test-batch",
+            adapter_path="test.py",
+            llm_model="test-model",
+            top_k=3,
+        )
+        llm_client = _make_mock_batch_llm_client(
+            ["SCORE: 2\nATTRIBUTES: match\nREASONING: Good"] * 3
+        )
+
+        run_batch_evaluation(
+            queries,
+            _make_mock_adapter(),
+            config,
+            llm_client,
+            FileBackend(output_dir=str(tmp_path)),
+            vertical=vertical,
+            poll_interval=0,
+            output_dir=str(tmp_path),
+        )
+
+        assert llm_client.submit_batch.call_count == 1
+        (batch,) = llm_client.submit_batch.call_args.args
+        assert all(r.custom_id.startswith("rel-") for r in batch)
+        assert "Shoes!" in batch[0].user_prompt
+
     def test_batch_concurrent_submit_both_upfront(self, tmp_path):
         """Both relevance and correction batches are submitted before polling."""
         queries = [QueryEntry(query="runnign shoes", type="broad")]
@@ -1353,9 +3571,14 @@ class TestRunBatchEvaluation:
         # Verify incremental checkpoint saves by re-running with a spy.
         # The checkpoint is cleared on success, so we use patch to count calls.
         llm_client2 = _make_mock_batch_llm_client(responses)
-        with patch(
-            "veritail.pipeline.save_checkpoint", wraps=save_checkpoint
-        ) as spy_save:
+        with (
+            patch(
+                "veritail.pipeline.save_checkpoint", wraps=save_checkpoint
+            ) as spy_save,
+            patch(
+                "veritail.pipeline.update_checkpoint", wraps=update_checkpoint
+            ) as spy_update,
+        ):
             run_batch_evaluation(
                 queries,
                 adapter,
@@ -1365,14 +3588,14 @@ class TestRunBatchEvaluation:
                 poll_interval=0,
                 output_dir=str(tmp_path),
             )
-            # Saved twice: partial (relevance only) then full (both batch IDs)
-            assert spy_save.call_count == 2
+            # Saved once with the relevance batch, then updated with the
+            # correction batch ID
+            assert spy_save.call_count == 1
             partial_cp = spy_save.call_args_list[0][0][2]
-            full_cp = spy_save.call_args_list[1][0][2]
             assert partial_cp.batch_id is not None
             assert partial_cp.correction_batch_id is None
-            assert full_cp.batch_id is not None
-            assert full_cp.correction_batch_id is not None
+            spy_update.assert_called_once()
+            assert spy_update.call_args.kwargs["correction_batch_id"] is not None
 
     def test_batch_no_corrections_single_submit(self, tmp_path):
         """Only 1 submit_batch when there are no corrections."""
@@ -1447,7 +3670,7 @@ class TestRunBatchEvaluation:
         client.supports_batch.return_value = True
         client.poll_batch.return_value = ("completed", 1, 1)
 
-        client.retrieve_batch_results.side_effect = [
+        client.iter_batch_results.side_effect = [
             # Relevance results
             [
                 BatchResult(
@@ -1529,7 +3752,7 @@ class TestRunBatchEvaluation:
         client = Mock(spec=LLMClient)
         client.supports_batch.return_value = True
         client.poll_batch.return_value = ("completed", 1, 1)
-        client.retrieve_batch_results.return_value = [
+        client.iter_batch_results.return_value = [
             BatchResult(
                 custom_id="rel-0-0",
                 response=LLMResponse(
@@ -1719,7 +3942,7 @@ class TestRunBatchEvaluation:
         client.submit_batch.return_value = "batch-corr-new"
         client.poll_batch.return_value = ("completed", 1, 1)
 
-        client.retrieve_batch_results.side_effect = [
+        client.iter_batch_results.side_effect = [
             # Relevance results
             [
                 BatchResult(
@@ -1955,7 +4178,7 @@ class TestRunBatchEvaluation:
         # Polls: relevance (already completed) + correction (new)
         client2.poll_batch.return_value = ("completed", 1, 1)
 
-        client2.retrieve_batch_results.side_effect = [
+        client2.iter_batch_results.side_effect = [
             # Relevance results
             [
                 BatchResult(
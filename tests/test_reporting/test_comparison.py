@@ -117,9 +117,11 @@ class TestGenerateComparisonReport:
                 "top_k": 10,
                 "adapter_path_a": "adapter_a.py",
                 "adapter_path_b": "adapter_b.py",
+                "llm_calls_saved": 42,
             },
         )
         assert "Timestamp (UTC)" in report
+        assert "LLM Calls Saved (Shared Pairs)" in report
         assert "2026-02-13T12:00:00Z" in report
         assert "claude-sonnet-4-5" in report
         assert "industrial" in report
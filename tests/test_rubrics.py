@@ -1,6 +1,11 @@
 """Tests for rubric content and expectations."""
 
-from veritail.rubrics.ecommerce_default import SYSTEM_PROMPT, format_user_prompt
+from veritail.rubrics.ecommerce_default import (
+    LISTWISE_SYSTEM_PROMPT,
+    SYSTEM_PROMPT,
+    format_listwise_user_prompt,
+    format_user_prompt,
+)
 from veritail.types import SearchResult
 
 
@@ -71,3 +76,51 @@ def test_format_user_prompt_with_correction_and_overlay():
     assert "## Original Search Query" in prompt
     assert "## Domain-Specific Scoring Guidance" in prompt
     assert "Footwear scoring guidance." in prompt
+
+
+def test_listwise_rubric_shares_scale_and_asks_for_result_blocks():
+    scale = SYSTEM_PROMPT.split("## Response Format")[0]
+    assert LISTWISE_SYSTEM_PROMPT.startswith(scale)
+    assert "RESULT 1\nSCORE: <score>" in LISTWISE_SYSTEM_PROMPT
+    assert LISTWISE_SYSTEM_PROMPT.count("## Response Format") == 1
+    assert "Do not include chain-of-thought." in LISTWISE_SYSTEM_PROMPT
+
+
+def test_format_listwise_user_prompt_numbers_products():
+    second = SearchResult(
+        product_id="SKU-002",
+        title="Trail Shoes",
+        description="Grippy trail shoes",
+        category="Shoes > Trail",
+        price=99.0,
+        position=4,
+        attributes={"color": "green"},
+    )
+    prompt = format_listwise_user_prompt(
+        "runnign shoes",
+        [_make_result(), second],
+        corrected_query="running shoes",
+        overlay="Prefer road shoes.",
+    )
+    assert "## Corrected Search Query (used for retrieval)" in prompt
+    assert "## Domain-Specific Scoring Guidance\nPrefer road shoes." in prompt
+    assert prompt.index("### Result 1\n- **Title**: Running Shoes") < prompt.index(
+        "### Result 2\n- **Title**: Trail Shoes"
+    )
+    assert "- **Position in Results**: 5" in prompt
+    assert "  - color: green" in prompt
+    assert "each of these 2 products" in prompt
+
+
+def test_format_user_prompt_can_omit_position():
+    first = _make_result()
+    moved = SearchResult(**{**first.__dict__, "position": 7})
+
+    with_position = format_user_prompt("running shoes", first)
+    assert "Position in Results" in with_position
+    assert format_user_prompt("running shoes", first, include_position=False) == (
+        format_user_prompt("running shoes", moved, include_position=False)
+    )
+    assert "Position in Results" not in format_user_prompt(
+        "running shoes", moved, include_position=False
+    )